@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the processing -> forecast stage hand-off.
+
+Compares the previous critical path (write processed/fused_forecast.json,
+re-read it, dict_to_swell_forecast, to_dict for predictions) with the
+in-memory hand-off run_pipeline now uses (predictions straight from the
+SwellForecast; the artifact is written off the critical path). Also compares
+the fusion input conversion from_json(json.dumps(d)) with from_dict(d).
+
+Usage:
+    python scripts/benchmark_stage_handoff.py [--events 40] [--observations 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.main import build_predictions
+from src.processing import dict_to_swell_forecast
+from src.processing.models.buoy_data import BuoyData, BuoyObservation
+from src.processing.models.swell_event import (
+    ForecastLocation,
+    SwellComponent,
+    SwellEvent,
+    SwellForecast,
+)
+
+SHORES = [("North Shore", 0.0), ("South Shore", 180.0), ("East Shore", 90.0), ("West Shore", 270.0)]
+
+
+def build_forecast(events: int) -> SwellForecast:
+    """Synthetic fused forecast with per-shore copies of every event."""
+    start = datetime(2025, 10, 15, tzinfo=UTC)
+
+    def event(index: int) -> SwellEvent:
+        peak = start + timedelta(hours=6 * index)
+        return SwellEvent(
+            event_id=f"swell_{index}",
+            start_time=(peak - timedelta(hours=12)).isoformat(),
+            peak_time=peak.isoformat(),
+            primary_direction=(290 + 7 * index) % 360,
+            significance=0.6,
+            hawaii_scale=4.0 + index % 5,
+            primary_components=[
+                SwellComponent(height=2.0, period=13.0 + index % 4, direction=315.0),
+                SwellComponent(height=1.2, period=9.0, direction=300.0),
+            ],
+            secondary_components=[SwellComponent(height=0.6, period=7.0, direction=60.0)],
+            metadata={"confidence": 0.75, "category": "medium", "buoy_ids": ["51001", "51101"]},
+        )
+
+    return SwellForecast(
+        forecast_id="bench",
+        generated_time=start.isoformat(),
+        swell_events=[event(i) for i in range(events)],
+        locations=[
+            ForecastLocation(
+                name=name,
+                shore=name,
+                latitude=21.6,
+                longitude=-158.1,
+                facing_direction=facing,
+                swell_events=[event(i) for i in range(events)],
+            )
+            for name, facing in SHORES
+        ],
+        metadata={"confidence": {"overall_score": 0.8}},
+    )
+
+
+def build_buoy(observations: int) -> BuoyData:
+    start = datetime(2025, 10, 15, tzinfo=UTC)
+    return BuoyData(
+        station_id="51001",
+        name="NW Hawaii",
+        latitude=24.4,
+        longitude=-162.1,
+        observations=[
+            BuoyObservation(
+                timestamp=(start - timedelta(minutes=10 * i)).isoformat(),
+                wave_height=2.0 + (i % 10) / 10,
+                dominant_period=14.0,
+                average_period=9.0,
+                wave_direction=315.0,
+                wind_speed=6.0,
+                wind_direction=70.0,
+            )
+            for i in range(observations)
+        ],
+    )
+
+
+def _time_per_call(func: Callable[[], object], iterations: int) -> float:
+    """Average milliseconds per call after a warm-up call."""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=40, help="Swell events per location")
+    parser.add_argument("--observations", type=int, default=2000, help="Buoy observations")
+    parser.add_argument("--iterations", type=int, default=50, help="Calls per measurement")
+    args = parser.parse_args()
+
+    forecast = build_forecast(args.events)
+    generated = forecast.generated_time
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir) / "fused_forecast.json"
+
+        def json_round_trip() -> None:
+            # Previous path: save_result, then generate_forecast re-reads the file
+            with open(path, "w") as f:
+                json.dump(forecast.to_dict(), f, indent=2)
+            with open(path) as f:
+                reloaded = dict_to_swell_forecast(json.loads(f.read()))
+            reloaded.to_dict()
+            build_predictions(reloaded, generated)
+
+        def in_memory() -> None:
+            build_predictions(forecast, generated)
+
+        handoff = {
+            "json round trip": _time_per_call(json_round_trip, args.iterations),
+            "in-memory": _time_per_call(in_memory, args.iterations),
+        }
+
+    buoy = build_buoy(args.observations).to_dict()
+    conversion = {
+        "from_json(json.dumps)": _time_per_call(
+            lambda: BuoyData.from_json(json.dumps(buoy)), args.iterations
+        ),
+        "from_dict": _time_per_call(lambda: BuoyData.from_dict(buoy), args.iterations),
+    }
+
+    print(
+        f"Stage hand-off ({args.events} events x {len(SHORES) + 1} locations, "
+        f"{args.iterations} iterations)"
+    )
+    for results in (handoff, conversion):
+        baseline = next(iter(results.values()))
+        for name, elapsed in results.items():
+            print(f"  {name:<24}{elapsed:>9.3f} ms{baseline / elapsed:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ValidationDatabase per-call overhead.
+
+Compares the previous access pattern (connect_with_retry + PRAGMAs + close on
+every call) with the pooled connections ValidationDatabase now uses, for a
+small write and a point read.
+
+Usage:
+    python scripts/benchmark_validation_db.py [--iterations 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.validation.database import (
+    ValidationDatabase,
+    connect_with_retry,
+    format_timestamp,
+    immediate_transaction,
+)
+
+INSERT_ACTUAL = """
+    INSERT INTO actuals (buoy_id, observation_time, wave_height, source)
+    VALUES (?, ?, ?, 'NDBC')
+"""
+SELECT_FORECAST = "SELECT * FROM forecasts WHERE forecast_id = ?"
+
+
+def per_call_connection(db_path: str, iterations: int) -> dict[str, float]:
+    """Previous pattern: open, configure and close a connection for every call."""
+    timestamp = format_timestamp(datetime.now())
+
+    def write() -> None:
+        conn = connect_with_retry(db_path)
+        try:
+            with immediate_transaction(conn):
+                conn.execute(INSERT_ACTUAL, ("51001", timestamp, 5.0))
+        finally:
+            conn.close()
+
+    def read() -> None:
+        conn = connect_with_retry(db_path)
+        try:
+            conn.execute(SELECT_FORECAST, ("bench",)).fetchone()
+        finally:
+            conn.close()
+
+    return {"write": _time_per_call(write, iterations), "read": _time_per_call(read, iterations)}
+
+
+def pooled_connection(db: ValidationDatabase, iterations: int) -> dict[str, float]:
+    """Current pattern: ValidationDatabase methods on pooled connections."""
+    now = datetime.now()
+    return {
+        "write": _time_per_call(lambda: db.save_actual("51001", now, wave_height=5.0), iterations),
+        "read": _time_per_call(lambda: db.get_forecast("bench"), iterations),
+    }
+
+
+def _time_per_call(func: Callable[[], object], iterations: int) -> float:
+    """Average microseconds per call after a short warm-up."""
+    for _ in range(min(50, iterations)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        db_path = str(Path(tempdir) / "validation.db")
+        db = ValidationDatabase(db_path)
+        db.save_forecast({"forecast_id": "bench", "generated_time": datetime.now()})
+
+        before = per_call_connection(db_path, args.iterations)
+        after = pooled_connection(db, args.iterations)
+        db.close()
+
+    print(f"ValidationDatabase per-call overhead ({args.iterations} calls each)")
+    print(f"{'operation':<12}{'per-call conn':>16}{'pooled':>12}{'speedup':>10}")
+    for operation in ("write", "read"):
+        print(
+            f"{operation:<12}{before[operation]:>13.1f} us{after[operation]:>9.1f} us"
+            f"{before[operation] / after[operation]:>9.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
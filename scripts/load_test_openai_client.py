@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Offline load test for OpenAIClient against a local stub server.
+
+Starts an OpenAI-compatible chat completions stub on localhost and fires
+concurrent requests through OpenAIClient, first with a new AsyncOpenAI client
+per request (the previous behaviour) and then through the pooled client.
+Reports throughput, TCP connections opened, 429 handling and latency
+percentiles. No API key or network access is needed.
+
+Usage:
+    python scripts/load_test_openai_client.py [--requests 200] [--concurrency 8]
+        [--server-latency 0.02] [--rate-limit-every 0]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.openai_client import CLIENT_POOL, OpenAIClient
+from src.core.rate_limiter import RateLimitConfig
+
+
+class StubServer:
+    """OpenAI-compatible stub that counts connections and can inject 429s."""
+
+    def __init__(self, latency: float, rate_limit_every: int):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.requests = 0
+        self.peers: set[tuple] = set()
+        self.runner = None
+        self.base_url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        number = self.requests
+        self.peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(self.latency)
+        if self.rate_limit_every and number % self.rate_limit_every == 0:
+            return web.json_response(
+                {"error": {"message": "Rate limit reached", "type": "requests", "code": None}},
+                status=429,
+                headers={"retry-after-ms": "50"},
+            )
+        return web.json_response(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "stub",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 50, "completion_tokens": 5, "total_tokens": 55},
+            }
+        )
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        self.base_url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/v1"
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.peers.clear()
+
+
+async def per_call_clients(server: StubServer, requests: int, concurrency: int) -> float:
+    """Previous pattern: a new AsyncOpenAI client for every request."""
+    from openai import AsyncOpenAI
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            client = AsyncOpenAI(api_key="stub-key", base_url=server.base_url)
+            await client.chat.completions.create(
+                model="stub", messages=[{"role": "user", "content": "hi"}]
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)), return_exceptions=True)
+    return time.perf_counter() - start
+
+
+async def pooled_client(server: StubServer, args: argparse.Namespace) -> tuple[float, dict]:
+    """Current pattern: OpenAIClient on the pooled connection."""
+    client = OpenAIClient(
+        api_key="stub-key",
+        model="stub",
+        max_tokens=16,
+        base_url=server.base_url,
+        max_concurrency=args.concurrency,
+        rate_limit=RateLimitConfig(requests_per_second=args.rate, burst_size=args.concurrency),
+    )
+    start = time.perf_counter()
+    await asyncio.gather(*(client.call_openai_api("system", "hi") for _ in range(args.requests)))
+    elapsed = time.perf_counter() - start
+    metrics = await client.get_metrics()
+    await CLIENT_POOL.close()
+    return elapsed, metrics
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = StubServer(args.server_latency, args.rate_limit_every)
+    await server.start()
+    try:
+        before = await per_call_clients(server, args.requests, args.concurrency)
+        before_connections = len(server.peers)
+        server.reset()
+
+        after, metrics = await pooled_client(server, args)
+        after_connections = len(server.peers)
+    finally:
+        await server.runner.cleanup()
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}")
+    print(f"{'pattern':<18}{'seconds':>10}{'req/s':>10}{'connections':>14}")
+    for name, elapsed, connections in (
+        ("client per call", before, before_connections),
+        ("pooled client", after, after_connections),
+    ):
+        print(f"{name:<18}{elapsed:>10.2f}{args.requests / elapsed:>10.1f}{connections:>14}")
+
+    latency = metrics["latency"]
+    print(f"429s: {metrics['rate_limited']}, retries: {metrics['retries']}")
+    for kind in ("ttfb", "total"):
+        summary = latency[kind]
+        print(
+            f"{kind:<6} count={summary['count']} mean={summary['mean']}s "
+            f"p50<={summary['p50']}s p95<={summary['p95']}s max={summary['max']}s"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200, help="Total requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight")
+    parser.add_argument(
+        "--server-latency", type=float, default=0.02, help="Stub response delay in seconds"
+    )
+    parser.add_argument(
+        "--rate-limit-every", type=int, default=0, help="Answer every Nth request with a 429"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=1000.0, help="Client requests per second before backoff"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,13 +5,17 @@ Provides a standard interface for all data collection agents.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from ..core.config import Config
+from ..core.http_cache import create_http_cache
 from ..core.http_client import HTTPClient
+from ..core.worker_pool import get_worker_pool
 
 
 class BaseAgent(ABC):
@@ -23,6 +27,7 @@ class BaseAgent(ABC):
     - Shared utilities for HTTP requests and file operations
     - Consistent metadata creation
     - Error handling and logging
+    - Shared worker pool for CPU-bound parsing, with per-agent CPU accounting
     """
 
     def __init__(self, config: Config, http_client: HTTPClient | None = None):
@@ -38,6 +43,15 @@ class BaseAgent(ABC):
         self.agent_name = self.__class__.__name__
         self.logger = logging.getLogger(f"agent.{self.agent_name.lower()}")
         self._owns_client = False
+        self.reset_cpu_stats()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Agents are pickled when their parse methods run in a worker process;
+        # the HTTP client (sockets, locks) stays behind
+        state = self.__dict__.copy()
+        state["http_client"] = None
+        state["_owns_client"] = False
+        return state
 
     @abstractmethod
     async def collect(self, data_dir: Path) -> list[dict[str, Any]]:
@@ -52,6 +66,66 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def collect_stream(self, data_dir: Path) -> AsyncIterator[dict[str, Any]]:
+        """
+        Collect data, yielding each file's metadata as soon as it is available.
+
+        The default implementation runs collect() and yields its results.
+        Agents that download many files override this to yield per download,
+        so the collector can journal records without buffering the full list.
+
+        Args:
+            data_dir: Directory to store collected data
+
+        Yields:
+            Metadata dictionaries describing collected data
+        """
+        for item in await self.collect(data_dir):
+            yield item
+
+    async def run_cpu_bound(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a CPU-bound parse/post-process callable off the event loop.
+
+        The callable runs in the shared worker pool (see
+        ``data_collection.parse_executor``), so downloads in other agents keep
+        flowing while it runs. Its CPU time is added to this agent's stats.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The callable's result
+        """
+        start = time.perf_counter()
+        try:
+            result, cpu_seconds = await get_worker_pool(self.config).run(func, *args, **kwargs)
+        finally:
+            self.cpu_stats["calls"] += 1
+            self.cpu_stats["wall_seconds"] += time.perf_counter() - start
+        self.cpu_stats["cpu_seconds"] += cpu_seconds
+        return result
+
+    def get_cpu_stats(self) -> dict[str, Any]:
+        """
+        Get CPU accounting for work run through run_cpu_bound.
+
+        Returns:
+            Dictionary with calls, cpu_seconds (measured in the worker) and
+            wall_seconds (including time queued for a worker)
+        """
+        return {
+            "calls": self.cpu_stats["calls"],
+            "cpu_seconds": round(self.cpu_stats["cpu_seconds"], 4),
+            "wall_seconds": round(self.cpu_stats["wall_seconds"], 4),
+        }
+
+    def reset_cpu_stats(self) -> None:
+        """Reset CPU accounting (called at the start of each collection run)."""
+        self.cpu_stats = {"calls": 0, "cpu_seconds": 0.0, "wall_seconds": 0.0}
+
     def create_metadata(
         self,
         name: str,
@@ -114,6 +188,7 @@ class BaseAgent(ABC):
                 retry_attempts=self.config.getint("data_collection", "retry_attempts", 3),
                 user_agent=self.config.get("data_collection", "user_agent", "SurfCastAI/1.0"),
                 output_dir=self.config.data_directory,
+                cache=create_http_cache(self.config),
             )
             self._owns_client = True
 
@@ -181,10 +256,10 @@ class BaseAgent(ABC):
             else:
                 file_path = None  # Let HTTP client handle it
 
-            # Download the file
+            # Stream straight to disk; callers only need the saved file
             self.logger.info(f"Downloading {url} to {file_path}")
             result = await self.http_client.download(
-                url, save_to_disk=True, custom_file_path=file_path
+                url, save_to_disk=True, custom_file_path=file_path, stream=True
             )
 
             if result.success:
@@ -196,6 +271,7 @@ class BaseAgent(ABC):
                     file_path=result.file_path,
                     size_bytes=result.size_bytes,
                     content_type=result.content_type,
+                    content_hash=result.content_hash,
                     download_time=result.download_time,
                 )
             else:
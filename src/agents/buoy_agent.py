@@ -97,13 +97,13 @@ class BuoyAgent(BaseAgent):
             content = result.content.decode("utf-8", errors="ignore") if result.content else ""
 
             if url.endswith(".spec") or "spec" in parsed:
-                return self._handle_spectral_buoy(station_id, url, content, buoy_dir)
+                return await self._handle_spectral_buoy(station_id, url, content, buoy_dir)
 
             if "text" in content_type or url.endswith(".txt"):
-                buoy_data = self._parse_text_buoy(content, station_id)
+                buoy_data = await self.run_cpu_bound(self._parse_text_buoy, content, station_id)
             else:
                 # Assume HTML page with table fallback
-                buoy_data = self._parse_html_buoy(content, station_id)
+                buoy_data = await self.run_cpu_bound(self._parse_html_buoy, content, station_id)
 
             if "observations" not in buoy_data or not buoy_data["observations"]:
                 return self.create_metadata(
@@ -214,10 +214,10 @@ class BuoyAgent(BaseAgent):
         except Exception:  # pragma: no cover - continue without timestamp
             return None
 
-    def _handle_spectral_buoy(
+    async def _handle_spectral_buoy(
         self, station_id: str, url: str, text: str, buoy_dir: Path
     ) -> dict[str, Any]:
-        spectrum = self._parse_spectral_data(text)
+        spectrum = await self.run_cpu_bound(self._parse_spectral_data, text)
         data = {
             "station_id": station_id,
             "spectrum": spectrum,
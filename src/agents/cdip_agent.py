@@ -7,6 +7,15 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from ..core.subsetting import (
+    cf_datetimes,
+    opendap_constraint,
+    parse_dap_ascii,
+    parse_das,
+    parse_dds,
+)
 from .base_agent import BaseAgent
 
 
@@ -19,6 +28,13 @@ class NearshoreSource:
     format: str = "json"
     description: str | None = None
     ndbc_fallback: str | None = None
+    subset: bool = True
+    time_steps: int = 1
+
+    @property
+    def uses_opendap(self) -> bool:
+        """Whether to request a server-side subset instead of the whole file."""
+        return self.subset and self.format == "cdip_netcdf" and "/dodsC/" in self.url
 
     @classmethod
     def from_dict(cls, raw: dict[str, Any]) -> NearshoreSource:
@@ -30,11 +46,17 @@ class NearshoreSource:
         fmt = str(raw.get("format", "json")).strip().lower()
         description = raw.get("description")
         ndbc_fallback = raw.get("ndbc_fallback")
+        subset = raw.get("subset", True)
+        time_steps = raw.get("time_steps", 1)
 
         if not station_id:
             raise ValueError("Nearshore source missing 'id'")
         if not url:
             raise ValueError(f"Nearshore source '{station_id}' missing 'url'")
+        if not isinstance(time_steps, int) or time_steps < 1:
+            raise ValueError(
+                f"Nearshore source '{station_id}' time_steps must be a positive integer"
+            )
 
         return cls(
             station_id=station_id,
@@ -42,6 +64,8 @@ class NearshoreSource:
             format=fmt,
             description=description,
             ndbc_fallback=ndbc_fallback,
+            subset=bool(subset),
+            time_steps=time_steps,
         )
 
 
@@ -50,6 +74,21 @@ class CDIPAgent(BaseAgent):
 
     SUPPORTED_FORMATS = {"json", "cdip_json", "cdip_netcdf", "csv", "text", "ndbc_text"}
 
+    # Station variables read from netCDF or an OPeNDAP subset (CDIP names, then generic ones)
+    WAVE_VARIABLES = (
+        "waveHs",
+        "Hs",
+        "waveTp",
+        "Tp",
+        "waveDp",
+        "Dp",
+        "waveTime",
+        "time",
+        "waveFrequency",
+        "waveEnergyDensity",
+        "waveQuality",
+    )
+
     async def collect(self, data_dir: Path) -> list[dict[str, Any]]:
         """Fetch configured nearshore buoy feeds (netCDF primary, NDBC text fallback)."""
 
@@ -120,8 +159,21 @@ class CDIPAgent(BaseAgent):
     ) -> dict[str, Any]:
         """Fetch and parse a single nearshore source, returning metadata."""
 
-        result = await self.http_client.download(source.url, save_to_disk=False)
-        if not result.success or result.content is None:
+        if source.uses_opendap:
+            return await self._fetch_opendap_subset(source, output_dir, primary)
+
+        if source.format == "cdip_netcdf":
+            # Stream netCDF straight to its final path; xarray reads it lazily from there
+            result = await self.http_client.download(
+                source.url, custom_file_path=output_dir / f"{source.station_id}.nc", stream=True
+            )
+        else:
+            result = await self.http_client.download(source.url, save_to_disk=False)
+
+        payload = None
+        if result.success:
+            payload = result.file_path if source.format == "cdip_netcdf" else result.content
+        if payload is None:
             return self.create_metadata(
                 name=source.station_id,
                 description=f"Failed to fetch nearshore buoy {source.station_id}",
@@ -133,7 +185,12 @@ class CDIPAgent(BaseAgent):
             )
 
         try:
-            parsed, data_type = self._parse_content(result.content, source, output_dir)
+            if source.format == "cdip_netcdf":
+                parsed, data_type = await self.run_cpu_bound(
+                    self._parse_netcdf, Path(payload), source
+                )
+            else:
+                parsed, data_type = await self.run_cpu_bound(self._parse_content, payload, source)
             file_path = output_dir / f"{source.station_id}.{data_type}"
 
             if data_type == "json":
@@ -161,6 +218,9 @@ class CDIPAgent(BaseAgent):
             self.logger.error(
                 f"Error processing nearshore source {source.station_id}: {exc}", exc_info=True
             )
+            if source.format == "cdip_netcdf":
+                # Don't leave an unparseable download behind for processing to pick up
+                Path(payload).unlink(missing_ok=True)
             return self.create_metadata(
                 name=source.station_id,
                 description=f"Failed to parse nearshore buoy content: {exc}",
@@ -170,13 +230,73 @@ class CDIPAgent(BaseAgent):
                 fallback_used=not primary,
             )
 
-    def _parse_content(
-        self, content: bytes, source: NearshoreSource, output_dir: Path
-    ) -> tuple[Any, str]:
-        """Parse content based on source format (netCDF, JSON, NDBC text, CSV)."""
+    async def _fetch_opendap_subset(
+        self, source: NearshoreSource, output_dir: Path, primary: bool
+    ) -> dict[str, Any]:
+        """
+        Fetch only the latest records of the wave variables from a THREDDS OPeNDAP endpoint.
 
-        if source.format == "cdip_netcdf":
-            return self._parse_netcdf(content, source, output_dir)
+        Reads the DDS for dimension sizes, builds an index hyperslab covering
+        the last ``time_steps`` records (full spectra for those records) and
+        requests it as DAP2 ASCII. The summary is saved as ``<station>.json``.
+        """
+        try:
+            dds = await self.http_client.download(f"{source.url}.dds", save_to_disk=False)
+            if not dds.success or dds.content is None:
+                raise RuntimeError(f"DDS request failed: {dds.error or 'download_failed'}")
+            constraint = opendap_constraint(
+                parse_dds(dds.content.decode("utf-8", errors="ignore")),
+                self.WAVE_VARIABLES,
+                source.time_steps,
+            )
+            if not constraint:
+                raise RuntimeError("dataset has none of the expected wave variables")
+
+            # Attributes only supply station info and time units; the subset is usable without them
+            das = await self.http_client.download(f"{source.url}.das", save_to_disk=False)
+            das_text = das.content.decode("utf-8", errors="ignore") if das.success else ""
+
+            result = await self.http_client.download(
+                f"{source.url}.ascii?{constraint}", save_to_disk=False
+            )
+            if not result.success or result.content is None:
+                raise RuntimeError(f"subset request failed: {result.error or 'download_failed'}")
+
+            parsed = await self.run_cpu_bound(
+                self._parse_opendap_subset,
+                das_text,
+                result.content.decode("utf-8", errors="ignore"),
+                source,
+            )
+            file_path = output_dir / f"{source.station_id}.json"
+            with open(file_path, "w") as fh:
+                json.dump(parsed, fh, ensure_ascii=False, indent=2)
+
+        except Exception as exc:
+            self.logger.warning(f"OPeNDAP subset failed for {source.station_id}: {exc}")
+            return self.create_metadata(
+                name=source.station_id,
+                description=f"Failed to fetch nearshore buoy {source.station_id}",
+                data_type="unknown",
+                source_url=source.url,
+                error=str(exc),
+                fallback_used=not primary,
+            )
+
+        metadata = self._build_success_metadata(
+            file_path=file_path,
+            source=source,
+            data_type="json",
+            source_url=source.url,
+            content_type=result.content_type,
+            parsed_payload=parsed,
+            fallback_used=not primary,
+        )
+        metadata["opendap_constraint"] = constraint
+        return metadata
+
+    def _parse_content(self, content: bytes, source: NearshoreSource) -> tuple[Any, str]:
+        """Parse content based on source format (JSON, NDBC text, CSV)."""
 
         if source.format == "ndbc_text":
             return self._parse_ndbc_text(content, source)
@@ -194,121 +314,91 @@ class CDIPAgent(BaseAgent):
 
         return text, "txt"
 
-    def _parse_netcdf(
-        self, content: bytes, source: NearshoreSource, output_dir: Path
-    ) -> tuple[dict[str, Any], str]:
-        """Parse CDIP THREDDS netCDF file using xarray."""
+    def _parse_netcdf(self, file_path: Path, source: NearshoreSource) -> tuple[dict[str, Any], str]:
+        """Parse a CDIP THREDDS netCDF file, already saved to disk, using xarray."""
         try:
-            import tempfile
-
             import xarray as xr
 
-            # Write to temp file for xarray to open
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".nc") as tmp:
-                tmp.write(content)
-                tmp_path = tmp.name
-
-            try:
-                ds = xr.open_dataset(tmp_path)
-
-                # Extract wave parameters (CDIP convention)
-                parsed = {
-                    "source_format": "cdip_netcdf",
-                    "station": {
-                        "id": source.station_id,
-                        "name": ds.attrs.get("station_name", source.station_id),
-                        "lat": (
-                            float(ds.attrs.get("latitude", 0)) if "latitude" in ds.attrs else None
-                        ),
-                        "lon": (
-                            float(ds.attrs.get("longitude", 0)) if "longitude" in ds.attrs else None
-                        ),
-                    },
+            with xr.open_dataset(file_path) as ds:
+                arrays = {
+                    name: ds[name].values for name in self.WAVE_VARIABLES if name in ds.variables
                 }
+                parsed = self._summarise_station(arrays, dict(ds.attrs), source, "cdip_netcdf")
+            return parsed, "nc"
 
-                # Extract latest wave summary
-                if "waveHs" in ds.variables:
-                    hs_vals = ds["waveHs"].values
-                    parsed["wave_summary"] = {
-                        "significant_height": float(hs_vals[-1]) if len(hs_vals) > 0 else None,
-                    }
-                elif "Hs" in ds.variables:
-                    hs_vals = ds["Hs"].values
-                    parsed["wave_summary"] = {
-                        "significant_height": float(hs_vals[-1]) if len(hs_vals) > 0 else None,
-                    }
-
-                if parsed.get("wave_summary") and "waveTp" in ds.variables:
-                    tp_vals = ds["waveTp"].values
-                    parsed["wave_summary"]["peak_period"] = (
-                        float(tp_vals[-1]) if len(tp_vals) > 0 else None
-                    )
-                elif parsed.get("wave_summary") and "Tp" in ds.variables:
-                    tp_vals = ds["Tp"].values
-                    parsed["wave_summary"]["peak_period"] = (
-                        float(tp_vals[-1]) if len(tp_vals) > 0 else None
-                    )
-
-                if parsed.get("wave_summary") and "waveDp" in ds.variables:
-                    dp_vals = ds["waveDp"].values
-                    parsed["wave_summary"]["peak_direction"] = (
-                        float(dp_vals[-1]) if len(dp_vals) > 0 else None
-                    )
-                elif parsed.get("wave_summary") and "Dp" in ds.variables:
-                    dp_vals = ds["Dp"].values
-                    parsed["wave_summary"]["peak_direction"] = (
-                        float(dp_vals[-1]) if len(dp_vals) > 0 else None
-                    )
-
-                # Extract time
-                if "waveTime" in ds.variables:
-                    time_vals = ds["waveTime"].values
-                    if len(time_vals) > 0:
-                        parsed["wave_summary"]["timestamp"] = str(time_vals[-1])
-                elif "time" in ds.variables:
-                    time_vals = ds["time"].values
-                    if len(time_vals) > 0:
-                        parsed["wave_summary"]["timestamp"] = str(time_vals[-1])
-
-                # Extract spectral data if available
-                if "waveFrequency" in ds.variables:
-                    freqs = ds["waveFrequency"].values.tolist()
-                    parsed["spectra"] = {"frequencies": freqs}
-
-                    if "waveEnergyDensity" in ds.variables:
-                        energy = ds["waveEnergyDensity"].values
-                        if len(energy.shape) > 1:
-                            # Take latest time slice
-                            parsed["spectra"]["energies"] = energy[-1].tolist()
-                        else:
-                            parsed["spectra"]["energies"] = energy.tolist()
-
-                # Quality flags
-                if "waveQuality" in ds.variables:
-                    quality = ds["waveQuality"].values
-                    parsed["quality_flags"] = {
-                        "quality": int(quality[-1]) if len(quality) > 0 else None
-                    }
-
-                ds.close()
-
-                # Copy netCDF to output directory
-                final_path = output_dir / f"{source.station_id}.nc"
-                import shutil
+        except ImportError:
+            raise RuntimeError("xarray or netCDF4 not installed - required for cdip_netcdf format")
+        except Exception as exc:
+            raise RuntimeError(f"Failed to parse netCDF file: {exc}")
 
-                shutil.copy(tmp_path, final_path)
+    def _parse_opendap_subset(
+        self, das_text: str, ascii_text: str, source: NearshoreSource
+    ) -> dict[str, Any]:
+        """Summarise an OPeNDAP ``.ascii`` hyperslab of a CDIP station dataset."""
+        attributes = parse_das(das_text)
+        arrays = parse_dap_ascii(ascii_text)
+        for name in ("waveTime", "time"):
+            if name in arrays:
+                units = attributes.get(name, {}).get("units")
+                arrays[name] = cf_datetimes(arrays[name], units)
+        return self._summarise_station(
+            arrays, attributes.get("NC_GLOBAL", {}), source, "cdip_opendap"
+        )
 
-                return parsed, "nc"
+    def _summarise_station(
+        self,
+        arrays: dict[str, Any],
+        attrs: dict[str, Any],
+        source: NearshoreSource,
+        source_format: str,
+    ) -> dict[str, Any]:
+        """Build the station summary from the latest record of each wave variable."""
 
-            finally:
-                import os
+        def latest(*names: str) -> Any:
+            for name in names:
+                values = arrays.get(name)
+                if values is not None:
+                    return values[-1] if len(values) > 0 else None
+            return None
 
-                os.unlink(tmp_path)
+        parsed: dict[str, Any] = {
+            "source_format": source_format,
+            "station": {
+                "id": source.station_id,
+                "name": attrs.get("station_name", source.station_id),
+                "lat": _safe_float(attrs.get("latitude")),
+                "lon": _safe_float(attrs.get("longitude")),
+            },
+        }
 
-        except ImportError:
-            raise RuntimeError("xarray or netCDF4 not installed - required for cdip_netcdf format")
-        except Exception as exc:
-            raise RuntimeError(f"Failed to parse netCDF file: {exc}")
+        # Extract latest wave summary (CDIP names first, generic names as fallback)
+        if "waveHs" in arrays or "Hs" in arrays:
+            wave_summary: dict[str, Any] = {
+                "significant_height": _safe_float(latest("waveHs", "Hs"))
+            }
+            if "waveTp" in arrays or "Tp" in arrays:
+                wave_summary["peak_period"] = _safe_float(latest("waveTp", "Tp"))
+            if "waveDp" in arrays or "Dp" in arrays:
+                wave_summary["peak_direction"] = _safe_float(latest("waveDp", "Dp"))
+            timestamp = latest("waveTime", "time")
+            if timestamp is not None:
+                wave_summary["timestamp"] = str(timestamp)
+            parsed["wave_summary"] = wave_summary
+
+        # Extract spectral data if available
+        if "waveFrequency" in arrays:
+            parsed["spectra"] = {"frequencies": np.asarray(arrays["waveFrequency"]).tolist()}
+            if "waveEnergyDensity" in arrays:
+                energy = np.asarray(arrays["waveEnergyDensity"])
+                # Take latest time slice
+                parsed["spectra"]["energies"] = (energy[-1] if energy.ndim > 1 else energy).tolist()
+
+        # Quality flags
+        if "waveQuality" in arrays:
+            quality = latest("waveQuality")
+            parsed["quality_flags"] = {"quality": int(quality) if quality is not None else None}
+
+        return parsed
 
     def _parse_ndbc_text(self, content: bytes, source: NearshoreSource) -> tuple[Any, str]:
         """Parse NDBC standard meteorological text format as fallback."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Dict, List, Any
 import json
@@ -17,13 +18,15 @@ class ChartAgent(BaseAgent):
         super().__init__(config)
 
     async def collect(self, data_dir: Path) -> List[Dict[str, Any]]:
+        return [item async for item in self.collect_stream(data_dir)]
+
+    async def collect_stream(self, data_dir: Path) -> AsyncIterator[Dict[str, Any]]:
         data_dir.mkdir(exist_ok=True)
         urls = self.config.get_data_source_urls('charts').get('charts', [])
         if not urls:
             self.logger.warning("No chart URLs configured")
-            return []
+            return
 
-        metadata: List[Dict[str, Any]] = []
         await self.ensure_http_client()
 
         for url in urls:
@@ -48,5 +51,4 @@ class ChartAgent(BaseAgent):
                         json.dump(manifest, fh, indent=2)
                     result['manifest_path'] = str(manifest_path)
                     result['size_bytes'] = file_path.stat().st_size
-            metadata.append(result)
-        return metadata
+            yield result
@@ -65,7 +65,7 @@ class MetarAgent(BaseAgent):
                 )
 
             metar_raw = lines[-1]
-            parsed = self._parse_metar(metar_raw, station_id)
+            parsed = await self.run_cpu_bound(self._parse_metar, metar_raw, station_id)
             parsed['raw_lines'] = lines
             parsed['source_url'] = url
 
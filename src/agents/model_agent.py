@@ -3,17 +3,38 @@ Model Agent for collecting wave model data from PacIOOS, NOAA, and other sources
 """
 
 import asyncio
+import hashlib
+import io
 import json
 import logging
 import re
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ..core.config import Config
 from ..core.http_client import HTTPClient
+from ..core.subsetting import ERDDAP_GRID_AXES, erddap_griddap_url
 from .base_agent import BaseAgent
 
+# Columns read from WW3 CSVs; everything else in the file is skipped
+ERDDAP_NUMERIC_COLUMNS = ("Thgt", "Tper", "Tdir", "shgt")
+NOMADS_NUMERIC_COLUMNS = (
+    "Hs",
+    "Significant Wave Height",
+    "Tp",
+    "Peak Period",
+    "Dp",
+    "Peak Direction",
+)
+NOMADS_TIME_COLUMNS = ("time", "Time", "Date")
+
+_CSV_COMMENT_RE = re.compile(rb"^[ \t]*[#!].*$", re.MULTILINE)
+_CSV_FIRST_ROW_RE = re.compile(rb"^[ \t]*([^#!\s][^\r\n]*)\r?$\n?", re.MULTILINE)
+
 
 class ModelAgent(BaseAgent):
     """
@@ -24,6 +45,7 @@ class ModelAgent(BaseAgent):
     - Supports both direct data downloads and web scraping
     - Processes model imagery and data files
     - Extracts model run metadata
+    - Builds server-side ERDDAP griddap subsets from configuration
     """
 
     def __init__(self, config: Config, http_client: HTTPClient | None = None):
@@ -41,36 +63,85 @@ class ModelAgent(BaseAgent):
         Returns:
             List of metadata dictionaries
         """
+        return [item async for item in self.collect_stream(data_dir)]
+
+    async def collect_stream(self, data_dir: Path) -> AsyncIterator[dict[str, Any]]:
+        """
+        Collect wave model data, yielding metadata as each source completes.
+
+        Args:
+            data_dir: Directory to store collected data
+
+        Yields:
+            Metadata dictionaries
+        """
         # Use the provided data_dir directly (already agent-specific)
         model_dir = data_dir
 
-        # Get model URLs from config
+        # Get model URLs from config, plus constrained ERDDAP requests
         model_urls = self.config.get_data_source_urls("models").get("models", [])
+        model_urls = list(model_urls) + self._erddap_subset_urls()
 
         if not model_urls:
             self.logger.warning("No wave model URLs configured")
-            return []
+            return
 
         # Ensure HTTP client is available
         await self.ensure_http_client()
 
         # Create tasks for all model URLs
-        tasks = []
-        for url in model_urls:
-            tasks.append(self.process_model_url(url, model_dir))
+        tasks = [
+            asyncio.ensure_future(self.process_model_url(url, model_dir)) for url in model_urls
+        ]
 
-        # Execute all tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Yield results as they complete, skipping exceptions
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    result = await future
+                except Exception as e:
+                    self.logger.error(f"Error processing model data: {e}")
+                    continue
+                if isinstance(result, dict):
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _erddap_subset_urls(self) -> list[str]:
+        """
+        Build ERDDAP griddap requests from ``data_sources.models.subsets``.
 
-        # Filter out exceptions
-        metadata_list: list[dict[str, Any]] = []
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Error processing model data: {result}")
-            elif isinstance(result, dict):
-                metadata_list.append(result)
+        Each entry names a ``dataset`` URL and the ``variables`` to fetch, and
+        optionally ``time_steps`` (latest N steps) or ``time_range``,
+        ``latitude``/``longitude`` boxes, ``depth``, ``stride`` and ``axes``,
+        so the server returns only that hyperslab.
 
-        return metadata_list
+        Returns:
+            Request URLs for valid entries
+        """
+        models_config = self.config.get("data_sources", "models", {})
+        subsets = models_config.get("subsets", []) if isinstance(models_config, dict) else []
+
+        urls = []
+        for entry in subsets:
+            try:
+                urls.append(
+                    erddap_griddap_url(
+                        entry["dataset"],
+                        list(entry["variables"]),
+                        time_steps=int(entry.get("time_steps", 1)),
+                        time_range=entry.get("time_range"),
+                        latitude=entry.get("latitude"),
+                        longitude=entry.get("longitude"),
+                        depth=entry.get("depth"),
+                        stride=int(entry.get("stride", 1)),
+                        axes=tuple(entry.get("axes", ERDDAP_GRID_AXES)),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.error(f"Invalid ERDDAP subset configuration {entry!r}: {e}")
+        return urls
 
     async def process_model_url(self, url: str, model_dir: Path) -> dict[str, Any]:
         """
@@ -176,7 +247,7 @@ class ModelAgent(BaseAgent):
     ) -> dict[str, Any]:
         """Process a direct model data file URL."""
         # Generate filename from URL - handle query strings for ERDDAP
-        url_base = url.split("?")[0]  # Remove query string for filename
+        url_base, _, query = url.partition("?")
         base_filename = url_base.split("/")[-1]
 
         # Determine extension from URL pattern
@@ -195,6 +266,12 @@ class ModelAgent(BaseAgent):
         if extension and not base_filename.endswith(extension):
             base_filename = base_filename + extension
 
+        # Subsets of one dataset share a base URL; key the file by its constraint
+        if query:
+            stem, dot, suffix = base_filename.rpartition(".")
+            digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:8]
+            base_filename = f"{stem}_{digest}{dot}{suffix}" if dot else f"{suffix}_{digest}"
+
         filename = f"model_{model_type}_{location}_{base_filename}"
 
         # Download the data file
@@ -225,13 +302,17 @@ class ModelAgent(BaseAgent):
                     self.logger.warning(f"Failed to extract model metadata: {e}")
             elif data_type == "csv":
                 try:
-                    parsed_summary = self._parse_ww3_csv(Path(result.file_path))
+                    parsed_summary = await self.run_cpu_bound(
+                        self._parse_ww3_csv, Path(result.file_path)
+                    )
                 except Exception as e:  # pragma: no cover - defensive
                     self.logger.warning(f"Failed to parse WW3 CSV {url}: {e}")
             elif data_type == "bulletin" or model_type == "gfswave":
                 # Parse GFS-Wave station bulletin files
                 try:
-                    parsed_summary = self._parse_gfswave_bull(Path(result.file_path))
+                    parsed_summary = await self.run_cpu_bound(
+                        self._parse_gfswave_bull, Path(result.file_path)
+                    )
                     # Extract key metadata for quick access
                     if parsed_summary.get("metadata"):
                         model_metadata = {
@@ -550,206 +631,186 @@ class ModelAgent(BaseAgent):
         Supports two formats:
         1. NOMADS point output: time,Hs,Tp,Dp (with # comments)
         2. ERDDAP gridded output: time,depth,latitude,longitude,Thgt,Tper,Tdir,shgt,sper,sdir (with units row)
+
+        Only the columns used by the summary are read, straight into typed
+        NumPy arrays; ERDDAP grids are aggregated per time step with
+        vectorized group-by reductions.
         """
         summary: dict[str, Any] = {"rows": 0, "events": [], "format": "unknown"}
 
         if not file_path.exists():
             return summary
 
+        raw = file_path.read_bytes()
         header: list[str] | None = None
-        records: list[dict[str, str]] = []
         station_meta: dict[str, Any] = {}
-        is_erddap = False
-        units_row_found = False
-
-        with open(file_path, encoding="utf-8", errors="ignore") as fh:
-            for raw_line in fh:
-                line = raw_line.strip()
-                if not line:
-                    continue
-
-                if line.startswith("#") or line.startswith("!"):
-                    # Capture metadata lines of the form "# KEY: value"
-                    cleaned = line.lstrip("#!").strip()
-                    if ":" in cleaned:
-                        key, value = (part.strip() for part in cleaned.split(":", 1))
-                        key_normalized = key.lower().replace(" ", "_")
-                        station_meta[key_normalized] = value
-                    continue
 
-                if header is None:
-                    header = [h.strip() for h in line.split(",") if h.strip()]
-
-                    # Detect ERDDAP format by column structure
-                    if "latitude" in header and "longitude" in header and "depth" in header:
-                        is_erddap = True
-                        summary["format"] = "erddap"
-                    else:
-                        summary["format"] = "nomads"
-                    continue
-
-                # Check if this is the units row (ERDDAP format)
-                if is_erddap and not units_row_found:
-                    # Units row has entries like "UTC", "m", "degrees_north", "degrees_east", "meters"
-                    if any(
-                        unit in line
-                        for unit in ["UTC", "degrees_north", "degrees_east", "meters", "m"]
-                    ):
-                        units_row_found = True
-                        continue
+        # Leading "# KEY: value" metadata, then the header row
+        position = 0
+        while header is None and position < len(raw):
+            end = raw.find(b"\n", position)
+            end = len(raw) if end < 0 else end
+            line = raw[position:end].strip()
+            position = end + 1
+            if not line:
+                continue
+            if line.startswith((b"#", b"!")):
+                _collect_csv_metadata(line, station_meta)
+                continue
+            header = [h.strip() for h in line.decode("utf-8", errors="ignore").split(",")]
+        body = raw[position:]
 
-                row = [value.strip() for value in line.split(",")]
-                if header and len(row) >= len(header):
-                    record = {header[i]: row[i] for i in range(len(header))}
-                    records.append(record)
+        # Comment lines between data rows carry metadata too
+        if _has_csv_comments(body):
+            for match in _CSV_COMMENT_RE.finditer(body):
+                _collect_csv_metadata(match.group(0), station_meta)
 
-        summary["rows"] = len(records)
         if station_meta:
             summary["metadata"] = station_meta
+        if header is None:
+            return summary
+
+        # Detect ERDDAP format by column structure
+        is_erddap = {"latitude", "longitude", "depth"} <= set(header)
+        summary["format"] = "erddap" if is_erddap else "nomads"
+
+        if is_erddap:
+            units_row = _CSV_FIRST_ROW_RE.search(body)
+            if units_row and _is_units_row(
+                units_row.group(1), header, ("depth", "latitude", "longitude")
+            ):
+                # ERDDAP .csv puts units ("UTC", "m", "degrees_north", ...) on the first row
+                units = units_row.group(1).decode("utf-8", errors="ignore").split(",")
+                summary["units"] = {
+                    name: unit.strip() for name, unit in zip(header, units, strict=False) if name
+                }
+                body = body[units_row.end() :]
+            rows, columns = _read_csv_columns(body, header, ERDDAP_NUMERIC_COLUMNS, ("time",))
+        else:
+            rows, columns = _read_csv_columns(
+                body, header, NOMADS_NUMERIC_COLUMNS, NOMADS_TIME_COLUMNS
+            )
 
-        if not records:
+        summary["rows"] = rows
+        if not rows:
             return summary
 
         if is_erddap:
             # ERDDAP format: aggregate grid points by time
-            return self._parse_erddap_records(records, summary)
-        else:
-            # NOMADS format: time-series at single point
-            return self._parse_nomads_records(records, summary)
+            return self._parse_erddap_columns(columns, rows, summary)
+        # NOMADS format: time-series at single point
+        return self._parse_nomads_columns(columns, summary)
 
-    def _parse_erddap_records(
-        self, records: list[dict[str, str]], summary: dict[str, Any]
+    def _parse_erddap_columns(
+        self, columns: dict[str, np.ndarray], rows: int, summary: dict[str, Any]
     ) -> dict[str, Any]:
-        """Parse ERDDAP gridded WW3 CSV records."""
-        # Group by time and aggregate statistics
-        time_groups: dict[str, list[dict[str, Any]]] = {}
+        """
+        Aggregate ERDDAP gridded WW3 columns per time step.
 
-        for record in records:
-            timestamp = record.get("time")
-            if not timestamp:
-                continue
+        Missing values (empty cells, NaN land points) are excluded from the
+        statistics but still count towards a time step's grid points.
+        """
+        timestamps = columns.get("time", np.zeros(rows, dtype="S1"))
+        has_time = timestamps != b""
+        if not has_time.any():
+            return summary
 
-            if timestamp not in time_groups:
-                time_groups[timestamp] = []
-
-            # Extract wave parameters (ERDDAP uses different names)
-            point_data = {
-                "lat": self._to_float(record.get("latitude")),
-                "lon": self._to_float(record.get("longitude")),
-                "depth": self._to_float(record.get("depth")),
-                "thgt": self._to_float(record.get("Thgt")),  # Total significant height
-                "tper": self._to_float(record.get("Tper")),  # Peak period
-                "tdir": self._to_float(record.get("Tdir")),  # Peak direction
-                "shgt": self._to_float(record.get("shgt")),  # Swell height
-                "sper": self._to_float(record.get("sper")),  # Swell period
-                "sdir": self._to_float(record.get("sdir")),  # Swell direction
-            }
-            time_groups[timestamp].append(point_data)
+        # Group rows by timestamp: unique() sorts, so groups are in time order
+        times, group = np.unique(timestamps[has_time], return_inverse=True)
+        order = np.argsort(group, kind="stable")
+        group_sizes = np.bincount(group, minlength=len(times))
+        starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
 
-        # Compute summary statistics across grid
-        events: list[dict[str, Any]] = []
-        all_thgt: list[float] = []
-        all_tper: list[float] = []
-        all_tdir: list[float] = []
-        all_shgt: list[float] = []
-
-        for timestamp in sorted(time_groups.keys())[:12]:  # Keep first 12 time steps
-            points = time_groups[timestamp]
-
-            # Extract valid values
-            thgt_vals = [p["thgt"] for p in points if p["thgt"] is not None]
-            tper_vals = [p["tper"] for p in points if p["tper"] is not None]
-            tdir_vals = [p["tdir"] for p in points if p["tdir"] is not None]
-            shgt_vals = [p["shgt"] for p in points if p["shgt"] is not None]
-
-            all_thgt.extend(thgt_vals)
-            all_tper.extend(tper_vals)
-            all_tdir.extend(tdir_vals)
-            all_shgt.extend(shgt_vals)
-
-            if thgt_vals:
-                event = {
-                    "timestamp": timestamp,
-                    "thgt_mean_m": sum(thgt_vals) / len(thgt_vals),
-                    "thgt_max_m": max(thgt_vals),
-                    "thgt_min_m": min(thgt_vals),
-                    "grid_points": len(points),
-                }
+        # Keep first 12 time steps
+        kept = min(len(times), 12)
+        in_window = group[order] < kept
+
+        stats: dict[str, dict[str, np.ndarray]] = {}
+        window: dict[str, np.ndarray] = {}
+        for key, name in [("thgt", "Thgt"), ("tper", "Tper"), ("tdir", "Tdir"), ("shgt", "shgt")]:
+            values = _float_column(columns, name, rows)[has_time][order]
+            valid = ~np.isnan(values)
+            stats[key] = _grouped_stats(values, valid, starts)
+            window[key] = values[valid & in_window]
 
-                if tper_vals:
-                    event["tper_mean_s"] = sum(tper_vals) / len(tper_vals)
-                if tdir_vals:
-                    event["tdir_mean_deg"] = sum(tdir_vals) / len(tdir_vals)
-                if shgt_vals:
-                    event["shgt_mean_m"] = sum(shgt_vals) / len(shgt_vals)
-
-                events.append(event)
-
-        # Overall statistics
-        if all_thgt:
-            summary["total_height_max_m"] = max(all_thgt)
-            summary["total_height_min_m"] = min(all_thgt)
-            summary["total_height_mean_m"] = sum(all_thgt) / len(all_thgt)
-        if all_tper:
-            summary["peak_period_range_s"] = [min(all_tper), max(all_tper)]
-        if all_tdir:
-            summary["peak_direction_range_deg"] = [min(all_tdir), max(all_tdir)]
-        if all_shgt:
-            summary["swell_height_max_m"] = max(all_shgt)
-            summary["swell_height_mean_m"] = sum(all_shgt) / len(all_shgt)
+        events: list[dict[str, Any]] = []
+        for index in range(kept):
+            if not stats["thgt"]["count"][index]:
+                continue
+            event = {
+                "timestamp": times[index].decode("utf-8", errors="ignore"),
+                "thgt_mean_m": float(stats["thgt"]["mean"][index]),
+                "thgt_max_m": float(stats["thgt"]["max"][index]),
+                "thgt_min_m": float(stats["thgt"]["min"][index]),
+                "grid_points": int(group_sizes[index]),
+            }
+            for key, field in [
+                ("tper", "tper_mean_s"),
+                ("tdir", "tdir_mean_deg"),
+                ("shgt", "shgt_mean_m"),
+            ]:
+                if stats[key]["count"][index]:
+                    event[field] = float(stats[key]["mean"][index])
+            events.append(event)
+
+        # Overall statistics across the kept time steps
+        if window["thgt"].size:
+            summary["total_height_max_m"] = float(window["thgt"].max())
+            summary["total_height_min_m"] = float(window["thgt"].min())
+            summary["total_height_mean_m"] = float(window["thgt"].mean())
+        if window["tper"].size:
+            summary["peak_period_range_s"] = [
+                float(window["tper"].min()),
+                float(window["tper"].max()),
+            ]
+        if window["tdir"].size:
+            summary["peak_direction_range_deg"] = [
+                float(window["tdir"].min()),
+                float(window["tdir"].max()),
+            ]
+        if window["shgt"].size:
+            summary["swell_height_max_m"] = float(window["shgt"].max())
+            summary["swell_height_mean_m"] = float(window["shgt"].mean())
 
         summary["events"] = events
-        summary["time_steps"] = len(time_groups)
-        summary["grid_points_per_time"] = len(records) // len(time_groups) if time_groups else 0
+        summary["time_steps"] = len(times)
+        summary["grid_points_per_time"] = rows // len(times)
 
         return summary
 
-    def _parse_nomads_records(
-        self, records: list[dict[str, str]], summary: dict[str, Any]
+    def _parse_nomads_columns(
+        self, columns: dict[str, np.ndarray], summary: dict[str, Any]
     ) -> dict[str, Any]:
-        """Parse NOMADS point WW3 CSV records (legacy format)."""
-        hs_values: list[float] = []
-        tp_values: list[float] = []
-        dp_values: list[float] = []
+        """Summarise NOMADS point WW3 columns (legacy format)."""
+        rows = summary["rows"]
+        hs = _float_column(columns, ("Hs", "Significant Wave Height"), rows)
+        tp = _float_column(columns, ("Tp", "Peak Period"), rows)
+        dp = _float_column(columns, ("Dp", "Peak Direction"), rows)
+        timestamps = _text_column(columns, NOMADS_TIME_COLUMNS, rows)
+
+        valid_hs = hs[~np.isnan(hs)]
+        if valid_hs.size:
+            summary["significant_height_max"] = float(valid_hs.max())
+            summary["significant_height_min"] = float(valid_hs.min())
+        for values, key in [(tp, "peak_period_range"), (dp, "peak_direction_range")]:
+            valid = values[~np.isnan(values)]
+            if valid.size:
+                summary[key] = [float(valid.min()), float(valid.max())]
+
+        # keep first dozen entries for downstream prompts
         events: list[dict[str, Any]] = []
-
-        for record in records:
-            hs = self._to_float(record.get("Hs") or record.get("Significant Wave Height"))
-            tp = self._to_float(record.get("Tp") or record.get("Peak Period"))
-            dp = self._to_float(record.get("Dp") or record.get("Peak Direction"))
-            timestamp = record.get("time") or record.get("Time") or record.get("Date")
-
-            if hs is not None:
-                hs_values.append(hs)
-            if tp is not None:
-                tp_values.append(tp)
-            if dp is not None:
-                dp_values.append(dp)
-
-            if timestamp:
-                event = {"timestamp": timestamp, "hs_m": hs, "tp_s": tp, "dp_deg": dp}
-                events.append(event)
-
-        if hs_values:
-            summary["significant_height_max"] = max(hs_values)
-            summary["significant_height_min"] = min(hs_values)
-        if tp_values:
-            summary["peak_period_range"] = [min(tp_values), max(tp_values)]
-        if dp_values:
-            summary["peak_direction_range"] = [min(dp_values), max(dp_values)]
-
-        summary["events"] = events[:12]  # keep first dozen entries for downstream prompts
+        for index in np.flatnonzero(timestamps != b"")[:12]:
+            events.append(
+                {
+                    "timestamp": timestamps[index].decode("utf-8", errors="ignore"),
+                    "hs_m": _optional_float(hs[index]),
+                    "tp_s": _optional_float(tp[index]),
+                    "dp_deg": _optional_float(dp[index]),
+                }
+            )
+        summary["events"] = events
         return summary
 
-    @staticmethod
-    def _to_float(value: str | None) -> float | None:
-        try:
-            if value is None or value == "":
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
     def _parse_gfswave_bull(self, file_path: Path) -> dict[str, Any]:
         """
         Parse GFS-Wave station bulletin file into structured summary.
@@ -941,3 +1002,178 @@ class ModelAgent(BaseAgent):
                 summary["forecast_days"] = last_day - first_day + 1
 
         return summary
+
+
+def _collect_csv_metadata(line: bytes, station_meta: dict[str, Any]) -> None:
+    """Record a "# KEY: value" comment line."""
+    cleaned = line.decode("utf-8", errors="ignore").strip().lstrip("#!").strip()
+    if ":" in cleaned:
+        key, value = (part.strip() for part in cleaned.split(":", 1))
+        station_meta[key.lower().replace(" ", "_")] = value
+
+
+def _has_csv_comments(body: bytes) -> bool:
+    return b"#" in body or b"!" in body
+
+
+def _is_units_row(row: bytes, header: list[str], names: Sequence[str]) -> bool:
+    """Whether a row holds units rather than numbers in the given columns."""
+    cells = row.split(b",")
+    for name in names:
+        index = header.index(name) if name in header else len(cells)
+        cell = cells[index].strip() if index < len(cells) else b""
+        if cell:
+            try:
+                float(cell)
+            except ValueError:
+                return True
+    return False
+
+
+def _read_csv_columns(
+    body: bytes, header: list[str], numeric: Sequence[str], text: Sequence[str]
+) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Read selected CSV columns into typed arrays.
+
+    Numeric columns become float64 (NaN for empty or malformed cells) and text
+    columns stripped bytes; columns missing from the header are omitted.
+    Blank and comment lines are skipped, rows with fewer cells than the header
+    are dropped and extra cells ignored.
+
+    Args:
+        body: CSV data rows (after the header)
+        header: Column names
+        numeric: Numeric columns to read
+        text: Text columns to read
+
+    Returns:
+        (row count, column name -> array)
+    """
+    positions = {name: index for index, name in enumerate(header)}
+    wanted = [
+        (name, positions[name], name in text) for name in (*text, *numeric) if name in positions
+    ]
+    # Drop comment lines up front so the parser below stays on its C path
+    if _has_csv_comments(body):
+        body = _CSV_COMMENT_RE.sub(b"", body)
+    if not body.strip():
+        return 0, {}
+
+    try:
+        # Fast path: one C parsing pass over a well-formed block. Reading the
+        # last header column too makes short rows fail over to the slow path.
+        table = np.loadtxt(
+            io.BytesIO(body),
+            delimiter=",",
+            comments=None,
+            usecols=[index for _, index, _ in wanted] + [len(header) - 1],
+            dtype=[
+                (f"c{i}", "S64" if is_text else "f8") for i, (_, _, is_text) in enumerate(wanted)
+            ]
+            + [("last", "S1")],
+            ndmin=1,
+        )
+    except ValueError:
+        return _split_csv_columns(body, header, wanted)
+
+    columns = {
+        name: _compact_text(table[f"c{i}"]) if is_text else table[f"c{i}"]
+        for i, (name, _, is_text) in enumerate(wanted)
+    }
+    return len(table), columns
+
+
+def _split_csv_columns(
+    body: bytes, header: list[str], wanted: list[tuple[str, int, bool]]
+) -> tuple[int, dict[str, np.ndarray]]:
+    """Column-wise fallback for ragged rows or empty numeric cells."""
+    width = len(header)
+    cells = [
+        cell
+        for line in body.splitlines()
+        if line.strip() and line.count(b",") >= width - 1
+        for cell in line.split(b",")[:width]
+    ]
+    columns = {}
+    for name, index, is_text in wanted:
+        values = np.array(cells[index::width], dtype=bytes)
+        columns[name] = _compact_text(values) if is_text else _to_float_array(np.char.strip(values))
+    return len(cells) // width, columns
+
+
+def _compact_text(values: np.ndarray) -> np.ndarray:
+    """Strip a bytes column and narrow it to its longest cell."""
+    values = np.char.strip(values)
+    width = int(np.char.str_len(values).max()) if values.size else 0
+    return values.astype(f"S{max(width, 1)}")
+
+
+def _to_float_array(values: np.ndarray) -> np.ndarray:
+    """Convert a bytes column to float64; empty or malformed cells become NaN."""
+    try:
+        return values.astype(np.float64)
+    except ValueError:
+        pass
+    result = np.full(values.shape, np.nan)
+    filled = values != b""
+    try:
+        result[filled] = values[filled].astype(np.float64)
+    except ValueError:
+        for index in np.flatnonzero(filled):
+            try:
+                result[index] = float(values[index])
+            except ValueError:
+                continue
+    return result
+
+
+def _float_column(
+    columns: dict[str, np.ndarray], names: str | Sequence[str], rows: int
+) -> np.ndarray:
+    """First numeric value per row among alternative column names (NaN if none)."""
+    result = np.full(rows, np.nan)
+    for name in (names,) if isinstance(names, str) else names:
+        if name in columns:
+            missing = np.isnan(result)
+            result[missing] = columns[name][missing]
+    return result
+
+
+def _text_column(columns: dict[str, np.ndarray], names: Sequence[str], rows: int) -> np.ndarray:
+    """First non-empty cell per row among alternative column names."""
+    result = np.zeros(rows, dtype="S1")
+    for name in names:
+        if name in columns:
+            result = np.where(result == b"", columns[name], result)
+    return result
+
+
+def _grouped_stats(
+    values: np.ndarray, valid: np.ndarray, starts: np.ndarray
+) -> dict[str, np.ndarray]:
+    """
+    Count, mean, max and min of valid values per contiguous group.
+
+    Args:
+        values: Values sorted by group
+        valid: Mask of values to include
+        starts: Start index of each (non-empty) group
+
+    Returns:
+        Per-group arrays; mean/max/min are NaN or +/-inf for groups with no valid values
+    """
+    count = np.add.reduceat(valid.astype(np.intp), starts)
+    total = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+    return {
+        "count": count,
+        "mean": mean,
+        "max": np.maximum.reduceat(np.where(valid, values, -np.inf), starts),
+        "min": np.minimum.reduceat(np.where(valid, values, np.inf), starts),
+    }
+
+
+def _optional_float(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
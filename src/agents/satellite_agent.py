@@ -5,6 +5,7 @@ Satellite Agent for collecting satellite imagery from NOAA, NASA, and other sour
 import asyncio
 import logging
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -40,6 +41,18 @@ class SatelliteAgent(BaseAgent):
         Returns:
             List of metadata dictionaries
         """
+        return [item async for item in self.collect_stream(data_dir)]
+
+    async def collect_stream(self, data_dir: Path) -> AsyncIterator[dict[str, Any]]:
+        """
+        Collect satellite imagery, yielding metadata as each frame completes.
+
+        Args:
+            data_dir: Directory to store collected data
+
+        Yields:
+            Metadata dictionaries
+        """
         # Create satellite data directory
         satellite_dir = data_dir / "satellite"
         satellite_dir.mkdir(exist_ok=True)
@@ -49,28 +62,30 @@ class SatelliteAgent(BaseAgent):
 
         if not satellite_urls:
             self.logger.warning("No satellite URLs configured")
-            return []
+            return
 
         # Ensure HTTP client is available
         await self.ensure_http_client()
 
         # Create tasks for all satellite URLs
-        tasks = []
-        for url in satellite_urls:
-            tasks.append(self.process_satellite_url(url, satellite_dir))
-
-        # Execute all tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out exceptions
-        metadata_list = []
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Error processing satellite data: {result}")
-            elif result:
-                metadata_list.append(result)
-
-        return metadata_list
+        tasks = [
+            asyncio.ensure_future(self.process_satellite_url(url, satellite_dir))
+            for url in satellite_urls
+        ]
+
+        # Yield results as they complete, skipping exceptions
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    result = await future
+                except Exception as e:
+                    self.logger.error(f"Error processing satellite data: {e}")
+                    continue
+                if result:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def process_satellite_url(self, url: str, satellite_dir: Path) -> dict[str, Any]:
         """
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from .bundle_manager import BundleManager
 from .config import Config, load_config
+from .http_cache import HTTPValidatorCache
 from .http_client import DownloadResult, HTTPClient
 from .metadata_tracker import MetadataTracker
 from .rate_limiter import RateLimitConfig, RateLimiter, TokenBucket
@@ -16,6 +17,7 @@ __all__ = [
     "load_config",
     "HTTPClient",
     "DownloadResult",
+    "HTTPValidatorCache",
     "RateLimiter",
     "TokenBucket",
     "RateLimitConfig",
@@ -0,0 +1,137 @@
+"""
+Content-addressed blob store for cross-bundle deduplication.
+
+Files are stored once under their SHA-256 digest and bundles reference them
+through hard links, so identical downloads in consecutive collection runs
+share a single copy on disk. Blobs are reclaimed once no bundle manifest
+references them.
+"""
+
+import hashlib
+import logging
+import os
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStore:
+    """
+    Stores file contents keyed by SHA-256 digest.
+
+    Features:
+    - Two-level fan-out layout (``<root>/<digest[:2]>/<digest>``)
+    - Ingests bundle files in place by swapping them for hard links
+    - Garbage collection against an externally computed set of live digests
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Initialize the blob store.
+
+        Args:
+            root: Directory holding the blobs (created on first ingest)
+        """
+        self.root = Path(root)
+        self.logger = logging.getLogger("blob_store")
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        """Compute the SHA-256 digest of a file."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the blob for a digest."""
+        return self.root / digest[:2] / digest
+
+    def ingest(self, path: Path) -> tuple[str | None, int]:
+        """
+        Move a file's content into the store and leave a hard link in its place.
+
+        If a blob with the same content already exists, the file is replaced
+        by a link to it and its own copy is freed. Otherwise the file becomes
+        the blob. When the filesystem does not support hard links the file
+        is left untouched and not tracked.
+
+        Args:
+            path: File to ingest
+
+        Returns:
+            Tuple of (digest or None if not stored, bytes reclaimed)
+        """
+        try:
+            digest = self.hash_file(path)
+            blob = self.blob_path(digest)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+
+            if not blob.exists():
+                os.link(path, blob)
+                return digest, 0
+
+            if os.path.samefile(path, blob):
+                return digest, 0
+
+            size = path.stat().st_size
+            self._replace_with_link(blob, path)
+            return digest, size
+        except OSError as e:
+            self.logger.warning(f"Could not deduplicate {path}: {e}")
+            return None, 0
+
+    def collect_garbage(self, live_digests: Iterable[str]) -> tuple[int, int]:
+        """
+        Remove blobs that are not referenced by any live digest.
+
+        Bundle files are separate hard links, so removing a blob never
+        deletes data a bundle still holds.
+
+        Args:
+            live_digests: Digests referenced by remaining bundles
+
+        Returns:
+            Tuple of (blobs removed, bytes freed)
+        """
+        if not self.root.exists():
+            return 0, 0
+
+        live = set(live_digests)
+        removed = 0
+        freed = 0
+        for blob in self.root.glob("*/*"):
+            if blob.name in live or not blob.is_file():
+                continue
+            try:
+                stat = blob.stat()
+                blob.unlink()
+            except OSError as e:
+                self.logger.warning(f"Failed to remove blob {blob.name}: {e}")
+                continue
+            removed += 1
+            # Only the last link actually returns space to the filesystem
+            if stat.st_nlink <= 1:
+                freed += stat.st_size
+
+        for fan_out_dir in self.root.iterdir():
+            if fan_out_dir.is_dir() and not any(fan_out_dir.iterdir()):
+                fan_out_dir.rmdir()
+
+        if removed:
+            self.logger.info(f"Removed {removed} unreferenced blob(s), freed {freed} bytes")
+        return removed, freed
+
+    @staticmethod
+    def _replace_with_link(source: Path, target: Path) -> None:
+        """Atomically replace ``target`` with a hard link to ``source``."""
+        temp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}.link")
+        os.link(source, temp_path)
+        try:
+            temp_path.replace(target)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
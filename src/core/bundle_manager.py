@@ -5,17 +5,35 @@ import logging
 import shutil
 import tempfile
 import zipfile
+from collections import Counter
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from ..utils.exceptions import SecurityError
+from .blob_store import BlobStore
 
 # Security constants for archive extraction
 MAX_ARCHIVE_FILE_SIZE = 100 * 1024 * 1024  # 100MB per file
 MAX_ARCHIVE_TOTAL_SIZE = 1024 * 1024 * 1024  # 1GB total
 MAX_COMPRESSION_RATIO = 100  # Zip bomb detection
 
+# Content-addressed store shared by all bundles
+BLOB_DIRNAME = "blobs"
+
+# Top-level directories under the data root that are not bundles
+RESERVED_DIRS = frozenset({"temp", "archive", "cache", BLOB_DIRNAME})
+
+# Append-only record of collected files, written by DataCollector as agents produce them
+JOURNAL_FILENAME = "metadata_journal.jsonl"
+
+# Per-bundle map of relative file path -> blob digest
+MANIFEST_FILENAME = "blob_manifest.json"
+
+# Bundle subdirectories and files that are rewritten after collection and never deduplicated
+_DEDUP_EXCLUDED_DIRS = frozenset({"processed"})
+_DEDUP_EXCLUDED_FILES = frozenset({"metadata.json"})
+
 
 class BundleManager:
     """
@@ -26,6 +44,7 @@ class BundleManager:
     - Provides access to bundle metadata
     - Handles bundle cleanup and archiving
     - Supports operations on multiple bundles
+    - Deduplicates downloaded files across bundles via a content-addressed blob store
     """
 
     def __init__(self, data_dir: str | Path):
@@ -38,6 +57,7 @@ class BundleManager:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger("bundle_manager")
+        self.blob_store = BlobStore(self.data_dir / BLOB_DIRNAME)
 
     def _write_latest_bundle_atomic(self, bundle_id: str | None) -> None:
         """
@@ -101,9 +121,7 @@ class BundleManager:
 
             # Fall back to finding the most recent bundle directory
             bundles = [
-                d
-                for d in self.data_dir.iterdir()
-                if d.is_dir() and d.name != "temp" and d.name != "archive"
+                d for d in self.data_dir.iterdir() if d.is_dir() and d.name not in RESERVED_DIRS
             ]
 
             if not bundles:
@@ -184,7 +202,7 @@ class BundleManager:
 
         # Find all bundle directories
         for item in self.data_dir.iterdir():
-            if item.is_dir() and item.name != "temp" and item.name != "archive":
+            if item.is_dir() and item.name not in RESERVED_DIRS:
                 processed_fused = item / "processed" / "fused_forecast.json"
                 is_complete = processed_fused.exists()
                 if not include_incomplete and not is_complete:
@@ -287,7 +305,7 @@ class BundleManager:
                     # Remove the bundle
                     bundle_id = bundle.get("bundle_id")
                     if bundle_id:
-                        self._remove_bundle(bundle_id)
+                        self._remove_bundle(bundle_id, collect_garbage=False)
                         removed_count += 1
             except (ValueError, TypeError):
                 # If timestamp is invalid, check file modification time
@@ -297,9 +315,12 @@ class BundleManager:
                     if bundle_path.exists():
                         mtime = datetime.fromtimestamp(bundle_path.stat().st_mtime, tz=UTC)
                         if mtime < cutoff_time:
-                            self._remove_bundle(bundle_id)
+                            self._remove_bundle(bundle_id, collect_garbage=False)
                             removed_count += 1
 
+        if removed_count:
+            self.collect_garbage()
+
         self.logger.info(f"Cleaned up {removed_count} old bundles")
         return removed_count
 
@@ -345,20 +366,25 @@ class BundleManager:
                     bundle_time = datetime.fromtimestamp(bundle_path.stat().st_mtime, tz=UTC)
 
             if bundle_time and bundle_time < cutoff_time:
-                if self._remove_bundle(bundle_id):
+                if self._remove_bundle(bundle_id, collect_garbage=False):
                     removed.append(bundle)
 
         if removed:
+            self.collect_garbage()
             self.logger.info("Removed %d bundle(s) older than %d days", len(removed), days)
 
         return removed
 
-    def _remove_bundle(self, bundle_id: str) -> bool:
+    def _remove_bundle(self, bundle_id: str, collect_garbage: bool = True) -> bool:
         """
         Remove a specific bundle.
 
+        Deduplicated files are hard links, so removing the directory only drops
+        this bundle's references; shared blobs are reclaimed by collect_garbage().
+
         Args:
             bundle_id: Bundle ID to remove
+            collect_garbage: Release blobs no longer referenced by any bundle
 
         Returns:
             True if bundle was removed, False otherwise
@@ -368,12 +394,113 @@ class BundleManager:
             try:
                 shutil.rmtree(bundle_path)
                 self.logger.info(f"Removed bundle: {bundle_id}")
+                if collect_garbage:
+                    self.collect_garbage()
                 return True
             except Exception as e:
                 self.logger.error(f"Error removing bundle {bundle_id}: {e}")
 
         return False
 
+    def deduplicate_bundle(self, bundle_id: str) -> dict[str, Any]:
+        """
+        Move a bundle's downloaded files into the blob store and record a manifest.
+
+        Each file is replaced by a hard link to the blob holding its content, so
+        files identical to ones in earlier bundles no longer take extra space.
+        Top-level metadata, agent ``metadata.json`` files and processed outputs
+        are left alone because they are rewritten after collection.
+
+        Args:
+            bundle_id: Bundle ID to deduplicate
+
+        Returns:
+            Dictionary with files, deduplicated and bytes_saved counts
+        """
+        stats = {"files": 0, "deduplicated": 0, "bytes_saved": 0}
+        bundle_path = self.get_bundle_path(bundle_id)
+        if bundle_path is None:
+            self.logger.warning(f"Bundle not found: {bundle_id}")
+            return stats
+
+        manifest: dict[str, str] = {}
+        for agent_dir in sorted(bundle_path.iterdir()):
+            if not agent_dir.is_dir() or agent_dir.name in _DEDUP_EXCLUDED_DIRS:
+                continue
+            for file_path in sorted(agent_dir.rglob("*")):
+                if not file_path.is_file() or file_path.name in _DEDUP_EXCLUDED_FILES:
+                    continue
+                digest, saved = self.blob_store.ingest(file_path)
+                if digest is None:
+                    continue
+                manifest[str(file_path.relative_to(bundle_path))] = digest
+                stats["files"] += 1
+                if saved:
+                    stats["deduplicated"] += 1
+                    stats["bytes_saved"] += saved
+
+        self._write_json_atomic(bundle_path / MANIFEST_FILENAME, {"version": 1, "files": manifest})
+        self.logger.info(
+            f"Deduplicated bundle {bundle_id}: {stats['deduplicated']}/{stats['files']} "
+            f"files shared, {stats['bytes_saved']} bytes saved"
+        )
+        return stats
+
+    def get_bundle_manifest(self, bundle_id: str) -> dict[str, str]:
+        """
+        Get the blob manifest (relative path -> digest) for a bundle.
+
+        Args:
+            bundle_id: Bundle ID
+
+        Returns:
+            Manifest mapping, empty if the bundle was never deduplicated
+        """
+        manifest_path = self.data_dir / bundle_id / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.error(f"Invalid blob manifest {manifest_path}: {e}")
+            return {}
+        files = manifest.get("files", {}) if isinstance(manifest, dict) else {}
+        return files if isinstance(files, dict) else {}
+
+    def blob_reference_counts(self) -> Counter:
+        """
+        Count references to each blob across all bundle manifests.
+
+        Returns:
+            Counter mapping digest -> number of bundle files referencing it
+        """
+        counts: Counter = Counter()
+        for item in self.data_dir.iterdir():
+            if item.is_dir() and item.name not in RESERVED_DIRS:
+                counts.update(self.get_bundle_manifest(item.name).values())
+        return counts
+
+    def collect_garbage(self) -> int:
+        """
+        Remove blobs whose reference count across bundle manifests has dropped to zero.
+
+        Returns:
+            Number of blobs removed
+        """
+        counts = self.blob_reference_counts()
+        removed, _ = self.blob_store.collect_garbage(
+            digest for digest, count in counts.items() if count > 0
+        )
+        return removed
+
+    def _write_json_atomic(self, path: Path, payload: Any) -> None:
+        """Write JSON via temp file + rename."""
+        with tempfile.NamedTemporaryFile(mode="w", dir=path.parent, delete=False) as tf:
+            json.dump(payload, tf, indent=2)
+            temp_path = Path(tf.name)
+        temp_path.replace(path)
+
     def archive_bundle(self, bundle_id: str) -> bool:
         """
         Archive a bundle to save space.
@@ -405,8 +532,9 @@ class BundleManager:
                 base_dir=bundle_id,
             )
 
-            # Remove original bundle directory
+            # Remove original bundle directory; the zip holds full copies of shared blobs
             shutil.rmtree(bundle_path)
+            self.collect_garbage()
 
             self.logger.info(f"Archived bundle {bundle_id} to {archive_file}")
             return True
@@ -596,6 +724,13 @@ class BundleManager:
             except json.JSONDecodeError:
                 self.logger.error(f"Invalid JSON in all_metadata.json: {metadata_path}")
 
+        # Interrupted streaming collections leave only the journal behind
+        journal_path = bundle_path / JOURNAL_FILENAME
+        if journal_path.exists():
+            records = self._read_journal(journal_path)
+            if records:
+                return records
+
         # Fall back to scanning the bundle directory
         files = []
         for agent_dir in bundle_path.iterdir():
@@ -618,6 +753,28 @@ class BundleManager:
 
         return files
 
+    def _read_journal(self, journal_path: Path) -> list[dict[str, Any]]:
+        """
+        Read file records from a collection journal, skipping a torn final line.
+
+        Args:
+            journal_path: Path to the metadata journal
+
+        Returns:
+            List of file metadata records
+        """
+        records = []
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Skipping truncated journal entry in {journal_path}")
+                    continue
+                if isinstance(entry, dict) and "record" in entry:
+                    records.append(entry["record"])
+        return records
+
     def get_bundle_file(self, bundle_id: str, file_path: str) -> Path | None:
         """
         Get path to a specific file within a bundle.
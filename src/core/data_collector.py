@@ -3,14 +3,17 @@ Data Collector for orchestrating data collection from multiple agents.
 """
 
 import asyncio
+import inspect
 import json
 import logging
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from ..agents.altimetry_agent import AltimetryAgent
+from ..agents.base_agent import BaseAgent
 from ..agents.buoy_agent import BuoyAgent
 from ..agents.cdip_agent import CDIPAgent
 from ..agents.chart_agent import ChartAgent
@@ -23,9 +26,66 @@ from ..agents.tide_agent import TideAgent
 from ..agents.tropical_agent import TropicalAgent
 from ..agents.upper_air_agent import UpperAirAgent
 from ..agents.weather_agent import WeatherAgent
+from .bundle_manager import JOURNAL_FILENAME, RESERVED_DIRS
 from .config import Config
+from .http_cache import create_http_cache
 from .http_client import HTTPClient
 
+AgentCompleteCallback = Callable[[str, dict[str, Any]], Awaitable[None] | None]
+
+
+def _safe_size_bytes(entry: dict[str, Any]) -> int:
+    value = entry.get("size_bytes", 0)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _agent_stats(counter: dict[str, int]) -> dict[str, Any]:
+    """Build the per-agent statistics dict from running counters."""
+    total = counter["total"]
+    successful = counter["successful"]
+    return {
+        "total": total,
+        "successful": successful,
+        "failed": total - successful,
+        "success_rate": round(successful / total * 100, 1) if total > 0 else 0,
+        "total_size_bytes": counter["total_size_bytes"],
+    }
+
+
+class _JsonArrayWriter:
+    """
+    Incrementally writes a JSON array to a temp file, renaming it into place on close.
+
+    Keeps only the open file handle in memory, regardless of how many items
+    are written. An unclosed writer leaves no file at the final path.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._temp_path = path.with_name(path.name + ".partial")
+        self._fh = None
+        self._count = 0
+
+    def write(self, item: dict[str, Any]) -> None:
+        if self._fh is None:
+            self._fh = open(self._temp_path, "w", encoding="utf-8")
+            self._fh.write("[\n")
+        elif self._count:
+            self._fh.write(",\n")
+        self._fh.write(json.dumps(item, indent=2))
+        self._count += 1
+
+    def close(self) -> None:
+        if self._fh is None:
+            self._fh = open(self._temp_path, "w", encoding="utf-8")
+            self._fh.write("[")
+        self._fh.write("\n]" if self._count else "]")
+        self._fh.close()
+        self._temp_path.replace(self.path)
+
 
 class DataCollector:
     """
@@ -116,14 +176,28 @@ class DataCollector:
                 retry_attempts=self.config.getint("data_collection", "retry_attempts", 3),
                 user_agent=self.config.get("data_collection", "user_agent", "SurfCastAI/1.0"),
                 output_dir=self.data_dir,
+                cache=create_http_cache(self.config),
             )
 
-    async def collect_data(self, region: str | None = None) -> dict[str, Any]:
+    async def collect_data(
+        self,
+        region: str | None = None,
+        on_agent_complete: AgentCompleteCallback | None = None,
+    ) -> dict[str, Any]:
         """
         Collect data from all configured agents.
 
+        In streaming mode (data_collection.streaming, the default) each agent's
+        file records flow through a bounded queue into an on-disk journal, so
+        memory use does not grow with the number of collected files and a crash
+        mid-run leaves a partially usable bundle behind.
+
         Args:
             region: Optional region to focus on (e.g., 'Hawaii', 'North Pacific')
+            on_agent_complete: Optional callback (sync or async) invoked with
+                (agent_name, stats) as soon as each agent finishes, so downstream
+                work can start before slower agents complete (streaming mode only).
+                Each call runs as its own task; collection waits for them before returning
 
         Returns:
             Dictionary with collection results and metadata
@@ -133,6 +207,7 @@ class DataCollector:
             "total_files": 0,
             "successful_files": 0,
             "failed_files": 0,
+            "failed_agents": [],
             "agents": {},
             "total_size_bytes": 0,
         }
@@ -151,43 +226,44 @@ class DataCollector:
         await self._ensure_http_client()
 
         # Execute all agents
-        agent_results = {}
-        all_metadata = []
+        agent_results: dict[str, Any] = {}
+        all_metadata: list[dict[str, Any]] | None = None
+        streaming = self.config.getboolean("data_collection", "streaming", True)
+
+        def _bundle_metadata(status: str) -> dict[str, Any]:
+            return {
+                "bundle_id": bundle_id,
+                "timestamp": bundle_time,
+                "region": region,
+                "collection_status": status,
+                "agent_results": agent_results,
+                "stats": {
+                    "total_files": run_stats["total_files"],
+                    "successful_files": run_stats["successful_files"],
+                    "failed_files": run_stats["failed_files"],
+                    "failed_agents": run_stats["failed_agents"],
+                    "total_size_mb": round(run_stats["total_size_bytes"] / (1024 * 1024), 2),
+                },
+            }
 
         try:
-            # Create tasks for all agents
-            tasks = []
             for agent_name, agent in self.agents.items():
                 self.logger.info(f"Starting agent: {agent_name}")
                 # Pass the HTTP client to the agent
                 agent.http_client = self.http_client
-                tasks.append(self._run_agent(agent_name, agent, bundle_dir))
-
-            # Execute all tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for i, (agent_name, result) in enumerate(
-                zip(self.agents.keys(), results, strict=False)
-            ):
-                if isinstance(result, Exception):
-                    self.logger.error(f"Error in agent {agent_name}: {result}")
-                    agent_results[agent_name] = {
-                        "status": "error",
-                        "error": str(result),
-                        "files_collected": 0,
-                    }
-                else:
-                    metadata, stats = result
-                    agent_results[agent_name] = stats
-                    all_metadata.extend(metadata)
-
-                    # Update run statistics
-                    run_stats["total_files"] += stats["total"]
-                    run_stats["successful_files"] += stats["successful"]
-                    run_stats["failed_files"] += stats["failed"]
-                    run_stats["total_size_bytes"] += stats["total_size_bytes"]
-                    run_stats["agents"][agent_name] = stats
+                if isinstance(agent, BaseAgent):
+                    agent.reset_cpu_stats()
+
+            if streaming:
+                await self._collect_streaming(
+                    bundle_dir,
+                    agent_results,
+                    run_stats,
+                    lambda: self._save_bundle_metadata(bundle_dir, _bundle_metadata("in_progress")),
+                    on_agent_complete,
+                )
+            else:
+                all_metadata = await self._collect_batch(bundle_dir, agent_results, run_stats)
 
         finally:
             # Close HTTP client
@@ -195,19 +271,14 @@ class DataCollector:
                 await self.http_client.close()
                 self.http_client = None
 
+        # Share files identical to earlier bundles through the blob store
+        if self.config.getboolean("data_collection", "deduplicate_bundles", True):
+            dedup_stats = await asyncio.to_thread(self._deduplicate_bundle, bundle_id)
+            run_stats["deduplicated_files"] = dedup_stats["deduplicated"]
+            run_stats["bytes_deduplicated"] = dedup_stats["bytes_saved"]
+
         # Save bundle metadata
-        bundle_metadata = {
-            "bundle_id": bundle_id,
-            "timestamp": bundle_time,
-            "region": region,
-            "agent_results": agent_results,
-            "stats": {
-                "total_files": run_stats["total_files"],
-                "successful_files": run_stats["successful_files"],
-                "failed_files": run_stats["failed_files"],
-                "total_size_mb": round(run_stats["total_size_bytes"] / (1024 * 1024), 2),
-            },
-        }
+        bundle_metadata = _bundle_metadata("complete")
 
         # Save metadata files
         self._save_bundle_metadata(bundle_dir, bundle_metadata, all_metadata)
@@ -221,6 +292,8 @@ class DataCollector:
             f"Successful: {run_stats['successful_files']}, "
             f"Failed: {run_stats['failed_files']}"
         )
+        if run_stats["failed_agents"]:
+            self.logger.warning(f"Failed agents: {', '.join(run_stats['failed_agents'])}")
 
         return {
             "bundle_id": bundle_id,
@@ -229,6 +302,235 @@ class DataCollector:
             "metadata": bundle_metadata,
         }
 
+    async def _collect_batch(
+        self, bundle_dir: Path, agent_results: dict[str, Any], run_stats: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Run all agents with a single gather, holding their metadata in memory.
+
+        Args:
+            bundle_dir: Bundle directory
+            agent_results: Per-agent results, filled in place
+            run_stats: Run statistics, updated in place
+
+        Returns:
+            Combined metadata list for all agents
+        """
+        all_metadata: list[dict[str, Any]] = []
+
+        # Create tasks for all agents
+        tasks = [
+            self._run_agent(agent_name, agent, bundle_dir)
+            for agent_name, agent in self.agents.items()
+        ]
+
+        # Execute all tasks concurrently
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Process results
+        for agent_name, result in zip(self.agents.keys(), results, strict=False):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in agent {agent_name}: {result}")
+                agent_results[agent_name] = {
+                    "status": "error",
+                    "error": str(result),
+                    "files_collected": 0,
+                }
+                run_stats["failed_agents"].append(agent_name)
+            else:
+                metadata, stats = result
+                self._add_cpu_stats(stats, self.agents[agent_name])
+                agent_results[agent_name] = stats
+                all_metadata.extend(metadata)
+                self._add_run_stats(run_stats, agent_name, stats)
+
+        return all_metadata
+
+    async def _collect_streaming(
+        self,
+        bundle_dir: Path,
+        agent_results: dict[str, Any],
+        run_stats: dict[str, Any],
+        checkpoint: Callable[[], None],
+        on_agent_complete: AgentCompleteCallback | None,
+    ) -> None:
+        """
+        Run all agents as producers feeding a bounded queue drained by a journal writer.
+
+        Args:
+            bundle_dir: Bundle directory
+            agent_results: Per-agent results, filled in place
+            run_stats: Run statistics, updated in place
+            checkpoint: Persists provisional bundle metadata after each agent finishes
+            on_agent_complete: Optional per-agent completion callback
+        """
+        queue_size = max(1, self.config.getint("data_collection", "stream_queue_size", 256))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        checkpoint()
+        writer = asyncio.create_task(
+            self._journal_writer(
+                queue, bundle_dir, agent_results, run_stats, checkpoint, on_agent_complete
+            )
+        )
+        producers = [
+            asyncio.create_task(self._stream_agent(agent_name, agent, bundle_dir, queue))
+            for agent_name, agent in self.agents.items()
+        ]
+
+        try:
+            await asyncio.gather(*producers)
+            await queue.put(None)
+            await writer
+        except BaseException:
+            for task in (*producers, writer):
+                task.cancel()
+            await asyncio.gather(*producers, writer, return_exceptions=True)
+            raise
+
+    async def _stream_agent(
+        self, agent_name: str, agent: Any, bundle_dir: Path, queue: asyncio.Queue
+    ) -> None:
+        """
+        Run a single agent, pushing each file record onto the queue as it is produced.
+
+        Args:
+            agent_name: Name of the agent
+            agent: Agent instance
+            bundle_dir: Directory to store collected data
+            queue: Bounded queue consumed by the journal writer
+        """
+        try:
+            # Create agent-specific directory
+            agent_dir = bundle_dir / agent_name
+            agent_dir.mkdir(exist_ok=True)
+
+            if hasattr(agent, "collect_stream"):
+                async for item in agent.collect_stream(agent_dir):
+                    await queue.put(("record", agent_name, item))
+            else:
+                for item in await agent.collect(agent_dir):
+                    await queue.put(("record", agent_name, item))
+
+            await queue.put(("done", agent_name, None))
+
+        except Exception as e:
+            self.logger.error(f"Error in agent {agent_name}: {e}")
+            await queue.put(("error", agent_name, str(e)))
+
+    async def _journal_writer(
+        self,
+        queue: asyncio.Queue,
+        bundle_dir: Path,
+        agent_results: dict[str, Any],
+        run_stats: dict[str, Any],
+        checkpoint: Callable[[], None],
+        on_agent_complete: AgentCompleteCallback | None,
+    ) -> None:
+        """
+        Drain the queue, appending records to the journal and per-agent metadata files.
+
+        Only running counters are kept in memory; the records themselves go
+        straight to disk.
+        """
+        counters: dict[str, dict[str, int]] = {}
+        agent_writers: dict[str, _JsonArrayWriter] = {}
+        all_writer = _JsonArrayWriter(bundle_dir / "all_metadata.json")
+        # Completion callbacks run as their own tasks so a slow one never stalls draining
+        callbacks: list[asyncio.Task] = []
+
+        try:
+            with open(bundle_dir / JOURNAL_FILENAME, "a", encoding="utf-8") as journal:
+                while True:
+                    event = await queue.get()
+                    if event is None:
+                        break
+
+                    kind, agent_name, payload = event
+                    counter = counters.setdefault(
+                        agent_name, {"total": 0, "successful": 0, "total_size_bytes": 0}
+                    )
+                    agent_writer = agent_writers.get(agent_name)
+                    if agent_writer is None:
+                        agent_writer = _JsonArrayWriter(bundle_dir / agent_name / "metadata.json")
+                        agent_writers[agent_name] = agent_writer
+
+                    if kind == "record":
+                        journal.write(json.dumps({"agent": agent_name, "record": payload}) + "\n")
+                        journal.flush()
+                        agent_writer.write(payload)
+                        all_writer.write(payload)
+                        counter["total"] += 1
+                        if payload.get("status") == "success":
+                            counter["successful"] += 1
+                        counter["total_size_bytes"] += _safe_size_bytes(payload)
+                        continue
+
+                    # Agent finished (successfully or not): finalize its metadata file
+                    agent_writer.close()
+                    stats = _agent_stats(counter)
+                    event_record = {"agent": agent_name, "event": kind}
+                    if kind == "error":
+                        event_record["error"] = payload
+                    journal.write(json.dumps(event_record) + "\n")
+                    journal.flush()
+
+                    if kind == "error":
+                        # Records streamed before the failure stay on disk, but a
+                        # failed agent is reported on its own, outside the run totals
+                        agent_results[agent_name] = {
+                            "status": "error",
+                            "error": payload,
+                            "files_collected": counter["total"],
+                            "partial_stats": stats,
+                        }
+                        run_stats["failed_agents"].append(agent_name)
+                    else:
+                        self._add_cpu_stats(stats, self.agents.get(agent_name))
+                        agent_results[agent_name] = stats
+                        self._add_run_stats(run_stats, agent_name, stats)
+
+                    checkpoint()
+
+                    if kind == "done" and on_agent_complete is not None:
+                        callbacks.append(
+                            asyncio.create_task(
+                                self._notify_agent_complete(on_agent_complete, agent_name, stats)
+                            )
+                        )
+
+            all_writer.close()
+            await asyncio.gather(*callbacks)
+        finally:
+            for task in callbacks:
+                task.cancel()
+
+    async def _notify_agent_complete(
+        self, callback: AgentCompleteCallback, agent_name: str, stats: dict[str, Any]
+    ) -> None:
+        """Invoke a completion callback, logging rather than propagating its errors."""
+        try:
+            result = callback(agent_name, stats)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.logger.error(f"Agent completion callback failed for {agent_name}: {e}")
+
+    @staticmethod
+    def _add_cpu_stats(stats: dict[str, Any], agent: Any) -> None:
+        """Attach an agent's parsing CPU accounting to its statistics."""
+        if isinstance(agent, BaseAgent):
+            stats["cpu"] = agent.get_cpu_stats()
+
+    @staticmethod
+    def _add_run_stats(run_stats: dict[str, Any], agent_name: str, stats: dict[str, Any]) -> None:
+        """Fold one agent's statistics into the run totals."""
+        run_stats["total_files"] += stats["total"]
+        run_stats["successful_files"] += stats["successful"]
+        run_stats["failed_files"] += stats["failed"]
+        run_stats["total_size_bytes"] += stats["total_size_bytes"]
+        run_stats["agents"][agent_name] = stats
+
     async def _run_agent(self, agent_name: str, agent: Any, bundle_dir: Path) -> tuple:
         """
         Run a single agent and collect its results.
@@ -250,30 +552,17 @@ class DataCollector:
             metadata = await agent.collect(agent_dir)
 
             # Calculate statistics
-            total = len(metadata)
-            successful = sum(1 for item in metadata if item.get("status") == "success")
-            failed = total - successful
-
-            def _safe_size_bytes(entry: dict[str, Any]) -> int:
-                value = entry.get("size_bytes", 0)
-                try:
-                    return int(value)
-                except (TypeError, ValueError):
-                    return 0
-
-            total_size = sum(_safe_size_bytes(item) for item in metadata)
+            stats = _agent_stats(
+                {
+                    "total": len(metadata),
+                    "successful": sum(1 for item in metadata if item.get("status") == "success"),
+                    "total_size_bytes": sum(_safe_size_bytes(item) for item in metadata),
+                }
+            )
 
             # Save agent-specific metadata
             self._save_agent_metadata(agent_dir, metadata)
 
-            stats = {
-                "total": total,
-                "successful": successful,
-                "failed": failed,
-                "success_rate": round(successful / total * 100, 1) if total > 0 else 0,
-                "total_size_bytes": total_size,
-            }
-
             return metadata, stats
 
         except Exception as e:
@@ -281,22 +570,34 @@ class DataCollector:
             raise
 
     def _save_bundle_metadata(
-        self, bundle_dir: Path, bundle_metadata: dict[str, Any], all_metadata: list[dict[str, Any]]
+        self,
+        bundle_dir: Path,
+        bundle_metadata: dict[str, Any],
+        all_metadata: list[dict[str, Any]] | None = None,
     ):
-        """Save bundle metadata to files."""
-        # Save bundle summary
-        with open(bundle_dir / "bundle_metadata.json", "w") as f:
+        """Save bundle metadata to files (all_metadata is skipped when already streamed)."""
+        # Save bundle summary atomically so readers never see a partial file
+        temp_path = bundle_dir / "bundle_metadata.json.tmp"
+        with open(temp_path, "w") as f:
             json.dump(bundle_metadata, f, indent=2)
+        temp_path.replace(bundle_dir / "bundle_metadata.json")
 
         # Save complete metadata
-        with open(bundle_dir / "all_metadata.json", "w") as f:
-            json.dump(all_metadata, f, indent=2)
+        if all_metadata is not None:
+            with open(bundle_dir / "all_metadata.json", "w") as f:
+                json.dump(all_metadata, f, indent=2)
 
     def _save_agent_metadata(self, agent_dir: Path, metadata: list[dict[str, Any]]):
         """Save agent-specific metadata."""
         with open(agent_dir / "metadata.json", "w") as f:
             json.dump(metadata, f, indent=2)
 
+    def _deduplicate_bundle(self, bundle_id: str) -> dict[str, Any]:
+        """Move the bundle's downloads into the shared blob store."""
+        from .bundle_manager import BundleManager
+
+        return BundleManager(self.data_dir).deduplicate_bundle(bundle_id)
+
     def _update_latest_bundle(self, bundle_id: str):
         """Update reference to the latest bundle."""
         from .bundle_manager import BundleManager
@@ -375,7 +676,7 @@ class DataCollector:
 
         # Find all bundle directories
         for item in self.data_dir.iterdir():
-            if item.is_dir() and item.name != "temp":
+            if item.is_dir() and item.name not in RESERVED_DIRS:
                 # Try to load metadata
                 try:
                     with open(item / "bundle_metadata.json") as f:
@@ -0,0 +1,354 @@
+"""
+Persistent HTTP validator cache for conditional GET revalidation.
+
+Stores the last successful response body per URL together with its
+ETag/Last-Modified validators and freshness lifetime, so repeat downloads
+can be answered with a 304 (or skipped entirely while still fresh) and the
+cached body materialized into the new bundle by hard link or copy. Streamed
+downloads are adopted into the cache from their file on disk, so large
+products never have to be held in memory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached response for a single URL.
+
+    Attributes:
+        url: Request URL (after placeholder expansion and validation)
+        etag: ETag validator, if the server sent one
+        last_modified: Last-Modified validator, if the server sent one
+        content_type: Content-Type of the cached body
+        size_bytes: Size reported for the original download
+        body_size: Size of the cached body on disk
+        sha256: Hex SHA-256 of the cached body
+        stored_at: Epoch seconds when the body was stored or last revalidated
+        expires_at: Epoch seconds until which the body is fresh without revalidation
+    """
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    content_type: str | None = None
+    size_bytes: int | None = None
+    body_size: int = 0
+    stored_at: float = 0.0
+    expires_at: float = 0.0
+    sha256: str | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the body can be served without contacting the server."""
+        return self.expires_at > time.time()
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since request headers."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPValidatorCache:
+    """
+    On-disk cache of response bodies and validators keyed by URL.
+
+    Features:
+    - One entry per URL: ``entries/<hash>.json`` plus ``bodies/<hash>``
+    - Bodies are replaced atomically, so hard links held by older bundles keep
+      their original content
+    - Honors Cache-Control max-age/no-store and Expires for freshness
+    """
+
+    def __init__(self, cache_dir: str | Path, link_mode: str = "hardlink"):
+        """
+        Initialize the validator cache.
+
+        Args:
+            cache_dir: Root directory for cache entries and bodies
+            link_mode: How cached bodies are materialized ('hardlink' or 'copy')
+        """
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / "entries"
+        self.bodies_dir = self.cache_dir / "bodies"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        self.link_mode = link_mode
+        self.logger = logging.getLogger("http_cache")
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, url: str) -> Path:
+        return self.entries_dir / f"{self._key(url)}.json"
+
+    def body_path(self, url: str) -> Path:
+        """Path of the cached body for a URL."""
+        return self.bodies_dir / self._key(url)
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """
+        Return the cache entry for a URL if both metadata and body are present.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            CacheEntry or None on miss
+        """
+        entry_path = self._entry_path(url)
+        if not entry_path.exists() or not self.body_path(url).exists():
+            return None
+        try:
+            with open(entry_path) as f:
+                entry = CacheEntry(**json.load(f))
+        except (OSError, TypeError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Discarding unreadable cache entry for {url}: {e}")
+            self.invalidate(url)
+            return None
+        return entry if entry.url == url else None
+
+    def store(self, url: str, content: bytes, headers: dict[str, Any], size_bytes: int | None):
+        """
+        Store a 200 response body and its validators.
+
+        Responses without validators or freshness information, or marked
+        ``no-store``, are not cached.
+
+        Args:
+            url: Request URL
+            content: Response body
+            headers: Response headers
+            size_bytes: Size reported on the DownloadResult
+
+        Returns:
+            The stored CacheEntry, or None if the response is not cacheable
+        """
+        entry = self._new_entry(
+            url, headers, size_bytes, len(content), hashlib.sha256(content).hexdigest()
+        )
+        if entry is None:
+            return None
+
+        try:
+            self._atomic_write(self.body_path(url), content)
+            self._write_entry(entry)
+        except OSError as e:
+            self.logger.warning(f"Failed to cache response for {url}: {e}")
+            return None
+        return entry
+
+    def store_file(
+        self,
+        url: str,
+        source: Path,
+        headers: dict[str, Any],
+        size_bytes: int | None,
+        sha256: str | None = None,
+    ):
+        """
+        Store a 200 response body that was streamed to a file.
+
+        The file is adopted by hard link (or copied, per ``link_mode``) without
+        reading it into memory. Cacheability rules match :meth:`store`.
+
+        Args:
+            url: Request URL
+            source: File holding the complete response body
+            headers: Response headers
+            size_bytes: Size reported on the DownloadResult
+            sha256: Hex SHA-256 of the body, if already computed
+
+        Returns:
+            The stored CacheEntry, or None if the response is not cacheable
+        """
+        try:
+            body_size = source.stat().st_size
+        except OSError as e:
+            self.logger.warning(f"Failed to cache response for {url}: {e}")
+            return None
+        entry = self._new_entry(url, headers, size_bytes, body_size, sha256)
+        if entry is None:
+            return None
+
+        body_path = self.body_path(url)
+        temp_path = body_path.with_name(f".{body_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            if self.link_mode == "hardlink":
+                try:
+                    os.link(source, temp_path)
+                except OSError:
+                    shutil.copyfile(source, temp_path)
+            else:
+                shutil.copyfile(source, temp_path)
+            temp_path.replace(body_path)
+            self._write_entry(entry)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Failed to cache response for {url}: {e}")
+            return None
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: dict[str, Any]) -> CacheEntry:
+        """
+        Update validators and freshness after a 304 Not Modified.
+
+        Args:
+            entry: Existing cache entry
+            headers: Headers from the 304 response
+
+        Returns:
+            Updated CacheEntry
+        """
+        now = time.time()
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.stored_at = now
+        entry.expires_at = self._expires_at(headers, now)
+        try:
+            self._write_entry(entry)
+        except OSError as e:
+            self.logger.warning(f"Failed to refresh cache entry for {entry.url}: {e}")
+        return entry
+
+    def materialize(self, entry: CacheEntry, destination: Path) -> Path:
+        """
+        Place the cached body at ``destination`` by hard link, falling back to copy.
+
+        Args:
+            entry: Cache entry to materialize
+            destination: Target file path
+
+        Returns:
+            Path of the materialized file
+        """
+        source = self.body_path(entry.url)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Never write through an existing link into a shared body
+        destination.unlink(missing_ok=True)
+
+        if self.link_mode == "hardlink":
+            try:
+                os.link(source, destination)
+                return destination
+            except OSError:
+                pass  # Cross-device or unsupported filesystem; fall back to copy
+
+        shutil.copyfile(source, destination)
+        return destination
+
+    def read_body(self, entry: CacheEntry) -> bytes:
+        """Read the cached body into memory."""
+        return self.body_path(entry.url).read_bytes()
+
+    def _new_entry(
+        self,
+        url: str,
+        headers: dict[str, Any],
+        size_bytes: int | None,
+        body_size: int,
+        sha256: str | None,
+    ) -> CacheEntry | None:
+        """Build an entry for a 200 response, or None if it must not be cached."""
+        cache_control = str(headers.get("Cache-Control", ""))
+        if "no-store" in cache_control.lower():
+            self.invalidate(url)
+            return None
+
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_type=headers.get("Content-Type"),
+            size_bytes=size_bytes,
+            body_size=body_size,
+            stored_at=now,
+            expires_at=self._expires_at(headers, now),
+            sha256=sha256,
+        )
+        if not (entry.etag or entry.last_modified or entry.expires_at > now):
+            return None
+        return entry
+
+    def invalidate(self, url: str) -> None:
+        """Remove the cache entry and body for a URL."""
+        self._entry_path(url).unlink(missing_ok=True)
+        self.body_path(url).unlink(missing_ok=True)
+
+    def _write_entry(self, entry: CacheEntry) -> None:
+        self._atomic_write(
+            self._entry_path(entry.url), json.dumps(asdict(entry), indent=2).encode("utf-8")
+        )
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write via temp file + rename so the target inode is replaced, not truncated."""
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tf:
+            tf.write(data)
+            temp_path = Path(tf.name)
+        try:
+            temp_path.replace(path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _expires_at(headers: dict[str, Any], now: float) -> float:
+        """Compute the freshness deadline from Cache-Control/Expires headers."""
+        cache_control = str(headers.get("Cache-Control", ""))
+        if "no-cache" in cache_control.lower():
+            return 0.0
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            return now + int(match.group(1))
+        expires = headers.get("Expires")
+        if expires:
+            try:
+                return parsedate_to_datetime(str(expires)).timestamp()
+            except (TypeError, ValueError):
+                return 0.0
+        return 0.0
+
+
+def create_http_cache(config: Any) -> HTTPValidatorCache | None:
+    """
+    Build the validator cache from configuration.
+
+    Reads ``data_collection.http_cache`` (enable flag, default True),
+    ``data_collection.http_cache_dir`` (default ``<data_directory>/cache/http``)
+    and ``data_collection.http_cache_link_mode`` ('hardlink' or 'copy').
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        HTTPValidatorCache, or None when disabled
+    """
+    if not config.getboolean("data_collection", "http_cache", True):
+        return None
+    cache_dir = config.get("data_collection", "http_cache_dir") or (
+        Path(config.data_directory) / "cache" / "http"
+    )
+    link_mode = config.get("data_collection", "http_cache_link_mode", "hardlink")
+    return HTTPValidatorCache(cache_dir, link_mode=link_mode)
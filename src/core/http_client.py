@@ -8,6 +8,7 @@ import hashlib
 import inspect
 import logging
 import os
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
@@ -18,9 +19,21 @@ import aiohttp
 
 from ..utils.exceptions import RateLimitError, SecurityError
 from ..utils.security import sanitize_filename, validate_url
+from .http_cache import CacheEntry, HTTPValidatorCache
 from .rate_limiter import RateLimitConfig, RateLimiter
 
 
+def _default_file_mode() -> int:
+    """Mode that open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: os.umask() can only be queried by setting it
+_DEFAULT_FILE_MODE = _default_file_mode()
+
+
 class DownloadResult:
     """Result of a download operation with comprehensive metadata."""
 
@@ -28,7 +41,8 @@ class DownloadResult:
         self.url = url
         self.success = success
         self.status_code: int | None = None
-        self.content: bytes | None = None
+        self._content: bytes | None = None
+        self._content_file: Path | None = None
         self.headers: dict[str, str] = {}
         self.error: str | None = None
         self.download_time: float = 0
@@ -37,9 +51,29 @@ class DownloadResult:
         self.file_path: str | None = None
         self.size_bytes: int | None = None
         self.content_type: str | None = None
+        self.cache_hit: bool = False
+        self.content_hash: str | None = None
         self.timestamp = datetime.now().isoformat()
         self.domain = urlparse(url).netloc
 
+    @property
+    def content(self) -> bytes | None:
+        """Response body; a body deferred to a file is read on first access."""
+        if self._content is None and self._content_file is not None:
+            self._content = self._content_file.read_bytes()
+            self._content_file = None
+        return self._content
+
+    @content.setter
+    def content(self, value: bytes | None) -> None:
+        self._content = value
+        self._content_file = None
+
+    def defer_content(self, path: Path) -> None:
+        """Serve ``content`` from ``path`` when (and only if) it is accessed."""
+        self._content = None
+        self._content_file = path
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -53,6 +87,8 @@ class DownloadResult:
             "file_path": self.file_path,
             "size_bytes": self.size_bytes,
             "content_type": self.content_type,
+            "cache_hit": self.cache_hit,
+            "content_hash": self.content_hash,
             "timestamp": self.timestamp,
             "domain": self.domain,
         }
@@ -76,6 +112,8 @@ class HTTPClient:
     - Request/response logging
     - URL validation and sanitization
     - Support for dynamic URL parameters
+    - Optional conditional-GET revalidation against a persistent validator cache
+    - Streaming downloads written to disk in chunks with an incremental SHA-256
     """
 
     def __init__(
@@ -87,6 +125,8 @@ class HTTPClient:
         user_agent: str = "SurfCastAI/1.0",
         output_dir: Path | None = None,
         logger: logging.Logger | None = None,
+        cache: HTTPValidatorCache | None = None,
+        chunk_size: int = 256 * 1024,
     ):
         """
         Initialize HTTP client.
@@ -99,6 +139,8 @@ class HTTPClient:
             user_agent: User agent string
             output_dir: Output directory for downloads
             logger: Optional logger instance
+            cache: Optional validator cache for ETag/Last-Modified revalidation
+            chunk_size: Read size in bytes for streaming downloads
         """
         self.timeout = timeout
         self.max_concurrent = max_concurrent
@@ -106,6 +148,8 @@ class HTTPClient:
         self.user_agent = user_agent
         self.output_dir = output_dir or Path("./data")
         self.logger = logger or logging.getLogger(__name__)
+        self.cache = cache
+        self.chunk_size = chunk_size
 
         # Create rate limiter if not provided
         self.rate_limiter = rate_limiter or RateLimiter(
@@ -127,6 +171,8 @@ class HTTPClient:
             "total_downloads": 0,
             "total_errors": 0,
             "total_wait_time": 0,
+            "cache_hits": 0,
+            "bytes_saved": 0,
         }
 
     async def __aenter__(self):
@@ -228,6 +274,54 @@ class HTTPClient:
             self.logger.warning("Failed to read response body", exc_info=True)
             return None
 
+    async def _iter_chunks(self, response: Any):
+        """Yield the response body in chunks; test doubles without a stream yield it whole."""
+        stream = getattr(response, "content", None)
+        if isinstance(stream, aiohttp.StreamReader):
+            async for chunk in stream.iter_chunked(self.chunk_size):
+                yield chunk
+            return
+
+        content = await self._consume_content(response)
+        if content:
+            yield content
+
+    async def _stream_to_file(self, response: Any, file_path: Path) -> tuple[int, str]:
+        """
+        Write the response body to a file chunk by chunk.
+
+        Chunks go to a temp file in the target directory that replaces
+        ``file_path`` only once the body is complete, so readers never see a
+        partial file and hard links to an older body keep their content.
+
+        Args:
+            response: HTTP response
+            file_path: Destination path
+
+        Returns:
+            (bytes written, hex SHA-256 of the body)
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part"
+        )
+        temp_path = Path(temp_name)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in self._iter_chunks(response):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            # mkstemp creates files 0600; give the download the usual umask-based mode
+            os.chmod(temp_name, _DEFAULT_FILE_MODE)
+            temp_path.replace(file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return size, digest.hexdigest()
+
     async def _handle_http_response(
         self,
         response: Any,
@@ -237,6 +331,9 @@ class HTTPClient:
         save_to_disk: bool,
         custom_file_path: Path | None,
         attempt: int,
+        cache_key: str | None = None,
+        cache_entry: CacheEntry | None = None,
+        stream: bool = False,
     ) -> dict[str, Any]:
         """Process a single HTTP response and decide next action."""
 
@@ -246,6 +343,34 @@ class HTTPClient:
         result.content_type = headers.get("Content-Type", "unknown")
         result.headers = headers
 
+        if status == 304 and cache_entry is not None:
+            self.cache.refresh(cache_entry, headers)
+            result.status_code = status
+            self._serve_from_cache(
+                result, cache_entry, url, domain, save_to_disk, custom_file_path, stream
+            )
+            return {"action": "success"}
+
+        if status == 200 and stream:
+            file_path = custom_file_path or self._generate_file_path(url, result.content_type)
+            size_bytes, content_hash = await self._stream_to_file(response, file_path)
+            result.size_bytes = size_bytes
+            result.content_hash = content_hash
+            result.file_path = str(file_path)
+            result.success = True
+            self.logger.info(f"Streamed {url} to {file_path} ({size_bytes} bytes)")
+
+            if self.cache is not None:
+                self.cache.store_file(
+                    cache_key or url, file_path, headers, size_bytes, content_hash
+                )
+
+            self.stats["downloads_per_domain"][domain] = (
+                self.stats["downloads_per_domain"].get(domain, 0) + 1
+            )
+            self.stats["total_downloads"] += 1
+            return {"action": "success"}
+
         if status == 200:
             content = await self._consume_content(response)
             result.content = content
@@ -269,11 +394,16 @@ class HTTPClient:
             if save_to_disk and content is not None:
                 file_path = custom_file_path or self._generate_file_path(url, result.content_type)
                 file_path.parent.mkdir(parents=True, exist_ok=True)
+                # Replace rather than truncate: the path may be a hard link to a cached body
+                file_path.unlink(missing_ok=True)
                 with open(file_path, "wb") as f:
                     f.write(content)
                 result.file_path = str(file_path)
                 self.logger.info(f"Saved {url} to {file_path} ({len(content)} bytes)")
 
+            if self.cache is not None and content is not None:
+                self.cache.store(cache_key or url, content, headers, result.size_bytes)
+
             if domain in self.stats["downloads_per_domain"]:
                 self.stats["downloads_per_domain"][domain] += 1
             else:
@@ -312,6 +442,45 @@ class HTTPClient:
         self.logger.warning(f"Failed to download {url}: {message}")
         return {"action": "break", "error": message}
 
+    def _serve_from_cache(
+        self,
+        result: DownloadResult,
+        entry: CacheEntry,
+        url: str,
+        domain: str,
+        save_to_disk: bool,
+        custom_file_path: Path | None,
+        stream: bool = False,
+    ) -> None:
+        """Populate a result from a cached body after a 304 or while still fresh."""
+        result.content_type = entry.content_type or result.content_type or "unknown"
+        result.size_bytes = entry.size_bytes
+        result.content_hash = entry.sha256
+        result.success = True
+        result.cache_hit = True
+
+        if save_to_disk or stream:
+            # Link (or copy) the cached body straight to the output path. Streamed
+            # downloads never get the body in memory; otherwise it is read from
+            # the materialized file only if a caller asks for it.
+            file_path = custom_file_path or self._generate_file_path(url, result.content_type)
+            self.cache.materialize(entry, file_path)
+            result.file_path = str(file_path)
+            if stream:
+                result.content = None
+            else:
+                result.defer_content(file_path)
+            self.logger.info(f"Reused cached {url} at {file_path} ({entry.body_size} bytes)")
+        else:
+            result.content = self.cache.read_body(entry)
+
+        self.stats["downloads_per_domain"][domain] = (
+            self.stats["downloads_per_domain"].get(domain, 0) + 1
+        )
+        self.stats["total_downloads"] += 1
+        self.stats["cache_hits"] += 1
+        self.stats["bytes_saved"] += entry.body_size
+
     def _process_url_placeholders(self, url: str) -> str:
         """
         Replace date/time placeholders in URL.
@@ -401,7 +570,11 @@ class HTTPClient:
         return domain_dir / filename
 
     async def download(
-        self, url: str, save_to_disk: bool = True, custom_file_path: Path | None = None
+        self,
+        url: str,
+        save_to_disk: bool = True,
+        custom_file_path: Path | None = None,
+        stream: bool = False,
     ) -> DownloadResult:
         """
         Download a URL with comprehensive error handling and retry logic.
@@ -410,6 +583,10 @@ class HTTPClient:
             url: URL to download
             save_to_disk: Whether to save content to disk
             custom_file_path: Optional custom file path
+            stream: Write the body to disk in chunks instead of buffering it.
+                The file is always saved (``save_to_disk`` is ignored),
+                ``result.content`` stays None and ``result.file_path``,
+                ``size_bytes`` and ``content_hash`` describe the body
 
         Returns:
             DownloadResult object with comprehensive metadata
@@ -438,6 +615,17 @@ class HTTPClient:
             self.logger.warning(f"Security validation failed for {url}: {e}")
             return result
 
+        # Serve fresh cache entries without spending a request; otherwise revalidate
+        cache_entry = self.cache.lookup(validated_url) if self.cache is not None else None
+        if cache_entry is not None and cache_entry.is_fresh:
+            result.status_code = 200
+            self._serve_from_cache(
+                result, cache_entry, url, domain, save_to_disk, custom_file_path, stream
+            )
+            result.download_time = time.time() - start_time
+            return result
+        request_headers = cache_entry.conditional_headers() if cache_entry is not None else {}
+
         # Ensure session exists
         await self._ensure_session()
 
@@ -476,18 +664,39 @@ class HTTPClient:
                 else:
                     self.logger.info(f"Downloading {url}")
 
-                request = self._session.get(validated_url)
+                if request_headers:
+                    request = self._session.get(validated_url, headers=request_headers)
+                else:
+                    request = self._session.get(validated_url)
                 response_obj, use_context = await self._resolve_response(request)
 
                 if use_context:
                     async with response_obj as response:
                         outcome = await self._handle_http_response(
-                            response, result, url, domain, save_to_disk, custom_file_path, attempt
+                            response,
+                            result,
+                            url,
+                            domain,
+                            save_to_disk,
+                            custom_file_path,
+                            attempt,
+                            cache_key=validated_url,
+                            cache_entry=cache_entry,
+                            stream=stream,
                         )
                 else:
                     response = response_obj
                     outcome = await self._handle_http_response(
-                        response, result, url, domain, save_to_disk, custom_file_path, attempt
+                        response,
+                        result,
+                        url,
+                        domain,
+                        save_to_disk,
+                        custom_file_path,
+                        attempt,
+                        cache_key=validated_url,
+                        cache_entry=cache_entry,
+                        stream=stream,
                     )
                     await self._finalize_response(response)
 
@@ -679,5 +888,7 @@ class HTTPClient:
                 else 0
             ),
             "total_wait_time": self.stats["total_wait_time"],
+            "cache_hits": self.stats["cache_hits"],
+            "bytes_saved": self.stats["bytes_saved"],
             "domain_statistics": domain_stats,
         }
@@ -0,0 +1,322 @@
+"""
+Image preparation for vision API calls.
+
+Charts and satellite images are stored at full resolution, but the API
+downsamples them anyway: a ``low`` detail image is seen at 512x512 and a
+``high`` detail image is scaled to fit 2048x2048 and then to 768 px on its
+shortest side. ImagePreparer does that resize locally, re-encodes the result
+(PNG for few-colour charts, JPEG for photographic imagery) and caches the
+base64 data URL in memory keyed by file content digest and detail level, so
+repeated calls upload fewer bytes and skip the decode/resize/encode work.
+
+It also computes the token cost of an image from its post-resize dimensions
+(OpenAI tile accounting: 85 base tokens plus 170 per 512 px tile for high
+detail, 85 flat for low detail).
+"""
+
+import base64
+import hashlib
+import io
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from PIL import Image
+
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+}
+
+# API-side image sizing
+LOW_DETAIL_SIZE = 512
+HIGH_DETAIL_MAX_SIDE = 2048
+HIGH_DETAIL_SHORT_SIDE = 768
+TILE_SIZE = 512
+BASE_TOKENS = 85
+TILE_TOKENS = 170
+
+# Sources with at most this many colours are treated as charts (palette PNG);
+# resizing adds blended colours, which are folded back into a smaller palette
+PALETTE_MAX_COLORS = 256
+RESIZED_PALETTE_COLORS = 64
+JPEG_QUALITY = 85
+
+
+def target_size(width: int, height: int, detail: str) -> tuple[int, int]:
+    """
+    Dimensions the API works with for an image at a detail level.
+
+    Images are only ever scaled down. ``auto`` is treated like ``high``.
+
+    Args:
+        width: Source width in pixels
+        height: Source height in pixels
+        detail: Detail level (low, auto or high)
+
+    Returns:
+        (width, height) after resizing
+    """
+    if detail == "low":
+        scale = min(1.0, LOW_DETAIL_SIZE / max(width, height))
+    else:
+        scale = min(
+            1.0,
+            HIGH_DETAIL_MAX_SIDE / max(width, height),
+            HIGH_DETAIL_SHORT_SIDE / min(width, height),
+        )
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def image_tokens(width: int, height: int, detail: str) -> int:
+    """
+    Input tokens billed for an image at a detail level.
+
+    Args:
+        width: Source width in pixels
+        height: Source height in pixels
+        detail: Detail level (low, auto or high)
+
+    Returns:
+        Token count
+    """
+    if detail == "low":
+        return BASE_TOKENS
+    width, height = target_size(width, height, detail)
+    tiles = math.ceil(width / TILE_SIZE) * math.ceil(height / TILE_SIZE)
+    return BASE_TOKENS + TILE_TOKENS * tiles
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """Encoded image payload ready to attach to a vision request."""
+
+    data_url: str
+    width: int | None  # None when the image could not be decoded and is sent as-is
+    height: int | None
+    source_bytes: int
+    tokens: int | None
+
+
+class ImagePreparer:
+    """
+    Resize, re-encode and cache images for vision requests.
+
+    Features:
+    - Downsampling to the size the API uses for each detail level
+    - PNG (palette) for charts, JPEG for photographic imagery; images that
+      need no resize keep their original bytes when those are smaller
+    - In-memory LRU cache of data URLs bounded by encoded size
+    - Token estimates from post-resize dimensions
+    - Thread-safe, so preparation can run in worker threads
+    """
+
+    def __init__(self, max_cache_bytes: int = 64 * 1024 * 1024, logger=None):
+        """
+        Initialize the preparer.
+
+        Args:
+            max_cache_bytes: Upper bound on cached data URL sizes
+            logger: Optional logger instance
+        """
+        self.max_cache_bytes = max_cache_bytes
+        self.logger = logger or logging.getLogger("core.image_prep")
+        self._cache: OrderedDict[tuple[str, str], PreparedImage] = OrderedDict()
+        self._cache_bytes = 0
+        # (path, mtime_ns, size) -> content digest, so unchanged files are not re-hashed
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, file_path: str | Path) -> str:
+        """
+        SHA-256 digest of a file's content, memoized by path, mtime and size.
+
+        Args:
+            file_path: Path to the image
+
+        Returns:
+            Hex digest
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Image file not found: {file_path}")
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def prepare(self, file_path: str | Path, detail: str = "auto") -> PreparedImage:
+        """
+        Get the encoded payload for an image, preparing it on a cache miss.
+
+        Args:
+            file_path: Path to a local image file
+            detail: Detail level the image will be sent with
+
+        Returns:
+            PreparedImage
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is not supported
+        """
+        path = Path(file_path)
+        if path.suffix.lower() not in IMAGE_MIME_TYPES:
+            raise ValueError(
+                f"Unsupported image format: {path.suffix.lower()}. "
+                f"Supported formats: {', '.join(IMAGE_MIME_TYPES.keys())}"
+            )
+
+        key = (self.digest(path), detail)
+        with self._lock:
+            prepared = self._cache.get(key)
+            if prepared is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return prepared
+            self.misses += 1
+
+        prepared = self._encode(path, detail)
+        self.logger.debug(
+            f"Prepared {path.name} ({detail}): {prepared.width}x{prepared.height}, "
+            f"{prepared.source_bytes} bytes -> {len(prepared.data_url)} byte data URL"
+        )
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = prepared
+                self._cache_bytes += len(prepared.data_url)
+            while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted.data_url)
+        return prepared
+
+    def estimate_tokens(self, file_path: str | Path, detail: str) -> int | None:
+        """
+        Token cost of an image from its header dimensions (no full decode).
+
+        Args:
+            file_path: Path to a local image file
+            detail: Detail level the image will be sent with
+
+        Returns:
+            Token count, or None if the image can't be read
+        """
+        try:
+            with Image.open(file_path) as image:
+                width, height = image.size
+        except (OSError, ValueError):
+            return None
+        return image_tokens(width, height, detail)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "cache_bytes": self._cache_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+            self._digests.clear()
+
+    @staticmethod
+    def _encode(path: Path, detail: str) -> PreparedImage:
+        """Resize and re-encode an image, keeping the original bytes if they are smaller."""
+        source = path.read_bytes()
+        mime_type = IMAGE_MIME_TYPES[path.suffix.lower()]
+        try:
+            with Image.open(io.BytesIO(source)) as image:
+                image.load()
+                width, height = image.size
+                size = target_size(width, height, detail)
+                encoded, mime_type_out = _reencode(image, size)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            # Not decodable (or animated): send as-is, like before
+            return PreparedImage(_data_url(source, mime_type), None, None, len(source), None)
+
+        if size == (width, height) and len(source) <= len(encoded):
+            encoded, mime_type_out = source, mime_type
+        return PreparedImage(
+            data_url=_data_url(encoded, mime_type_out),
+            width=size[0],
+            height=size[1],
+            source_bytes=len(source),
+            tokens=image_tokens(width, height, detail),
+        )
+
+
+def _data_url(data: bytes, mime_type: str) -> str:
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode()}"
+
+
+def _reencode(image: Image.Image, size: tuple[int, int]) -> tuple[bytes, str]:
+    """
+    Resize and encode an image.
+
+    Few-colour sources (charts) are area-averaged and re-quantized to a small
+    palette PNG, which keeps lines and labels crisp; photographic sources are
+    resampled with Lanczos and encoded as JPEG.
+    """
+    if getattr(image, "n_frames", 1) > 1:
+        raise ValueError("Animated images are sent unmodified")
+
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    is_chart = image.getcolors(PALETTE_MAX_COLORS) is not None
+
+    buffer = io.BytesIO()
+    if is_chart or has_alpha:
+        if image.size != size:
+            image = image.resize(size, Image.Resampling.BOX)
+        if not has_alpha:
+            colors = image.getcolors(RESIZED_PALETTE_COLORS)
+            image = image.quantize(colors=len(colors) if colors else RESIZED_PALETTE_COLORS)
+        image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue(), "image/png"
+
+    if image.size != size:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    image.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    return buffer.getvalue(), "image/jpeg"
+
+
+def create_image_preparer(config: Any) -> ImagePreparer | None:
+    """
+    Build the image preparer from configuration.
+
+    Reads ``forecast.image_preprocessing`` (default True) and
+    ``forecast.image_cache_mb`` (default 64).
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        ImagePreparer, or None when disabled (images are then sent unmodified)
+    """
+    if not config.getboolean("forecast", "image_preprocessing", True):
+        return None
+    max_mb = config.getfloat("forecast", "image_cache_mb", 64.0)
+    return ImagePreparer(max_cache_bytes=int(max_mb * 1024 * 1024))
@@ -0,0 +1,308 @@
+"""
+Persistent response cache for LLM calls.
+
+Responses are stored in a local SQLite database keyed by a SHA-256 digest of
+everything that determines the output: model, request settings, prompts and
+the content digests of attached images. Re-running forecast generation on an
+unchanged bundle can then be answered from disk instead of the API. Entries
+expire after a TTL and the store is trimmed least-recently-used first when it
+grows past its size limit.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_MODES = ("off", "read", "write", "readwrite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_accessed ON responses(last_accessed);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """
+    A stored LLM response.
+
+    Attributes:
+        key: Cache key (hex digest)
+        model: Model that produced the response
+        content: Response text
+        input_tokens: Prompt tokens the original call consumed
+        output_tokens: Completion tokens the original call consumed
+        created_at: Epoch seconds when the response was stored
+    """
+
+    key: str
+    model: str
+    content: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    created_at: float = 0.0
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed, content-addressed LLM response cache.
+
+    Features:
+    - Deterministic keys from model, settings, prompts and image digests
+    - off/read/write/readwrite modes
+    - TTL expiry and LRU eviction by total size
+    - One short-lived connection per operation, safe to use from threads
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        mode: str = "readwrite",
+        ttl_seconds: float | None = 7 * 24 * 3600,
+        max_bytes: int | None = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+            mode: One of CACHE_MODES
+            ttl_seconds: Entry lifetime (None = never expire)
+            max_bytes: Size limit for stored responses (None = unlimited)
+
+        Raises:
+            ValueError: If mode is not a known cache mode
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode '{mode}'. Expected one of: {CACHE_MODES}")
+
+        self.db_path = Path(db_path)
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger("llm_cache")
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def reads(self) -> bool:
+        """Whether lookups are served from the cache."""
+        return self.mode in ("read", "readwrite")
+
+    @property
+    def writes(self) -> bool:
+        """Whether new responses are stored."""
+        return self.mode in ("write", "readwrite")
+
+    @staticmethod
+    def make_key(
+        model: str,
+        settings: dict[str, Any],
+        system_prompt: str,
+        user_prompt: str,
+        image_digests: Iterable[str] = (),
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model name
+            settings: Request settings that affect the output
+            system_prompt: System prompt
+            user_prompt: User prompt
+            image_digests: Content digests (or URLs) of attached images, in order
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "settings": settings,
+                "system": system_prompt,
+                "user": user_prompt,
+                "images": list(image_digests),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Look up a response, dropping it if it has expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CachedResponse, or None on a miss
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT key, model, content, input_tokens, output_tokens, created_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            entry = CachedResponse(*row)
+            if self._is_expired(entry.created_at, now):
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            conn.execute("UPDATE responses SET last_accessed = ? WHERE key = ?", (now, key))
+            return entry
+
+    def put(
+        self,
+        key: str,
+        model: str,
+        content: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """
+        Store a response and enforce the size limit.
+
+        Args:
+            key: Cache key
+            model: Model that produced the response
+            content: Response text
+            input_tokens: Prompt tokens consumed
+            output_tokens: Completion tokens consumed
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, content, input_tokens, output_tokens, size_bytes, created_at, "
+                "last_accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    model,
+                    content,
+                    input_tokens,
+                    output_tokens,
+                    len(content.encode()),
+                    now,
+                    now,
+                ),
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used ones over the size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with closing(self._connect()) as conn, conn:
+            if self.ttl_seconds is not None:
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                )
+                removed += cursor.rowcount
+
+            if self.max_bytes is not None:
+                (total,) = conn.execute(
+                    "SELECT COALESCE(SUM(size_bytes), 0) FROM responses"
+                ).fetchone()
+                if total > self.max_bytes:
+                    victims = []
+                    for key, size in conn.execute(
+                        "SELECT key, size_bytes FROM responses ORDER BY last_accessed"
+                    ):
+                        if total <= self.max_bytes:
+                            break
+                        victims.append((key,))
+                        total -= size
+                    conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                    removed += len(victims)
+
+        if removed:
+            self.logger.debug(f"Evicted {removed} cached response(s)")
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Summarize the cache contents.
+
+        Returns:
+            Dictionary with entries, size_bytes, mode and path
+        """
+        with closing(self._connect()) as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM responses"
+            ).fetchone()
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "mode": self.mode,
+            "path": str(self.db_path),
+        }
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and created_at < now - self.ttl_seconds
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+
+def create_llm_cache(config: Any) -> LLMResponseCache | None:
+    """
+    Build the LLM response cache from configuration.
+
+    Reads ``openai.response_cache_mode`` (default 'off'),
+    ``openai.response_cache_dir`` (default ``<data_directory>/cache/llm``),
+    ``openai.response_cache_ttl_hours`` (default 168) and
+    ``openai.response_cache_max_mb`` (default 256).
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        LLMResponseCache, or None when the mode is 'off'
+    """
+    mode = config.get("openai", "response_cache_mode", "off") or "off"
+    if mode == "off":
+        return None
+    if mode not in CACHE_MODES:
+        logging.getLogger("llm_cache").warning(
+            f"Ignoring unknown openai.response_cache_mode '{mode}'; response cache disabled"
+        )
+        return None
+
+    cache_dir = config.get("openai", "response_cache_dir") or (
+        Path(config.data_directory) / "cache" / "llm"
+    )
+    ttl_hours = config.getfloat("openai", "response_cache_ttl_hours", 168.0)
+    max_mb = config.getfloat("openai", "response_cache_max_mb", 256.0)
+    return LLMResponseCache(
+        Path(cache_dir) / "responses.sqlite3",
+        mode=mode,
+        ttl_seconds=ttl_hours * 3600 if ttl_hours and ttl_hours > 0 else None,
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb and max_mb > 0 else None,
+    )
@@ -5,14 +5,179 @@ This module provides a centralized OpenAI API client used by ForecastEngine
 and specialist classes (BuoyAnalyst, PressureAnalyst, SeniorForecaster).
 It handles both text and multimodal (vision) API calls while tracking
 token usage and costs in a thread-safe manner.
+
+API clients are pooled per event loop and (api_key, base_url), so HTTP
+keep-alive connections and TLS sessions survive across calls and across
+OpenAIClient instances that talk to the same provider. Each pooled connection
+carries a concurrency semaphore and a TokenBucket that backs off on 429s.
 """
 
 import asyncio
 import base64
+import bisect
+import hashlib
 import logging
+import time
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .image_prep import ImagePreparer
+from .llm_cache import LLMResponseCache
+from .rate_limiter import RateLimitConfig, TokenBucket
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Timing of the request in flight in the current task, filled in by the
+# pooled HTTP client's response hook when headers arrive
+_request_timing: ContextVar[dict[str, float] | None] = ContextVar(
+    "openai_request_timing", default=None
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (seconds) with approximate percentiles."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Upper bound of the bucket holding the q-th percentile.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Bucket upper bound in seconds (the observed max for the +Inf
+            bucket), or None without samples
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return round(self.max, 4)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary with count, mean, max, p50/p95 and per-bucket counts."""
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["le_inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "max": round(self.max, 4),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass
+class PooledConnection:
+    """Long-lived API client plus the limits shared by everyone using it."""
+
+    client: Any
+    semaphore: asyncio.Semaphore
+    bucket: TokenBucket
+
+
+class ClientPool:
+    """
+    Long-lived API clients keyed by event loop and (client class, api_key, base_url).
+
+    HTTP clients are bound to the event loop they run on, so each loop gets
+    its own set; entries disappear with their loop. The client class is part
+    of the key so tests that patch ``openai.AsyncOpenAI`` get a fresh client.
+    The first caller for a key sets its concurrency and rate limits.
+    """
+
+    def __init__(self):
+        self._connections: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple, PooledConnection]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self,
+        client_class: Any,
+        api_key: str,
+        base_url: str | None,
+        max_concurrency: int,
+        rate_limit: RateLimitConfig,
+    ) -> PooledConnection:
+        """
+        Get or create the pooled connection for a provider.
+
+        Args:
+            client_class: AsyncOpenAI (or compatible) class
+            api_key: Provider API key
+            base_url: Custom API base URL, None for OpenAI
+            max_concurrency: Maximum requests in flight (also the HTTP connection limit)
+            rate_limit: Token bucket configuration
+
+        Returns:
+            PooledConnection for the running event loop
+        """
+        connections = self._connections.setdefault(asyncio.get_running_loop(), {})
+        key = (client_class, api_key, base_url)
+        if key not in connections:
+            connections[key] = PooledConnection(
+                client=self._build_client(client_class, api_key, base_url, max_concurrency),
+                semaphore=asyncio.Semaphore(max_concurrency),
+                bucket=TokenBucket(rate_limit),
+            )
+        return connections[key]
+
+    async def close(self) -> None:
+        """Close the pooled clients of the running event loop."""
+        connections = self._connections.pop(asyncio.get_running_loop(), {})
+        for connection in connections.values():
+            await connection.client.close()
+
+    @staticmethod
+    def _build_client(client_class: Any, api_key: str, base_url: str | None, max_connections: int):
+        import httpx
+        from openai import DefaultAsyncHttpxClient
+
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            event_hooks={"response": [_record_first_byte]},
+        )
+        client_kwargs = {"api_key": api_key, "http_client": http_client, "max_retries": 0}
+        if base_url:
+            client_kwargs["base_url"] = base_url
+        # Retries are handled by OpenAIClient so 429s can feed the token bucket
+        return client_class(**client_kwargs)
+
+
+async def _record_first_byte(response) -> None:
+    """httpx response hook: runs once headers are received, before the body is read."""
+    timing = _request_timing.get()
+    if timing is not None and "first_byte" not in timing:
+        timing["first_byte"] = time.perf_counter()
+
+
+# Process-wide pool shared by all OpenAIClient instances
+CLIENT_POOL = ClientPool()
+
 
 class OpenAIClient:
     """
@@ -23,8 +188,14 @@ class OpenAIClient:
     - Automatic cost calculation by model
     - Thread-safe token/cost tracking
     - Graceful handling of model parameter differences
-    - Support for local file paths (converts to base64 data URLs)
+    - Support for local file paths (converts to base64 data URLs, resized and
+      cached per detail level when an ImagePreparer is given)
     - Support for alternative providers (Kimi K2) via custom base_url
+    - Optional persistent response cache (LLMResponseCache) for identical requests
+    - Pooled long-lived API clients (HTTP keep-alive) with a concurrency cap
+    - Adaptive backoff on 429s through a shared TokenBucket, retries for
+      transient errors
+    - TTFB and total latency histograms
 
     Usage:
         # OpenAI (default)
@@ -93,6 +264,12 @@ class OpenAIClient:
         temperature: float | None = None,
         logger: logging.Logger | None = None,
         base_url: str | None = None,
+        cache: LLMResponseCache | None = None,
+        settings: dict[str, Any] | None = None,
+        max_concurrency: int = 4,
+        rate_limit: RateLimitConfig | None = None,
+        max_retries: int = 3,
+        image_preparer: ImagePreparer | None = None,
     ):
         """
         Initialize OpenAI-compatible API client.
@@ -104,6 +281,14 @@ class OpenAIClient:
             temperature: Sampling temperature (None = use model default, recommended for GPT-5)
             logger: Optional logger instance (creates one if not provided)
             base_url: Optional custom API base URL (e.g., 'https://api.moonshot.ai/v1' for Kimi)
+            cache: Optional response cache consulted before calling the API
+            settings: Additional model settings (e.g. ModelSettings.into_response_kwargs())
+                that distinguish otherwise identical requests in cache keys
+            max_concurrency: Maximum requests in flight per (api_key, base_url)
+            rate_limit: Request rate per (api_key, base_url); adapts down on 429s
+            max_retries: Retries for rate-limited (429) and transient failures
+            image_preparer: Optional resize/encode cache for local images
+                (None sends files unmodified)
         """
         self.api_key = api_key
         self.model = model
@@ -111,12 +296,27 @@ class OpenAIClient:
         self.temperature = temperature
         self.logger = logger or logging.getLogger("openai.client")
         self.base_url = base_url
+        self.cache = cache
+        self.settings = settings or {}
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limit = rate_limit or RateLimitConfig(requests_per_second=10.0, burst_size=10)
+        self.max_retries = max(0, max_retries)
+        self.image_preparer = image_preparer
 
         # Initialize cost tracking
         self.total_cost = 0.0
         self.api_call_count = 0
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.saved_input_tokens = 0
+        self.saved_output_tokens = 0
+        self.saved_cost = 0.0
+        self.rate_limited_count = 0
+        self.retry_count = 0
+        self.ttfb_latency = LatencyHistogram()
+        self.total_latency = LatencyHistogram()
         self._cost_lock = asyncio.Lock()  # Thread-safe metric updates
 
         # Log initialization
@@ -154,9 +354,18 @@ class OpenAIClient:
             ImportError: If openai package is not installed
             Exception: For API errors or other failures
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(system_prompt, user_prompt, image_urls, detail)
+            if self.cache.reads:
+                cached = await asyncio.to_thread(self.cache.get, cache_key)
+                await self._track_cache_lookup(cached)
+                if cached is not None:
+                    return cached.content
+
         # Import here to avoid dependency if OpenAI is not available
         try:
-            from openai import AsyncOpenAI
+            from openai import APIConnectionError, AsyncOpenAI
         except ImportError:
             self.logger.error("OpenAI package not installed. Install with: pip install openai")
             return "Error: OpenAI package not installed."
@@ -167,11 +376,10 @@ class OpenAIClient:
             self.logger.debug(f"User prompt length: {len(user_prompt)} chars")
             self.logger.debug(f"User prompt preview: {user_prompt[:500]}...")
 
-            # Initialize client with optional custom base URL (for Kimi K2, etc.)
-            client_kwargs = {"api_key": self.api_key}
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
-            client = AsyncOpenAI(**client_kwargs)
+            # Reuse the pooled client for this provider (custom base URL for Kimi K2, etc.)
+            connection = CLIENT_POOL.get(
+                AsyncOpenAI, self.api_key, self.base_url, self.max_concurrency, self.rate_limit
+            )
 
             # Build message content
             if image_urls:
@@ -182,7 +390,9 @@ class OpenAIClient:
                     # Convert local paths to base64 data URLs
                     if url.startswith("data/"):
                         try:
-                            url = self._convert_image_to_data_url(url)
+                            url = await asyncio.to_thread(
+                                self._convert_image_to_data_url, url, detail
+                            )
                         except Exception as e:
                             self.logger.warning(f"Failed to load image {url}: {e}")
                             continue
@@ -212,8 +422,8 @@ class OpenAIClient:
             if self.temperature is not None:
                 request_kwargs["temperature"] = self.temperature
 
-            # Call API with parameter fallback for legacy models
-            response = await self._call_api_with_fallback(client, request_kwargs)
+            # Call API with retries, rate limiting and parameter fallback for legacy models
+            response = await self._send_request(connection, request_kwargs, APIConnectionError)
 
             # Extract and track usage
             if response.choices and response.choices[0].message:
@@ -223,15 +433,27 @@ class OpenAIClient:
                 )
 
                 # Track token usage and costs
-                if hasattr(response, "usage") and response.usage:
-                    await self._track_usage(response.usage)
+                usage = getattr(response, "usage", None)
+                if usage:
+                    await self._track_usage(usage)
                 else:
                     self.logger.warning("No usage data returned from API")
 
                 if content is None:
                     self.logger.error("API returned None for content")
                     return ""
-                return content.strip()
+
+                content = content.strip()
+                if cache_key is not None and self.cache.writes and content:
+                    await asyncio.to_thread(
+                        self.cache.put,
+                        cache_key,
+                        self.model,
+                        content,
+                        getattr(usage, "prompt_tokens", 0) or 0,
+                        getattr(usage, "completion_tokens", 0) or 0,
+                    )
+                return content
             else:
                 self.logger.error("No content returned from OpenAI API")
                 return ""
@@ -252,6 +474,15 @@ class OpenAIClient:
             self.api_call_count = 0
             self.total_input_tokens = 0
             self.total_output_tokens = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.saved_input_tokens = 0
+            self.saved_output_tokens = 0
+            self.saved_cost = 0.0
+            self.rate_limited_count = 0
+            self.retry_count = 0
+            self.ttfb_latency = LatencyHistogram()
+            self.total_latency = LatencyHistogram()
             self.logger.debug("Metrics reset")
 
     async def get_metrics(self) -> dict[str, Any]:
@@ -265,6 +496,11 @@ class OpenAIClient:
             - input_tokens: Total input tokens
             - output_tokens: Total output tokens
             - model: Model name
+            - cache_hits / cache_misses: Response cache lookups
+            - saved_input_tokens / saved_output_tokens: Tokens served from cache
+            - saved_cost: Cost avoided by cache hits in USD
+            - rate_limited / retries: 429 responses received and retries made
+            - latency: {"ttfb": ..., "total": ...} histogram summaries in seconds
         """
         async with self._cost_lock:
             return {
@@ -273,14 +509,95 @@ class OpenAIClient:
                 "input_tokens": self.total_input_tokens,
                 "output_tokens": self.total_output_tokens,
                 "model": self.model,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "saved_input_tokens": self.saved_input_tokens,
+                "saved_output_tokens": self.saved_output_tokens,
+                "saved_cost": round(self.saved_cost, 6),
+                "rate_limited": self.rate_limited_count,
+                "retries": self.retry_count,
+                "latency": {
+                    "ttfb": self.ttfb_latency.to_dict(),
+                    "total": self.total_latency.to_dict(),
+                },
             }
 
-    def _convert_image_to_data_url(self, file_path: str) -> str:
+    def _cache_key(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        image_urls: list[str] | None,
+        detail: str,
+    ) -> str:
+        """
+        Build the response cache key for a request.
+
+        Local images are keyed by content digest so a re-downloaded chart with
+        identical bytes still hits; remote URLs are keyed by the URL itself.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            image_urls: Image URLs/paths as passed to call_openai_api
+            detail: Image detail level
+
+        Returns:
+            Cache key
+        """
+        settings = {
+            "base_url": self.base_url,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            **self.settings,
+        }
+        images = [self._image_digest(url, self.image_preparer) for url in (image_urls or [])[:10]]
+        if images:
+            settings["detail"] = detail
+        return LLMResponseCache.make_key(self.model, settings, system_prompt, user_prompt, images)
+
+    @staticmethod
+    def _image_digest(url: str, preparer: ImagePreparer | None = None) -> str:
+        """Content digest for local images, the URL itself otherwise."""
+        if url.startswith("data/"):
+            try:
+                if preparer is not None:
+                    return preparer.digest(url)
+                return hashlib.sha256(Path(url).read_bytes()).hexdigest()
+            except OSError:
+                pass
+        return url
+
+    async def _track_cache_lookup(self, cached) -> None:
+        """
+        Record a response cache hit or miss.
+
+        Args:
+            cached: CachedResponse on a hit, None on a miss
+        """
+        async with self._cost_lock:
+            if cached is None:
+                self.cache_misses += 1
+                return
+            self.cache_hits += 1
+            self.saved_input_tokens += cached.input_tokens
+            self.saved_output_tokens += cached.output_tokens
+            self.saved_cost += self._calculate_cost(cached.input_tokens, cached.output_tokens)
+
+        self.logger.info(
+            f"Response cache hit: saved {cached.input_tokens} input + "
+            f"{cached.output_tokens} output tokens"
+        )
+
+    def _convert_image_to_data_url(self, file_path: str, detail: str = "auto") -> str:
         """
         Convert local image file to base64 data URL.
 
+        With an image preparer the image is resized for the detail level and
+        the encoded result is cached; otherwise the file is sent as-is.
+
         Args:
             file_path: Path to local image file
+            detail: Detail level the image will be sent with
 
         Returns:
             Base64-encoded data URL
@@ -289,6 +606,9 @@ class OpenAIClient:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is not supported
         """
+        if self.image_preparer is not None:
+            return self.image_preparer.prepare(file_path, detail).data_url
+
         path = Path(file_path)
 
         if not path.exists():
@@ -307,6 +627,97 @@ class OpenAIClient:
         image_data = base64.b64encode(path.read_bytes()).decode()
         return f"data:{mime_type};base64,{image_data}"
 
+    async def _send_request(
+        self,
+        connection: PooledConnection,
+        request_kwargs: dict[str, Any],
+        connection_error: type[Exception] = ConnectionError,
+    ):
+        """
+        Send a request through a pooled connection.
+
+        Waits for the provider's token bucket and concurrency slot, records
+        latency on success, and retries 429s (throttling the bucket, honoring
+        Retry-After) and transient failures (exponential backoff).
+
+        Args:
+            connection: Pooled client, semaphore and token bucket
+            request_kwargs: Base request parameters (model, messages, etc.)
+            connection_error: Exception type raised for network failures
+
+        Returns:
+            API response object
+        """
+        for attempt in range(self.max_retries + 1):
+            await connection.bucket.acquire()
+            async with connection.semaphore:
+                timing = {"start": time.perf_counter()}
+                token = _request_timing.set(timing)
+                try:
+                    response = await self._call_api_with_fallback(connection.client, request_kwargs)
+                except Exception as e:
+                    error = e
+                else:
+                    connection.bucket.recover()
+                    await self._track_latency(timing)
+                    return response
+                finally:
+                    _request_timing.reset(token)
+
+            status = getattr(error, "status_code", None)
+            if status == 429 and getattr(error, "code", None) != "insufficient_quota":
+                delay = connection.bucket.throttle(self._retry_after(error))
+                async with self._cost_lock:
+                    self.rate_limited_count += 1
+            elif (
+                status in (408, 409)
+                or (isinstance(status, int) and status >= 500)
+                or isinstance(error, connection_error)
+            ):
+                delay = self._retry_after(error) or 0.5 * 2**attempt
+            else:
+                raise error
+
+            if attempt == self.max_retries:
+                raise error
+            async with self._cost_lock:
+                self.retry_count += 1
+            self.logger.warning(
+                f"API request failed ({status or type(error).__name__}); "
+                f"retry {attempt + 1}/{self.max_retries} in {delay:.2f}s"
+            )
+            if status != 429:
+                # 429 delays are enforced by the blocked token bucket
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float | None:
+        """Server-requested delay in seconds from Retry-After(-ms) headers, if any."""
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    async def _track_latency(self, timing: dict[str, float]) -> None:
+        """
+        Record time to first byte and total latency of a successful request.
+
+        Args:
+            timing: perf_counter timestamps ("start", optional "first_byte")
+        """
+        total = time.perf_counter() - timing["start"]
+        async with self._cost_lock:
+            self.total_latency.observe(total)
+            if "first_byte" in timing:
+                self.ttfb_latency.observe(timing["first_byte"] - timing["start"])
+
     async def _call_api_with_fallback(self, client, request_kwargs: dict[str, Any]):
         """
         Call OpenAI API with graceful fallback for legacy models.
@@ -30,9 +30,14 @@ class TokenBucket:
     - Configurable rate limit (tokens per second)
     - Burst capability with configurable burst size
     - Blocking mechanism for handling 429 responses
+    - Adaptive rate: throttle() backs off multiplicatively on 429s and
+      recover() restores the configured rate gradually on success
     - Thread-safe with asyncio locks
     """
 
+    # Lower bound for the adaptive rate, as a fraction of the configured rate
+    MIN_RATE_SCALE = 0.05
+
     def __init__(self, config: RateLimitConfig):
         """
         Initialize token bucket.
@@ -44,8 +49,14 @@ class TokenBucket:
         self.tokens = float(config.burst_size)
         self.last_refill = time.time()
         self.blocked_until = 0
+        self.rate_scale = 1.0
         self._lock = asyncio.Lock()
 
+    @property
+    def rate(self) -> float:
+        """Current refill rate in tokens per second (configured rate x adaptive scale)."""
+        return self.config.requests_per_second * self.rate_scale
+
     async def acquire(self, tokens_needed: float = 1.0) -> float:
         """
         Wait until tokens are available and consume them.
@@ -68,20 +79,20 @@ class TokenBucket:
 
             # Refill tokens based on time elapsed
             time_elapsed = now - self.last_refill
-            tokens_to_add = time_elapsed * self.config.requests_per_second
+            tokens_to_add = time_elapsed * self.rate
             self.tokens = min(self.tokens + tokens_to_add, self.config.burst_size)
             self.last_refill = now
 
             # Wait if not enough tokens
             while self.tokens < tokens_needed:
                 tokens_deficit = tokens_needed - self.tokens
-                wait_time = tokens_deficit / self.config.requests_per_second
+                wait_time = tokens_deficit / self.rate
                 await asyncio.sleep(wait_time)
 
                 # Refill again after waiting
                 now = time.time()
                 time_elapsed = now - self.last_refill
-                tokens_to_add = time_elapsed * self.config.requests_per_second
+                tokens_to_add = time_elapsed * self.rate
                 self.tokens = min(self.tokens + tokens_to_add, self.config.burst_size)
                 self.last_refill = now
 
@@ -102,6 +113,35 @@ class TokenBucket:
         # Reset tokens to prevent burst after unblock
         self.tokens = 0
 
+    def throttle(self, retry_after: float | None = None, factor: float = 0.5) -> float:
+        """
+        Back off after a 429 response.
+
+        Blocks the bucket for ``retry_after`` seconds (or one refill interval
+        at the reduced rate when the server gave no hint) and scales the
+        refill rate down by ``factor``.
+
+        Args:
+            retry_after: Server-provided delay in seconds, if any
+            factor: Multiplier applied to the current rate scale
+
+        Returns:
+            float: Seconds the bucket is blocked for
+        """
+        self.rate_scale = max(self.MIN_RATE_SCALE, self.rate_scale * factor)
+        delay = retry_after if retry_after is not None else 1.0 / self.rate
+        self.block_until(max(self.blocked_until, time.time() + delay))
+        return delay
+
+    def recover(self, step: float = 0.1) -> None:
+        """
+        Raise the rate scale after a successful request, up to the configured rate.
+
+        Args:
+            step: Amount added to the rate scale
+        """
+        self.rate_scale = min(1.0, self.rate_scale + step)
+
     @property
     def available_tokens(self) -> float:
         """Get current number of available tokens."""
@@ -117,6 +157,7 @@ class TokenBucket:
         self.tokens = float(self.config.burst_size)
         self.last_refill = time.time()
         self.blocked_until = 0
+        self.rate_scale = 1.0
 
     def get_stats(self) -> dict[str, Any]:
         """Get bucket statistics."""
@@ -124,6 +165,7 @@ class TokenBucket:
             "available_tokens": self.tokens,
             "blocked_until": self.blocked_until,
             "is_blocked": self.is_blocked,
+            "rate_scale": self.rate_scale,
             "config": self.config.to_dict(),
         }
 
@@ -0,0 +1,298 @@
+"""
+Server-side subsetting for OPeNDAP (THREDDS) and ERDDAP griddap endpoints.
+
+Station and model products are published as whole files, but agents only use
+a few variables, the latest time steps and (for grids) a small lat/lon box.
+Both protocols can cut that hyperslab on the server:
+
+- OPeNDAP (DAP2): ``<url>.dds`` describes variables and dimension sizes;
+  ``<url>.ascii?var[start:stride:stop]`` returns only the requested index
+  ranges. ``<url>.das`` carries attributes such as time units.
+- ERDDAP griddap: ``<dataset>.csv?var[(t0):1:(t1)][...]`` selects each axis
+  by value (or by index with ``last``) and returns CSV.
+
+This module builds the constraint expressions and parses the DAP2 text
+responses; it does no I/O itself.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+ERDDAP_GRID_AXES = ("time", "depth", "latitude", "longitude")
+
+_DDS_VAR_RE = re.compile(r"^\s*(\w+)\s+([\w.]+)((?:\s*\[\s*\w+\s*=\s*\d+\s*\])*)\s*;", re.MULTILINE)
+_DDS_DIM_RE = re.compile(r"\[\s*(\w+)\s*=\s*(\d+)\s*\]")
+_DAS_ATTR_RE = re.compile(r"^\s*(\w+)\s+([\w.]+)\s+(.*);\s*$")
+_ASCII_HEADER_RE = re.compile(r"^([\w.]+)((?:\[\d+\])*)$")
+_INDEX_PREFIX_RE = re.compile(r"^(?:\[\d+\])+,\s*")
+_CF_TIME_RE = re.compile(
+    r"^\s*(\w+)\s+since\s+(\d{4}-\d{1,2}-\d{1,2})(?:[ T](\d{1,2}:\d{2}(?::\d{2})?))?"
+)
+_CF_UNITS = {
+    "seconds": "s",
+    "second": "s",
+    "minutes": "m",
+    "minute": "m",
+    "hours": "h",
+    "hour": "h",
+    "days": "D",
+    "day": "D",
+}
+
+
+@dataclass(frozen=True)
+class DapVariable:
+    """Variable declared in an OPeNDAP DDS."""
+
+    name: str
+    dtype: str
+    dims: tuple[tuple[str, int], ...]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(size for _, size in self.dims)
+
+
+def parse_dds(text: str) -> dict[str, DapVariable]:
+    """
+    Parse an OPeNDAP Dataset Descriptor Structure.
+
+    Grid map vectors repeat their coordinate variables; the first declaration
+    of each name wins.
+
+    Args:
+        text: DDS response body
+
+    Returns:
+        Mapping of variable name to DapVariable
+    """
+    variables: dict[str, DapVariable] = {}
+    for dtype, name, dims in _DDS_VAR_RE.findall(text):
+        if dtype in {"Dataset", "Grid", "Structure", "Sequence"} or name in variables:
+            continue
+        shape = tuple((dim, int(size)) for dim, size in _DDS_DIM_RE.findall(dims))
+        variables[name] = DapVariable(name, dtype, shape)
+    return variables
+
+
+def parse_das(text: str) -> dict[str, dict[str, Any]]:
+    """
+    Parse an OPeNDAP Dataset Attribute Structure.
+
+    Args:
+        text: DAS response body
+
+    Returns:
+        Mapping of container name (variable name or ``NC_GLOBAL``) to attributes.
+        Single values are unwrapped; numeric types are converted.
+    """
+    attributes: dict[str, dict[str, Any]] = {}
+    stack: list[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.endswith("{"):
+            stack.append(stripped[:-1].strip())
+            continue
+        if stripped.startswith("}"):
+            if stack:
+                stack.pop()
+            continue
+        match = _DAS_ATTR_RE.match(line)
+        if not match or not stack:
+            continue
+        dtype, name, raw = match.groups()
+        if dtype == "String":
+            values: list[Any] = [
+                value.replace('\\"', '"') for value in re.findall(r'"((?:[^"\\]|\\.)*)"', raw)
+            ]
+        else:
+            values = [_to_number(value.strip(), dtype) for value in raw.split(",")]
+        attributes.setdefault(stack[-1], {})[name] = values[0] if len(values) == 1 else values
+    return attributes
+
+
+def opendap_constraint(
+    variables: dict[str, DapVariable],
+    names: Iterable[str],
+    time_steps: int = 1,
+) -> str:
+    """
+    Build a DAP2 hyperslab constraint for the latest records of some variables.
+
+    Time dimensions (named ``time`` or ending in ``Time``) are limited to the
+    last ``time_steps`` indices; other dimensions are requested in full.
+    Names missing from the DDS are skipped.
+
+    Args:
+        variables: Parsed DDS
+        names: Variables to request
+        time_steps: Number of trailing time records
+
+    Returns:
+        Constraint expression, e.g. ``waveHs[1438:1:1439],waveFrequency[0:1:63]``
+    """
+    projections = []
+    for name in names:
+        variable = variables.get(name)
+        if variable is None:
+            continue
+        ranges = []
+        for dim, size in variable.dims:
+            if size == 0:
+                break
+            start = max(size - time_steps, 0) if _is_time_dim(dim) else 0
+            ranges.append(f"[{start}:1:{size - 1}]")
+        else:
+            projections.append(name + "".join(ranges))
+    return ",".join(projections)
+
+
+def parse_dap_ascii(text: str) -> dict[str, Any]:
+    """
+    Parse a DAP2 ``.ascii`` response.
+
+    Handles plain arrays (``name[2][4]`` followed by ``[i], v, ...`` rows),
+    Grid members (``grid.array``/``grid.map``; maps are kept under their own
+    name) and scalars (``name, value``).
+
+    Args:
+        text: ASCII response body
+
+    Returns:
+        Mapping of variable name to numpy array (or list of strings)
+    """
+    separator = re.search(r"^-{10,}\s*$", text, re.MULTILINE)
+    body = text[separator.end() :] if separator else text
+
+    arrays: dict[str, Any] = {}
+    name: str | None = None
+    shape: tuple[int, ...] = ()
+    values: list[str] = []
+
+    def finish() -> None:
+        if name is not None and name not in arrays:
+            arrays[name] = _to_array(values, shape)
+
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            finish()
+            name, values = None, []
+            continue
+        if name is None:
+            header = _ASCII_HEADER_RE.match(line)
+            if header:
+                name = header.group(1).rsplit(".", 1)[-1]
+                shape = tuple(int(size) for size in re.findall(r"\d+", header.group(2)))
+                continue
+            label, _, value = line.partition(",")
+            arrays.setdefault(label.strip().rsplit(".", 1)[-1], _to_array([value], ()))
+            continue
+        values.extend(part.strip() for part in _INDEX_PREFIX_RE.sub("", line).split(","))
+    finish()
+    return arrays
+
+
+def cf_datetimes(values: Any, units: str | None) -> np.ndarray:
+    """
+    Convert CF ``<unit> since <epoch>`` numbers to ``datetime64[s]``.
+
+    Args:
+        values: Numeric time values
+        units: CF units string (e.g. ``seconds since 1970-01-01 00:00:00 UTC``)
+
+    Returns:
+        datetime64 array; the input unchanged if the units aren't understood
+    """
+    match = _CF_TIME_RE.match(units or "")
+    unit = _CF_UNITS.get(match.group(1).lower()) if match else None
+    if unit is None:
+        return np.asarray(values)
+    year, month, day = (int(part) for part in match.group(2).split("-"))
+    hour, minute, second = ([int(part) for part in (match.group(3) or "0").split(":")] + [0, 0])[:3]
+    epoch = np.datetime64(
+        f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}", "s"
+    )
+    seconds_per_unit = np.timedelta64(1, unit) / np.timedelta64(1, "s")
+    offsets = np.rint(np.asarray(values, dtype=float) * seconds_per_unit)
+    return epoch + offsets.astype("timedelta64[s]")
+
+
+def erddap_griddap_url(
+    dataset_url: str,
+    variables: Sequence[str],
+    *,
+    time_steps: int = 1,
+    time_range: Sequence[str] | None = None,
+    latitude: Sequence[float] | None = None,
+    longitude: Sequence[float] | None = None,
+    depth: float | None = None,
+    stride: int = 1,
+    axes: Sequence[str] = ERDDAP_GRID_AXES,
+    file_type: str = "csv",
+) -> str:
+    """
+    Build an ERDDAP griddap request for a hyperslab of a dataset.
+
+    Args:
+        dataset_url: Dataset URL without extension
+            (e.g. ``https://.../erddap/griddap/ww3_hawaii``)
+        variables: Data variables to return
+        time_steps: Number of latest time steps (ignored with ``time_range``)
+        time_range: ``(start, end)`` ISO-8601 times
+        latitude: ``(min, max)`` latitude box
+        longitude: ``(min, max)`` longitude box, in the dataset's convention
+        depth: Single depth value (all depths when None)
+        stride: Spatial stride for the lat/lon box
+        axes: Dataset axes in order
+        file_type: ERDDAP response type (csv, nc, json, ...)
+
+    Returns:
+        Request URL
+    """
+    ranges = []
+    for axis in axes:
+        if axis == "time":
+            if time_range:
+                ranges.append(f"[({time_range[0]}):1:({time_range[1]})]")
+            elif time_steps > 1:
+                ranges.append(f"[last-{time_steps - 1}:1:last]")
+            else:
+                ranges.append("[last]")
+        elif axis == "latitude" and latitude:
+            ranges.append(f"[({latitude[0]}):{stride}:({latitude[1]})]")
+        elif axis == "longitude" and longitude:
+            ranges.append(f"[({longitude[0]}):{stride}:({longitude[1]})]")
+        elif axis == "depth" and depth is not None:
+            ranges.append(f"[({depth})]")
+        else:
+            ranges.append("[0:1:last]")
+    constraint = "".join(ranges)
+    return f"{dataset_url.rstrip('/')}.{file_type}?" + ",".join(
+        f"{variable}{constraint}" for variable in variables
+    )
+
+
+def _is_time_dim(dim: str) -> bool:
+    return dim.lower() == "time" or dim.endswith("Time")
+
+
+def _to_number(value: str, dtype: str) -> Any:
+    try:
+        return float(value) if dtype.startswith("Float") else int(value)
+    except ValueError:
+        return value
+
+
+def _to_array(values: list[str], shape: tuple[int, ...]) -> Any:
+    if values and all(value.startswith('"') for value in values):
+        return [value.strip('"') for value in values]
+    try:
+        array = np.array([float(value) for value in values])
+    except ValueError:
+        return values
+    return array.reshape(shape) if shape and array.size == int(np.prod(shape)) else array
@@ -0,0 +1,175 @@
+"""
+Shared worker pool for CPU-bound work in data collection agents.
+
+Agents parse downloaded payloads (NDBC text, WW3 CSV, netCDF, METAR) inside
+``async def collect``. Parsing on the event loop stalls every other in-flight
+download, so agents hand those callables to a shared pool instead:
+
+- ``thread`` (default): a ThreadPoolExecutor; works for any callable, and
+  numpy/xarray release the GIL for much of their work
+- ``process``: a ProcessPoolExecutor for pure-Python parsers; callables and
+  arguments must be picklable (agents drop their HTTP client when pickled).
+  Callables that can't be pickled run on the thread pool instead
+- ``inline``: run on the calling thread (previous behaviour)
+
+Each call reports the CPU time it used, measured in the worker, so agents
+can account for their parsing cost.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import pickle
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process", "inline")
+
+
+def _timed_call(func: Callable[..., T], args: tuple, kwargs: dict) -> tuple[T, float]:
+    """Run func and return (result, CPU seconds used by the worker thread)."""
+    start = time.thread_time()
+    result = func(*args, **kwargs)
+    return result, time.thread_time() - start
+
+
+class WorkerPool:
+    """
+    Lazily created executor shared by all agents.
+
+    Features:
+    - Thread, process or inline execution
+    - Per-call CPU time measured in the worker
+    - Thread-pool fallback for callables that can't be sent to a process
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 0, logger=None):
+        """
+        Initialize the pool.
+
+        Args:
+            kind: Executor kind (thread, process or inline)
+            max_workers: Worker count (0 = CPU count)
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If kind is not a known executor kind
+        """
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind {kind!r}; expected one of {EXECUTOR_KINDS}")
+        self.kind = kind
+        self.max_workers = max_workers if max_workers > 0 else os.cpu_count() or 1
+        self.logger = logger or logging.getLogger("core.worker_pool")
+        self._executor: Executor | None = None
+        self._thread_fallback: ThreadPoolExecutor | None = None
+        # Callable qualname -> whether it can be sent to a worker process
+        self._picklable: dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, float]:
+        """
+        Run a callable in the pool.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            (result, CPU seconds used)
+        """
+        if self.kind == "inline":
+            return _timed_call(func, args, kwargs)
+
+        executor = self._executor_for(func)
+        call = functools.partial(_timed_call, func, args, kwargs)
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executors; they are recreated on next use."""
+        with self._lock:
+            executors = [self._executor, self._thread_fallback]
+            self._executor = self._thread_fallback = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
+    def _executor_for(self, func: Callable) -> Executor:
+        with self._lock:
+            if self.kind == "process" and not self._can_pickle(func):
+                if self._thread_fallback is None:
+                    self._thread_fallback = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="parse"
+                    )
+                return self._thread_fallback
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="parse"
+                    )
+            return self._executor
+
+    def _can_pickle(self, func: Callable) -> bool:
+        key = getattr(func, "__qualname__", repr(func))
+        picklable = self._picklable.get(key)
+        if picklable is None:
+            try:
+                pickle.dumps(func)
+                picklable = True
+            except Exception as e:
+                self.logger.debug(f"{key} can't run in a worker process ({e}); using threads")
+                picklable = False
+            self._picklable[key] = picklable
+        return picklable
+
+
+_shared_pools: dict[tuple[str, int], WorkerPool] = {}
+_shared_lock = threading.Lock()
+
+
+def get_worker_pool(config: Any) -> WorkerPool:
+    """
+    Get the shared worker pool for a configuration.
+
+    Reads ``data_collection.parse_executor`` (thread, process or inline;
+    default thread) and ``data_collection.parse_workers`` (default 0 = CPU
+    count). Agents with the same settings share one pool.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        WorkerPool
+    """
+    kind = config.get("data_collection", "parse_executor", "thread")
+    if kind not in EXECUTOR_KINDS:
+        logging.getLogger("core.worker_pool").warning(
+            f"Unknown data_collection.parse_executor {kind!r}; using thread"
+        )
+        kind = "thread"
+    max_workers = config.getint("data_collection", "parse_workers", 0)
+    if not isinstance(max_workers, int):
+        max_workers = 0
+    key = (kind, max_workers)
+    with _shared_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = _shared_pools[key] = WorkerPool(kind, max_workers)
+        return pool
+
+
+def shutdown_worker_pools(wait: bool = True) -> None:
+    """Shut down all shared worker pools."""
+    with _shared_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -44,41 +44,32 @@ def build_context(forecast_data: dict[str, Any]) -> dict[str, Any]:
         shore: _build_shore_digest(shore_info) for shore, shore_info in shore_data.items()
     }
 
-    sections = [
-        "=== DATA QUALITY & CONFIDENCE ===",
-        overview,
-        gaps,
-        "",
-        "=== SWELL MATRIX (HST) ===",
-        swell_matrix,
-        "",
-        "=== 3-DAY TIMELINE ESTIMATE (HST) ===",
-        timeline,
-        "",
-        "=== WEATHER SNAPSHOT ===",
-        weather,
-        "",
-        "=== TIDES ===",
-        tides,
-        "",
-        "=== UPPER-AIR DIAGNOSTICS ===",
-        upper_air,
-        "",
-        "=== CLIMATOLOGY REFERENCES ===",
-        climatology,
-        "",
-        "=== TROPICAL & SYNOPTIC NOTES ===",
-        tropical,
-    ]
-
-    data_digest = "\n".join(line for line in sections if line)
+    digest_sections = {
+        name: "\n".join(line for line in lines if line)
+        for name, lines in (
+            ("data_quality", ["=== DATA QUALITY & CONFIDENCE ===", overview, gaps]),
+            ("swell_matrix", ["=== SWELL MATRIX (HST) ===", swell_matrix]),
+            ("timeline", ["=== 3-DAY TIMELINE ESTIMATE (HST) ===", timeline]),
+            ("weather", ["=== WEATHER SNAPSHOT ===", weather]),
+            ("tides", ["=== TIDES ===", tides]),
+            ("upper_air", ["=== UPPER-AIR DIAGNOSTICS ===", upper_air]),
+            ("climatology", ["=== CLIMATOLOGY REFERENCES ===", climatology]),
+            ("tropical", ["=== TROPICAL & SYNOPTIC NOTES ===", tropical]),
+        )
+    }
 
     return {
-        "data_digest": data_digest,
+        "data_digest": join_digest_sections(digest_sections),
+        "digest_sections": digest_sections,
         "shore_digests": shore_digests,
     }
 
 
+def join_digest_sections(digest_sections: dict[str, str]) -> str:
+    """Assemble the data digest from its (possibly trimmed) sections."""
+    return "\n".join(section for section in digest_sections.values() if section)
+
+
 # ---------------------------------------------------------------------------
 # Section builders
 # ---------------------------------------------------------------------------
@@ -6,14 +6,26 @@ for the forecast engine, separating data concerns from AI orchestration.
 """
 
 import copy
+import dataclasses
 import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from ..core.image_prep import ImagePreparer
 from ..processing.models.swell_event import SwellForecast
 from .context_builder import build_context
+from .prompt_templates import PromptTemplates
+from .token_budget import (
+    TokenEstimate,
+    count_digest_sections,
+    count_prompt_sections,
+    trim_to_budget,
+)
+
+# Per-image token guesses by detail level when dimensions are unknown
+FALLBACK_IMAGE_TOKENS = {"high": 3000, "auto": 1500, "low": 500}
 
 
 class ForecastDataManager:
@@ -38,6 +50,8 @@ class ForecastDataManager:
         image_detail_satellite: str = "auto",
         image_detail_sst: str = "low",
         logger: logging.Logger | None = None,
+        image_preparer: ImagePreparer | None = None,
+        templates: PromptTemplates | None = None,
     ):
         """
         Initialize data manager with configuration.
@@ -49,6 +63,10 @@ class ForecastDataManager:
             image_detail_satellite: Detail level for satellite imagery (high/auto/low)
             image_detail_sst: Detail level for SST charts (high/auto/low)
             logger: Logger instance for this manager
+            image_preparer: Optional image preparer used to estimate image
+                tokens from real (post-resize) dimensions
+            templates: Optional prompt templates used to count the rendered
+                main forecast prompt
         """
         self.max_images = max_images
         self.image_detail_pressure = image_detail_pressure
@@ -56,6 +74,8 @@ class ForecastDataManager:
         self.image_detail_satellite = image_detail_satellite
         self.image_detail_sst = image_detail_sst
         self.logger = logger or logging.getLogger("forecast.data_manager")
+        self.image_preparer = image_preparer
+        self.templates = templates
 
         # Log configuration
         self.logger.info(f"Data Manager initialized: max_images={self.max_images}")
@@ -137,10 +157,14 @@ class ForecastDataManager:
 
             # Only include events that still have at least one valid component
             if valid_primary or valid_secondary:
-                # Create filtered event
-                event.primary_components = valid_primary
-                event.secondary_components = valid_secondary
-                valid_swell_events.append(event)
+                # Create filtered event (the input forecast is left untouched)
+                valid_swell_events.append(
+                    dataclasses.replace(
+                        event,
+                        primary_components=valid_primary,
+                        secondary_components=valid_secondary,
+                    )
+                )
             else:
                 excluded_event_count += 1
                 self.logger.warning(
@@ -271,6 +295,7 @@ class ForecastDataManager:
         # Build rich context strings for the LLM prompts
         context_summary = build_context(forecast_data)
         forecast_data["data_digest"] = context_summary.get("data_digest", "")
+        forecast_data["digest_sections"] = context_summary.get("digest_sections", {})
         forecast_data["shore_digests"] = context_summary.get("shore_digests", {})
 
         return forecast_data
@@ -643,86 +668,99 @@ class ForecastDataManager:
         """
         Estimate total token usage for forecast generation.
 
-        This estimates tokens from:
-        - Text data (swell events, shore data, prompts)
-        - Images (based on detail level)
-        - Expected output
+        Args:
+            forecast_data: Prepared forecast data
+
+        Returns:
+            Estimated token count (see estimate_token_usage)
+        """
+        return self.estimate_token_usage(forecast_data).total
+
+    def estimate_token_usage(self, forecast_data: dict[str, Any]) -> TokenEstimate:
+        """
+        Estimate token usage for forecast generation, broken down by source.
 
         Token calculation:
-        - Text: ~4 chars per token
-        - Images (high detail): 3000 tokens
-        - Images (auto detail): 1500 tokens
-        - Images (low detail): 500 tokens
-        - Base prompt overhead: 5000 tokens
+        - Text: the rendered main forecast prompt (system prompt, user prompt
+          and each data digest section) counted with a local tokenizer; without
+          prompt templates, the digest plus a 5000 token prompt overhead
+        - Images: computed from post-resize dimensions when an image preparer
+          is available, otherwise 3000 (high), 1500 (auto) or 500 (low) each
         - Output estimate: 10000 tokens
 
         Args:
             forecast_data: Prepared forecast data
 
         Returns:
-            Estimated token count
+            TokenEstimate
         """
-        # Text data estimation (rough: ~4 chars per token)
-        text_tokens = 0
-
-        # Forecast data structures
-        swell_events_str = str(forecast_data.get("swell_events", []))
-        shore_data_str = str(forecast_data.get("shore_data", {}))
-        text_tokens += len(swell_events_str) // 4
-        text_tokens += len(shore_data_str) // 4
-
-        # System prompts and templates (estimated)
-        text_tokens += 5000  # Base prompt overhead including system prompts
+        if self.templates is not None:
+            prompt = count_prompt_sections(forecast_data, self.templates)
+        else:
+            prompt = {"prompt_overhead": 5000, **count_digest_sections(forecast_data)}
 
         # Image token estimation (based on actual image detail levels configured)
-        image_tokens = 0
         images = forecast_data.get("images", {})
+        image_tokens = (
+            # Pressure charts (4 images)
+            self.estimate_image_tokens(
+                images.get("pressure_charts", [])[:4], self.image_detail_pressure
+            )
+            # Wave models (4 images)
+            + self.estimate_image_tokens(images.get("wave_models", [])[:4], self.image_detail_wave)
+            # Satellite (1 image)
+            + self.estimate_image_tokens(
+                images.get("satellite", [])[:1], self.image_detail_satellite
+            )
+            # SST charts (1 image)
+            + self.estimate_image_tokens(images.get("sst_charts", [])[:1], self.image_detail_sst)
+        )
 
-        # Pressure charts (4 images)
-        pressure_count = min(len(images.get("pressure_charts", [])), 4)
-        if self.image_detail_pressure == "high":
-            image_tokens += pressure_count * 3000
-        elif self.image_detail_pressure == "auto":
-            image_tokens += pressure_count * 1500
-        else:  # low
-            image_tokens += pressure_count * 500
-
-        # Wave models (4 images)
-        wave_count = min(len(images.get("wave_models", [])), 4)
-        if self.image_detail_wave == "high":
-            image_tokens += wave_count * 3000
-        elif self.image_detail_wave == "auto":
-            image_tokens += wave_count * 1500
-        else:  # low
-            image_tokens += wave_count * 500
-
-        # Satellite (1 image)
-        if images.get("satellite"):
-            if self.image_detail_satellite == "high":
-                image_tokens += 3000
-            elif self.image_detail_satellite == "auto":
-                image_tokens += 1500
-            else:  # low
-                image_tokens += 500
-
-        # SST charts (1 image)
-        if images.get("sst_charts"):
-            if self.image_detail_sst == "high":
-                image_tokens += 3000
-            elif self.image_detail_sst == "auto":
-                image_tokens += 1500
-            else:  # low
-                image_tokens += 500
-
-        # Output tokens (conservative estimate for forecast generation)
-        output_tokens = 10000  # Long-form forecast text
-
-        # Total estimate
-        total_tokens = text_tokens + image_tokens + output_tokens
-
+        estimate = TokenEstimate(prompt=prompt, images=image_tokens)
         self.logger.info(
-            f"Token estimate: {text_tokens} text + {image_tokens} images + "
-            f"{output_tokens} output = {total_tokens} total"
+            f"Token estimate: {estimate.text} text + {estimate.images} images + "
+            f"{estimate.output} output = {estimate.total} total"
         )
+        return estimate
 
-        return total_tokens
+    def trim_to_budget(
+        self, forecast_data: dict[str, Any], estimate: TokenEstimate, budget: int
+    ) -> list[str]:
+        """
+        Drop the lowest-value data digest sections until the estimate fits a budget.
+
+        Args:
+            forecast_data: Prepared forecast data (digest updated in place)
+            estimate: Estimate from estimate_token_usage (updated in place)
+            budget: Token budget to fit
+
+        Returns:
+            Names of the dropped digest sections
+        """
+        dropped = trim_to_budget(forecast_data, estimate, budget)
+        if dropped:
+            self.logger.info(
+                f"Trimmed data digest sections {', '.join(dropped)}: "
+                f"estimate now {estimate.total} tokens (budget {budget})"
+            )
+        return dropped
+
+    def estimate_image_tokens(self, paths: list[str], detail: str) -> int:
+        """
+        Estimate tokens for images sent at one detail level.
+
+        Args:
+            paths: Image paths
+            detail: Detail level (high/auto/low)
+
+        Returns:
+            Token estimate for all images
+        """
+        fallback = FALLBACK_IMAGE_TOKENS.get(detail, FALLBACK_IMAGE_TOKENS["low"])
+        total = 0
+        for path in paths:
+            tokens = None
+            if self.image_preparer is not None:
+                tokens = self.image_preparer.estimate_tokens(path, detail)
+            total += fallback if tokens is None else tokens
+        return total
@@ -14,17 +14,23 @@ from pathlib import Path
 from typing import Any
 
 from ..core.config import Config
+from ..core.image_prep import create_image_preparer
+from ..core.llm_cache import create_llm_cache
 from ..core.openai_client import OpenAIClient
+from ..core.rate_limiter import RateLimitConfig
 from ..processing.models.swell_event import SwellForecast
 from ..processing.storm_detector import StormDetector
 from ..utils.prompt_loader import PromptLoader
 from ..utils.swell_propagation import SwellPropagationCalculator
 from ..utils.validation_feedback import ValidationFeedback
 from .data_manager import ForecastDataManager
+from .generation_scheduler import GenerationScheduler, GenerationStep
 from .local_generator import LocalForecastGenerator
 from .model_settings import ModelSettings
 from .prompt_templates import PromptTemplates
 
+SHORE_FORECASTS = ("north_shore", "south_shore", "east_shore", "west_shore")
+
 
 class ForecastEngine:
     """
@@ -189,6 +195,24 @@ class ForecastEngine:
             f"sst={self.image_detail_sst}"
         )
 
+        # Persistent response cache shared by all clients (None when disabled)
+        self.response_cache = create_llm_cache(self.config)
+
+        # Resized/encoded image cache shared by all clients (None sends files as-is)
+        self.image_preparer = create_image_preparer(self.config)
+
+        # Connection limits shared by all clients of a provider: concurrent
+        # requests, request rate (adapts down on 429s) and retries
+        self.api_client_options = {
+            "max_concurrency": max(1, self.config.getint("openai", "max_concurrency", 4)),
+            "rate_limit": RateLimitConfig(
+                requests_per_second=self.config.getfloat("openai", "requests_per_second", 10.0),
+                burst_size=self.config.getint("openai", "burst_size", 10),
+            ),
+            "max_retries": self.config.getint("openai", "max_retries", 3),
+            "image_preparer": self.image_preparer,
+        }
+
         # Initialize OpenAI-compatible client (works with OpenAI and Kimi K2)
         self.openai_client = OpenAIClient(
             api_key=self.openai_api_key,
@@ -197,6 +221,9 @@ class ForecastEngine:
             temperature=self.temperature,
             logger=self.logger.getChild("openai_client"),
             base_url=self.base_url,  # None for OpenAI, custom URL for Kimi K2
+            cache=self.response_cache,
+            settings=self.primary_model_settings.into_response_kwargs(),
+            **self.api_client_options,
         )
 
         # Hybrid Vision Architecture for non-vision primary models
@@ -251,6 +278,8 @@ class ForecastEngine:
                         temperature=0.3,
                         logger=self.logger.getChild("vision_client"),
                         base_url=self.base_url,  # Same Kimi base URL
+                        cache=self.response_cache,
+                        **self.api_client_options,
                     )
                     self.logger.info(
                         f"Kimi vision enabled: {self.vision_model} for images, {model_name} for reasoning (all free)"
@@ -268,6 +297,8 @@ class ForecastEngine:
                             temperature=0.3,
                             logger=self.logger.getChild("vision_client"),
                             base_url=None,
+                            cache=self.response_cache,
+                            **self.api_client_options,
                         )
                         self.logger.info(
                             f"Hybrid vision enabled: {self.vision_model} for images, {model_name} for reasoning"
@@ -285,6 +316,8 @@ class ForecastEngine:
                         temperature=0.3,
                         logger=self.logger.getChild("vision_client"),
                         base_url=None,
+                        cache=self.response_cache,
+                        **self.api_client_options,
                     )
                     self.logger.info(
                         f"Hybrid vision enabled: {self.vision_model} for images, {model_name} for reasoning"
@@ -300,6 +333,8 @@ class ForecastEngine:
             image_detail_satellite=self.image_detail_satellite,
             image_detail_sst=self.image_detail_sst,
             logger=self.logger.getChild("data_manager"),
+            image_preparer=self.image_preparer,
+            templates=self.templates,
         )
 
         # Initialize storm detection components
@@ -313,6 +348,24 @@ class ForecastEngine:
             "forecast", "enable_budget_enforcement", True
         )
         self.estimated_tokens = 0
+        # What to do when the prompt is over budget: 'fallback' switches the main
+        # forecast to the local generator, 'trim' first drops the lowest-value
+        # data digest sections to fit the budget
+        self.budget_strategy = self.config.get("forecast", "budget_strategy", "fallback")
+
+        # Generation scheduling: cap concurrent API-bound steps, and choose which
+        # shore forecasts wait for storm arrivals. By default every shore does, so
+        # prompts are unchanged; shores left out of the list start immediately,
+        # alongside image analysis, without arrival context.
+        self.max_concurrent_generations = max(
+            1, self.config.getint("forecast", "max_concurrent_generations", 4)
+        )
+        arrival_shores = self.config.get("forecast", "arrival_context_shores", None)
+        if arrival_shores is None:
+            arrival_shores = SHORE_FORECASTS
+        elif isinstance(arrival_shores, str):
+            arrival_shores = [shore.strip() for shore in arrival_shores.split(",") if shore.strip()]
+        self.arrival_context_shores = set(arrival_shores)
 
         # Log budget configuration
         self.logger.info(
@@ -432,23 +485,11 @@ class ForecastEngine:
                 # When specialist workflow is fully implemented, it will replace
                 # the individual _generate_* calls with senior_forecaster synthesis.
 
-            # Generate main forecast (Must run first to populate storm_arrivals from image analysis)
-            main_forecast = await self._generate_main_forecast(forecast_data)
-
-            # Generate derivative forecasts in parallel to reduce total latency
-            north_task = self._generate_shore_forecast("north_shore", forecast_data)
-            south_task = self._generate_shore_forecast("south_shore", forecast_data)
-            east_task = self._generate_shore_forecast("east_shore", forecast_data)
-            west_task = self._generate_shore_forecast("west_shore", forecast_data)
-            daily_task = self._generate_daily_forecast(forecast_data)
-
-            (
-                north_shore_forecast,
-                south_shore_forecast,
-                east_shore_forecast,
-                west_shore_forecast,
-                daily_forecast,
-            ) = await asyncio.gather(north_task, south_task, east_task, west_task, daily_task)
+            # Generate all sections as a dependency graph: each step starts as soon
+            # as its inputs (storm arrivals, adaptive context, ...) are ready
+            sections = await self._run_generation_steps(forecast_data)
+            main_forecast = sections["main_forecast"]
+            daily_forecast = sections["daily"]
 
             # Get API usage metrics
             metrics = await self.openai_client.get_metrics()
@@ -458,6 +499,13 @@ class ForecastEngine:
                 "input_tokens": metrics["input_tokens"],
                 "output_tokens": metrics["output_tokens"],
                 "model": self.openai_model,
+                "cache_hits": metrics.get("cache_hits", 0),
+                "cache_misses": metrics.get("cache_misses", 0),
+                "saved_tokens": metrics.get("saved_input_tokens", 0)
+                + metrics.get("saved_output_tokens", 0),
+                "saved_cost": metrics.get("saved_cost", 0.0),
+                "rate_limited": metrics.get("rate_limited", 0),
+                "latency": metrics.get("latency", {}),
             }
             cost_summary = (
                 metrics["total_cost"],
@@ -487,10 +535,10 @@ class ForecastEngine:
                 "forecast_id": forecast_id,
                 "generated_time": generated_time,
                 "main_forecast": main_forecast,
-                "north_shore": north_shore_forecast,
-                "south_shore": south_shore_forecast,
-                "east_shore": east_shore_forecast,
-                "west_shore": west_shore_forecast,
+                "north_shore": sections["north_shore"],
+                "south_shore": sections["south_shore"],
+                "east_shore": sections["east_shore"],
+                "west_shore": sections["west_shore"],
                 "daily": daily_forecast,
                 "metadata": fused_metadata,
             }
@@ -512,6 +560,112 @@ class ForecastEngine:
                 "generated_time": datetime.now().isoformat(),
             }
 
+    def _build_generation_steps(self, forecast_data: dict[str, Any]) -> list[GenerationStep]:
+        """
+        Describe forecast generation as steps with declared inputs.
+
+        Image analysis produces the storm arrivals. The main narrative needs the
+        image analysis; shore forecasts listed in ``arrival_context_shores`` and
+        the daily forecast need the storm arrivals but not the main narrative,
+        so they run alongside it. Other shore forecasts start immediately.
+
+        Args:
+            forecast_data: Prepared forecast data (shared by all steps)
+
+        Returns:
+            List of GenerationStep objects
+        """
+
+        # Budget trims apply to the main prompt only (see _main_forecast_digest)
+        main_digest: dict[str, Any] = {}
+
+        async def analyze_images(_: dict[str, Any]) -> str | None:
+            nonlocal main_digest
+            digest = self._main_forecast_digest(forecast_data)
+            if digest is None:
+                return None
+            main_digest = digest
+            return await self._analyze_images(forecast_data)
+
+        async def storm_arrivals(_: dict[str, Any]) -> list[dict[str, Any]]:
+            return forecast_data.get("storm_arrivals", [])
+
+        async def adaptive_context(_: dict[str, Any]) -> str:
+            return self._get_adaptive_context()
+
+        async def main_forecast(inputs: dict[str, Any]) -> str:
+            return await self._generate_main_forecast(
+                {**forecast_data, **main_digest},
+                image_analysis=inputs["image_analysis"],
+                adaptive_context=inputs["adaptive_context"],
+            )
+
+        async def daily_forecast(inputs: dict[str, Any]) -> str:
+            return await self._generate_daily_forecast(
+                forecast_data, adaptive_context=inputs["adaptive_context"]
+            )
+
+        def shore_step(shore: str) -> GenerationStep:
+            include_arrivals = shore in self.arrival_context_shores
+
+            async def run(inputs: dict[str, Any]) -> str:
+                return await self._generate_shore_forecast(
+                    shore,
+                    forecast_data,
+                    adaptive_context=inputs["adaptive_context"],
+                    include_arrivals=include_arrivals,
+                )
+
+            requires = ("seasonal_context", "adaptive_context")
+            if include_arrivals:
+                requires += ("storm_arrivals",)
+            return GenerationStep(shore, run, requires=requires)
+
+        return [
+            GenerationStep("adaptive_context", adaptive_context, limited=False),
+            GenerationStep("image_analysis", analyze_images),
+            GenerationStep(
+                "storm_arrivals", storm_arrivals, requires=("image_analysis",), limited=False
+            ),
+            GenerationStep(
+                "main_forecast",
+                main_forecast,
+                requires=(
+                    "image_analysis",
+                    "storm_arrivals",
+                    "seasonal_context",
+                    "adaptive_context",
+                ),
+            ),
+            *(shore_step(shore) for shore in SHORE_FORECASTS),
+            GenerationStep(
+                "daily", daily_forecast, requires=("storm_arrivals", "adaptive_context")
+            ),
+        ]
+
+    async def _run_generation_steps(self, forecast_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run the forecast generation steps under the configured concurrency limit.
+
+        Args:
+            forecast_data: Prepared forecast data
+
+        Returns:
+            Dictionary of step outputs keyed by step name
+        """
+        scheduler = GenerationScheduler(
+            max_concurrency=self.max_concurrent_generations,
+            logger=self.logger.getChild("scheduler"),
+        )
+        results = await scheduler.run(
+            self._build_generation_steps(forecast_data),
+            inputs={"seasonal_context": forecast_data.get("seasonal_context", {})},
+        )
+
+        timings = ", ".join(f"{name}={seconds:.1f}s" for name, seconds in scheduler.timings.items())
+        self.logger.info(f"Generation steps completed: {timings}")
+        return results
+
     def _check_token_budget(self, estimated: int) -> tuple[bool, str]:
         """
         Check if estimated token usage fits within budget.
@@ -558,22 +712,135 @@ class ForecastEngine:
 
         return (True, f"Within budget: {estimated}/{self.token_budget} ({pct_used:.1f}%)")
 
-    async def _generate_main_forecast(self, forecast_data: dict[str, Any]) -> str:
+    async def _generate_main_forecast(
+        self,
+        forecast_data: dict[str, Any],
+        image_analysis: str | None = None,
+        adaptive_context: str | None = None,
+    ) -> str:
         """
         Generate the main comprehensive forecast.
 
         Args:
             forecast_data: Prepared forecast data
+            image_analysis: Image analysis from _analyze_images; when None the
+                budget is checked and the images are analyzed here
+            adaptive_context: Adaptive performance context; looked up when None
 
         Returns:
             Generated forecast text
         """
-        if self.use_local_generator:
-            generator = LocalForecastGenerator(forecast_data)
-            return generator.build_main_forecast()
+        if image_analysis is None:
+            main_digest = self._main_forecast_digest(forecast_data)
+            if main_digest is None:
+                generator = LocalForecastGenerator(forecast_data)
+                return generator.build_main_forecast()
+            # Storm arrivals from image analysis go to the shared forecast_data
+            image_analysis = await self._analyze_images(forecast_data)
+            forecast_data = {**forecast_data, **main_digest}
+
+        # Now generate forecast with both text data AND image analysis
+        prompt = self.templates.get_caldwell_prompt(forecast_data)
+        if image_analysis:
+            prompt = f"{prompt}\n\n{image_analysis}\n\nIntegrate the above image analysis into your forecast."
+
+        # Add swell arrival predictions if available
+        arrival_context = self._format_arrival_predictions(forecast_data)
+        if arrival_context:
+            prompt = f"{prompt}\n\n{arrival_context}\n\nIncorporate the above swell arrival predictions into your forecast timeline."
+
+        # Get template
+        template = self.templates.get_template("caldwell")
+        system_prompt = template.get("system_prompt", "")
+
+        # Add seasonal context to system prompt
+        seasonal_context = forecast_data.get("seasonal_context", {})
+        season = seasonal_context.get("current_season", "unknown")
+        seasonal_patterns = seasonal_context.get("seasonal_patterns", {})
 
-        # Estimate token usage and check budget
-        self.estimated_tokens = self.data_manager.estimate_tokens(forecast_data)
+        system_prompt += f"\nCurrent Season: {season.title()}\n"
+        system_prompt += f"Typical {season.title()} Patterns:\n"
+        for shore, info in seasonal_patterns.items():
+            system_prompt += (
+                f"- {shore.replace('_', ' ').title()}: {info.get('typical_conditions', '')}\n"
+            )
+
+        # Add confidence information
+        confidence = forecast_data.get("confidence", {})
+        overall_confidence = confidence.get("overall_score", 0.7)
+
+        system_prompt += f"\nOverall Forecast Confidence: {overall_confidence:.1f}/1.0\n"
+        if overall_confidence < 0.6:
+            system_prompt += (
+                "Include appropriate language indicating lower confidence in the forecast.\n"
+            )
+
+        # Add adaptive context based on recent performance
+        if adaptive_context is None:
+            adaptive_context = self._get_adaptive_context()
+        if adaptive_context:
+            system_prompt += f"\n\n{adaptive_context}"
+
+        # Generate forecast with timeout
+        try:
+            self.logger.info(f"Calling {self.openai_model} for main forecast generation...")
+            forecast = await asyncio.wait_for(
+                self.openai_client.call_openai_api(system_prompt, prompt), timeout=300.0
+            )
+            self.logger.info("Main forecast generation completed")
+        except TimeoutError:
+            self.logger.error("Main forecast generation timed out after 5 minutes")
+            forecast = "Error: Forecast generation timed out. Please try again."
+            return forecast
+        except Exception as e:
+            self.logger.error(f"Error in main forecast generation: {e}")
+            forecast = f"Error generating forecast: {str(e)}"
+            return forecast
+
+        # Apply iterative refinement if enabled
+        if self.refinement_cycles > 0:
+            forecast = await self._refine_forecast(forecast, forecast_data)
+
+        return forecast
+
+    def _main_forecast_digest(self, forecast_data: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Fit the main forecast prompt to the token budget.
+
+        The trim works on a copy: shore and daily prompts read the same
+        forecast_data (concurrently, under the generation scheduler) and keep
+        the full digest.
+
+        Args:
+            forecast_data: Prepared forecast data (not modified)
+
+        Returns:
+            Digest keys to override for the main prompt (empty when nothing was
+            trimmed), or None when the main forecast must come from the local
+            generator (configured, or over budget even after trimming with
+            budget_strategy 'trim')
+        """
+        if self.use_local_generator:
+            return None
+
+        # Estimate token usage, trim the digest if configured, and check budget
+        overrides: dict[str, Any] = {}
+        estimate = self.data_manager.estimate_token_usage(forecast_data)
+        if (
+            self.budget_strategy == "trim"
+            and self.enable_budget_enforcement
+            and estimate.total > self.token_budget
+        ):
+            trimmed = {
+                **forecast_data,
+                "digest_sections": dict(forecast_data.get("digest_sections") or {}),
+            }
+            if self.data_manager.trim_to_budget(trimmed, estimate, self.token_budget):
+                overrides = {
+                    "digest_sections": trimmed["digest_sections"],
+                    "data_digest": trimmed["data_digest"],
+                }
+        self.estimated_tokens = estimate.total
         within_budget, budget_message = self._check_token_budget(self.estimated_tokens)
 
         self.logger.info(f"Token budget check: {budget_message}")
@@ -581,23 +848,32 @@ class ForecastEngine:
         if not within_budget:
             self.logger.error(f"Token budget exceeded: {budget_message}")
             self.logger.error("Falling back to local generator due to token limit")
-            generator = LocalForecastGenerator(forecast_data)
-            return generator.build_main_forecast()
+            return None
 
+        return overrides
+
+    async def _analyze_images(self, forecast_data: dict[str, Any]) -> str:
+        """
+        Run vision analysis on the selected charts and imagery.
+
+        Pressure chart analysis also runs storm detection, which stores the
+        predicted swell arrivals in forecast_data["storm_arrivals"].
+
+        Args:
+            forecast_data: Prepared forecast data
+
+        Returns:
+            Combined image analysis text (empty if no images were analyzed)
+        """
         # Get images and select critical ones (using configured max_images)
         images = forecast_data.get("images", {})
         selected_images = self.data_manager.select_critical_images(images)
 
         # Log token estimation
-        estimated_tokens = 0
-        for img in selected_images:
-            detail = img["detail"]
-            if detail == "high":
-                estimated_tokens += 3000
-            elif detail == "auto":
-                estimated_tokens += 1500
-            elif detail == "low":
-                estimated_tokens += 500
+        estimated_tokens = sum(
+            self.data_manager.estimate_image_tokens([img["url"]], img["detail"])
+            for img in selected_images
+        )
 
         if selected_images:
             self.logger.info(
@@ -796,76 +1072,23 @@ class ForecastEngine:
                 self.logger.error(f"Error in SST chart analysis: {e}")
                 image_analysis += f"\n\nSEA SURFACE TEMPERATURE ANALYSIS: [ERROR: {e}]\n"
 
-        # Now generate forecast with both text data AND image analysis
-        prompt = self.templates.get_caldwell_prompt(forecast_data)
-        if image_analysis:
-            prompt = f"{prompt}\n\n{image_analysis}\n\nIntegrate the above image analysis into your forecast."
-
-        # Add swell arrival predictions if available
-        arrival_context = self._format_arrival_predictions(forecast_data)
-        if arrival_context:
-            prompt = f"{prompt}\n\n{arrival_context}\n\nIncorporate the above swell arrival predictions into your forecast timeline."
-
-        # Get template
-        template = self.templates.get_template("caldwell")
-        system_prompt = template.get("system_prompt", "")
-
-        # Add seasonal context to system prompt
-        seasonal_context = forecast_data.get("seasonal_context", {})
-        season = seasonal_context.get("current_season", "unknown")
-        seasonal_patterns = seasonal_context.get("seasonal_patterns", {})
+        return image_analysis
 
-        system_prompt += f"\nCurrent Season: {season.title()}\n"
-        system_prompt += f"Typical {season.title()} Patterns:\n"
-        for shore, info in seasonal_patterns.items():
-            system_prompt += (
-                f"- {shore.replace('_', ' ').title()}: {info.get('typical_conditions', '')}\n"
-            )
-
-        # Add confidence information
-        confidence = forecast_data.get("confidence", {})
-        overall_confidence = confidence.get("overall_score", 0.7)
-
-        system_prompt += f"\nOverall Forecast Confidence: {overall_confidence:.1f}/1.0\n"
-        if overall_confidence < 0.6:
-            system_prompt += (
-                "Include appropriate language indicating lower confidence in the forecast.\n"
-            )
-
-        # Add adaptive context based on recent performance
-        adaptive_context = self._get_adaptive_context()
-        if adaptive_context:
-            system_prompt += f"\n\n{adaptive_context}"
-
-        # Generate forecast with timeout
-        try:
-            self.logger.info(f"Calling {self.openai_model} for main forecast generation...")
-            forecast = await asyncio.wait_for(
-                self.openai_client.call_openai_api(system_prompt, prompt), timeout=300.0
-            )
-            self.logger.info("Main forecast generation completed")
-        except TimeoutError:
-            self.logger.error("Main forecast generation timed out after 5 minutes")
-            forecast = "Error: Forecast generation timed out. Please try again."
-            return forecast
-        except Exception as e:
-            self.logger.error(f"Error in main forecast generation: {e}")
-            forecast = f"Error generating forecast: {str(e)}"
-            return forecast
-
-        # Apply iterative refinement if enabled
-        if self.refinement_cycles > 0:
-            forecast = await self._refine_forecast(forecast, forecast_data)
-
-        return forecast
-
-    async def _generate_shore_forecast(self, shore: str, forecast_data: dict[str, Any]) -> str:
+    async def _generate_shore_forecast(
+        self,
+        shore: str,
+        forecast_data: dict[str, Any],
+        adaptive_context: str | None = None,
+        include_arrivals: bool = True,
+    ) -> str:
         """
         Generate a shore-specific forecast.
 
         Args:
             shore: Shore name ('north_shore' or 'south_shore')
             forecast_data: Prepared forecast data
+            adaptive_context: Adaptive performance context; looked up when None
+            include_arrivals: Whether to add storm arrival predictions to the prompt
 
         Returns:
             Generated shore-specific forecast text
@@ -878,9 +1101,10 @@ class ForecastEngine:
         prompt = self.templates.get_shore_prompt(shore, forecast_data)
 
         # Add swell arrival predictions if available
-        arrival_context = self._format_arrival_predictions(forecast_data)
-        if arrival_context:
-            prompt = f"{prompt}\n\n{arrival_context}"
+        if include_arrivals:
+            arrival_context = self._format_arrival_predictions(forecast_data)
+            if arrival_context:
+                prompt = f"{prompt}\n\n{arrival_context}"
 
         # Get template - map shore to template name
         shore_to_template = {
@@ -911,7 +1135,8 @@ class ForecastEngine:
             system_prompt += f"- Typical Conditions: {shore_info.get('typical_conditions', '')}\n"
 
         # Add adaptive context
-        adaptive_context = self._get_adaptive_context()
+        if adaptive_context is None:
+            adaptive_context = self._get_adaptive_context()
         if adaptive_context:
             system_prompt += f"\n\n{adaptive_context}"
 
@@ -931,12 +1156,15 @@ class ForecastEngine:
 
         return forecast
 
-    async def _generate_daily_forecast(self, forecast_data: dict[str, Any]) -> str:
+    async def _generate_daily_forecast(
+        self, forecast_data: dict[str, Any], adaptive_context: str | None = None
+    ) -> str:
         """
         Generate a daily forecast.
 
         Args:
             forecast_data: Prepared forecast data
+            adaptive_context: Adaptive performance context; looked up when None
 
         Returns:
             Generated daily forecast text
@@ -958,7 +1186,8 @@ class ForecastEngine:
             prompt = f"{prompt}\n\n{arrival_context}"
 
         # Add adaptive context
-        adaptive_context = self._get_adaptive_context()
+        if adaptive_context is None:
+            adaptive_context = self._get_adaptive_context()
         if adaptive_context:
             system_prompt += f"\n\n{adaptive_context}"
 
@@ -11,6 +11,8 @@ from datetime import datetime
 from statistics import mean, stdev
 from typing import Any
 
+import numpy as np
+
 from ...processing.models.buoy_data import BuoyData, BuoyObservation
 from .base_specialist import BaseSpecialist
 from .schemas import (
@@ -23,6 +25,21 @@ from .schemas import (
 )
 
 
+def _present_values(buoy: BuoyData, field_name: str) -> list[float]:
+    """Non-missing values of one observation field, in series order."""
+    column = buoy.observations.column(field_name)
+    return column[~np.isnan(column)].tolist()
+
+
+def _pooled_values(buoy_data: list[BuoyData], field_name: str) -> np.ndarray:
+    """Non-missing values of one observation field across all buoys."""
+    columns = [buoy.observations.column(field_name) for buoy in buoy_data]
+    if not columns:
+        return np.empty(0)
+    pooled = np.concatenate(columns)
+    return pooled[~np.isnan(pooled)]
+
+
 class BuoyAnalyst(BaseSpecialist):
     """
     Specialist for analyzing buoy observation data.
@@ -249,20 +266,10 @@ class BuoyAnalyst(BaseSpecialist):
             if len(buoy.observations) < 2:
                 continue
 
-            # Extract time series data
-            heights = []
-            periods = []
-            directions = []
-            timestamps = []
-
-            for obs in buoy.observations:
-                if obs.wave_height is not None:
-                    heights.append(obs.wave_height)
-                    timestamps.append(obs.timestamp)
-                if obs.dominant_period is not None:
-                    periods.append(obs.dominant_period)
-                if obs.wave_direction is not None:
-                    directions.append(obs.wave_direction)
+            # Extract time series data (missing values dropped per variable)
+            heights = _present_values(buoy, "wave_height")
+            periods = _present_values(buoy, "dominant_period")
+            directions = _present_values(buoy, "wave_direction")
 
             # Calculate trends (simple linear slope)
             height_trend = self._calculate_trend(heights)
@@ -334,23 +341,16 @@ class BuoyAnalyst(BaseSpecialist):
         anomalies = []
 
         # Calculate global statistics for comparison
-        all_heights = []
-        all_periods = []
-
-        for buoy in buoy_data:
-            for obs in buoy.observations:
-                if obs.wave_height is not None:
-                    all_heights.append(obs.wave_height)
-                if obs.dominant_period is not None:
-                    all_periods.append(obs.dominant_period)
+        all_heights = _pooled_values(buoy_data, "wave_height")
+        all_periods = _pooled_values(buoy_data, "dominant_period")
 
         if len(all_heights) < 3 or len(all_periods) < 3:
             return anomalies  # Not enough data for meaningful statistics
 
-        height_mean = mean(all_heights)
-        height_std = stdev(all_heights)
-        period_mean = mean(all_periods)
-        period_std = stdev(all_periods)
+        height_mean = float(np.mean(all_heights))
+        height_std = float(np.std(all_heights, ddof=1))
+        period_mean = float(np.mean(all_periods))
+        period_std = float(np.std(all_periods, ddof=1))
 
         # Check each buoy for anomalies
         for buoy in buoy_data:
@@ -549,23 +549,18 @@ class BuoyAnalyst(BaseSpecialist):
         Returns:
             Dictionary with summary statistics
         """
-        all_heights = []
-        all_periods = []
-
-        for buoy in buoy_data:
-            for obs in buoy.observations:
-                if obs.wave_height is not None:
-                    all_heights.append(obs.wave_height)
-                if obs.dominant_period is not None:
-                    all_periods.append(obs.dominant_period)
+        all_heights = _pooled_values(buoy_data, "wave_height")
+        all_periods = _pooled_values(buoy_data, "dominant_period")
+        has_heights = len(all_heights) > 0
+        has_periods = len(all_periods) > 0
 
         stats = {
-            "avg_wave_height": round(mean(all_heights), 2) if all_heights else None,
-            "max_wave_height": round(max(all_heights), 2) if all_heights else None,
-            "min_wave_height": round(min(all_heights), 2) if all_heights else None,
-            "avg_period": round(mean(all_periods), 2) if all_periods else None,
-            "max_period": round(max(all_periods), 2) if all_periods else None,
-            "min_period": round(min(all_periods), 2) if all_periods else None,
+            "avg_wave_height": round(float(np.mean(all_heights)), 2) if has_heights else None,
+            "max_wave_height": round(float(np.max(all_heights)), 2) if has_heights else None,
+            "min_wave_height": round(float(np.min(all_heights)), 2) if has_heights else None,
+            "avg_period": round(float(np.mean(all_periods)), 2) if has_periods else None,
+            "max_period": round(float(np.max(all_periods)), 2) if has_periods else None,
+            "min_period": round(float(np.min(all_periods)), 2) if has_periods else None,
         }
 
         return stats
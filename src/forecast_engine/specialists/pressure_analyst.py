@@ -7,12 +7,13 @@ weather systems, fetch patterns, and predict swell generation.
 
 import json
 import logging
-import math
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ...utils.swell_propagation import SwellPropagationCalculator
 from .base_specialist import BaseSpecialist
 from .schemas import (
@@ -360,7 +361,8 @@ Return structured data in JSON format with NO markdown formatting or code blocks
         """
         Enhance swell predictions with physics-based calculations.
 
-        Uses SwellPropagationCalculator for accurate arrival timing.
+        Uses SwellPropagationCalculator for accurate arrival timing; all swells
+        with source coordinates are propagated in a single batch.
 
         Args:
             swells: List of predicted swells from vision API
@@ -370,6 +372,8 @@ Return structured data in JSON format with NO markdown formatting or code blocks
             Enhanced swell predictions
         """
         enhanced = []
+        # (enhanced swell, source lat, source lon, period, generation time)
+        pending: list[tuple[dict[str, Any], float, float, float, datetime]] = []
 
         for swell in swells:
             enhanced_swell = swell.copy()
@@ -406,7 +410,7 @@ Return structured data in JSON format with NO markdown formatting or code blocks
                 source_lat = source_system.get("location_lat")
                 source_lon = source_system.get("location_lon")
 
-            # Calculate physics-based arrival if we have coordinates
+            # Queue physics-based arrival if we have coordinates
             if source_lat is not None and source_lon is not None:
                 try:
                     # Get period estimate
@@ -433,27 +437,14 @@ Return structured data in JSON format with NO markdown formatting or code blocks
                         generation_time = datetime.now()
                         self.logger.debug("Using current time as generation_time fallback")
 
-                    # Calculate arrival using physics
-                    arrival_time, details = self.swell_calculator.calculate_arrival(
-                        source_lat=source_lat,
-                        source_lon=source_lon,
-                        period_seconds=avg_period,
-                        generation_time=generation_time,
-                    )
-
-                    # Add calculated data to swell
-                    enhanced_swell["calculated_arrival"] = arrival_time.isoformat()
-                    enhanced_swell["travel_time_hrs"] = round(details["travel_time_hours"], 1)
-                    enhanced_swell["distance_nm"] = round(details["distance_nm"], 0)
-                    enhanced_swell["group_velocity_knots"] = round(
-                        details["group_velocity_knots"], 1
-                    )
-                    enhanced_swell["propagation_method"] = "physics_based"
-
-                    self.logger.info(
-                        f"Calculated swell arrival: {source_lat}°N {source_lon}°E → Hawaii, "
-                        f"period={avg_period:.1f}s, arrival={arrival_time.strftime('%a %b %d %I:%M %p')}, "
-                        f"travel={details['travel_time_hours']:.1f}hrs"
+                    pending.append(
+                        (
+                            enhanced_swell,
+                            float(source_lat),
+                            float(source_lon),
+                            avg_period,
+                            generation_time,
+                        )
                     )
 
                 except Exception as e:
@@ -478,8 +469,49 @@ Return structured data in JSON format with NO markdown formatting or code blocks
 
             enhanced.append(enhanced_swell)
 
+        if pending:
+            self._apply_swell_arrivals(pending)
+
         return enhanced
 
+    def _apply_swell_arrivals(
+        self, pending: list[tuple[dict[str, Any], float, float, float, datetime]]
+    ) -> None:
+        """
+        Propagate queued swells to Hawaii in one batch and record the arrivals.
+
+        Args:
+            pending: (enhanced swell, source lat, source lon, period, generation time)
+                tuples; the swells are updated in place
+        """
+        swells, lats, lons, periods, generation_times = zip(*pending, strict=True)
+        try:
+            batch = self.swell_calculator.propagate(
+                lats, lons, np.asarray(periods)[:, None], generation_times
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not calculate physics-based arrival: {e}")
+            return
+
+        for index, enhanced_swell in enumerate(swells):
+            arrival_time = batch.arrival_time(index)
+            travel_hours = float(batch.travel_time_hours[index, 0, 0])
+
+            # Add calculated data to swell
+            enhanced_swell["calculated_arrival"] = arrival_time.isoformat()
+            enhanced_swell["travel_time_hrs"] = round(travel_hours, 1)
+            enhanced_swell["distance_nm"] = round(float(batch.distance_nm[index, 0]), 0)
+            enhanced_swell["group_velocity_knots"] = round(
+                float(batch.group_velocity_knots[index, 0]), 1
+            )
+            enhanced_swell["propagation_method"] = "physics_based"
+
+            self.logger.info(
+                f"Calculated swell arrival: {lats[index]}°N {lons[index]}°E → Hawaii, "
+                f"period={periods[index]:.1f}s, arrival={arrival_time.strftime('%a %b %d %I:%M %p')}, "
+                f"travel={travel_hours:.1f}hrs"
+            )
+
     def _calculate_swell_travel_time(self, distance_nm: float, period_s: float) -> float:
         """
         Calculate swell travel time using deep water wave group velocity.
@@ -491,20 +523,7 @@ Return structured data in JSON format with NO markdown formatting or code blocks
         Returns:
             Travel time in hours
         """
-        # Deep water group velocity: Cg = g * T / (4 * pi)
-        # Where g is gravity (9.81 m/s²) and T is period
-        group_velocity_ms = (self.GRAVITY * period_s) / (4 * math.pi)
-
-        # Convert distance to meters
-        distance_m = distance_nm * self.NAUTICAL_MILE_TO_METERS
-
-        # Calculate travel time in seconds
-        travel_time_s = distance_m / group_velocity_ms
-
-        # Convert to hours
-        travel_time_hrs = travel_time_s / 3600.0
-
-        return travel_time_hrs
+        return float(self.swell_calculator.travel_times(distance_nm, period_s))
 
     def _calculate_distance_to_hawaii(self, lat: float, lon: float) -> float:
         """
@@ -517,26 +536,9 @@ Return structured data in JSON format with NO markdown formatting or code blocks
         Returns:
             Distance in nautical miles
         """
-        # Haversine formula
-        lat1_rad = math.radians(self.hawaii_lat)
-        lon1_rad = math.radians(self.hawaii_lon)
-        lat2_rad = math.radians(lat)
-        lon2_rad = math.radians(lon)
-
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+        return float(
+            self.swell_calculator.haversine_distances(self.hawaii_lat, self.hawaii_lon, lat, lon)
         )
-        c = 2 * math.asin(math.sqrt(a))
-
-        # Earth radius in nautical miles (approximately)
-        earth_radius_nm = 3440.065
-
-        distance_nm = earth_radius_nm * c
-        return distance_nm
 
     def _calculate_analysis_confidence(
         self,
@@ -0,0 +1,177 @@
+"""
+Token accounting for forecast generation prompts.
+
+Counts the prompts that are actually sent: the rendered Caldwell template and
+the data digest sections from context_builder, plus image tokens from
+post-resize dimensions and a reserve for the output. Counts are memoized per
+section text, so re-estimating after trimming or across shores only tokenizes
+new text.
+
+Text is tokenized with tiktoken (o200k_base) when it is installed and its
+encoding is available locally; otherwise a conservative word/number/
+punctuation approximation is used.
+"""
+
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from .context_builder import join_digest_sections
+
+try:  # Optional: exact counts when tiktoken is available
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on environment
+    tiktoken = None
+
+TOKENIZER_ENCODING = "o200k_base"
+
+# Expected output for a long-form forecast
+OUTPUT_TOKEN_RESERVE = 10000
+
+# Digest sections dropped first when trimming to a budget (lowest value
+# first). Data quality and the swell matrix are never dropped.
+TRIM_ORDER = ("climatology", "upper_air", "tropical", "tides", "weather", "timeline")
+
+# Word, number (BPE vocabularies split digits into groups of up to three) and
+# punctuation pieces for the approximate counter
+_PIECES = re.compile(r"[^\W\d_]+|\d{1,3}|[^\w\s]+|_+|\n+")
+
+logger = logging.getLogger("forecast.token_budget")
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception as e:  # Encoding files are fetched on first use
+        logger.warning(f"tiktoken encoding unavailable ({e}); using approximate token counts")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens in a piece of prompt text (memoized per text).
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Token count (exact with tiktoken, approximate otherwise)
+    """
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    tokens = 0
+    for piece in _PIECES.findall(text):
+        if piece[0].isalpha():
+            # Common words are one token; long words split every ~8 characters
+            tokens += 1 + (len(piece) - 1) // 8
+        elif piece[0] in "\n_" or piece[0].isdigit():
+            tokens += 1
+        else:
+            tokens += math.ceil(len(piece) / 2)
+    return tokens
+
+
+@dataclass
+class TokenEstimate:
+    """Token estimate for one forecast generation, broken down by source."""
+
+    prompt: dict[str, int] = field(default_factory=dict)  # Section name -> tokens
+    images: int = 0
+    output: int = OUTPUT_TOKEN_RESERVE
+
+    @property
+    def text(self) -> int:
+        return sum(self.prompt.values())
+
+    @property
+    def total(self) -> int:
+        return self.text + self.images + self.output
+
+
+def count_prompt_sections(forecast_data: dict[str, Any], templates) -> dict[str, int]:
+    """
+    Count the main forecast prompt section by section.
+
+    The user prompt is rendered without the data digest; digest sections are
+    counted separately (``digest:<name>``) so they can be trimmed.
+
+    Args:
+        forecast_data: Prepared forecast data
+        templates: PromptTemplates used to render the Caldwell prompt
+
+    Returns:
+        Mapping of section name to token count
+    """
+    template = templates.get_template("caldwell")
+    counts = {
+        "system_prompt": count_tokens(template.get("system_prompt", "")),
+        "user_prompt": count_tokens(
+            templates.get_caldwell_prompt({**forecast_data, "data_digest": ""})
+        ),
+    }
+    if "{data_digest}" in template.get("user_prompt", ""):
+        counts.update(count_digest_sections(forecast_data))
+    return counts
+
+
+def count_digest_sections(forecast_data: dict[str, Any]) -> dict[str, int]:
+    """
+    Count the data digest per section.
+
+    Args:
+        forecast_data: Prepared forecast data
+
+    Returns:
+        Mapping of ``digest:<name>`` to token count (a single ``data_digest``
+        entry when the digest has no sections)
+    """
+    sections = forecast_data.get("digest_sections")
+    if not sections:
+        return {"data_digest": count_tokens(forecast_data.get("data_digest", ""))}
+    return {f"digest:{name}": count_tokens(text) for name, text in sections.items()}
+
+
+def trim_to_budget(
+    forecast_data: dict[str, Any], estimate: TokenEstimate, budget: int
+) -> list[str]:
+    """
+    Drop the lowest-value digest sections until the estimate fits a budget.
+
+    Updates ``forecast_data['digest_sections']``, ``forecast_data['data_digest']``
+    and ``estimate`` in place. Stops when the estimate fits or nothing
+    trimmable is left.
+
+    Args:
+        forecast_data: Prepared forecast data
+        estimate: Current estimate (its prompt breakdown must include digest sections)
+        budget: Token budget to fit
+
+    Returns:
+        Names of the dropped sections, in drop order
+    """
+    sections = dict(forecast_data.get("digest_sections") or {})
+    dropped = []
+    for name in TRIM_ORDER:
+        if estimate.total <= budget:
+            break
+        key = f"digest:{name}"
+        if name in sections and key in estimate.prompt:
+            del sections[name]
+            estimate.prompt.pop(key)
+            dropped.append(name)
+
+    if dropped:
+        forecast_data["digest_sections"] = sections
+        forecast_data["data_digest"] = join_digest_sections(sections)
+    return dropped
@@ -10,16 +10,48 @@ import copy
 import json
 import logging
 import sys
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from src.core import BundleManager, Config, DataCollector, load_config
+from src.core.openai_client import CLIENT_POOL
+from src.core.worker_pool import shutdown_worker_pools
 from src.forecast_engine import ForecastEngine, ForecastFormatter
-from src.processing import BuoyProcessor, DataFusionSystem, WaveModelProcessor, WeatherProcessor
+from src.processing import (
+    DataFusionSystem,
+    ProcessingEngine,
+    SwellForecast,
+    dict_to_swell_forecast,
+)
 from src.validation import ValidationDatabase
 
 
+@dataclass
+class StageHandoff:
+    """
+    In-memory hand-off between pipeline stages.
+
+    When run_pipeline runs processing and forecasting together, the fused
+    SwellForecast is passed to the forecast stage directly instead of being
+    re-read from processed/fused_forecast.json. The artifact is still written,
+    in a worker thread off the critical path; flush() waits for it.
+    """
+
+    fused_forecast: SwellForecast | None = None
+    pending_writes: list[asyncio.Task] = field(default_factory=list)
+
+    def write_artifact(self, func, *args, **kwargs) -> None:
+        """Run a blocking artifact write in a worker thread."""
+        self.pending_writes.append(asyncio.create_task(asyncio.to_thread(func, *args, **kwargs)))
+
+    async def flush(self) -> list[Any]:
+        """Wait for pending artifact writes and return their results."""
+        writes, self.pending_writes = self.pending_writes, []
+        return await asyncio.gather(*writes)
+
+
 def setup_logging(config: Config) -> logging.Logger:
     """
     Set up logging based on configuration.
@@ -64,14 +96,28 @@ async def collect_data(config: Config, logger: logging.Logger) -> dict[str, Any]
     # Create data collector
     collector = DataCollector(config)
 
-    # Run collection
-    results = await collector.collect_data(region="Hawaii")
+    def log_agent_complete(agent_name: str, stats: dict[str, Any]) -> None:
+        logger.info(
+            f"Agent {agent_name} finished: {stats['successful']}/{stats['total']} files collected"
+        )
+
+    # Run collection (the collector closes its HTTP client when done)
+    try:
+        results = await collector.collect_data(
+            region="Hawaii", on_agent_complete=log_agent_complete
+        )
+    finally:
+        # Agents parse on shared worker pools; release them with the client
+        shutdown_worker_pools()
 
     return results
 
 
 async def process_data(
-    config: Config, logger: logging.Logger, bundle_id: str | None = None
+    config: Config,
+    logger: logging.Logger,
+    bundle_id: str | None = None,
+    handoff: StageHandoff | None = None,
 ) -> dict[str, Any]:
     """
     Process collected data.
@@ -80,6 +126,8 @@ async def process_data(
         config: Application configuration
         logger: Logger instance
         bundle_id: Optional bundle ID to process (uses latest if not provided)
+        handoff: Optional in-memory hand-off; receives the fused forecast and
+            the artifact is written in the background
 
     Returns:
         Dictionary with processing results
@@ -104,53 +152,20 @@ async def process_data(
         logger.error(f"Bundle {bundle_id} not found or has no metadata")
         return {"status": "error", "message": f"Bundle {bundle_id} not found or has no metadata"}
 
-    def _load_agent_json(agent_name: str, pattern: str) -> list[dict[str, Any]]:
-        agent_path = Path(config.data_directory) / bundle_id / agent_name
-        payloads: list[dict[str, Any]] = []
-        if agent_path.exists():
-            for file_path in agent_path.glob(pattern):
-                try:
-                    with open(file_path) as fh:
-                        data = json.load(fh)
-                        # If the JSON is a list, extend; otherwise append
-                        if isinstance(data, list):
-                            payloads.extend(data)
-                        else:
-                            payloads.append(data)
-                except Exception as exc:
-                    logger.warning(f"Failed to load {file_path}: {exc}")
-        return payloads
-
-    # Process buoy data
-    logger.info("Processing buoy data")
-    buoy_processor = BuoyProcessor(config)
+    # Process buoy, weather and model files plus supplemental agent outputs in parallel,
+    # reusing cached results for files unchanged since the last processed bundle
+    logger.info("Processing buoy, weather and wave model data")
+    engine = ProcessingEngine(config)
+    bundle_results = engine.process_bundle(bundle_id)
     logger.info(
-        f"BuoyProcessor created: {type(buoy_processor)}, has process_bundle: {hasattr(buoy_processor, 'process_bundle')}"
+        f"Processing engine finished: {bundle_results.cache_misses} file(s) processed, "
+        f"{bundle_results.cache_hits} reused from cache"
     )
-    logger.info(f"Calling process_bundle with bundle_id={bundle_id}, pattern='**/buoy_*.json'")
-    buoy_results = buoy_processor.process_bundle(bundle_id, "**/buoy_*.json")
-    logger.info(f"process_bundle returned: {type(buoy_results)}, length={len(buoy_results)}")
-
-    # Process weather data
-    logger.info("Processing weather data")
-    weather_processor = WeatherProcessor(config)
-    weather_results = weather_processor.process_bundle(bundle_id, "weather/weather_*.json")
-
-    # Process model data
-    logger.info("Processing wave model data")
-    wave_model_processor = WaveModelProcessor(config)
-    model_results = wave_model_processor.process_bundle(bundle_id, "models/model_*.*")
-
-    # Load supplemental agent outputs
-    metar_data = _load_agent_json("metar", "metar_*.json")
-    tide_data = _load_agent_json("tides", "tide_*.json")
-    tropical_data = _load_agent_json("tropical", "tropical_outlook.json")
-    chart_data = _load_agent_json("charts", "*.json")
-    altimetry_data = _load_agent_json("altimetry", "metadata.json")
-    nearshore_data = _load_agent_json("nearshore_buoys", "metadata.json")
-    upper_air_data = _load_agent_json("upper_air", "metadata.json")
-    climatology_data = _load_agent_json("climatology", "metadata.json")
-    marine_forecast_data = _load_agent_json("marine_forecasts/marine_forecasts", "*.json")
+
+    buoy_results = bundle_results.stage_results["buoy"]
+    weather_results = bundle_results.stage_results["weather"]
+    model_results = bundle_results.stage_results["model"]
+    supplemental = bundle_results.supplemental
 
     # Fuse the data
     logger.info("Fusing data from multiple sources")
@@ -165,15 +180,7 @@ async def process_data(
         "buoy_data": [result.data for result in buoy_results if result.success],
         "weather_data": [result.data for result in weather_results if result.success],
         "model_data": [result.data for result in model_results if result.success],
-        "metar_data": metar_data,
-        "tide_data": tide_data,
-        "tropical_data": tropical_data,
-        "chart_data": chart_data,
-        "altimetry_data": altimetry_data,
-        "nearshore_data": nearshore_data,
-        "upper_air_data": upper_air_data,
-        "climatology_data": climatology_data,
-        "marine_forecast_data": marine_forecast_data,
+        **supplemental,
     }
 
     # Process fusion
@@ -195,6 +202,7 @@ async def process_data(
             "total": len(model_results),
             "successful": sum(1 for r in model_results if r.success),
         },
+        "cache": {"hits": bundle_results.cache_hits, "misses": bundle_results.cache_misses},
         "fusion_result": fusion_result.success,
     }
 
@@ -206,7 +214,13 @@ async def process_data(
 
         # Save fused data
         fusion_path = processed_dir / "fused_forecast.json"
-        fusion_system.save_result(fusion_result, fusion_path, overwrite=True)
+        if handoff is not None:
+            handoff.fused_forecast = fusion_result.data
+            handoff.write_artifact(
+                fusion_system.save_result, fusion_result, fusion_path, overwrite=True
+            )
+        else:
+            fusion_system.save_result(fusion_result, fusion_path, overwrite=True)
 
         results["fusion_path"] = str(fusion_path)
     else:
@@ -216,7 +230,10 @@ async def process_data(
 
 
 async def generate_forecast(
-    config: Config, logger: logging.Logger, bundle_id: str | None = None
+    config: Config,
+    logger: logging.Logger,
+    bundle_id: str | None = None,
+    handoff: StageHandoff | None = None,
 ) -> dict[str, Any]:
     """
     Generate forecast based on collected data.
@@ -225,6 +242,8 @@ async def generate_forecast(
         config: Application configuration
         logger: Logger instance
         bundle_id: Optional bundle ID to use (uses latest if not provided)
+        handoff: Optional in-memory hand-off; its fused forecast is used
+            instead of reading processed/fused_forecast.json
 
     Returns:
         Dictionary with forecast results
@@ -243,33 +262,13 @@ async def generate_forecast(
 
     logger.info(f"Using bundle: {bundle_id}")
 
-    # Check for processed forecast data
-    processed_dir = Path(config.data_directory) / bundle_id / "processed"
-    fusion_path = processed_dir / "fused_forecast.json"
-
-    if not fusion_path.exists():
-        logger.error(f"Processed data not found: {fusion_path}")
-        return {
-            "status": "error",
-            "message": "Processed data not found. Run data processing first.",
-        }
-
-    # Load processed data
-    logger.info(f"Loading processed data from {fusion_path}")
-    fusion_dict: dict[str, Any] = {}
-
-    with open(fusion_path) as f:
-        try:
-            # Try to parse as JSON
-            fusion_data = json.loads(f.read())
-            # Convert to SwellForecast object
-            from src.processing.models import dict_to_swell_forecast
-
-            fusion_data = dict_to_swell_forecast(fusion_data)
-            fusion_dict = fusion_data.to_dict()
-        except json.JSONDecodeError:
-            logger.error(f"Invalid JSON in {fusion_path}")
-            return {"status": "error", "message": "Invalid JSON in processed data file"}
+    if handoff is not None and handoff.fused_forecast is not None:
+        logger.info("Using fused forecast handed off from processing")
+        fusion_data = handoff.fused_forecast
+    else:
+        fusion_data = _load_fused_forecast(config, logger, bundle_id)
+        if isinstance(fusion_data, dict):
+            return fusion_data
 
     # Create forecast engine
     logger.info("Creating forecast engine")
@@ -277,7 +276,11 @@ async def generate_forecast(
 
     # Generate forecast
     logger.info("Generating forecast")
-    forecast = await forecast_engine.generate_forecast(fusion_data)
+    try:
+        forecast = await forecast_engine.generate_forecast(fusion_data)
+    finally:
+        # Pooled API clients are bound to this event loop; close them before it ends
+        await CLIENT_POOL.close()
 
     # Check for errors
     if "error" in forecast:
@@ -314,24 +317,7 @@ async def generate_forecast(
 
         database.save_forecast(persist_forecast)
 
-        predictions: list[dict[str, Any]] = []
-        generated_time = forecast.get("generated_time")
-        for location in fusion_dict.get("locations", []):
-            shore = location.get("shore") or location.get("name")
-            for event in location.get("swell_events", []):
-                predictions.append(
-                    {
-                        "shore": shore,
-                        "forecast_time": generated_time,
-                        "valid_time": event.get("peak_time") or event.get("start_time"),
-                        "height": event.get("hawaii_scale"),
-                        "period": event.get("dominant_period"),
-                        "direction": event.get("primary_direction_cardinal"),
-                        "category": event.get("metadata", {}).get("category"),
-                        "confidence": event.get("metadata", {}).get("confidence", 0.7),
-                    }
-                )
-
+        predictions = build_predictions(fusion_data, forecast.get("generated_time"))
         if predictions:
             database.save_predictions(forecast_id, predictions)
 
@@ -347,6 +333,64 @@ async def generate_forecast(
     }
 
 
+def _load_fused_forecast(
+    config: Config, logger: logging.Logger, bundle_id: str
+) -> SwellForecast | dict[str, Any]:
+    """
+    Load a bundle's fused forecast from processed/fused_forecast.json.
+
+    Returns:
+        SwellForecast, or an error result dictionary
+    """
+    processed_dir = Path(config.data_directory) / bundle_id / "processed"
+    fusion_path = processed_dir / "fused_forecast.json"
+
+    if not fusion_path.exists():
+        logger.error(f"Processed data not found: {fusion_path}")
+        return {
+            "status": "error",
+            "message": "Processed data not found. Run data processing first.",
+        }
+
+    logger.info(f"Loading processed data from {fusion_path}")
+    try:
+        with open(fusion_path) as f:
+            return dict_to_swell_forecast(json.loads(f.read()))
+    except json.JSONDecodeError:
+        logger.error(f"Invalid JSON in {fusion_path}")
+        return {"status": "error", "message": "Invalid JSON in processed data file"}
+
+
+def build_predictions(fused_forecast: SwellForecast, generated_time: Any) -> list[dict[str, Any]]:
+    """
+    Build per-shore validation predictions from a fused forecast.
+
+    Args:
+        fused_forecast: Fused swell forecast
+        generated_time: Forecast generation time recorded on each prediction
+
+    Returns:
+        Prediction dictionaries for ValidationDatabase.save_predictions
+    """
+    predictions: list[dict[str, Any]] = []
+    for location in fused_forecast.locations:
+        shore = location.shore or location.name
+        for event in location.swell_events:
+            predictions.append(
+                {
+                    "shore": shore,
+                    "forecast_time": generated_time,
+                    "valid_time": event.peak_time or event.start_time,
+                    "height": event.hawaii_scale,
+                    "period": event.dominant_period,
+                    "direction": event.primary_direction_cardinal,
+                    "category": event.metadata.get("category"),
+                    "confidence": event.metadata.get("confidence", 0.7),
+                }
+            )
+    return predictions
+
+
 async def run_pipeline(
     config: Config, logger: logging.Logger, mode: str, bundle_id: str | None = None
 ) -> dict[str, Any]:
@@ -364,19 +408,32 @@ async def run_pipeline(
     """
     results = {}
 
-    if mode in ["collect", "full"]:
-        collection_results = await collect_data(config, logger)
-        results["collection"] = collection_results
-        # Use the newly created bundle for subsequent steps
-        bundle_id = collection_results.get("bundle_id")
-
-    if mode in ["process", "forecast", "full"]:
-        processing_results = await process_data(config, logger, bundle_id)
-        results["processing"] = processing_results
+    # Hand the fused forecast from processing to forecasting in memory; the
+    # processed artifact is written in the background
+    handoff = None
+    if mode in ["forecast", "full"] and config.getboolean("processing", "in_memory_handoff", True):
+        handoff = StageHandoff()
 
-    if mode in ["forecast", "full"]:
-        forecast_results = await generate_forecast(config, logger, bundle_id)
-        results["forecast"] = forecast_results
+    try:
+        if mode in ["collect", "full"]:
+            collection_results = await collect_data(config, logger)
+            results["collection"] = collection_results
+            # Use the newly created bundle for subsequent steps
+            bundle_id = collection_results.get("bundle_id")
+
+        if mode in ["process", "forecast", "full"]:
+            processing_results = await process_data(config, logger, bundle_id, handoff)
+            results["processing"] = processing_results
+            bundle_id = processing_results.get("bundle_id", bundle_id)
+
+        if mode in ["forecast", "full"]:
+            forecast_results = await generate_forecast(config, logger, bundle_id, handoff)
+            results["forecast"] = forecast_results
+    finally:
+        if handoff is not None:
+            for written in await handoff.flush():
+                if written is False:
+                    logger.warning("Failed to write processed data artifact")
 
     return results
 
@@ -433,6 +490,8 @@ def bundle_info(config: Config, bundle_id: str | None = None) -> None:
     print(f"  Total files: {stats.get('total_files', 0)}")
     print(f"  Successful files: {stats.get('successful_files', 0)}")
     print(f"  Failed files: {stats.get('failed_files', 0)}")
+    if stats.get("failed_agents"):
+        print(f"  Failed agents: {', '.join(stats['failed_agents'])}")
     print(f"  Total size: {stats.get('total_size_mb', 0):.2f} MB")
 
     # Print agent results
@@ -488,15 +547,47 @@ def bundle_files(config: Config, bundle_id: str | None = None) -> None:
         print()
 
 
-async def validate_forecast_cmd(config: Config, forecast_id: str) -> None:
+def create_forecast_validator(config: Config, database, offline: bool = False):
+    """
+    Build a ForecastValidator whose observations go through the local archive.
+
+    Args:
+        config: Application configuration
+        database: ValidationDatabase instance
+        offline: Serve observations from the archive only (no NDBC downloads)
+
+    Returns:
+        Configured ForecastValidator
+    """
+    from src.validation import BuoyDataFetcher, ForecastValidator
+    from src.validation.observation_archive import create_observation_archive
+
+    archive = create_observation_archive(config)
+    offline = offline or config.getboolean("validation", "offline", False)
+    if offline and archive is None:
+        raise ValueError("Offline validation requires validation.observation_archive")
+
+    refresh_interval = config.getfloat("validation", "archive_refresh_seconds", 600.0)
+    return ForecastValidator(
+        database,
+        match_window_hours=config.getfloat("validation", "match_window_hours", 2.0),
+        tie_break=config.get("validation", "match_tie_break", "earlier"),
+        fetcher_factory=lambda: BuoyDataFetcher(
+            archive=archive, offline=offline, refresh_interval=refresh_interval
+        ),
+    )
+
+
+async def validate_forecast_cmd(config: Config, forecast_id: str, offline: bool = False) -> None:
     """
     Validate a specific forecast against actual observations.
 
     Args:
         config: Application configuration
         forecast_id: ID of forecast to validate
+        offline: Use only archived observations
     """
-    from src.validation import ForecastValidator, ValidationDatabase
+    from src.validation import ValidationDatabase
 
     print(f"\nValidating forecast: {forecast_id}")
     print("=" * 60)
@@ -504,7 +595,7 @@ async def validate_forecast_cmd(config: Config, forecast_id: str) -> None:
     # Initialize database and validator
     db_path = config.get("validation", "database_path", "data/validation.db")
     database = ValidationDatabase(db_path)
-    validator = ForecastValidator(database)
+    validator = create_forecast_validator(config, database, offline=offline)
 
     try:
         # Run validation
@@ -560,15 +651,23 @@ async def validate_forecast_cmd(config: Config, forecast_id: str) -> None:
         logging.getLogger("surfcastai").error(f"Validation error: {e}", exc_info=True)
 
 
-async def validate_all_forecasts_cmd(config: Config, hours_after: int = 24) -> None:
+async def validate_all_forecasts_cmd(
+    config: Config, hours_after: int = 24, workers: int | None = None, offline: bool = False
+) -> None:
     """
     Validate all forecasts that are ready for validation.
 
+    Observations are fetched once per buoy for the whole batch, forecasts are
+    scored concurrently and results are committed in groups, so an interrupted
+    run can simply be restarted.
+
     Args:
         config: Application configuration
         hours_after: Minimum hours after forecast before validating
+        workers: Concurrent validation workers (default: validation.batch_workers)
+        offline: Use only archived observations
     """
-    from src.validation import ForecastValidator, ValidationDatabase
+    from src.validation import BatchValidator, ValidationDatabase
 
     print(f"\nValidating all forecasts ({hours_after}+ hours old)")
     print("=" * 60)
@@ -576,52 +675,37 @@ async def validate_all_forecasts_cmd(config: Config, hours_after: int = 24) -> N
     # Initialize database and validator
     db_path = config.get("validation", "database_path", "data/validation.db")
     database = ValidationDatabase(db_path)
-    validator = ForecastValidator(database)
-
-    # Get forecasts needing validation
-    forecasts = database.get_forecasts_needing_validation(hours_after=hours_after)
-
-    if not forecasts:
-        print(f"\nNo forecasts found that need validation (must be {hours_after}+ hours old)")
-        return
-
-    print(f"\nFound {len(forecasts)} forecast(s) to validate:\n")
-
-    # Validate each forecast
-    results_summary = []
-
-    for i, forecast in enumerate(forecasts, 1):
-        forecast_id = forecast["forecast_id"]
-        created_at = forecast["created_at"]
-
-        print(f"{i}. Validating {forecast_id} (created {created_at})...")
-
-        try:
-            results = await validator.validate_forecast(forecast_id, hours_after=hours_after)
-
-            metrics = results.get("metrics", {})
-            results_summary.append(
-                {
-                    "forecast_id": forecast_id,
-                    "success": "error" not in results,
-                    "mae": metrics.get("mae"),
-                    "rmse": metrics.get("rmse"),
-                    "categorical_accuracy": metrics.get("categorical_accuracy"),
-                    "direction_accuracy": metrics.get("direction_accuracy"),
-                    "sample_size": metrics.get("sample_size", 0),
-                }
-            )
+    validator = create_forecast_validator(config, database, offline=offline)
 
+    def report_progress(progress, result) -> None:
+        eta = progress.eta_seconds
+        eta_text = (
+            f", ETA {eta:.0f}s" if eta is not None and progress.completed < progress.total else ""
+        )
+        prefix = f"[{progress.completed}/{progress.total} {progress.fraction:.0%}{eta_text}]"
+        if result["success"]:
             print(
-                f"   ✓ Validated: MAE={metrics.get('mae', 0):.2f}ft, "
-                f"RMSE={metrics.get('rmse', 0):.2f}ft, "
-                f"Cat={metrics.get('categorical_accuracy', 0)*100:.0f}%, "
-                f"n={metrics.get('sample_size', 0)}"
+                f"{prefix} ✓ {result['forecast_id']}: MAE={result.get('mae') or 0:.2f}ft, "
+                f"RMSE={result.get('rmse') or 0:.2f}ft, "
+                f"Cat={(result.get('categorical_accuracy') or 0)*100:.0f}%, "
+                f"n={result.get('sample_size', 0)}"
             )
+        else:
+            print(f"{prefix} ✗ {result['forecast_id']}: {result.get('error')}")
 
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-            results_summary.append({"forecast_id": forecast_id, "success": False, "error": str(e)})
+    batch = BatchValidator(
+        validator,
+        max_workers=workers or config.getint("validation", "batch_workers", 4),
+        commit_every=config.getint("validation", "batch_commit_size", 20),
+        progress_callback=report_progress,
+    )
+
+    # Forecasts already committed by an interrupted run are no longer pending
+    results_summary = await batch.run(hours_after=hours_after)
+
+    if not results_summary:
+        print(f"\nNo forecasts found that need validation (must be {hours_after}+ hours old)")
+        return
 
     # Print summary
     print("\n" + "=" * 60)
@@ -843,6 +927,11 @@ def main():
         choices=["openai", "kimi"],
         help="LLM provider to use (default: openai). Requires MOONSHOT_API_KEY env var for kimi.",
     )
+    run_parser.add_argument(
+        "--cache-mode",
+        choices=["off", "read", "write", "readwrite"],
+        help="LLM response cache mode for this run (default: openai.response_cache_mode)",
+    )
 
     # List bundles command
     list_parser = subparsers.add_parser("list", help="List available data bundles")
@@ -858,6 +947,11 @@ def main():
     # Validation commands
     validate_parser = subparsers.add_parser("validate", help="Validate a specific forecast")
     validate_parser.add_argument("--forecast", "-f", required=True, help="Forecast ID to validate")
+    validate_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use only locally archived buoy observations (no NDBC downloads)",
+    )
 
     validate_all_parser = subparsers.add_parser(
         "validate-all", help="Validate all pending forecasts"
@@ -868,6 +962,17 @@ def main():
         default=24,
         help="Minimum hours after forecast before validating (default: 24)",
     )
+    validate_all_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Concurrent validation workers (default: validation.batch_workers or 4)",
+    )
+    validate_all_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use only locally archived buoy observations (no NDBC downloads)",
+    )
 
     accuracy_report_parser = subparsers.add_parser(
         "accuracy-report", help="Generate accuracy report"
@@ -936,6 +1041,10 @@ def main():
                     "Specialist team %s via CLI", "enabled" if use_specialists else "disabled"
                 )
 
+            if hasattr(args, "cache_mode") and args.cache_mode:
+                config.set("openai", "response_cache_mode", args.cache_mode)
+                logger.info(f"LLM response cache mode via CLI: {args.cache_mode}")
+
             # Handle provider selection (openai or kimi)
             if hasattr(args, "provider") and args.provider:
                 config._config["llm_provider"] = args.provider
@@ -978,6 +1087,8 @@ def main():
                 print(f"  Total files: {stats.get('total_files', 0)}")
                 print(f"  Successful files: {stats.get('successful_files', 0)}")
                 print(f"  Failed files: {stats.get('failed_files', 0)}")
+                if stats.get("failed_agents"):
+                    print(f"  Failed agents: {', '.join(stats['failed_agents'])}")
 
             if "processing" in results:
                 processing = results["processing"]
@@ -1009,12 +1120,14 @@ def main():
 
         elif args.command == "validate":
             # Validate a specific forecast
-            asyncio.run(validate_forecast_cmd(config, args.forecast))
+            asyncio.run(validate_forecast_cmd(config, args.forecast, args.offline))
             return 0
 
         elif args.command == "validate-all":
             # Validate all pending forecasts
-            asyncio.run(validate_all_forecasts_cmd(config, args.hours_after))
+            asyncio.run(
+                validate_all_forecasts_cmd(config, args.hours_after, args.workers, args.offline)
+            )
             return 0
 
         elif args.command == "accuracy-report":
@@ -11,6 +11,7 @@ from .models.swell_event import (
     SwellForecast,
     dict_to_swell_forecast,
 )
+from .processing_engine import BundleProcessingResults, ProcessingEngine
 from .wave_model_processor import WaveModelProcessor
 from .weather_processor import WeatherProcessor
 
@@ -24,4 +25,6 @@ __all__ = [
     "WeatherProcessor",
     "WaveModelProcessor",
     "DataFusionSystem",
+    "ProcessingEngine",
+    "BundleProcessingResults",
 ]
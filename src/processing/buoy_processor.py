@@ -71,11 +71,9 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
         try:
             # Check if this is already saved JSON format (has 'station_id' and 'observations' keys)
             # or raw NDBC format
-            import json
-
             if "station_id" in data and "observations" in data:
-                # Already in saved format, use from_json
-                buoy_data = BuoyData.from_json(json.dumps(data))
+                # Already in saved format
+                buoy_data = BuoyData.from_dict(data)
             else:
                 # Raw NDBC format, use from_ndbc_json
                 buoy_data = BuoyData.from_ndbc_json(data)
@@ -118,22 +116,57 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
 
         # If processing was successful and we have BuoyData, try to link spec file
         if result.success and isinstance(result.data, BuoyData):
-            buoy_data = result.data
-            station_id = buoy_data.station_id
+            self._link_spec_file(result.data)
 
-            # Look for corresponding .spec file in www_ndbc_noaa_gov directory
-            # The spec files are in the root data directory, not in bundles
-            data_dir = Path(self.config.data_directory)
-            spec_file = data_dir / "www_ndbc_noaa_gov" / f"{station_id}.spec"
+        return result
 
-            if spec_file.exists():
-                buoy_data.spec_file_path = str(spec_file)
-                self.logger.info(f"Found spectral data for buoy {station_id}: {spec_file}")
-            else:
-                self.logger.debug(f"No spectral data found for buoy {station_id} at {spec_file}")
+    def refresh_cached_result(
+        self, result: ProcessingResult, file_path: str | Path
+    ) -> ProcessingResult:
+        """
+        Re-link spectral data and re-run the analysis for a cached result.
+
+        The .spec file lives outside the bundle, so it may have appeared or
+        disappeared since the cached result was produced. Freshness scores and
+        staleness warnings depend on the current time, so the analysis is
+        repeated on the cached (already cleaned) observations.
+
+        Args:
+            result: Cached processing result
+            file_path: Path of the buoy data file
 
+        Returns:
+            ProcessingResult with an up-to-date spec_file_path and analysis
+        """
+        if result.success and isinstance(result.data, BuoyData):
+            result.data.spec_file_path = None
+            self._link_spec_file(result.data)
+            warnings, metadata = self._analyze_buoy_data(result.data)
+            result.data.metadata.update(metadata)
+            result.warnings = warnings
+            result.metadata = metadata
         return result
 
+    def _link_spec_file(self, buoy_data: BuoyData) -> None:
+        """
+        Attach the path of a matching .spec file to the buoy data, if present.
+
+        Args:
+            buoy_data: BuoyData to update in place
+        """
+        station_id = buoy_data.station_id
+
+        # Look for corresponding .spec file in www_ndbc_noaa_gov directory
+        # The spec files are in the root data directory, not in bundles
+        data_dir = Path(self.config.data_directory)
+        spec_file = data_dir / "www_ndbc_noaa_gov" / f"{station_id}.spec"
+
+        if spec_file.exists():
+            buoy_data.spec_file_path = str(spec_file)
+            self.logger.info(f"Found spectral data for buoy {station_id}: {spec_file}")
+        else:
+            self.logger.debug(f"No spectral data found for buoy {station_id} at {spec_file}")
+
     def detect_trend(self, buoy_data: BuoyData, hours: int = 24) -> dict[str, Any]:
         """
         Detect trends in wave height over the specified time period.
@@ -152,24 +185,15 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
             - confidence: Confidence in trend (0.0-1.0)
             - r_squared: R-squared value of linear regression
         """
-        # Extract wave heights and timestamps for the specified period
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-
-        heights = []
-        timestamps = []
+        # Extract wave heights (in feet) and timestamps for the specified period
+        cutoff = (datetime.now() - timedelta(hours=hours)).timestamp()
+        series = buoy_data.observations
+        wave_height = series.column("wave_height")
+        epoch = series.epoch
 
-        for obs in buoy_data.observations:
-            if obs.wave_height is None:
-                continue
-
-            try:
-                obs_time = datetime.fromisoformat(obs.timestamp.replace("Z", "+00:00"))
-                if obs_time >= cutoff_time.replace(tzinfo=obs_time.tzinfo):
-                    # Convert meters to feet for slope calculation
-                    heights.append(obs.wave_height * 3.28084)
-                    timestamps.append(obs_time.timestamp())
-            except (ValueError, TypeError):
-                continue
+        in_window = ~np.isnan(wave_height) & (epoch >= cutoff)
+        heights = wave_height[in_window] * 3.28084
+        timestamps = epoch[in_window]
 
         # Need at least 3 points for meaningful regression
         if len(heights) < 3:
@@ -182,9 +206,7 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
             }
 
         # Convert timestamps to hours since first observation
-        timestamps = np.array(timestamps)
         hours_elapsed = (timestamps - timestamps[0]) / 3600.0
-        heights = np.array(heights)
 
         # Perform linear regression
         slope, intercept, r_value, p_value, std_err = stats.linregress(hours_elapsed, heights)
@@ -233,26 +255,21 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
             - z_scores: Z-scores for all observations
         """
         # Extract wave heights
-        heights = []
-        valid_indices = []
-
-        for i, obs in enumerate(buoy_data.observations):
-            if obs.wave_height is not None:
-                heights.append(obs.wave_height)
-                valid_indices.append(i)
+        wave_height = buoy_data.observations.column("wave_height")
+        valid_indices = np.flatnonzero(~np.isnan(wave_height))
+        heights_array = wave_height[valid_indices]
 
-        if len(heights) < 3:
+        if len(heights_array) < 3:
             return {
                 "anomalies": [],
                 "anomaly_count": 0,
                 "mean_height": 0.0,
                 "std_height": 0.0,
                 "z_scores": [],
-                "sample_size": len(heights),
+                "sample_size": len(heights_array),
             }
 
         # Calculate z-scores
-        heights_array = np.array(heights)
         mean_height = np.mean(heights_array)
         std_height = np.std(heights_array, ddof=1)  # Sample standard deviation
 
@@ -263,26 +280,26 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
                 "anomaly_count": 0,
                 "mean_height": float(mean_height),
                 "std_height": 0.0,
-                "z_scores": [0.0] * len(heights),
-                "sample_size": len(heights),
+                "z_scores": [0.0] * len(heights_array),
+                "sample_size": len(heights_array),
             }
 
         z_scores = (heights_array - mean_height) / std_height
 
         # Find anomalies (|z-score| > threshold)
         anomaly_mask = np.abs(z_scores) > threshold
-        anomalies = [valid_indices[i] for i in range(len(valid_indices)) if anomaly_mask[i]]
+        anomalies = valid_indices[anomaly_mask].tolist()
 
         # Log warnings for anomalies
         if anomalies:
             self.logger.warning(
                 f"Detected {len(anomalies)} anomalous readings in buoy {buoy_data.station_id}"
             )
-            for idx in anomalies:
-                obs = buoy_data.observations[idx]
-                z_score = z_scores[valid_indices.index(idx)]
+            timestamps = buoy_data.observations.timestamps
+            for idx, z_score in zip(anomalies, z_scores[anomaly_mask], strict=True):
                 self.logger.debug(
-                    f"Anomaly at {obs.timestamp}: wave_height={obs.wave_height}m, z-score={z_score:.2f}"
+                    f"Anomaly at {timestamps[idx]}: wave_height={wave_height[idx]}m, "
+                    f"z-score={z_score:.2f}"
                 )
 
         return {
@@ -290,8 +307,8 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
             "anomaly_count": len(anomalies),
             "mean_height": float(mean_height),
             "std_height": float(std_height),
-            "z_scores": [float(z) for z in z_scores],
-            "sample_size": len(heights),
+            "z_scores": z_scores.tolist(),
+            "sample_size": len(heights_array),
             "threshold": threshold,
         }
 
@@ -321,15 +338,16 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
             "consistency_score": 0.0,
         }
 
-        if not buoy_data.observations:
+        series = buoy_data.observations
+        if not series:
             return scores
 
         # 1. Calculate freshness score
-        latest_obs = buoy_data.observations[0]
-        try:
-            obs_time = datetime.fromisoformat(latest_obs.timestamp.replace("Z", "+00:00"))
-            now = datetime.now(obs_time.tzinfo)
-            hours_old = (now - obs_time).total_seconds() / 3600
+        latest_epoch = series.epoch[0]
+        if np.isnan(latest_epoch):
+            scores["freshness_score"] = 0.5  # Unknown freshness
+        else:
+            hours_old = (datetime.now().timestamp() - latest_epoch) / 3600
 
             # Score decreases linearly from 1.0 at 0 hours to 0.0 at 6 hours
             if hours_old <= 1.0:
@@ -337,57 +355,34 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
             elif hours_old >= 6.0:
                 scores["freshness_score"] = 0.0
             else:
-                scores["freshness_score"] = 1.0 - (hours_old - 1.0) / 5.0
-        except (ValueError, TypeError):
-            scores["freshness_score"] = 0.5  # Unknown freshness
+                scores["freshness_score"] = float(1.0 - (hours_old - 1.0) / 5.0)
 
         # 2. Calculate completeness score
         essential_fields = ["wave_height", "dominant_period", "wave_direction"]
         optional_fields = ["wind_speed", "wind_direction", "water_temperature"]
-        all_fields = essential_fields + optional_fields
-
-        complete_count = 0
-        partial_count = 0
-
-        for obs in buoy_data.observations:
-            # Check essential fields
-            essential_present = sum(
-                1 for field in essential_fields if getattr(obs, field) is not None
-            )
 
-            if essential_present == len(essential_fields):
-                # Check optional fields
-                optional_present = sum(
-                    1 for field in optional_fields if getattr(obs, field) is not None
-                )
-                if optional_present == len(optional_fields):
-                    complete_count += 1
-                else:
-                    partial_count += 1
-            else:
-                partial_count += 1
+        essential_present = np.logical_and.reduce(
+            [~np.isnan(series.column(name)) for name in essential_fields]
+        )
+        optional_present = np.logical_and.reduce(
+            [~np.isnan(series.column(name)) for name in optional_fields]
+        )
+        complete_count = int(np.count_nonzero(essential_present & optional_present))
 
-        total_obs = len(buoy_data.observations)
+        total_obs = len(series)
+        partial_count = total_obs - complete_count
         scores["completeness_score"] = (complete_count + 0.5 * partial_count) / total_obs
 
         # 3. Calculate consistency score (check for sudden jumps)
-        if len(buoy_data.observations) < 2:
+        if total_obs < 2:
             scores["consistency_score"] = 1.0
         else:
-            jump_count = 0
-            checked_pairs = 0
-
-            for i in range(len(buoy_data.observations) - 1):
-                current = buoy_data.observations[i]
-                next_obs = buoy_data.observations[i + 1]
-
-                # Check wave height consistency
-                if current.wave_height is not None and next_obs.wave_height is not None:
-                    checked_pairs += 1
-                    # Flag as jump if change is more than 2 meters between observations
-                    height_diff = abs(current.wave_height - next_obs.wave_height)
-                    if height_diff > 2.0:
-                        jump_count += 1
+            # Flag as jump if wave height changes more than 2 meters between observations
+            wave_height = series.column("wave_height")
+            height_diff = np.abs(np.diff(wave_height))
+            checked = ~np.isnan(height_diff)
+            checked_pairs = int(np.count_nonzero(checked))
+            jump_count = int(np.count_nonzero(height_diff[checked] > 2.0))
 
             if checked_pairs > 0:
                 scores["consistency_score"] = 1.0 - (jump_count / checked_pairs)
@@ -413,40 +408,26 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
         Returns:
             Cleaned buoy data
         """
-        # Filter out observations with missing essential data
-        valid_observations = []
-        for obs in buoy_data.observations:
-            # Skip observations with no wave height or period
-            if obs.wave_height is None and obs.dominant_period is None:
-                continue
-
-            # Clean up invalid values
-            if obs.wave_height is not None and obs.wave_height < 0:
-                obs.wave_height = None
-
-            if obs.dominant_period is not None and obs.dominant_period < 0:
-                obs.dominant_period = None
-
-            if obs.wave_direction is not None and (
-                obs.wave_direction < 0 or obs.wave_direction > 360
-            ):
-                obs.wave_direction = None
-
-            valid_observations.append(obs)
-
-        # Sort observations by timestamp (newest first)
-        valid_observations.sort(
-            key=lambda obs: (
-                datetime.fromisoformat(obs.timestamp.replace("Z", "+00:00"))
-                if "T" in obs.timestamp
-                else datetime.now()
-            ),
-            reverse=True,
+        series = buoy_data.observations
+
+        # Filter out observations with no wave height or period
+        keep = ~(
+            np.isnan(series.column("wave_height")) & np.isnan(series.column("dominant_period"))
         )
 
-        # Update buoy data with cleaned observations
-        buoy_data.observations = valid_observations
+        # Clean up invalid values (comparisons with NaN are False, so missing stays missing)
+        series.set_missing("wave_height", series.column("wave_height") < 0)
+        series.set_missing("dominant_period", series.column("dominant_period") < 0)
+        wave_direction = series.column("wave_direction")
+        series.set_missing("wave_direction", (wave_direction < 0) | (wave_direction > 360))
 
+        # Sort observations by timestamp (newest first); entries without a time sort as now
+        has_time = np.array(["T" in timestamp for timestamp in series.timestamps], dtype=bool)
+        sort_key = np.where(has_time, series.epoch, datetime.now().timestamp())
+        kept = np.flatnonzero(keep)
+        order = kept[np.argsort(-sort_key[kept], kind="stable")]
+
+        series.select(order)
         return buoy_data
 
     def _analyze_buoy_data(self, buoy_data: BuoyData) -> tuple[list[str], dict[str, Any]]:
@@ -556,51 +537,33 @@ class BuoyProcessor(DataProcessor[dict[str, Any], BuoyData]):
         # Store weight for data fusion based on quality score
         metadata["analysis"]["weight"] = metadata["analysis"]["quality_score"]
 
+        series = buoy_data.observations
+
         # Check data freshness
-        if buoy_data.observations:
-            latest_obs = buoy_data.observations[0]
-            try:
-                obs_time = datetime.fromisoformat(latest_obs.timestamp.replace("Z", "+00:00"))
-                now = datetime.now(obs_time.tzinfo)
-                hours_old = (now - obs_time).total_seconds() / 3600
+        if series:
+            latest_epoch = series.epoch[0]
+            if np.isnan(latest_epoch):
+                warnings.append("Could not parse observation timestamp")
+            else:
+                hours_old = float((datetime.now().timestamp() - latest_epoch) / 3600)
 
                 metadata["analysis"]["hours_since_update"] = hours_old
 
                 if hours_old > 6:
                     warnings.append(f"Buoy data is {hours_old:.1f} hours old")
                     metadata["analysis"]["quality_score"] -= min(0.5, hours_old / 24)
-            except (ValueError, TypeError):
-                warnings.append("Could not parse observation timestamp")
-
-        # Check for data gaps
-        if len(buoy_data.observations) >= 2:
-            gap_found = False
-            for i in range(len(buoy_data.observations) - 1):
-                try:
-                    current = datetime.fromisoformat(
-                        buoy_data.observations[i].timestamp.replace("Z", "+00:00")
-                    )
-                    next_obs = datetime.fromisoformat(
-                        buoy_data.observations[i + 1].timestamp.replace("Z", "+00:00")
-                    )
-                    gap = (current - next_obs).total_seconds() / 3600
-
-                    if gap > 3:  # More than 3 hours between observations
-                        gap_found = True
-                        break
-                except (ValueError, TypeError):
-                    continue
 
-            if gap_found:
+        # Check for data gaps (more than 3 hours between consecutive observations)
+        if len(series) >= 2:
+            gaps = -np.diff(series.epoch) / 3600
+            if np.any(gaps > 3):
                 warnings.append("Gaps found in buoy data time series")
                 metadata["analysis"]["quality_score"] -= 0.2
 
         # Analyze wave height trends
-        if len(buoy_data.observations) >= 3:
-            heights = []
-            for obs in buoy_data.observations[:12]:  # Use up to 12 recent observations
-                if obs.wave_height is not None:
-                    heights.append(obs.wave_height)
+        if len(series) >= 3:
+            recent = series.column("wave_height")[:12]  # Use up to 12 recent observations
+            heights = recent[~np.isnan(recent)].tolist()
 
             if heights:
                 # Calculate trend
@@ -326,18 +326,18 @@ class ConfidenceScorer:
             Accuracy score (0.0 to 1.0)
         """
         try:
-            # If validation database is available, query recent accuracy
+            recent_mae = None
+
+            # If validation database is available, read recent accuracy from
+            # its daily performance summary (a handful of rows per day)
             if self.validation_db:
-                # TODO: Query validation database for recent MAE
-                # recent_mae = self.validation_db.get_recent_mae(days=7)
-                # accuracy = max(0.0, 1.0 - (recent_mae / 5.0))
-                # return min(1.0, accuracy)
-                pass
+                recent_mae = self.validation_db.get_recent_mae(days=7)
 
-            # Check fusion metadata for validation info
-            metadata = fusion_data.get("metadata", {})
-            validation = metadata.get("validation", {})
-            recent_mae = validation.get("recent_mae")
+            # Otherwise check fusion metadata for validation info
+            if recent_mae is None:
+                metadata = fusion_data.get("metadata", {})
+                validation = metadata.get("validation", {})
+                recent_mae = validation.get("recent_mae")
 
             if recent_mae is not None:
                 # Convert MAE to accuracy score
@@ -5,7 +5,6 @@ This module integrates data from multiple sources (buoys, weather forecasts, wav
 to create a unified view of current and forecasted surf conditions.
 """
 
-import json
 import logging
 import math
 from datetime import UTC, datetime
@@ -14,6 +13,7 @@ from typing import Any
 
 from ..core.config import Config
 from ..utils.swell_propagation import SwellPropagationCalculator
+from ..validation.database import ValidationReader
 from .confidence_scorer import ConfidenceScorer
 from .data_processor import DataProcessor, ProcessingResult
 from .hawaii_context import HawaiiContext
@@ -101,11 +101,26 @@ class DataFusionSystem(DataProcessor[dict[str, Any], SwellForecast]):
         self.logger = logging.getLogger("processor.data_fusion")
         self.hawaii_context = HawaiiContext()
         self.source_scorer = SourceScorer()
-        self.confidence_scorer = ConfidenceScorer()
+        self.confidence_scorer = ConfidenceScorer(validation_db=self._load_validation_db())
         self.storm_detector = StormDetector()
         self.propagation_calc = SwellPropagationCalculator()
         self.spectral_analyzer = SpectralAnalyzer()
 
+    def _load_validation_db(self) -> ValidationReader | None:
+        """
+        Reader for historical accuracy from the validation database.
+
+        The reader opens a read-only connection on first use, so processing
+        never creates, migrates or locks the database.
+
+        Returns:
+            ValidationReader, or None when no database path is configured
+        """
+        db_path = self.config.get("validation", "database_path", "data/validation.db")
+        if not isinstance(db_path, str):
+            return None
+        return ValidationReader(db_path)
+
     def validate(self, data: dict[str, Any]) -> list[str]:
         """
         Validate input data for fusion.
@@ -257,11 +272,8 @@ class DataFusionSystem(DataProcessor[dict[str, Any], SwellForecast]):
                 buoy_data_list.append(buoy_item)
             elif isinstance(buoy_item, dict):
                 # Try to create BuoyData from dictionary
-                # Use from_json which handles both raw NDBC and normalized formats
                 try:
-                    import json
-
-                    buoy = BuoyData.from_json(json.dumps(buoy_item))
+                    buoy = BuoyData.from_dict(buoy_item)
                     buoy_data_list.append(buoy)
                 except Exception as e:
                     self.logger.warning(f"Failed to convert buoy data: {e}")
@@ -296,7 +308,7 @@ class DataFusionSystem(DataProcessor[dict[str, Any], SwellForecast]):
                         weather_data_list.append(weather)
                     elif "provider" in weather_item:
                         # Already in our format
-                        weather = WeatherData.from_json(json.dumps(weather_item))
+                        weather = WeatherData.from_dict(weather_item)
                         weather_data_list.append(weather)
                 except Exception as e:
                     self.logger.warning(f"Failed to convert weather data: {e}")
@@ -325,7 +337,12 @@ class DataFusionSystem(DataProcessor[dict[str, Any], SwellForecast]):
             elif isinstance(model_item, dict):
                 # Try to create ModelData from dictionary
                 try:
-                    if "metadata" in model_item and "forecasts" in model_item:
+                    if "model_id" in model_item:
+                        # Already in our format (checked first: to_dict() also
+                        # has the SWAN metadata/forecasts keys)
+                        model = ModelData.from_dict(model_item)
+                        model_data_list.append(model)
+                    elif "metadata" in model_item and "forecasts" in model_item:
                         # SWAN format
                         model = ModelData.from_swan_json(model_item)
                         model_data_list.append(model)
@@ -333,10 +350,6 @@ class DataFusionSystem(DataProcessor[dict[str, Any], SwellForecast]):
                         # WW3 format
                         model = ModelData.from_ww3_json(model_item)
                         model_data_list.append(model)
-                    elif "model_id" in model_item:
-                        # Already in our format
-                        model = ModelData.from_json(json.dumps(model_item))
-                        model_data_list.append(model)
                 except Exception as e:
                     self.logger.warning(f"Failed to convert model data: {e}")
 
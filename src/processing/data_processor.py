@@ -187,6 +187,25 @@ class DataProcessor(Generic[T_Input, T_Output], ABC):
             self.logger.error(f"Error processing file {file_path}: {e}")
             return ProcessingResult(success=False, error=f"Error processing file: {str(e)}")
 
+    def refresh_cached_result(
+        self, result: ProcessingResult, file_path: str | Path
+    ) -> ProcessingResult:
+        """
+        Re-apply environment-dependent enrichment to a result restored from cache.
+
+        Processors whose output depends on more than the file content (for
+        example, files that live outside the bundle) override this so that a
+        cached result stays consistent with a fresh run.
+
+        Args:
+            result: Cached processing result
+            file_path: Path of the file the result was produced from
+
+        Returns:
+            ProcessingResult to use for this run
+        """
+        return result
+
     def process_bundle(
         self, bundle_id: str | None = None, file_pattern: str | None = None
     ) -> list[ProcessingResult]:
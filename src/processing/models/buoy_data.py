@@ -4,11 +4,14 @@ Standardized data model for buoy observations.
 
 import json
 import logging
+from collections.abc import Iterable, MutableSequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from ...utils.numeric import safe_float
+import numpy as np
+
+from ...utils.numeric import safe_float, safe_float_array
 
 # Physical constraint bounds for buoy data validation
 WAVE_HEIGHT_BOUNDS = (0.0, 30.0)  # meters
@@ -20,9 +23,67 @@ WATER_TEMP_BOUNDS = (-2.0, 35.0)  # celsius
 AIR_TEMP_BOUNDS = (-40.0, 50.0)  # celsius
 DIRECTION_BOUNDS = (0.0, 360.0)  # degrees
 
+# Numeric observation fields, their NDBC column names and physical bounds
+OBSERVATION_FIELDS = (
+    "wave_height",
+    "dominant_period",
+    "average_period",
+    "wave_direction",
+    "wind_speed",
+    "wind_direction",
+    "air_temperature",
+    "water_temperature",
+    "pressure",
+)
+NDBC_FIELD_KEYS = {
+    "wave_height": "WVHT",
+    "dominant_period": "DPD",
+    "average_period": "APD",
+    "wave_direction": "MWD",
+    "wind_speed": "WSPD",
+    "wind_direction": "WDIR",
+    "air_temperature": "ATMP",
+    "water_temperature": "WTMP",
+    "pressure": "PRES",
+}
+FIELD_BOUNDS = {
+    "wave_height": WAVE_HEIGHT_BOUNDS,
+    "dominant_period": DOMINANT_PERIOD_BOUNDS,
+    "average_period": AVERAGE_PERIOD_BOUNDS,
+    "wave_direction": DIRECTION_BOUNDS,
+    "wind_speed": WIND_SPEED_BOUNDS,
+    "wind_direction": DIRECTION_BOUNDS,
+    "air_temperature": AIR_TEMP_BOUNDS,
+    "water_temperature": WATER_TEMP_BOUNDS,
+    "pressure": PRESSURE_BOUNDS,
+}
+
 logger = logging.getLogger(__name__)
 
 
+def parse_epoch(timestamp: str) -> float:
+    """
+    Convert an ISO timestamp to epoch seconds.
+
+    Naive timestamps are interpreted in local time, matching datetime.timestamp().
+
+    Args:
+        timestamp: ISO 8601 timestamp (a trailing 'Z' is accepted)
+
+    Returns:
+        Epoch seconds, or NaN if the timestamp cannot be parsed
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, TypeError, ValueError):
+        return float("nan")
+
+
+def _is_raw_ndbc(record: dict[str, Any]) -> bool:
+    """Whether an observation record uses NDBC column names (WVHT, DPD, ...)."""
+    return "WVHT" in record or "DPD" in record or "MWD" in record
+
+
 @dataclass
 class BuoyObservation:
     """
@@ -161,17 +222,323 @@ class BuoyObservation:
         }
 
 
+def _row(obs: BuoyObservation) -> tuple:
+    """Snapshot of the values an observation contributes to the columns."""
+    return (obs.timestamp, *(getattr(obs, name) for name in OBSERVATION_FIELDS))
+
+
+class ObservationSeries(MutableSequence):
+    """
+    Columnar store for a buoy's observations.
+
+    Each numeric field is a contiguous float64 array (NaN = missing) and
+    timestamps are kept both as the original ISO strings and as an epoch-seconds
+    array. BuoyObservation objects are only created when an item is accessed;
+    changes made to those objects are written back before any columnar read,
+    so list-style callers and vectorized analytics see the same data.
+    """
+
+    def __init__(
+        self,
+        timestamps: Iterable[str] | None = None,
+        columns: dict[str, Any] | None = None,
+        raw_data: list[dict[str, Any]] | None = None,
+    ):
+        """
+        Initialize the series.
+
+        Args:
+            timestamps: ISO timestamps, one per observation
+            columns: Mapping of field name to values (missing fields are all-NaN)
+            raw_data: Optional original record per observation
+        """
+        self._timestamps: list[str] = list(timestamps or [])
+        size = len(self._timestamps)
+        columns = columns or {}
+        self._columns: dict[str, np.ndarray] = {
+            name: (
+                np.asarray(columns[name], dtype=np.float64).copy()
+                if name in columns
+                else np.full(size, np.nan)
+            )
+            for name in OBSERVATION_FIELDS
+        }
+        self._raw_data: list[dict[str, Any]] | None = list(raw_data) if raw_data else None
+        self._epoch: np.ndarray | None = None
+        self._objects: dict[int, BuoyObservation] = {}
+        self._pending: list[BuoyObservation] = []
+        # Row of each materialized object as last written to the columns
+        self._snapshots: dict[int, tuple] = {}
+
+    @classmethod
+    def from_observations(cls, observations: Iterable["BuoyObservation"]) -> "ObservationSeries":
+        """Build a series from existing BuoyObservation objects."""
+        series = cls()
+        series.extend(observations)
+        return series
+
+    @classmethod
+    def from_records(
+        cls, records: list[dict[str, Any]], ndbc: bool | None = None
+    ) -> "ObservationSeries":
+        """
+        Build a series from observation dictionaries without creating objects.
+
+        Records may use NDBC column names (WVHT, DPD, ...) or normalized field
+        names, as accepted by BuoyObservation.from_ndbc() and BuoyData.from_json().
+        Values are validated against the physical bounds for each field.
+
+        Args:
+            records: Observation dictionaries
+            ndbc: Treat every record as NDBC format (True), as normalized (False),
+                or detect per record (None)
+
+        Returns:
+            ObservationSeries instance
+        """
+        records = [record for record in records if isinstance(record, dict)]
+        raw_flags = [_is_raw_ndbc(record) if ndbc is None else ndbc for record in records]
+
+        timestamps = []
+        raw_data = []
+        for record, is_raw in zip(records, raw_flags, strict=True):
+            if is_raw:
+                timestamps.append(
+                    record.get("Date", record.get("DATE", "")) or datetime.now().isoformat()
+                )
+                raw_data.append(record)
+            else:
+                timestamps.append(record.get("timestamp", ""))
+                raw_data.append(record.get("raw_data", {}))
+
+        columns = {}
+        for name in OBSERVATION_FIELDS:
+            ndbc_key = NDBC_FIELD_KEYS[name]
+            values = [
+                record.get(ndbc_key, record.get(name)) if is_raw else record.get(name)
+                for record, is_raw in zip(records, raw_flags, strict=True)
+            ]
+            low, high = FIELD_BOUNDS[name]
+            columns[name] = safe_float_array(values, low, high, name)
+
+        has_raw = any(raw_data)
+        return cls(timestamps, columns, raw_data if has_raw else None)
+
+    # -- Columnar access -------------------------------------------------
+
+    @property
+    def timestamps(self) -> list[str]:
+        """ISO timestamps in series order."""
+        self._synchronize()
+        return list(self._timestamps)
+
+    @property
+    def epoch(self) -> np.ndarray:
+        """Timestamps as epoch seconds (NaN where unparsable), read-only."""
+        self._synchronize()
+        if self._epoch is None:
+            self._epoch = np.array(
+                [parse_epoch(timestamp) for timestamp in self._timestamps], dtype=np.float64
+            )
+            self._epoch.flags.writeable = False
+        return self._epoch
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a read-only float64 array for an observation field.
+
+        Args:
+            name: Field name from OBSERVATION_FIELDS
+
+        Returns:
+            Array with NaN for missing values
+        """
+        self._synchronize()
+        view = self._columns[name].view()
+        view.flags.writeable = False
+        return view
+
+    def set_missing(self, name: str, mask: np.ndarray) -> None:
+        """
+        Mark values of a field as missing where ``mask`` is True.
+
+        Args:
+            name: Field name from OBSERVATION_FIELDS
+            mask: Boolean array aligned with the series
+        """
+        self._synchronize()
+        mask = np.asarray(mask, dtype=bool)
+        self._columns[name][mask] = np.nan
+        for index, obs in self._objects.items():
+            if mask[index]:
+                setattr(obs, name, None)
+                self._snapshots[index] = _row(obs)
+
+    def select(self, indices: np.ndarray | list[int]) -> None:
+        """
+        Keep only the given positions, in the given order.
+
+        Args:
+            indices: Integer positions into the current series
+        """
+        self._synchronize()
+        indices = np.asarray(indices, dtype=np.intp)
+        self._timestamps = [self._timestamps[i] for i in indices]
+        self._columns = {name: values[indices] for name, values in self._columns.items()}
+        if self._raw_data is not None:
+            self._raw_data = [self._raw_data[i] for i in indices]
+        if self._epoch is not None:
+            self._epoch = self._epoch[indices]
+            self._epoch.flags.writeable = False
+        self._objects = {
+            new: self._objects[old] for new, old in enumerate(indices) if old in self._objects
+        }
+        self._snapshots = {
+            new: self._snapshots[old] for new, old in enumerate(indices) if old in self._snapshots
+        }
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Serialize observations to dictionaries without materializing objects."""
+        self._synchronize()
+        values = {
+            name: [None if v != v else v for v in column.tolist()]
+            for name, column in self._columns.items()
+        }
+        return [
+            {"timestamp": timestamp, **{name: values[name][i] for name in OBSERVATION_FIELDS}}
+            for i, timestamp in enumerate(self._timestamps)
+        ]
+
+    # -- Sequence protocol -----------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._timestamps) + len(self._pending)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        self._flush()
+        index = self._normalize_index(index)
+        obs = self._objects.get(index)
+        if obs is None:
+            values = {}
+            for name in OBSERVATION_FIELDS:
+                value = float(self._columns[name][index])
+                values[name] = None if np.isnan(value) else value
+            obs = BuoyObservation(
+                timestamp=self._timestamps[index],
+                raw_data=self._raw_data[index] if self._raw_data is not None else {},
+                **values,
+            )
+            self._objects[index] = obs
+            self._snapshots[index] = _row(obs)
+        return obs
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = value
+            self._reset(items)
+            return
+        self._flush()
+        index = self._normalize_index(index)
+        self._objects[index] = value
+        self._snapshots.pop(index, None)
+
+    def __delitem__(self, index) -> None:
+        self._synchronize()
+        positions = range(len(self))[index]
+        drop = {positions} if isinstance(positions, int) else set(positions)
+        self.select([i for i in range(len(self)) if i not in drop])
+
+    def insert(self, index: int, value: "BuoyObservation") -> None:
+        if index >= len(self):
+            self.append(value)
+            return
+        items = list(self)
+        items.insert(index, value)
+        self._reset(items)
+
+    def append(self, value: "BuoyObservation") -> None:
+        self._pending.append(value)
+
+    def extend(self, values: Iterable["BuoyObservation"]) -> None:
+        self._pending.extend(values)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        """Sort like list.sort(); prefer select() with a vectorized order."""
+        self._reset(sorted(self, key=key, reverse=reverse))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ObservationSeries | list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ObservationSeries(size={len(self)})"
+
+    # -- Internals -------------------------------------------------------
+
+    def _normalize_index(self, index: int) -> int:
+        size = len(self._timestamps)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("observation index out of range")
+        return index
+
+    def _reset(self, observations: list["BuoyObservation"]) -> None:
+        fresh = ObservationSeries.from_observations(observations)
+        fresh._flush()
+        self.__dict__.update(fresh.__dict__)
+
+    def _flush(self) -> None:
+        """Move appended objects into the columnar arrays."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        start = len(self._timestamps)
+        self._timestamps.extend(obs.timestamp for obs in pending)
+        for name in OBSERVATION_FIELDS:
+            appended = np.array([getattr(obs, name) for obs in pending], dtype=np.float64)
+            self._columns[name] = np.concatenate([self._columns[name], appended])
+        if self._raw_data is not None or any(obs.raw_data for obs in pending):
+            existing = self._raw_data if self._raw_data is not None else [{}] * start
+            self._raw_data = existing + [obs.raw_data for obs in pending]
+        self._objects.update({start + offset: obs for offset, obs in enumerate(pending)})
+        self._snapshots.update({start + offset: _row(obs) for offset, obs in enumerate(pending)})
+        self._epoch = None
+
+    def _synchronize(self) -> None:
+        """Write back changes made through materialized BuoyObservation objects."""
+        self._flush()
+        for index, obs in self._objects.items():
+            row = _row(obs)
+            if row == self._snapshots.get(index):
+                continue
+            self._snapshots[index] = row
+            timestamp, *values = row
+            if timestamp != self._timestamps[index]:
+                self._timestamps[index] = timestamp
+                self._epoch = None
+            for name, value in zip(OBSERVATION_FIELDS, values, strict=True):
+                self._columns[name][index] = np.nan if value is None else value
+
+
 @dataclass
 class BuoyData:
     """
     Complete buoy dataset with metadata and observations.
 
+    Observations are stored columnar in an ObservationSeries; assigning a plain
+    list of BuoyObservation objects converts it.
+
     Attributes:
         station_id: Buoy station ID
         name: Buoy name or description
         latitude: Buoy latitude
         longitude: Buoy longitude
-        observations: List of buoy observations
+        observations: Buoy observations (newest first after processing)
         metadata: Additional metadata
         spec_file_path: Optional path to spectral data file (.spec)
     """
@@ -180,10 +547,15 @@ class BuoyData:
     name: str | None = None
     latitude: float | None = None
     longitude: float | None = None
-    observations: list[BuoyObservation] = field(default_factory=list)
+    observations: ObservationSeries = field(default_factory=ObservationSeries)
     metadata: dict[str, Any] = field(default_factory=dict)
     spec_file_path: str | None = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "observations" and not isinstance(value, ObservationSeries):
+            value = ObservationSeries.from_observations(value or [])
+        super().__setattr__(name, value)
+
     @property
     def latest_observation(self) -> BuoyObservation | None:
         """Get the latest observation."""
@@ -204,21 +576,15 @@ class BuoyData:
         """
         station_id = data.get("station_id", "unknown")
 
-        # Create BuoyData instance
-        buoy_data = cls(
+        return cls(
             station_id=station_id,
             name=data.get("name", f"NDBC Buoy {station_id}"),
             latitude=data.get("latitude"),
             longitude=data.get("longitude"),
+            observations=ObservationSeries.from_records(data.get("observations", []), ndbc=True),
             metadata=data.get("metadata", {}),
         )
 
-        # Add observations
-        for obs in data.get("observations", []):
-            buoy_data.observations.append(BuoyObservation.from_ndbc(obs))
-
-        return buoy_data
-
     def to_dict(self) -> dict[str, Any]:
         """
         Convert to dictionary.
@@ -231,7 +597,7 @@ class BuoyData:
             "name": self.name,
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "observations": [obs.to_dict() for obs in self.observations],
+            "observations": self.observations.to_records(),
             "metadata": self.metadata,
         }
 
@@ -249,87 +615,33 @@ class BuoyData:
         """
         Create a BuoyData from JSON string.
 
+        Observations may be in raw NDBC format (WVHT, DPD, ...) or the normalized
+        format written by to_dict(); both are bounds-validated.
+
         Args:
             json_str: JSON string
 
         Returns:
             BuoyData instance
         """
-        data = json.loads(json_str)
+        return cls.from_dict(json.loads(json_str))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BuoyData":
+        """
+        Create a BuoyData from a dictionary in the to_dict() layout.
 
-        # Create BuoyData instance
-        buoy_data = cls(
+        Args:
+            data: Dictionary with buoy data
+
+        Returns:
+            BuoyData instance
+        """
+        return cls(
             station_id=data.get("station_id", "unknown"),
             name=data.get("name"),
             latitude=data.get("latitude"),
             longitude=data.get("longitude"),
+            observations=ObservationSeries.from_records(data.get("observations", [])),
             metadata=data.get("metadata", {}),
         )
-
-        # Add observations - handle both raw NDBC format and normalized format
-        for obs in data.get("observations", []):
-            # Check if this is raw NDBC format (has 'WVHT', 'DPD', etc.)
-            # or normalized format (has 'wave_height', 'dominant_period', etc.)
-            if "WVHT" in obs or "DPD" in obs or "MWD" in obs:
-                # Raw NDBC format - use from_ndbc to parse it
-                observation = BuoyObservation.from_ndbc(obs)
-            else:
-                # Normalized format - apply bounds validation
-                observation = BuoyObservation(
-                    timestamp=obs.get("timestamp", ""),
-                    wave_height=safe_float(
-                        obs.get("wave_height"),
-                        WAVE_HEIGHT_BOUNDS[0],
-                        WAVE_HEIGHT_BOUNDS[1],
-                        "wave_height",
-                    ),
-                    dominant_period=safe_float(
-                        obs.get("dominant_period"),
-                        DOMINANT_PERIOD_BOUNDS[0],
-                        DOMINANT_PERIOD_BOUNDS[1],
-                        "dominant_period",
-                    ),
-                    average_period=safe_float(
-                        obs.get("average_period"),
-                        AVERAGE_PERIOD_BOUNDS[0],
-                        AVERAGE_PERIOD_BOUNDS[1],
-                        "average_period",
-                    ),
-                    wave_direction=safe_float(
-                        obs.get("wave_direction"),
-                        DIRECTION_BOUNDS[0],
-                        DIRECTION_BOUNDS[1],
-                        "wave_direction",
-                    ),
-                    wind_speed=safe_float(
-                        obs.get("wind_speed"),
-                        WIND_SPEED_BOUNDS[0],
-                        WIND_SPEED_BOUNDS[1],
-                        "wind_speed",
-                    ),
-                    wind_direction=safe_float(
-                        obs.get("wind_direction"),
-                        DIRECTION_BOUNDS[0],
-                        DIRECTION_BOUNDS[1],
-                        "wind_direction",
-                    ),
-                    air_temperature=safe_float(
-                        obs.get("air_temperature"),
-                        AIR_TEMP_BOUNDS[0],
-                        AIR_TEMP_BOUNDS[1],
-                        "air_temperature",
-                    ),
-                    water_temperature=safe_float(
-                        obs.get("water_temperature"),
-                        WATER_TEMP_BOUNDS[0],
-                        WATER_TEMP_BOUNDS[1],
-                        "water_temperature",
-                    ),
-                    pressure=safe_float(
-                        obs.get("pressure"), PRESSURE_BOUNDS[0], PRESSURE_BOUNDS[1], "pressure"
-                    ),
-                    raw_data=obs.get("raw_data", {}),
-                )
-            buoy_data.observations.append(observation)
-
-        return buoy_data
@@ -247,8 +247,19 @@ class ModelData:
         Returns:
             ModelData instance
         """
-        data = json.loads(json_str)
+        return cls.from_dict(json.loads(json_str))
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ModelData":
+        """
+        Create a ModelData from a dictionary in the to_dict() layout.
+
+        Args:
+            data: Dictionary with model data
+
+        Returns:
+            ModelData instance
+        """
         # Create ModelData instance
         model_data = cls(
             model_id=data.get("model_id", "unknown"),
@@ -231,8 +231,19 @@ class WeatherData:
         Returns:
             WeatherData instance
         """
-        data = json.loads(json_str)
+        return cls.from_dict(json.loads(json_str))
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WeatherData":
+        """
+        Create a WeatherData from a dictionary in the to_dict() layout.
+
+        Args:
+            data: Dictionary with weather data
+
+        Returns:
+            WeatherData instance
+        """
         # Create WeatherData instance
         weather_data = cls(
             provider=data.get("provider", "unknown"),
@@ -0,0 +1,410 @@
+"""
+Parallel, incremental bundle processing engine for SurfCastAI.
+
+Fans the per-file work of the buoy, weather and wave model processors (plus
+the supplemental agent JSON loads) out across a process pool, and reuses
+cached ProcessingResults for files whose content has not changed since the
+last processed bundle.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..core.bundle_manager import BundleManager
+from ..core.config import Config
+from .buoy_processor import BuoyProcessor
+from .data_processor import DataProcessor, ProcessingResult
+from .wave_model_processor import WaveModelProcessor
+from .weather_processor import WeatherProcessor
+
+logger = logging.getLogger(__name__)
+
+# Bump when processor output changes so stale cache entries are ignored
+CACHE_VERSION = 1
+
+# Per-file processing stages: (stage name, processor class, glob pattern)
+PROCESSOR_STAGES: tuple[tuple[str, type[DataProcessor], str], ...] = (
+    ("buoy", BuoyProcessor, "**/buoy_*.json"),
+    ("weather", WeatherProcessor, "weather/weather_*.json"),
+    ("model", WaveModelProcessor, "models/model_*.*"),
+)
+
+# Supplemental agent outputs: (fusion key, agent directory, glob pattern)
+SUPPLEMENTAL_SOURCES: tuple[tuple[str, str, str], ...] = (
+    ("metar_data", "metar", "metar_*.json"),
+    ("tide_data", "tides", "tide_*.json"),
+    ("tropical_data", "tropical", "tropical_outlook.json"),
+    ("chart_data", "charts", "*.json"),
+    ("altimetry_data", "altimetry", "metadata.json"),
+    ("nearshore_data", "nearshore_buoys", "metadata.json"),
+    ("upper_air_data", "upper_air", "metadata.json"),
+    ("climatology_data", "climatology", "metadata.json"),
+    ("marine_forecast_data", "marine_forecasts/marine_forecasts", "*.json"),
+)
+
+# Worker-process state, populated by _init_worker
+_worker_config: Config | None = None
+_worker_processors: dict[tuple[type[DataProcessor], str], DataProcessor] = {}
+
+
+def _init_worker(config: Config) -> None:
+    """Store the configuration once per worker process."""
+    global _worker_config
+    _worker_config = config
+    _worker_processors.clear()
+
+
+def _config_fingerprint(config: Config) -> str:
+    """Digest of the full configuration, so processors are rebuilt when it changes."""
+    material = json.dumps(getattr(config, "_config", None), sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _get_processor(processor_cls: type[DataProcessor], config: Config) -> DataProcessor:
+    """Return a processor instance, reusing one per class and configuration within a process."""
+    key = (processor_cls, _config_fingerprint(config))
+    processor = _worker_processors.get(key)
+    if processor is None:
+        processor = processor_cls(config)
+        _worker_processors[key] = processor
+    return processor
+
+
+def _process_file_task(
+    processor_cls: type[DataProcessor], file_path: str, config: Config | None = None
+) -> ProcessingResult:
+    """Process a single bundle file (runs inside a worker process)."""
+    processor = _get_processor(processor_cls, config or _worker_config)
+    return processor.process_file(file_path)
+
+
+def load_agent_json(agent_path: str | Path, pattern: str) -> tuple[list[dict[str, Any]], list[str]]:
+    """
+    Load and flatten JSON payloads written by a collection agent.
+
+    Args:
+        agent_path: Agent directory inside the bundle
+        pattern: Glob pattern for the files to load
+
+    Returns:
+        Tuple of (payloads, warning messages)
+    """
+    agent_path = Path(agent_path)
+    payloads: list[dict[str, Any]] = []
+    warnings: list[str] = []
+    if agent_path.exists():
+        for file_path in agent_path.glob(pattern):
+            try:
+                with open(file_path) as fh:
+                    data = json.load(fh)
+                    # If the JSON is a list, extend; otherwise append
+                    if isinstance(data, list):
+                        payloads.extend(data)
+                    else:
+                        payloads.append(data)
+            except Exception as exc:
+                warnings.append(f"Failed to load {file_path}: {exc}")
+    return payloads, warnings
+
+
+def hash_file(file_path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 digest of a file's content.
+
+    Args:
+        file_path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ProcessingCache:
+    """
+    On-disk cache of ProcessingResults keyed by stage and file content hash.
+
+    Entries are pickled ProcessingResults stored under the data directory.
+    Only successful results are cached, and time-dependent fields (freshness
+    scores, staleness warnings) are recomputed on load by each processor's
+    ``refresh_cached_result``.
+    The cache is trusted local state written only by this engine. After each
+    run, entries not used by that run are pruned, so the cache always mirrors
+    the last processed bundle.
+    """
+
+    def __init__(self, cache_dir: str | Path, salt: str = ""):
+        """
+        Initialize the processing cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            salt: Extra key material (e.g. processing config) mixed into every key
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.salt = salt
+        self.logger = logging.getLogger("processing.cache")
+
+    def key(self, stage: str, content_hash: str) -> str:
+        """Build the cache key for a stage/content pair."""
+        material = f"{CACHE_VERSION}:{stage}:{self.salt}:{content_hash}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> ProcessingResult | None:
+        """Return the cached result for a key, or None on miss or corruption."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as fh:
+                result = pickle.load(fh)
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        return result if isinstance(result, ProcessingResult) else None
+
+    def put(self, key: str, result: ProcessingResult) -> None:
+        """Store a result atomically (temp file + rename)."""
+        path = self._path(key)
+        temp_path = path.with_suffix(".tmp")
+        try:
+            with open(temp_path, "wb") as fh:
+                pickle.dump(result, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(path)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache processing result: {e}")
+            temp_path.unlink(missing_ok=True)
+
+    def prune(self, keep: set[str]) -> int:
+        """
+        Remove entries whose keys are not in ``keep``.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.pkl"):
+            if path.stem not in keep:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+@dataclass
+class BundleProcessingResults:
+    """
+    Results of processing every stage of a bundle.
+
+    Attributes:
+        stage_results: Per-stage list of ProcessingResults (buoy, weather, model)
+        supplemental: Fusion key -> flattened supplemental agent payloads
+        warnings: Non-fatal problems (e.g. unreadable supplemental files)
+        cache_hits: Number of files served from the processing cache
+        cache_misses: Number of files processed from scratch
+    """
+
+    stage_results: dict[str, list[ProcessingResult]] = field(default_factory=dict)
+    supplemental: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class ProcessingEngine:
+    """
+    Parallel, incremental processor for whole data bundles.
+
+    Features:
+    - Processes buoy, weather and wave model files across a process pool
+    - Loads supplemental agent JSON concurrently with the processors
+    - Skips files whose content hash matches the last processed bundle
+    - Falls back to in-process execution for a single worker or a broken pool
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        max_workers: int | None = None,
+        use_cache: bool | None = None,
+    ):
+        """
+        Initialize the processing engine.
+
+        Args:
+            config: Application configuration
+            max_workers: Worker processes (defaults to processing.max_workers or CPU count)
+            use_cache: Enable incremental reuse (defaults to processing.incremental)
+        """
+        self.config = config
+        self.logger = logging.getLogger("processing.engine")
+
+        if max_workers is None:
+            max_workers = config.getint("processing", "max_workers", 0) or (os.cpu_count() or 1)
+        self.max_workers = max(1, max_workers)
+
+        if use_cache is None:
+            use_cache = config.getboolean("processing", "incremental", True)
+        self.use_cache = use_cache
+
+        self.data_dir = Path(config.data_directory)
+        self.cache: ProcessingCache | None = None
+        if self.use_cache:
+            salt = json.dumps(config.get("processing", default={}), sort_keys=True, default=str)
+            self.cache = ProcessingCache(self.data_dir / "cache" / "processing", salt=salt)
+
+    def process_bundle(self, bundle_id: str) -> BundleProcessingResults:
+        """
+        Process every stage of a bundle.
+
+        Args:
+            bundle_id: Bundle ID to process
+
+        Returns:
+            BundleProcessingResults with per-stage results and supplemental data
+        """
+        results = BundleProcessingResults()
+        bundle_path = BundleManager(self.data_dir).get_bundle_path(bundle_id)
+        if bundle_path is None:
+            error = ProcessingResult(success=False, error=f"Bundle not found: {bundle_id}")
+            results.stage_results = {name: [error] for name, _, _ in PROCESSOR_STAGES}
+            return results
+
+        # Resolve files and cache hits up front; only misses go to the pool
+        stage_slots: dict[str, list[ProcessingResult | None]] = {}
+        pending: list[tuple[str, int, type[DataProcessor], Path, str | None]] = []
+        used_keys: set[str] = set()
+
+        for stage, processor_cls, pattern in PROCESSOR_STAGES:
+            files = sorted(bundle_path.glob(pattern))
+            self.logger.info(f"Found {len(files)} {stage} file(s) matching '{pattern}'")
+            if not files:
+                stage_slots[stage] = [
+                    ProcessingResult(success=False, error=f"No files found in bundle {bundle_id}")
+                ]
+                continue
+
+            slots: list[ProcessingResult | None] = [None] * len(files)
+            for index, file_path in enumerate(files):
+                key = self._cache_key(stage, file_path)
+                cached = self.cache.get(key) if self.cache and key else None
+                if cached is not None:
+                    processor = _get_processor(processor_cls, self.config)
+                    slots[index] = processor.refresh_cached_result(cached, file_path)
+                    used_keys.add(key)
+                    results.cache_hits += 1
+                else:
+                    pending.append((stage, index, processor_cls, file_path, key))
+            stage_slots[stage] = slots
+
+        results.cache_misses = len(pending)
+        self.logger.info(
+            f"Processing {len(pending)} file(s) with {self.max_workers} worker(s) "
+            f"({results.cache_hits} reused from cache)"
+        )
+
+        try:
+            self._run(bundle_path, pending, stage_slots, results, used_keys)
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Process pool failed ({e}); retrying in-process")
+            self.max_workers = 1
+            self._run(bundle_path, pending, stage_slots, results, used_keys)
+
+        results.stage_results = {stage: list(slots) for stage, slots in stage_slots.items()}
+
+        if self.cache:
+            removed = self.cache.prune(used_keys)
+            if removed:
+                self.logger.debug(f"Pruned {removed} stale processing cache entries")
+
+        return results
+
+    def _cache_key(self, stage: str, file_path: Path) -> str | None:
+        """Return the cache key for a file, or None if caching is off or hashing fails."""
+        if not self.cache:
+            return None
+        try:
+            return self.cache.key(stage, hash_file(file_path))
+        except OSError as e:
+            self.logger.warning(f"Could not hash {file_path}: {e}")
+            return None
+
+    def _run(
+        self,
+        bundle_path: Path,
+        pending: list[tuple[str, int, type[DataProcessor], Path, str | None]],
+        stage_slots: dict[str, list[ProcessingResult | None]],
+        results: BundleProcessingResults,
+        used_keys: set[str],
+    ) -> None:
+        """Execute pending file tasks and supplemental loads, filling in results."""
+        executor: Executor | None = None
+        if self.max_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(self.config,)
+            )
+
+        try:
+            file_futures: list[tuple[str, int, Path, str | None, Future | ProcessingResult]] = []
+            for stage, index, processor_cls, file_path, key in pending:
+                if executor is not None:
+                    task = executor.submit(_process_file_task, processor_cls, str(file_path))
+                else:
+                    task = _process_file_task(processor_cls, str(file_path), self.config)
+                file_futures.append((stage, index, file_path, key, task))
+
+            supplemental_futures: dict[str, Future | tuple[list[dict[str, Any]], list[str]]] = {}
+            for fusion_key, agent_dir, pattern in SUPPLEMENTAL_SOURCES:
+                agent_path = bundle_path / agent_dir
+                if executor is not None:
+                    supplemental_futures[fusion_key] = executor.submit(
+                        load_agent_json, agent_path, pattern
+                    )
+                else:
+                    supplemental_futures[fusion_key] = load_agent_json(agent_path, pattern)
+
+            for stage, index, file_path, key, task in file_futures:
+                if isinstance(task, Future):
+                    try:
+                        result = task.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        self.logger.error(f"Error processing file {file_path}: {e}")
+                        result = ProcessingResult(
+                            success=False, error=f"Error processing file: {str(e)}"
+                        )
+                else:
+                    result = task
+                stage_slots[stage][index] = result
+                # Failures may be transient; only cache results worth replaying
+                if self.cache and key and result.success:
+                    self.cache.put(key, result)
+                    used_keys.add(key)
+
+            for fusion_key, outcome in supplemental_futures.items():
+                payloads, warnings = outcome.result() if isinstance(outcome, Future) else outcome
+                results.supplemental[fusion_key] = payloads
+                for warning in warnings:
+                    self.logger.warning(warning)
+                results.warnings.extend(warnings)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
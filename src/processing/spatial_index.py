@@ -0,0 +1,235 @@
+"""
+Spatial index for model grid points.
+
+Grid points are projected onto the unit sphere and stored in a KD-tree, so
+great-circle radius and nearest-neighbour queries cost O(log n) instead of a
+Haversine evaluation per point. Indexes are cached by grid signature because
+every forecast hour of a model run (and usually consecutive runs) shares the
+same grid.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Convert latitude/longitude in degrees to (n, 3) unit-sphere coordinates."""
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def haversine_km(
+    lat1: float | np.ndarray,
+    lon1: float | np.ndarray,
+    lat2: float | np.ndarray,
+    lon2: float | np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized Haversine distance in kilometers.
+
+    Args:
+        lat1: Latitude(s) of the first point(s)
+        lon1: Longitude(s) of the first point(s)
+        lat2: Latitude(s) of the second point(s)
+        lon2: Longitude(s) of the second point(s)
+
+    Returns:
+        Distances in kilometers (broadcast over the inputs)
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+    )
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class SpatialIndex:
+    """
+    KD-tree over grid points on the unit sphere.
+
+    Features:
+    - Radius queries in great-circle kilometers, exact at the boundary
+    - k-nearest-neighbour queries with Haversine distances
+    - Batched queries for several locations (e.g. all Hawaii shores) at once
+    - Points with missing coordinates are ignored rather than failing the build
+    """
+
+    def __init__(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        signature: str | None = None,
+    ):
+        """
+        Build the index.
+
+        Args:
+            latitudes: Point latitudes in degrees
+            longitudes: Point longitudes in degrees
+            signature: Precomputed grid signature, if already known
+        """
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.signature = signature or self.grid_signature(self.latitudes, self.longitudes)
+
+        valid = np.isfinite(self.latitudes) & np.isfinite(self.longitudes)
+        self._positions = np.flatnonzero(valid)
+        self._tree = cKDTree(_unit_vectors(self.latitudes[valid], self.longitudes[valid]))
+
+    def __len__(self) -> int:
+        return len(self.latitudes)
+
+    @staticmethod
+    def grid_signature(latitudes: np.ndarray, longitudes: np.ndarray) -> str:
+        """
+        Identify a grid by the exact coordinates of its points.
+
+        Args:
+            latitudes: Point latitudes as float64
+            longitudes: Point longitudes as float64
+
+        Returns:
+            Hex digest of the coordinate arrays
+        """
+        digest = hashlib.sha1(np.ascontiguousarray(latitudes).tobytes())
+        digest.update(np.ascontiguousarray(longitudes).tobytes())
+        return digest.hexdigest()
+
+    def query_radius(self, latitude: float, longitude: float, radius_km: float) -> np.ndarray:
+        """
+        Find all points within a great-circle radius of a location.
+
+        Args:
+            latitude: Query latitude in degrees
+            longitude: Query longitude in degrees
+            radius_km: Search radius in kilometers (inclusive)
+
+        Returns:
+            Sorted array of point indices
+        """
+        return self.query_radius_many([(latitude, longitude)], radius_km)[0]
+
+    def query_radius_many(
+        self, locations: Sequence[tuple[float, float]], radius_km: float
+    ) -> list[np.ndarray]:
+        """
+        Radius query for several locations in one tree traversal.
+
+        Args:
+            locations: (latitude, longitude) pairs in degrees
+            radius_km: Search radius in kilometers (inclusive)
+
+        Returns:
+            One sorted array of point indices per location
+        """
+        if not len(locations):
+            return []
+        if not len(self._positions):
+            return [np.empty(0, dtype=np.intp) for _ in locations]
+
+        coords = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+        angle = min(radius_km / EARTH_RADIUS_KM, np.pi)
+        # Chord length for the angle, padded so floating-point error cannot
+        # drop points on the boundary; candidates are re-checked below.
+        chord = 2.0 * np.sin(angle / 2.0) + 1e-9
+        candidates = self._tree.query_ball_point(_unit_vectors(coords[:, 0], coords[:, 1]), chord)
+
+        results = []
+        for (lat, lon), hits in zip(coords, candidates, strict=True):
+            indices = self._positions[np.sort(np.asarray(hits, dtype=np.intp))]
+            distances = haversine_km(lat, lon, self.latitudes[indices], self.longitudes[indices])
+            results.append(indices[distances <= radius_km])
+        return results
+
+    def query_nearest(
+        self, latitude: float, longitude: float, k: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k points closest to a location.
+
+        Args:
+            latitude: Query latitude in degrees
+            longitude: Query longitude in degrees
+            k: Number of neighbours to return
+
+        Returns:
+            Tuple of (distances in km, point indices), nearest first
+        """
+        k = min(k, len(self._positions))
+        if k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+
+        _, hits = self._tree.query(_unit_vectors(np.array([latitude]), np.array([longitude])), k=k)
+        indices = self._positions[np.atleast_1d(hits[0])]
+        distances = haversine_km(
+            latitude, longitude, self.latitudes[indices], self.longitudes[indices]
+        )
+        return distances, indices
+
+
+class SpatialIndexCache:
+    """
+    LRU cache of SpatialIndex objects keyed by grid signature.
+
+    Features:
+    - Reuses one index for every forecast hour that shares a grid
+    - Bounded number of cached grids
+    - Hit/miss counters for diagnostics
+    """
+
+    def __init__(self, max_entries: int = 8):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of grids to keep
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._indexes: OrderedDict[str, SpatialIndex] = OrderedDict()
+        self.logger = logging.getLogger("processor.spatial_index")
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def get(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> SpatialIndex:
+        """
+        Return the index for a grid, building it on first use.
+
+        Args:
+            latitudes: Point latitudes in degrees
+            longitudes: Point longitudes in degrees
+
+        Returns:
+            SpatialIndex for the grid
+        """
+        lat = np.asarray(latitudes, dtype=np.float64)
+        lon = np.asarray(longitudes, dtype=np.float64)
+        signature = SpatialIndex.grid_signature(lat, lon)
+
+        index = self._indexes.get(signature)
+        if index is not None:
+            self.hits += 1
+            self._indexes.move_to_end(signature)
+            return index
+
+        self.misses += 1
+        index = SpatialIndex(lat, lon, signature=signature)
+        self._indexes[signature] = index
+        if len(self._indexes) > self.max_entries:
+            self._indexes.popitem(last=False)
+        self.logger.debug(f"Built spatial index for {len(index)} grid points")
+        return index
@@ -8,17 +8,219 @@ from spectral wave data. NDBC provides two types of spectral data:
 1. Spectral wave summary (.spec) - Pre-analyzed swell/wind wave components
 2. Raw spectral data (.data_spec) - Full frequency-direction energy matrices
 
-This implementation focuses on the commonly available spectral wave summary format,
-with extensibility for raw spectral analysis if needed.
+The single-observation path (parse_spec_file) reads the latest summary line.
+The batch path parses a whole .spec history, or a raw .data_spec/.swdir file,
+into 2-D NumPy arrays of time x field / time x frequency in one pass and runs
+peak detection across all timestamps at once.
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel, Field, field_validator
 
+# Numeric columns of the .spec summary, in file order (STEEPNESS is skipped)
+SPEC_SUMMARY_FIELDS = (
+    "wave_height",
+    "swell_height",
+    "swell_period",
+    "wind_wave_height",
+    "wind_wave_period",
+    "swell_direction",
+    "wind_wave_direction",
+    "average_period",
+    "mean_direction",
+)
+
+# Raw spectral file kinds keyed by file suffix
+RAW_SPECTRAL_KINDS = {
+    ".data_spec": "density",
+    ".swdir": "direction",
+    ".swdir2": "direction",
+    ".swr1": "coefficient",
+    ".swr2": "coefficient",
+}
+
+# NDBC fills missing raw spectral bins with 999.0
+RAW_SPECTRAL_MISSING = 999.0
+
+
+def _to_datetime64(time_columns: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 5) array of YY MM DD hh mm columns to datetime64[s].
+
+    Two-digit years (older NDBC files) are mapped to 19xx/20xx.
+    """
+    cols = time_columns.astype(np.int64)
+    years = np.where(
+        cols[:, 0] < 100, np.where(cols[:, 0] < 50, 2000, 1900) + cols[:, 0], cols[:, 0]
+    )
+    months = (years - 1970) * 12 + (cols[:, 1] - 1)
+    dates = months.astype("datetime64[M]").astype("datetime64[D]") + (cols[:, 2] - 1)
+    return (
+        dates.astype("datetime64[s]")
+        + cols[:, 3].astype("timedelta64[h]")
+        + cols[:, 4].astype("timedelta64[m]")
+    )
+
+
+def _iso_timestamps(times: np.ndarray) -> list[str]:
+    """Format datetime64 values the way parse_spec_file formats timestamps."""
+    return [f"{t}Z" for t in np.datetime_as_string(times, unit="s")]
+
+
+def _float_matrix(rows: list[list[str]]) -> np.ndarray:
+    """Convert equal-length token rows to float64, turning "MM" and junk into NaN."""
+    tokens = np.array(rows, dtype=str)
+    try:
+        return tokens.astype(np.float64)
+    except ValueError:
+        to_float = np.frompyfunc(_token_to_float, 1, 1)
+        return to_float(tokens).astype(np.float64)
+
+
+def _token_to_float(token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+
+@dataclass
+class SpecSummarySeries:
+    """
+    Full .spec summary history as a time x field matrix.
+
+    Attributes:
+        buoy_id: NDBC buoy station ID
+        times: Observation times (datetime64[s], file order, newest first)
+        values: Array of shape (len(times), len(SPEC_SUMMARY_FIELDS)); NaN marks
+            missing values and compass directions are converted to degrees
+    """
+
+    buoy_id: str
+    times: np.ndarray
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def timestamps(self) -> list[str]:
+        """ISO 8601 timestamps of all observations."""
+        return _iso_timestamps(self.times)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return one summary field across all observations."""
+        return self.values[:, SPEC_SUMMARY_FIELDS.index(name)]
+
+
+@dataclass
+class SpectralMatrix:
+    """
+    Raw NDBC spectra (.data_spec, .swdir, ...) as a time x frequency matrix.
+
+    Attributes:
+        buoy_id: NDBC buoy station ID
+        kind: 'density', 'direction' or 'coefficient'
+        times: Observation times (datetime64[s], file order)
+        frequencies: Frequency bins in Hz, shape (F,)
+        values: Array of shape (len(times), F); NaN marks missing bins
+        separation_frequency: Swell/wind-wave separation frequency per
+            observation (only present in .data_spec files)
+    """
+
+    buoy_id: str
+    kind: str
+    times: np.ndarray
+    frequencies: np.ndarray
+    values: np.ndarray
+    separation_frequency: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def timestamps(self) -> list[str]:
+        """ISO 8601 timestamps of all observations."""
+        return _iso_timestamps(self.times)
+
+    def align(self, times: np.ndarray, frequencies: np.ndarray) -> np.ndarray:
+        """
+        Re-index values onto another time/frequency grid.
+
+        Used to pair a .swdir matrix with its .data_spec counterpart, which
+        NDBC does not guarantee to cover the same observations.
+
+        Args:
+            times: Target observation times
+            frequencies: Target frequency bins
+
+        Returns:
+            Array of shape (len(times), len(frequencies)), NaN where the target
+            time or frequency is not present in this matrix
+        """
+        result = np.full((len(times), len(frequencies)), np.nan)
+        if not len(self.times):
+            return result
+
+        order = np.argsort(self.times, kind="stable")
+        sorted_times = self.times[order]
+        pos = np.clip(np.searchsorted(sorted_times, times), 0, len(sorted_times) - 1)
+        row_hit = sorted_times[pos] == times
+
+        freq_index = {round(float(f), 4): i for i, f in enumerate(self.frequencies)}
+        cols = np.array([freq_index.get(round(float(f), 4), -1) for f in frequencies], dtype=int)
+        col_hit = cols >= 0
+
+        source_rows = order[pos[row_hit]]
+        result[np.ix_(row_hit, col_hit)] = self.values[np.ix_(source_rows, cols[col_hit])]
+        return result
+
+
+@dataclass
+class SpectralPeakSeries:
+    """
+    Spectral peaks detected across all observations of a SpectralMatrix.
+
+    Each array has shape (len(times), max_components) and is ordered by
+    energy within a row (highest first); unused slots are NaN.
+
+    Attributes:
+        buoy_id: NDBC buoy station ID
+        times: Observation times (datetime64[s])
+        frequency_hz: Peak frequencies
+        energy_density: Peak energy density (m²/Hz)
+        height_meters: Significant height of the spectral bin around each peak
+        direction_degrees: Mean direction at the peak (NaN without .swdir data)
+    """
+
+    buoy_id: str
+    times: np.ndarray
+    frequency_hz: np.ndarray
+    energy_density: np.ndarray
+    height_meters: np.ndarray
+    direction_degrees: np.ndarray
+
+    @property
+    def period_seconds(self) -> np.ndarray:
+        """Peak periods (1 / frequency)."""
+        return 1.0 / self.frequency_hz
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of peaks found per observation."""
+        return np.count_nonzero(~np.isnan(self.frequency_hz), axis=1)
+
+    @property
+    def timestamps(self) -> list[str]:
+        """ISO 8601 timestamps of all observations."""
+        return _iso_timestamps(self.times)
+
 
 class SpectralPeak(BaseModel):
     """
@@ -86,7 +288,8 @@ class SpectralAnalyzer:
     NDBC's spectral wave summary format provides pre-analyzed swell and
     wind wave components, which this analyzer converts into structured data.
 
-    The analyzer can be extended to handle raw spectral matrices if needed.
+    Batch methods parse whole .spec histories and raw .data_spec/.swdir
+    spectra into NumPy matrices and detect peaks for all timestamps at once.
     """
 
     # Directional mapping (NDBC uses compass directions)
@@ -319,6 +522,387 @@ class SpectralAnalyzer:
             self.logger.error(f"Error parsing observation line: {e}", exc_info=True)
             return None
 
+    def parse_spec_history(self, file_path: str) -> SpecSummarySeries | None:
+        """
+        Parse every observation in a .spec file into a time x field matrix.
+
+        Unlike parse_spec_file, which only reads the latest line, this
+        converts the full history in one pass. Heights and periods >= 99 and
+        mean directions >= 999 are treated as missing.
+
+        Args:
+            file_path: Path to .spec file
+
+        Returns:
+            SpecSummarySeries, or None if the file has no usable observations
+        """
+        path = Path(file_path)
+        if not path.exists():
+            self.logger.error(f"Spec file not found: {file_path}")
+            return None
+
+        try:
+            rows = [row[:15] for row in self._read_data_rows(path.read_text()) if len(row) >= 15]
+            if not rows:
+                self.logger.warning(f"No observations found in {file_path}")
+                return None
+
+            tokens = np.array(rows, dtype=str)
+            time_columns = _float_matrix(tokens[:, 0:5])
+            valid_time = np.isfinite(time_columns).all(axis=1)
+            tokens = tokens[valid_time]
+
+            # WVHT SwH SwP WWH WWP APD MWD
+            numeric = _float_matrix(tokens[:, [5, 6, 7, 8, 9, 13, 14]])
+            numeric[:, :6][numeric[:, :6] >= 99.0] = np.nan
+            numeric[:, 6][numeric[:, 6] >= 999.0] = np.nan
+
+            directions = self._parse_direction_array(tokens[:, 10:12])
+
+            values = np.column_stack(
+                [numeric[:, 0:5], directions[:, 0], directions[:, 1], numeric[:, 5:7]]
+            )
+            return SpecSummarySeries(
+                buoy_id=path.stem,
+                times=_to_datetime64(time_columns[valid_time]),
+                values=values,
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error parsing spec history {file_path}: {e}", exc_info=True)
+            return None
+
+    def analyze_spec_history(self, file_path: str) -> list[SpectralAnalysisResult]:
+        """
+        Extract swell components for every observation in a .spec file.
+
+        Component selection applies the same rules as parse_spec_file,
+        evaluated as masks over the whole history at once.
+
+        Args:
+            file_path: Path to .spec file
+
+        Returns:
+            One SpectralAnalysisResult per observation, in file order
+        """
+        series = self.parse_spec_history(file_path)
+        if series is None:
+            return []
+
+        add_swell, add_wind_wave = self._summary_component_masks(series)
+        rows = series.values.tolist()
+        timestamps = series.timestamps
+
+        results = []
+        for i, row in enumerate(rows):
+            fields = dict(zip(SPEC_SUMMARY_FIELDS, row, strict=True))
+            peaks: list[SpectralPeak] = []
+            if add_swell[i]:
+                peaks.append(
+                    self._create_spectral_peak(
+                        height=fields["swell_height"],
+                        period=fields["swell_period"],
+                        direction=fields["swell_direction"],
+                        component_type="swell",
+                    )
+                )
+            if add_wind_wave[i]:
+                peaks.append(
+                    self._create_spectral_peak(
+                        height=fields["wind_wave_height"],
+                        period=fields["wind_wave_period"],
+                        direction=fields["wind_wave_direction"],
+                        component_type="wind_wave",
+                    )
+                )
+
+            peaks = sorted(peaks, key=lambda p: p.energy_density, reverse=True)
+            peaks = peaks[: self.max_components]
+
+            results.append(
+                SpectralAnalysisResult(
+                    buoy_id=series.buoy_id,
+                    timestamp=timestamps[i],
+                    peaks=peaks,
+                    total_energy=sum(p.energy_density for p in peaks),
+                    dominant_peak=peaks[0] if peaks else None,
+                    metadata={
+                        "total_wave_height": self._none_if_nan(fields["wave_height"]),
+                        "average_period": self._none_if_nan(fields["average_period"]),
+                        "mean_direction": self._none_if_nan(fields["mean_direction"]),
+                        "num_components": len(peaks),
+                        "source": "ndbc_spec_summary",
+                    },
+                )
+            )
+
+        return results
+
+    def parse_raw_spectra(self, file_path: str, kind: str | None = None) -> SpectralMatrix | None:
+        """
+        Parse a raw NDBC spectral file into a time x frequency matrix.
+
+        Args:
+            file_path: Path to a .data_spec, .swdir, .swdir2, .swr1 or .swr2 file
+            kind: Override for the data kind inferred from the file suffix
+
+        Returns:
+            SpectralMatrix, or None if the file has no usable observations
+        """
+        path = Path(file_path)
+        if not path.exists():
+            self.logger.error(f"Raw spectral file not found: {file_path}")
+            return None
+
+        kind = kind or RAW_SPECTRAL_KINDS.get(path.suffix)
+        if kind is None:
+            self.logger.error(f"Unknown raw spectral file type: {file_path}")
+            return None
+
+        try:
+            return self.parse_raw_spectra_text(path.read_text(), buoy_id=path.stem, kind=kind)
+        except Exception as e:
+            self.logger.error(f"Error parsing raw spectra {file_path}: {e}", exc_info=True)
+            return None
+
+    def parse_raw_spectra_text(self, text: str, buoy_id: str, kind: str) -> SpectralMatrix | None:
+        """
+        Parse raw NDBC spectral text into a time x frequency matrix.
+
+        Each data line holds YY MM DD hh mm, an optional separation frequency
+        (.data_spec only) and "value (frequency)" pairs. Lines whose length or
+        frequency grid differs from the rest of the file are dropped.
+
+        Args:
+            text: File contents
+            buoy_id: Buoy station ID
+            kind: 'density', 'direction' or 'coefficient'
+
+        Returns:
+            SpectralMatrix, or None if no usable observations were found
+        """
+        rows = self._read_data_rows(text.replace("(", " ").replace(")", " "))
+        if not rows:
+            return None
+
+        width = int(np.bincount([len(row) for row in rows]).argmax())
+        has_separation = (width - 5) % 2 == 1
+        offset = 6 if has_separation else 5
+        if width <= offset:
+            self.logger.warning(f"No spectral bins found for {buoy_id} ({kind})")
+            return None
+
+        same_width = [row for row in rows if len(row) == width]
+        data = _float_matrix(same_width)
+        pairs = data[:, offset:].reshape(len(data), -1, 2)
+        frequencies = pairs[0, :, 1]
+
+        keep = np.isfinite(data[:, 0:5]).all(axis=1) & np.isclose(
+            pairs[:, :, 1], frequencies, atol=5e-4
+        ).all(axis=1)
+        dropped = len(rows) - int(keep.sum())
+        if dropped:
+            self.logger.warning(
+                f"Dropped {dropped} spectral line(s) with a different layout for {buoy_id} ({kind})"
+            )
+
+        values = pairs[keep, :, 0]
+        values[values >= RAW_SPECTRAL_MISSING] = np.nan
+
+        separation = None
+        if has_separation:
+            separation = data[keep, 5]
+            # Missing separation frequencies are reported as 9.999
+            separation[separation >= 9.99] = np.nan
+
+        return SpectralMatrix(
+            buoy_id=buoy_id,
+            kind=kind,
+            times=_to_datetime64(data[keep, 0:5]),
+            frequencies=frequencies,
+            values=values,
+            separation_frequency=separation,
+        )
+
+    def find_spectral_peaks(
+        self, density: SpectralMatrix, direction: SpectralMatrix | None = None
+    ) -> SpectralPeakSeries:
+        """
+        Detect spectral peaks for every observation of a density matrix.
+
+        A peak is a local maximum along the frequency axis whose period lies
+        within [min_period, max_period] and whose energy is at least
+        energy_threshold times the strongest peak of the same observation.
+        Up to max_components peaks are selected per observation, strongest
+        first; candidates within min_separation_period (or, when direction
+        data is given, min_separation_direction) of an already selected peak
+        are suppressed. All observations are processed together.
+
+        Args:
+            density: Spectral energy density matrix (.data_spec)
+            direction: Optional mean wave direction matrix (.swdir)
+
+        Returns:
+            SpectralPeakSeries with NaN-padded (time x max_components) arrays
+        """
+        energy = density.values
+        n_times, n_freqs = energy.shape
+        k_max = self.max_components
+        outputs = [np.full((n_times, k_max), np.nan) for _ in range(4)]
+        frequency_out, energy_out, height_out, direction_out = outputs
+
+        peaks = SpectralPeakSeries(
+            buoy_id=density.buoy_id,
+            times=density.times,
+            frequency_hz=frequency_out,
+            energy_density=energy_out,
+            height_meters=height_out,
+            direction_degrees=direction_out,
+        )
+        if n_times == 0 or n_freqs == 0:
+            return peaks
+
+        freqs = density.frequencies
+        if direction is not None:
+            directions = direction.align(density.times, freqs)
+        else:
+            directions = np.full_like(energy, np.nan)
+
+        with np.errstate(divide="ignore"):
+            periods = np.where(freqs > 0, 1.0 / freqs, np.inf)
+        in_band = (periods >= self.min_period) & (periods <= self.max_period)
+        bandwidth = np.abs(np.gradient(freqs)) if n_freqs > 1 else np.full(1, np.nan)
+
+        filled = np.where(np.isnan(energy), -np.inf, energy)
+        local_max = np.ones_like(filled, dtype=bool)
+        if n_freqs > 1:
+            local_max[:, 1:-1] = (filled[:, 1:-1] > filled[:, :-2]) & (
+                filled[:, 1:-1] >= filled[:, 2:]
+            )
+            local_max[:, 0] = filled[:, 0] > filled[:, 1]
+            local_max[:, -1] = filled[:, -1] > filled[:, -2]
+
+        score = np.where(local_max & in_band & (filled > 0), filled, -np.inf)
+        strongest = score.max(axis=1, keepdims=True)
+        score[score < self.energy_threshold * strongest] = -np.inf
+
+        rows = np.arange(n_times)
+        for k in range(k_max):
+            best = score.argmax(axis=1)
+            found = np.isfinite(score[rows, best])
+            if not found.any():
+                break
+
+            r, c = rows[found], best[found]
+            frequency_out[r, k] = freqs[c]
+            energy_out[r, k] = energy[r, c]
+            height_out[r, k] = 4.0 * np.sqrt(energy[r, c] * bandwidth[c])
+            direction_out[r, k] = directions[r, c]
+
+            suppress = np.abs(periods[None, :] - periods[best][:, None]) < (
+                self.min_separation_period
+            )
+            if direction is not None:
+                dir_diff = np.abs(directions - directions[rows, best][:, None])
+                dir_diff = np.where(dir_diff > 180, 360 - dir_diff, dir_diff)
+                suppress |= dir_diff < self.min_separation_direction
+            suppress[~found] = False
+            suppress[r, c] = True
+            score[suppress] = -np.inf
+
+        return peaks
+
+    def analyze_raw_spectra(
+        self, density_path: str, direction_path: str | None = None
+    ) -> SpectralPeakSeries | None:
+        """
+        Parse raw .data_spec (and optional .swdir) files and detect peaks.
+
+        Args:
+            density_path: Path to .data_spec file
+            direction_path: Optional path to the matching .swdir file
+
+        Returns:
+            SpectralPeakSeries, or None if the density file cannot be parsed
+        """
+        density = self.parse_raw_spectra(density_path, kind="density")
+        if density is None:
+            return None
+
+        direction = None
+        if direction_path is not None:
+            direction = self.parse_raw_spectra(direction_path, kind="direction")
+
+        return self.find_spectral_peaks(density, direction)
+
+    def _summary_component_masks(self, series: SpecSummarySeries) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Decide which swell and wind-wave components to keep for each observation.
+
+        Args:
+            series: Parsed .spec history
+
+        Returns:
+            Tuple of boolean arrays (add_swell, add_wind_wave)
+        """
+        sw_height = series.column("swell_height")
+        sw_period = series.column("swell_period")
+        sw_dir = series.column("swell_direction")
+        ww_height = series.column("wind_wave_height")
+        ww_period = series.column("wind_wave_period")
+        ww_dir = series.column("wind_wave_direction")
+
+        with np.errstate(invalid="ignore"):
+            add_swell = (
+                (sw_height > 0)
+                & (sw_period >= self.min_period)
+                & (sw_period <= self.max_period)
+                & ~np.isnan(sw_dir)
+            )
+            valid_wind_wave = (
+                (ww_height > 0)
+                & (ww_period >= self.min_period)
+                & (ww_period <= self.max_period)
+                & ~np.isnan(ww_dir)
+            )
+
+            dir_diff = np.abs(sw_dir - ww_dir)
+            dir_diff = np.where(dir_diff > 180, 360 - dir_diff, dir_diff)
+            too_similar = (np.abs(sw_period - ww_period) < self.min_separation_period) | (
+                dir_diff < self.min_separation_direction
+            )
+
+        return add_swell, valid_wind_wave & ~(add_swell & too_similar)
+
+    def _parse_direction_array(self, dir_strings: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _parse_direction: compass strings to degrees, NaN if unknown.
+
+        Args:
+            dir_strings: Array of compass direction strings
+
+        Returns:
+            Float array of the same shape
+        """
+        unique, inverse = np.unique(dir_strings, return_inverse=True)
+        lookup = np.array(
+            [self.DIRECTION_MAP.get(d.strip().upper()) for d in unique], dtype=np.float64
+        )
+        return lookup[inverse].reshape(dir_strings.shape)
+
+    @staticmethod
+    def _read_data_rows(text: str) -> list[list[str]]:
+        """Split text into whitespace-separated rows, skipping blank and '#' header lines."""
+        return [
+            line.split()
+            for line in text.splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+    @staticmethod
+    def _none_if_nan(value: float) -> float | None:
+        return None if np.isnan(value) else value
+
     def _create_spectral_peak(
         self, height: float, period: float, direction: float, component_type: str
     ) -> SpectralPeak:
@@ -426,3 +1010,18 @@ def analyze_spec_file(file_path: str, **kwargs) -> SpectralAnalysisResult | None
     """
     analyzer = SpectralAnalyzer(**kwargs)
     return analyzer.parse_spec_file(file_path)
+
+
+def analyze_spec_history(file_path: str, **kwargs) -> list[SpectralAnalysisResult]:
+    """
+    Convenience function to analyze every observation in a .spec file.
+
+    Args:
+        file_path: Path to .spec file
+        **kwargs: Optional parameters for SpectralAnalyzer
+
+    Returns:
+        List of SpectralAnalysisResult, one per observation
+    """
+    analyzer = SpectralAnalyzer(**kwargs)
+    return analyzer.analyze_spec_history(file_path)
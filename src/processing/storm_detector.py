@@ -14,9 +14,16 @@ import re
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from ..utils.swell_propagation import HAWAII_LAT, HAWAII_LON, SwellPropagationCalculator
+from ..utils.swell_propagation import (
+    DEFAULT_PERIOD_SWEEP,
+    HAWAII_LAT,
+    HAWAII_LON,
+    SwellPropagationCalculator,
+)
+from .hawaii_context import HawaiiContext
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +136,11 @@ class StormDetector:
         """Initialize storm detector with swell propagation calculator."""
         self.logger = logging.getLogger(__name__)
         self.propagation_calc = SwellPropagationCalculator()
+        self.period_sweep = DEFAULT_PERIOD_SWEEP
+        self.arrival_targets = {"hawaii": (HAWAII_LAT, HAWAII_LON)}
+        for shore in HawaiiContext().get_all_shores():
+            shore_key = shore.name.lower().replace(" ", "_")
+            self.arrival_targets[shore_key] = (shore.latitude, shore.longitude)
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
@@ -485,8 +497,11 @@ class StormDetector:
             return []
 
         calc = propagation_calc or self.propagation_calc
-        arrivals = []
 
+        # Per-storm inputs; storms that cannot be parsed are skipped
+        valid_storms: list[StormInfo] = []
+        detection_times: list[datetime] = []
+        dominant_periods: list[float] = []
         for storm in storms:
             try:
                 # Parse detection time
@@ -498,51 +513,80 @@ class StormDetector:
                     fetch_length_nm=storm.fetch_nm,
                     duration_hours=storm.duration_hours,
                 )
+            except Exception as e:
+                self.logger.error(f"Failed to calculate arrival for storm {storm.storm_id}: {e}")
+                continue
 
-                # Calculate arrival at Hawaii
-                arrival_time, details = calc.calculate_arrival(
-                    source_lat=storm.location["lat"],
-                    source_lon=storm.location["lon"],
-                    period_seconds=period,
-                    generation_time=detection_time,
-                    target_lat=HAWAII_LAT,
-                    target_lon=HAWAII_LON,
-                )
+            valid_storms.append(storm)
+            detection_times.append(detection_time)
+            dominant_periods.append(period)
 
-                # Estimate wave height (rough empirical formula)
-                # Height decreases with distance and increases with wind speed
-                distance_factor = max(0.3, 1.0 - (details["distance_nm"] / 5000))
-                wind_factor = storm.wind_speed_kt / 50.0  # Normalize to 50kt
-                estimated_height_ft = 8.0 * wind_factor * distance_factor
-
-                arrival = {
-                    "storm_id": storm.storm_id,
-                    "storm_location": storm.location,
-                    "storm_wind_speed_kt": storm.wind_speed_kt,
-                    "storm_central_pressure_mb": storm.central_pressure_mb,
-                    "detection_time": storm.detection_time,
-                    "arrival_time": arrival_time.isoformat(),
-                    "travel_time_hours": details["travel_time_hours"],
-                    "travel_time_days": details["travel_time_hours"] / 24,
-                    "distance_nm": details["distance_nm"],
-                    "estimated_period_seconds": period,
-                    "estimated_height_ft": round(estimated_height_ft, 1),
-                    "group_velocity_knots": details["group_velocity_knots"],
-                    "confidence": storm.confidence,
-                }
+        if not valid_storms:
+            return []
+
+        # One vectorized call: column 0 is each storm's dominant period, the
+        # remaining columns sweep the period spectrum for the arrival window
+        sweep = np.asarray(self.period_sweep, dtype=np.float64)
+        periods = np.column_stack(
+            [dominant_periods, np.broadcast_to(sweep, (len(valid_storms), sweep.size))]
+        )
+        batch = calc.propagate(
+            source_lats=[storm.location["lat"] for storm in valid_storms],
+            source_lons=[storm.location["lon"] for storm in valid_storms],
+            periods=periods,
+            generation_times=detection_times,
+            targets=self.arrival_targets,
+        )
 
-                arrivals.append(arrival)
+        arrivals = []
+        for i, storm in enumerate(valid_storms):
+            period = dominant_periods[i]
+            arrival_time = batch.arrival_time(i, 0, "hawaii")
+            travel_time_hours = float(batch.travel_time_hours[i, 0, 0])
+            distance_nm = float(batch.distance_nm[i, 0])
+            window_start, window_end = batch.arrival_window(i, "hawaii")
+
+            # Estimate wave height (rough empirical formula)
+            # Height decreases with distance and increases with wind speed
+            distance_factor = max(0.3, 1.0 - (distance_nm / 5000))
+            wind_factor = storm.wind_speed_kt / 50.0  # Normalize to 50kt
+            estimated_height_ft = 8.0 * wind_factor * distance_factor
+
+            arrival = {
+                "storm_id": storm.storm_id,
+                "storm_location": storm.location,
+                "storm_wind_speed_kt": storm.wind_speed_kt,
+                "storm_central_pressure_mb": storm.central_pressure_mb,
+                "detection_time": storm.detection_time,
+                "arrival_time": arrival_time.isoformat(),
+                "travel_time_hours": travel_time_hours,
+                "travel_time_days": travel_time_hours / 24,
+                "distance_nm": distance_nm,
+                "estimated_period_seconds": period,
+                "estimated_height_ft": round(estimated_height_ft, 1),
+                "group_velocity_knots": float(batch.group_velocity_knots[i, 0]),
+                "confidence": storm.confidence,
+                "arrival_window": {
+                    "start": window_start.isoformat(),
+                    "end": window_end.isoformat(),
+                    "min_period_seconds": float(sweep.min()) if sweep.size else period,
+                    "max_period_seconds": float(sweep.max()) if sweep.size else period,
+                },
+                "shore_arrivals": {
+                    name: batch.arrival_time(i, 0, j).isoformat()
+                    for j, name in enumerate(batch.target_names)
+                    if name != "hawaii"
+                },
+            }
 
-                self.logger.info(
-                    f"Storm {storm.storm_id}: "
-                    f"Arrival {arrival_time.strftime('%Y-%m-%d %H:%M UTC')}, "
-                    f"~{estimated_height_ft:.1f}ft @ {period:.1f}s, "
-                    f"travel={details['travel_time_hours']/24:.1f}d"
-                )
+            arrivals.append(arrival)
 
-            except Exception as e:
-                self.logger.error(f"Failed to calculate arrival for storm {storm.storm_id}: {e}")
-                continue
+            self.logger.info(
+                f"Storm {storm.storm_id}: "
+                f"Arrival {arrival_time.strftime('%Y-%m-%d %H:%M UTC')}, "
+                f"~{estimated_height_ft:.1f}ft @ {period:.1f}s, "
+                f"travel={travel_time_hours/24:.1f}d"
+            )
 
         # Sort by arrival time
         arrivals.sort(key=lambda x: x["arrival_time"])
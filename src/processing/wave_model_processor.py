@@ -2,16 +2,17 @@
 Wave model data processor for SurfCastAI.
 """
 
-import json
 import logging
 import math
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from ..core.config import Config
 from .data_processor import DataProcessor, ProcessingResult
 from .hawaii_context import HawaiiContext
 from .models.wave_model import ModelData, ModelPoint
+from .spatial_index import SpatialIndex, SpatialIndexCache
 
 
 class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
@@ -36,6 +37,7 @@ class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
         super().__init__(config)
         self.logger = logging.getLogger("processor.wave_model")
         self.hawaii_context = HawaiiContext()
+        self.spatial_indexes = SpatialIndexCache()
 
     def validate(self, data: dict[str, Any]) -> list[str]:
         """
@@ -96,7 +98,7 @@ class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
                 model_data = data
             elif "model_id" in data:
                 # Data is already in our internal format, convert directly
-                model_data = ModelData.from_json(json.dumps(data))
+                model_data = ModelData.from_dict(data)
             elif "metadata" in data and "forecasts" in data:
                 # SWAN format
                 model_data = ModelData.from_swan_json(data)
@@ -139,6 +141,29 @@ class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
             self.logger.error(f"Error processing wave model data: {e}")
             return ProcessingResult(success=False, error=f"Processing error: {str(e)}")
 
+    def refresh_cached_result(
+        self, result: ProcessingResult, file_path: str | Path
+    ) -> ProcessingResult:
+        """
+        Re-run the model analysis for a cached result.
+
+        Model run age and the staleness warning depend on the current time, so
+        they are recomputed rather than replayed from the cache.
+
+        Args:
+            result: Cached processing result
+            file_path: Path of the model data file
+
+        Returns:
+            ProcessingResult with up-to-date warnings and metadata
+        """
+        if result.success and isinstance(result.data, ModelData):
+            warnings, metadata = self._analyze_model_data(result.data)
+            result.data.metadata.update(metadata)
+            result.warnings = warnings
+            result.metadata = metadata
+        return result
+
     def _clean_forecasts(self, model_data: ModelData) -> ModelData:
         """
         Clean and normalize model forecasts.
@@ -497,8 +522,15 @@ class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
         # Get all shores
         shores = self.hawaii_context.get_all_shores()
 
+        # Radius queries for every shore, once per forecast hour
+        shore_locations = [(shore.latitude, shore.longitude) for shore in shores]
+        points_near_shores = [
+            self._find_points_near_shores(forecast.points, shore_locations)
+            for forecast in model_data.forecasts
+        ]
+
         # For each shore, calculate impact
-        for shore in shores:
+        for shore_index, shore in enumerate(shores):
             shore_name = shore.name.lower().replace(" ", "_")
             shore_data = {
                 "impact_score": 0.0,
@@ -509,11 +541,9 @@ class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
 
             # For each forecast, calculate shore-specific metrics
             forecast_impacts = []
-            for forecast in model_data.forecasts:
-                # Find points close to this shore
-                shore_points = self._find_points_near_shore(
-                    forecast.points, shore.latitude, shore.longitude
-                )
+            for forecast, near_shores in zip(model_data.forecasts, points_near_shores, strict=True):
+                # Points close to this shore
+                shore_points = near_shores[shore_index]
 
                 if not shore_points:
                     continue
@@ -610,18 +640,49 @@ class WaveModelProcessor(DataProcessor[dict[str, Any], ModelData]):
         Returns:
             List of points near the shore
         """
-        near_points = []
+        return self._find_points_near_shores(points, [(shore_lat, shore_lon)], max_distance_km)[0]
 
-        for point in points:
-            # Calculate distance using Haversine formula
-            distance = self._haversine_distance(
-                shore_lat, shore_lon, point.latitude, point.longitude
-            )
+    def _find_points_near_shores(
+        self,
+        points: list[ModelPoint],
+        locations: list[tuple[float, float]],
+        max_distance_km: float = 50.0,
+    ) -> list[list[ModelPoint]]:
+        """
+        Find model points near several shores with one spatial index lookup.
 
-            if distance <= max_distance_km:
-                near_points.append(point)
+        Args:
+            points: List of model points
+            locations: (latitude, longitude) of each shore
+            max_distance_km: Maximum distance in kilometers
+
+        Returns:
+            List of nearby points for each location, in point order
+        """
+        if not points:
+            return [[] for _ in locations]
 
-        return near_points
+        index = self._get_spatial_index(points)
+        return [
+            [points[i] for i in hits]
+            for hits in index.query_radius_many(locations, max_distance_km)
+        ]
+
+    def _get_spatial_index(self, points: list[ModelPoint]) -> SpatialIndex:
+        """
+        Get the spatial index for a set of model points.
+
+        Forecast hours sharing a grid share one cached index.
+
+        Args:
+            points: List of model points
+
+        Returns:
+            SpatialIndex whose point indices match ``points``
+        """
+        return self.spatial_indexes.get(
+            [point.latitude for point in points], [point.longitude for point in points]
+        )
 
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -5,6 +5,7 @@ Weather data processor for SurfCastAI.
 import logging
 import re
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from ..core.config import Config
@@ -145,6 +146,29 @@ class WeatherProcessor(DataProcessor[dict[str, Any], WeatherData]):
             self.logger.error(f"Error processing weather data: {e}")
             return ProcessingResult(success=False, error=f"Processing error: {str(e)}")
 
+    def refresh_cached_result(
+        self, result: ProcessingResult, file_path: str | Path
+    ) -> ProcessingResult:
+        """
+        Re-classify weather patterns for a cached result.
+
+        Forecast age and the staleness warning depend on the current time, so
+        they are recomputed rather than replayed from the cache.
+
+        Args:
+            result: Cached processing result
+            file_path: Path of the weather data file
+
+        Returns:
+            ProcessingResult with up-to-date warnings and metadata
+        """
+        if result.success and isinstance(result.data, WeatherData):
+            warnings, metadata = self._classify_weather_patterns(result.data)
+            result.data.metadata.update(metadata)
+            result.warnings = warnings
+            result.metadata = metadata
+        return result
+
     def _standardize_units(self, weather_data: WeatherData) -> WeatherData:
         """
         Standardize units across weather periods.
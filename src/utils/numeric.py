@@ -1,6 +1,10 @@
 """Numeric utility functions for safe data type conversions."""
 
 import logging
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -101,3 +105,50 @@ def safe_float(
 
     except (ValueError, TypeError):
         return None
+
+
+def safe_float_array(
+    values: Sequence[Any],
+    min_val: float | None = None,
+    max_val: float | None = None,
+    field_name: str = "value",
+) -> np.ndarray:
+    """
+    Convert a sequence of values to a float64 array with NaN for missing data.
+
+    Vectorized counterpart of safe_float(): plain numbers and numeric strings
+    are converted in one pass, and only sequences containing values NumPy
+    cannot parse (units, ranges, placeholders like "MM") fall back to
+    per-value safe_float(). Out-of-bounds values become NaN and are logged
+    the same way safe_float() logs them.
+
+    Args:
+        values: Values to convert
+        min_val: Minimum allowed value (inclusive)
+        max_val: Maximum allowed value (inclusive)
+        field_name: Name of the field for logging purposes
+
+    Returns:
+        Array of floats, NaN where conversion failed or bounds were violated
+    """
+    try:
+        result = np.array(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        result = np.array([safe_float(value) for value in values], dtype=np.float64)
+
+    if result.ndim != 1:
+        return np.full(len(values), np.nan)
+
+    if min_val is not None:
+        below = result < min_val
+        for value in result[below]:
+            logger.warning(f"Rejecting {field_name}={value}: below minimum {min_val}")
+        result[below] = np.nan
+
+    if max_val is not None:
+        above = result > max_val
+        for value in result[above]:
+            logger.warning(f"Rejecting {field_name}={value}: above maximum {max_val}")
+        result[above] = np.nan
+
+    return result
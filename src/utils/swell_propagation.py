@@ -10,8 +10,12 @@ swell arrival timing from distant storms.
 
 import logging
 import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Hawaii reference point (approximate center of main islands)
@@ -22,6 +26,83 @@ HAWAII_LON = -157.5  # 157.5°W
 GRAVITY = 9.81  # m/s²
 KNOTS_TO_MS = 0.514444  # conversion factor
 NAUTICAL_MILE_TO_KM = 1.852
+EARTH_RADIUS_KM = 6371.0
+
+# Period spectrum swept when estimating arrival windows (10-25 s at 0.5 s steps)
+DEFAULT_PERIOD_SWEEP = tuple(np.arange(10.0, 25.5, 0.5).tolist())
+
+
+@dataclass
+class PropagationBatch:
+    """
+    Swell arrivals for a batch of storms, periods and target locations.
+
+    Arrays are indexed [storm, period, target] (or [storm, target] for
+    quantities that do not depend on the period). Times are expressed as
+    hours after each storm's generation time so they stay exact for both
+    naive and timezone-aware inputs; the accessors convert back to datetimes.
+
+    Attributes:
+        target_names: Names of the target locations, in array order
+        periods: Wave periods in seconds, shape (storms, periods)
+        generation_times: Generation time of each storm
+        distance_nm: Great circle distances, shape (storms, targets)
+        group_velocity_knots: Group velocities, shape (storms, periods)
+        travel_time_hours: Travel times, shape (storms, periods, targets)
+    """
+
+    target_names: list[str]
+    periods: np.ndarray
+    generation_times: list[datetime]
+    distance_nm: np.ndarray
+    group_velocity_knots: np.ndarray
+    travel_time_hours: np.ndarray
+
+    @property
+    def window_start_hours(self) -> np.ndarray:
+        """Earliest arrival (longest period) per storm and target, in hours."""
+        return np.nanmin(self.travel_time_hours, axis=1)
+
+    @property
+    def window_end_hours(self) -> np.ndarray:
+        """Latest arrival (shortest period) per storm and target, in hours."""
+        return np.nanmax(self.travel_time_hours, axis=1)
+
+    def arrival_time(self, storm: int, period: int = 0, target: int | str = 0) -> datetime:
+        """
+        Arrival time of one storm/period at one target.
+
+        Args:
+            storm: Storm index
+            period: Period index
+            target: Target index or name
+
+        Returns:
+            Arrival datetime (same timezone awareness as the generation time)
+        """
+        target = self._target_index(target)
+        hours = float(self.travel_time_hours[storm, period, target])
+        return self.generation_times[storm] + timedelta(hours=hours)
+
+    def arrival_window(self, storm: int, target: int | str = 0) -> tuple[datetime, datetime]:
+        """
+        First and last arrival across all periods of a storm at one target.
+
+        Args:
+            storm: Storm index
+            target: Target index or name
+
+        Returns:
+            Tuple of (earliest arrival, latest arrival)
+        """
+        target = self._target_index(target)
+        start = float(self.window_start_hours[storm, target])
+        end = float(self.window_end_hours[storm, target])
+        generated = self.generation_times[storm]
+        return generated + timedelta(hours=start), generated + timedelta(hours=end)
+
+    def _target_index(self, target: int | str) -> int:
+        return self.target_names.index(target) if isinstance(target, str) else target
 
 
 class SwellPropagationCalculator:
@@ -168,6 +249,100 @@ class SwellPropagationCalculator:
 
         return arrival_time, details
 
+    def haversine_distances(
+        self,
+        lat1: float | np.ndarray,
+        lon1: float | np.ndarray,
+        lat2: float | np.ndarray,
+        lon2: float | np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized great circle distance; inputs broadcast against each other.
+
+        Args:
+            lat1, lon1: First point(s) (degrees)
+            lat2, lon2: Second point(s) (degrees)
+
+        Returns:
+            Distances in nautical miles
+        """
+        lat1, lon1, lat2, lon2 = (
+            np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+        )
+        a = (
+            np.sin((lat2 - lat1) / 2) ** 2
+            + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        )
+        c = 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+        return EARTH_RADIUS_KM * c / NAUTICAL_MILE_TO_KM
+
+    def travel_times(
+        self, distance_nm: float | np.ndarray, period_seconds: float | np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized travel time; inputs broadcast against each other.
+
+        Args:
+            distance_nm: Distance(s) in nautical miles
+            period_seconds: Wave period(s) in seconds
+
+        Returns:
+            Travel times in hours
+        """
+        group_velocity_knots = (
+            self.calculate_group_velocity(np.asarray(period_seconds)) / KNOTS_TO_MS
+        )
+        return np.asarray(distance_nm, dtype=np.float64) / group_velocity_knots
+
+    def propagate(
+        self,
+        source_lats: Sequence[float],
+        source_lons: Sequence[float],
+        periods: Sequence[float] | Sequence[Sequence[float]] | np.ndarray,
+        generation_times: Sequence[datetime],
+        targets: Mapping[str, tuple[float, float]] | None = None,
+    ) -> PropagationBatch:
+        """
+        Calculate arrivals for many storms, periods and targets in one call.
+
+        Args:
+            source_lats: Storm latitudes (degrees), one per storm
+            source_lons: Storm longitudes (degrees), one per storm
+            periods: Either a 1-D period sweep shared by all storms, or a
+                (storms, periods) array; pass ``periods[:, None]`` for one
+                dominant period per storm
+            generation_times: When each storm generated its swell
+            targets: Mapping of target name to (lat, lon); defaults to the
+                Hawaii reference point
+
+        Returns:
+            PropagationBatch with distances, velocities and travel times
+        """
+        if targets is None:
+            targets = {"hawaii": (HAWAII_LAT, HAWAII_LON)}
+
+        lats = np.asarray(source_lats, dtype=np.float64)
+        lons = np.asarray(source_lons, dtype=np.float64)
+        target_coords = np.asarray(list(targets.values()), dtype=np.float64).reshape(-1, 2)
+        period_grid = np.asarray(periods, dtype=np.float64)
+        if period_grid.ndim <= 1:
+            period_grid = np.broadcast_to(np.atleast_1d(period_grid), (len(lats), period_grid.size))
+
+        distance_nm = self.haversine_distances(
+            lats[:, None], lons[:, None], target_coords[None, :, 0], target_coords[None, :, 1]
+        )
+        group_velocity_knots = self.calculate_group_velocity(period_grid) / KNOTS_TO_MS
+        travel_time_hours = distance_nm[:, None, :] / group_velocity_knots[:, :, None]
+
+        return PropagationBatch(
+            target_names=list(targets),
+            periods=period_grid,
+            generation_times=list(generation_times),
+            distance_nm=distance_nm,
+            group_velocity_knots=group_velocity_knots,
+            travel_time_hours=travel_time_hours,
+        )
+
     def estimate_period_from_storm(
         self,
         wind_speed_kt: float,
@@ -3,6 +3,8 @@ Validation feedback system for adaptive forecast improvement.
 
 This module queries recent forecast performance from the validation database
 and generates actionable prompt context for GPT-5 to improve future forecasts.
+When the database carries the materialized daily performance summary, the
+report is built from it instead of aggregating every validation.
 """
 
 import logging
@@ -143,6 +145,10 @@ class ValidationFeedback:
 
         try:
             with sqlite3.connect(self.db_path) as conn:
+                summary_report = self._report_from_summary(conn)
+                if summary_report is not None:
+                    return summary_report
+
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -229,6 +235,63 @@ class ValidationFeedback:
             logger.error(f"Database error while querying performance: {e}")
             raise
 
+    def _report_from_summary(self, conn: sqlite3.Connection) -> PerformanceReport | None:
+        """
+        Build the report from the daily performance summary table.
+
+        Reads O(days x shores) rows instead of the full validations join.
+
+        Args:
+            conn: Open database connection
+
+        Returns:
+            PerformanceReport, or None if the database has no summary table
+        """
+        # Imported here: src.core imports src.utils, so importing src.validation
+        # at module level would be circular
+        from ..validation import performance_summary
+
+        if not performance_summary.has_summary(conn):
+            return None
+
+        aggregates = performance_summary.query_shore_aggregates(
+            conn, self.lookback_days, include_outliers=True
+        )
+        overall = performance_summary.total(aggregates.values())
+        if not overall.mae_count:
+            logger.info(f"No validations found in last {self.lookback_days} days")
+            return self._empty_report()
+
+        def categorical(agg: "performance_summary.ShoreAggregate") -> float:
+            return agg.category_hits / agg.category_count if agg.category_count else 0.0
+
+        report = PerformanceReport(
+            report_date=datetime.now().isoformat(),
+            lookback_days=self.lookback_days,
+            overall_mae=overall.avg_mae or 0.0,
+            overall_rmse=overall.avg_rmse or 0.0,
+            overall_categorical=categorical(overall),
+            shore_performance=[
+                ShorePerformance(
+                    shore=shore,
+                    validation_count=agg.mae_count,
+                    avg_mae=agg.avg_mae or 0.0,
+                    avg_rmse=agg.avg_rmse or 0.0,
+                    avg_bias=agg.avg_bias or 0.0,
+                    categorical_accuracy=categorical(agg),
+                )
+                for shore, agg in aggregates.items()
+                if agg.mae_count
+            ],
+            has_recent_data=True,
+        )
+
+        logger.info(
+            f"Generated performance report from daily summary: {overall.mae_count} validations, "
+            f"MAE={report.overall_mae:.1f}ft"
+        )
+        return report
+
     def _empty_report(self) -> PerformanceReport:
         """
         Generate empty report when no data is available.
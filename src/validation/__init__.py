@@ -1,14 +1,19 @@
 """Forecast validation and accuracy tracking."""
 from .database import ValidationDatabase
 from .forecast_parser import ForecastParser, ForecastPrediction, parse_forecast
+from .observation_archive import ObservationArchive
 from .buoy_fetcher import BuoyDataFetcher
 from .forecast_validator import ForecastValidator
+from .batch_validator import BatchValidator, BatchProgress
 
 __all__ = [
     'ValidationDatabase',
     'ForecastParser',
     'ForecastPrediction',
     'parse_forecast',
+    'ObservationArchive',
     'BuoyDataFetcher',
     'ForecastValidator',
+    'BatchValidator',
+    'BatchProgress',
 ]
@@ -0,0 +1,391 @@
+"""
+Batch validation engine - validates every pending forecast in one pass.
+
+Validating forecasts one at a time refetches NDBC data for overlapping time
+windows. The batch engine instead:
+1. Loads the predictions of every pending forecast
+2. Merges the prediction time windows per buoy and downloads each buoy once
+3. Saves the observations in a single deduplicating transaction
+4. Scores forecasts concurrently with a bounded worker pool
+5. Writes validation rows in grouped transactions
+
+A forecast counts as pending only while it has no validation rows and has not
+been marked unmatched, so an interrupted run resumes where it left off:
+committed groups are skipped on the next run and observations already stored
+are not inserted twice.
+"""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .buoy_fetcher import BuoyDataFetcher
+from .forecast_validator import ForecastValidator
+
+TimeRange = tuple[datetime, datetime]
+
+
+@dataclass
+class BatchProgress:
+    """
+    Progress snapshot for a batch validation run.
+
+    Attributes:
+        completed: Forecasts finished (successfully or not)
+        total: Forecasts in the run
+        failed: Forecasts that could not be validated
+        elapsed_seconds: Wall-clock time since scoring started
+    """
+
+    completed: int
+    total: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def fraction(self) -> float:
+        """Completed fraction (0-1)."""
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Estimated seconds remaining, or None before the first forecast finishes."""
+        if not self.completed:
+            return None
+        return self.elapsed_seconds / self.completed * (self.total - self.completed)
+
+
+def merge_time_ranges(ranges: Iterable[TimeRange]) -> list[TimeRange]:
+    """
+    Merge overlapping or touching time ranges.
+
+    Args:
+        ranges: (start, end) pairs in any order
+
+    Returns:
+        Sorted, non-overlapping (start, end) pairs covering the same times
+    """
+    merged: list[TimeRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _in_ranges(value: datetime, ranges: list[TimeRange], starts: list[datetime]) -> bool:
+    """Check whether a time falls inside one of the merged ranges (starts = range starts)."""
+    index = bisect_right(starts, value) - 1
+    return index >= 0 and value <= ranges[index][1]
+
+
+class BatchValidator:
+    """
+    Validates many forecasts with shared observation fetches.
+
+    Features:
+    - One download per buoy covering the union of all forecast windows
+    - Observations saved once, deduplicated against the actuals table
+    - Bounded worker pool for scoring
+    - Grouped validation writes (one transaction per group)
+    - Progress callback with ETA
+    - Resumable: committed work is not repeated after an interruption
+    """
+
+    def __init__(
+        self,
+        validator: ForecastValidator,
+        max_workers: int = 4,
+        commit_every: int = 20,
+        progress_callback: Callable[[BatchProgress, dict[str, Any]], None] | None = None,
+        fetcher_factory: Callable[[], BuoyDataFetcher] | None = None,
+    ):
+        """
+        Initialize batch validator.
+
+        Args:
+            validator: ForecastValidator used for matching and scoring
+            max_workers: Maximum forecasts scored concurrently
+            commit_every: Forecasts per validation write transaction
+            progress_callback: Called with (progress, forecast summary) as each forecast finishes
+            fetcher_factory: Creates the BuoyDataFetcher (async context manager);
+                defaults to the validator's fetcher factory
+        """
+        self.validator = validator
+        self.database = validator.database
+        self.max_workers = max(1, max_workers)
+        self.commit_every = max(1, commit_every)
+        self.progress_callback = progress_callback
+        self.fetcher_factory = fetcher_factory or validator.fetcher_factory or BuoyDataFetcher
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def run(self, hours_after: int = 24) -> list[dict[str, Any]]:
+        """
+        Validate all forecasts that are ready for validation.
+
+        Args:
+            hours_after: Minimum hours after forecast before validating
+
+        Returns:
+            List of per-forecast summaries with forecast_id, success and either
+            metrics (mae, rmse, categorical_accuracy, direction_accuracy,
+            sample_size) or error
+        """
+        forecasts = self.database.get_forecasts_needing_validation(hours_after=hours_after)
+        if not forecasts:
+            return []
+
+        results: list[dict[str, Any]] = []
+        jobs: list[tuple[str, list[dict[str, Any]]]] = []
+        for forecast in forecasts:
+            forecast_id = forecast["forecast_id"]
+            data = await self.validator.get_forecast_data(forecast_id, hours_after)
+            if not data:
+                results.append(
+                    {
+                        "forecast_id": forecast_id,
+                        "success": False,
+                        "error": "Forecast not found or too recent",
+                    }
+                )
+            else:
+                jobs.append((forecast_id, data["predictions"]))
+
+        self.logger.info(f"Batch validating {len(jobs)} of {len(forecasts)} pending forecasts")
+
+        timelines, complete = await self._load_observations(
+            [pred for _, predictions in jobs for pred in predictions]
+        )
+        # A failed buoy download is no evidence that a forecast cannot match
+        results.extend(await self._score_all(jobs, timelines, mark_unmatched=complete))
+        return results
+
+    def _buoy_ranges(self, predictions: list[dict[str, Any]]) -> dict[str, list[TimeRange]]:
+        """
+        Merge the match windows of all predictions into time ranges per buoy.
+
+        Args:
+            predictions: Predictions from every forecast in the batch
+
+        Returns:
+            Dictionary mapping buoy ID to merged (start, end) ranges
+        """
+        window = self.validator.match_window
+        raw: dict[str, list[TimeRange]] = {}
+        unknown_shores = set()
+
+        for pred in predictions:
+            shore = pred.get("shore")
+            valid_time = pred.get("valid_time")
+            if not shore or not valid_time:
+                continue
+
+            buoy_ids = BuoyDataFetcher.BUOY_MAPPING.get(shore.lower().replace(" ", "_"))
+            if buoy_ids is None:
+                unknown_shores.add(shore)
+                continue
+
+            for buoy_id in buoy_ids:
+                raw.setdefault(buoy_id, []).append((valid_time - window, valid_time + window))
+
+        if unknown_shores:
+            self.logger.warning(f"Unknown shores skipped: {sorted(unknown_shores)}")
+
+        return {buoy_id: merge_time_ranges(ranges) for buoy_id, ranges in raw.items()}
+
+    async def _load_observations(
+        self, predictions: list[dict[str, Any]]
+    ) -> tuple[dict[Any, tuple[list[datetime], list[dict[str, Any]]]], bool]:
+        """
+        Fetch, store and index observations for all predictions in the batch.
+
+        Args:
+            predictions: Predictions from every forecast in the batch
+
+        Returns:
+            Tuple of (observation timelines keyed by shore, see
+            ForecastValidator.build_timelines; whether every buoy was fetched)
+        """
+        buoy_ranges = self._buoy_ranges(predictions)
+        if not buoy_ranges:
+            return {}, True
+
+        buoy_ids = list(buoy_ranges)
+        async with self.fetcher_factory() as fetcher:
+            results = await asyncio.gather(
+                *(
+                    fetcher.fetch_buoy(
+                        buoy_id, buoy_ranges[buoy_id][0][0], buoy_ranges[buoy_id][-1][1]
+                    )
+                    for buoy_id in buoy_ids
+                ),
+                return_exceptions=True,
+            )
+
+        observations = []
+        complete = True
+        for buoy_id, result in zip(buoy_ids, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error fetching buoy {buoy_id}: {result}", exc_info=result)
+                complete = False
+                continue
+            # Each buoy is downloaded once over its full span; keep only the
+            # times some forecast actually needs
+            ranges = buoy_ranges[buoy_id]
+            starts = [start for start, _ in ranges]
+            observations.extend(
+                obs for obs in result if _in_ranges(obs["observation_time"], ranges, starts)
+            )
+
+        self.logger.info(
+            f"Fetched {len(observations)} observations from {len(buoy_ids)} buoys "
+            f"({sum(len(r) for r in buoy_ranges.values())} merged time ranges)"
+        )
+        if not observations:
+            return {}, complete
+
+        for obs, actual_id in zip(
+            observations, self.database.save_actuals(observations), strict=True
+        ):
+            obs["id"] = actual_id
+
+        # Label observations with the prediction shore names they serve
+        shore_labels: dict[str, set[str]] = {}
+        for pred in predictions:
+            shore = pred.get("shore")
+            if shore:
+                for buoy_id in BuoyDataFetcher.BUOY_MAPPING.get(
+                    shore.lower().replace(" ", "_"), []
+                ):
+                    shore_labels.setdefault(buoy_id, set()).add(shore)
+
+        labelled = [
+            {**obs, "shore": shore}
+            for obs in observations
+            for shore in sorted(shore_labels.get(obs["buoy_id"], ()))
+        ]
+        return self.validator.build_timelines(labelled), complete
+
+    async def _score_all(
+        self,
+        jobs: list[tuple[str, list[dict[str, Any]]]],
+        timelines: dict[Any, tuple[list[datetime], list[dict[str, Any]]]],
+        mark_unmatched: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Score forecasts with a bounded worker pool and write results in groups.
+
+        Progress is reported once a forecast's outcome is committed.
+
+        Args:
+            jobs: (forecast_id, predictions) pairs
+            timelines: Observation timelines keyed by shore
+            mark_unmatched: Record forecasts without matches so they are not retried
+
+        Returns:
+            Per-forecast summaries in completion order
+        """
+        queue: asyncio.Queue[tuple[str, list[dict[str, Any]]]] = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        summaries: list[dict[str, Any]] = []
+        pending: list[tuple[dict[str, Any], list[dict[str, Any]]]] = []
+        reported: list[dict[str, Any]] = []
+        started = time.monotonic()
+
+        def report(summary: dict[str, Any]) -> None:
+            reported.append(summary)
+            if self.progress_callback:
+                self.progress_callback(
+                    BatchProgress(
+                        completed=len(reported),
+                        total=len(jobs),
+                        failed=sum(1 for s in reported if not s["success"]),
+                        elapsed_seconds=time.monotonic() - started,
+                    ),
+                    summary,
+                )
+
+        async def flush() -> None:
+            if not pending:
+                return
+            group = list(pending)
+            pending.clear()
+            await asyncio.to_thread(self._save_group, group)
+            for summary, _ in group:
+                report(summary)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    forecast_id, predictions = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    summary, records = await asyncio.to_thread(
+                        self.validator.score_forecast, forecast_id, predictions, timelines
+                    )
+                    unmatched = not records and mark_unmatched
+                except Exception as e:
+                    self.logger.error(f"Error validating {forecast_id}: {e}", exc_info=True)
+                    summary, records, unmatched = (
+                        {"forecast_id": forecast_id, "success": False, "error": str(e)},
+                        [],
+                        False,
+                    )
+
+                summaries.append(summary)
+                if not (records or unmatched):
+                    report(summary)
+                    continue
+
+                pending.append((summary, records))
+                if len(pending) >= self.commit_every:
+                    await flush()
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_workers, len(jobs)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Persist whatever finished, even if the run was interrupted
+            for task in workers:
+                task.cancel()
+            await flush()
+
+        return summaries
+
+    def _save_group(self, group: list[tuple[dict[str, Any], list[dict[str, Any]]]]) -> None:
+        """
+        Write a group of scored forecasts (runs in a worker thread).
+
+        Validation records are saved in one transaction and forecasts without
+        records are marked unmatched in another.
+
+        Args:
+            group: (summary, validation records) pairs; summaries are updated on failure
+        """
+        scored = [(summary, records) for summary, records in group if records]
+        if scored:
+            try:
+                self.database.save_validations(
+                    [record for _, records in scored for record in records]
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to save validation group: {e}")
+                for summary, _ in scored:
+                    summary.update(success=False, error=f"Failed to save validations: {e}")
+
+        unmatched = [summary["forecast_id"] for summary, records in group if not records]
+        if unmatched:
+            try:
+                self.database.mark_forecasts_unmatched(unmatched)
+            except Exception as e:
+                self.logger.error(f"Failed to mark unmatched forecasts: {e}")
@@ -7,6 +7,7 @@ Uses async HTTP requests with proper rate limiting and error handling.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
@@ -15,6 +16,7 @@ import aiohttp
 
 from ..core.http_client import HTTPClient
 from ..core.rate_limiter import RateLimiter, RateLimitConfig
+from .observation_archive import ObservationArchive
 
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,10 @@ class BuoyDataFetcher:
     Data source: NDBC real-time2 text files
     Format: Space-delimited with header rows
     Rate limit: 0.5 requests/second (NDBC courtesy limit)
+
+    With an ObservationArchive, only rows newer than the archive's
+    high-water mark are parsed and appended, and range queries are answered
+    from the archive. In offline mode the archive is the only data source.
     """
 
     # Buoy IDs mapped to shores
@@ -49,7 +55,10 @@ class BuoyDataFetcher:
         self,
         http_client: Optional[HTTPClient] = None,
         rate_limiter: Optional[RateLimiter] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        archive: Optional[ObservationArchive] = None,
+        offline: bool = False,
+        refresh_interval: float = 600.0
     ):
         """
         Initialize buoy data fetcher.
@@ -58,8 +67,18 @@ class BuoyDataFetcher:
             http_client: Optional HTTPClient instance (will create if None)
             rate_limiter: Optional RateLimiter instance (will create if None)
             timeout: Request timeout in seconds
+            archive: Optional local observation archive
+            offline: Answer only from the archive, never download
+            refresh_interval: Minimum seconds between downloads of the same
+                buoy when the archive does not yet cover a requested range
         """
         self.timeout = timeout
+        self.archive = archive
+        self.offline = offline
+        self.refresh_interval = refresh_interval
+
+        if offline and archive is None:
+            raise ValueError("Offline mode requires an observation archive")
 
         # Create rate limiter with NDBC-specific limits
         if rate_limiter is None:
@@ -152,6 +171,28 @@ class BuoyDataFetcher:
 
         return all_observations
 
+    async def fetch_buoy(
+        self,
+        buoy_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict]:
+        """
+        Fetch observations from a single buoy for a time range.
+
+        Used by batch validation, which merges the time ranges of many
+        forecasts per buoy and downloads each buoy once.
+
+        Args:
+            buoy_id: NDBC buoy identifier (e.g., '51001')
+            start_time: Start of time range (inclusive)
+            end_time: End of time range (inclusive)
+
+        Returns:
+            List of observation dictionaries (same keys as fetch_observations)
+        """
+        return await self._fetch_buoy_data(buoy_id, start_time, end_time)
+
     async def _fetch_buoy_data(
         self,
         buoy_id: str,
@@ -169,6 +210,75 @@ class BuoyDataFetcher:
         Returns:
             List of observation dictionaries
         """
+        if self.archive is None:
+            return await self._download_buoy_data(buoy_id, start_time, end_time) or []
+
+        high_water_mark = self.archive.high_water_mark(buoy_id)
+        if self._needs_refresh(buoy_id, high_water_mark, end_time):
+            # Archive every row newer than the high-water mark, not just the
+            # requested range, so later queries never see gaps
+            newer = await self._download_buoy_data(
+                buoy_id, datetime.min, datetime.max, newer_than=high_water_mark
+            )
+            if newer is None:
+                # Leave the buoy unthrottled so the next fetch retries
+                logger.warning(
+                    f"Refresh of buoy {buoy_id} failed; serving archived observations "
+                    f"up to {high_water_mark}"
+                )
+            else:
+                self.archive.mark_refreshed(buoy_id)
+                appended = self.archive.append(buoy_id, newer)
+                logger.debug(f"Archived {appended} new observations for buoy {buoy_id}")
+
+        return self.archive.query(buoy_id, start_time, end_time)
+
+    def _needs_refresh(
+        self,
+        buoy_id: str,
+        high_water_mark: Optional[datetime],
+        end_time: datetime
+    ) -> bool:
+        """
+        Decide whether the archive must be topped up from NDBC.
+
+        Args:
+            buoy_id: Buoy identifier
+            high_water_mark: Newest archived observation time (None if empty)
+            end_time: End of the requested range
+
+        Returns:
+            True if a download is needed and allowed
+        """
+        if self.offline:
+            return False
+        if high_water_mark is not None and high_water_mark >= end_time:
+            return False
+
+        # The archive keeps refresh times, so the throttle also holds for
+        # fetchers created per validation and for other processes
+        last_refresh = self.archive.last_refresh(buoy_id)
+        return last_refresh is None or time.time() - last_refresh >= self.refresh_interval
+
+    async def _download_buoy_data(
+        self,
+        buoy_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        newer_than: Optional[datetime] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Download and parse the realtime2 file for a single buoy.
+
+        Args:
+            buoy_id: NDBC buoy identifier
+            start_time: Start of time range
+            end_time: End of time range
+            newer_than: Stop at the first row at or before this time
+
+        Returns:
+            List of observation dictionaries, or None if the download failed
+        """
         url = self.NDBC_URL_TEMPLATE.format(buoy_id=buoy_id)
 
         logger.debug(f"Fetching data from buoy {buoy_id}: {url}")
@@ -181,14 +291,14 @@ class BuoyDataFetcher:
                 logger.warning(
                     f"Failed to fetch buoy {buoy_id}: {result.error}"
                 )
-                return []
+                return None
 
             # Decode content
             text = result.content.decode('utf-8', errors='replace')
 
             # Parse buoy data
             observations = self._parse_buoy_data(
-                buoy_id, text, start_time, end_time
+                buoy_id, text, start_time, end_time, newer_than=newer_than
             )
 
             logger.debug(
@@ -199,14 +309,15 @@ class BuoyDataFetcher:
 
         except Exception as e:
             logger.error(f"Error fetching buoy {buoy_id}: {e}", exc_info=True)
-            return []
+            return None
 
     def _parse_buoy_data(
         self,
         buoy_id: str,
         text: str,
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        newer_than: Optional[datetime] = None
     ) -> List[Dict]:
         """
         Parse NDBC text format into observation dictionaries.
@@ -227,6 +338,8 @@ class BuoyDataFetcher:
             text: Raw NDBC text data
             start_time: Filter observations after this time
             end_time: Filter observations before this time
+            newer_than: Stop parsing at the first row at or before this time
+                (realtime2 files list the newest rows first)
 
         Returns:
             List of parsed observation dictionaries
@@ -285,6 +398,10 @@ class BuoyDataFetcher:
 
                 observation_time = datetime(year, month, day, hour, minute)
 
+                # Rows are newest first; everything below is already archived
+                if newer_than is not None and observation_time <= newer_than:
+                    break
+
                 # Filter by time range
                 if observation_time < start_time or observation_time > end_time:
                     continue
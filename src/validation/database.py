@@ -3,11 +3,16 @@
 import json
 import logging
 import sqlite3
+import threading
 import time
+from collections.abc import Mapping
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
+
+from . import performance_summary
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +26,20 @@ MAX_RETRIES = 3  # Maximum number of retry attempts
 RETRY_DELAY = 0.1  # Initial retry delay in seconds (exponential backoff)
 RETRY_BACKOFF_MULTIPLIER = 2.0  # Multiply delay by this for each retry
 
+# PRAGMAs applied once per pooled connection. synchronous=NORMAL is durable
+# under WAL except for the last transactions on power loss, which validation
+# data can tolerate.
+TUNED_PRAGMAS = {
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # 16 MB page cache
+    "mmap_size": 268435456,  # 256 MB memory-mapped I/O
+    "temp_store": "MEMORY",
+}
+CACHED_STATEMENTS = 256  # Prepared statements kept per pooled connection
+
+# forecasts.status for forecasts whose predictions matched no observations
+UNMATCHED_STATUS = "unmatched"
+
 
 def format_timestamp(dt: datetime | str | float | int) -> str:
     """Convert datetime to ISO 8601 string format.
@@ -82,6 +101,10 @@ def connect_with_retry(
     timeout: float = DB_TIMEOUT,
     max_retries: int = MAX_RETRIES,
     retry_delay: float = RETRY_DELAY,
+    read_only: bool = False,
+    pragmas: Mapping[str, Any] | None = None,
+    check_same_thread: bool = True,
+    cached_statements: int = 128,
 ) -> sqlite3.Connection:
     """
     Connect to SQLite database with retry logic for transient failures.
@@ -91,6 +114,10 @@ def connect_with_retry(
         timeout: Connection timeout in seconds
         max_retries: Maximum retry attempts
         retry_delay: Initial delay between retries (seconds)
+        read_only: Open the file read-only (mode=ro) and refuse writes
+        pragmas: Extra PRAGMAs applied after connecting (name -> value)
+        check_same_thread: Passed to sqlite3.connect
+        cached_statements: Prepared statements cached per connection
 
     Returns:
         sqlite3.Connection object
@@ -103,9 +130,27 @@ def connect_with_retry(
 
     for attempt in range(max_retries):
         try:
-            conn = sqlite3.connect(db_path, timeout=timeout)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
+            if read_only:
+                uri = f"file:{quote(str(Path(db_path).resolve()))}?mode=ro"
+                conn = sqlite3.connect(
+                    uri,
+                    timeout=timeout,
+                    uri=True,
+                    check_same_thread=check_same_thread,
+                    cached_statements=cached_statements,
+                )
+                conn.execute("PRAGMA query_only = ON")
+            else:
+                conn = sqlite3.connect(
+                    db_path,
+                    timeout=timeout,
+                    check_same_thread=check_same_thread,
+                    cached_statements=cached_statements,
+                )
+                conn.execute("PRAGMA foreign_keys = ON")
+                conn.execute("PRAGMA journal_mode = WAL")
+            for name, value in (pragmas or {}).items():
+                conn.execute(f"PRAGMA {name} = {value}")
             return conn
         except (sqlite3.OperationalError, sqlite3.DatabaseError) as e:
             last_error = e
@@ -206,8 +251,167 @@ def extended_timeout_connection(db_path: str, timeout: float = 60.0):
         conn.close()
 
 
+class ConnectionPool:
+    """
+    Per-thread pool of SQLite connections to one database file.
+
+    Each thread (including asyncio.to_thread workers) gets its own connection,
+    opened on first use with connect_with_retry and tuned PRAGMAs, then reused
+    so its prepared-statement cache stays warm. ValidationDatabase methods are
+    synchronous, so tasks sharing an event-loop thread never interleave inside
+    a transaction and can share that thread's connection.
+
+    Features:
+    - Lazy, per-thread connections (no cross-thread sharing)
+    - Tuned PRAGMAs and statement caching applied once per connection
+    - Optional read-only mode for analytics readers
+    - close() closes every connection; threads transparently reconnect afterwards
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        timeout: float = DB_TIMEOUT,
+        read_only: bool = False,
+        pragmas: Mapping[str, Any] | None = None,
+    ):
+        """
+        Initialize the pool (no connections are opened yet).
+
+        Args:
+            db_path: Path to database file
+            timeout: Busy timeout for pooled connections in seconds
+            read_only: Open connections read-only
+            pragmas: PRAGMAs applied to each new connection (default: TUNED_PRAGMAS)
+        """
+        self.db_path = str(db_path)
+        self.timeout = timeout
+        self.read_only = read_only
+        self.pragmas = dict(TUNED_PRAGMAS if pragmas is None else pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._generation = 0
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's connection, opening it if needed.
+
+        Returns:
+            sqlite3.Connection owned by the pool
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+
+        conn = connect_with_retry(
+            self.db_path,
+            timeout=self.timeout,
+            read_only=self.read_only,
+            pragmas=self.pragmas,
+            # Only the owning thread uses the connection; close() may run elsewhere
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        with self._lock:
+            self._connections.append(conn)
+            self._local.generation = self._generation
+        self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def acquire(self, timeout: float | None = None):
+        """
+        Yield the calling thread's connection.
+
+        Acquires nest: only the outermost one on a thread applies ``timeout``
+        and, on release, restores the busy timeout and row_factory. Inner
+        acquires reuse the connection as the outer one configured it.
+
+        Args:
+            timeout: Busy timeout for this use only (e.g. longer for bulk writes)
+
+        Yields:
+            sqlite3.Connection owned by the pool (do not close it)
+        """
+        conn = self.connection()
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            if depth:
+                yield conn
+                return
+
+            custom_timeout = timeout is not None and timeout != self.timeout
+            if custom_timeout:
+                conn.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+            try:
+                yield conn
+            finally:
+                conn.row_factory = None
+                if custom_timeout:
+                    conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+        finally:
+            self._local.depth = depth
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
+
+
+class ValidationReader:
+    """Read-only view of an existing validation database.
+
+    For readers outside the validation commands (e.g. confidence scoring
+    during processing): nothing is opened until the first query, and the
+    schema is never created, migrated or backfilled. Those steps belong to
+    ValidationDatabase and the validation entry points.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Initialize the reader (no connection is opened yet).
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._pool = ConnectionPool(self.db_path, read_only=True)
+
+    def get_recent_mae(self, days: int = 7) -> float | None:
+        """Overall MAE over the last ``days`` days from the daily summary table.
+
+        Args:
+            days: Window length in days
+
+        Returns:
+            MAE in feet, or None if the database or its summary table does not
+            exist yet, or there are no validations in the window
+        """
+        if not self.db_path.exists():
+            return None
+        with self._pool.acquire() as conn:
+            if not performance_summary.has_summary(conn):
+                return None
+            aggregates = performance_summary.query_shore_aggregates(conn, days)
+        return performance_summary.total(aggregates.values()).avg_mae
+
+    def close(self) -> None:
+        """Close pooled connections (they reopen on next use)."""
+        self._pool.close()
+
+
 class ValidationDatabase:
-    """Manages SQLite database for forecast validation."""
+    """Manages SQLite database for forecast validation.
+
+    Connections come from per-thread pools instead of being opened and closed
+    per call: a read-write pool for writes and a read-only pool for queries,
+    so the instance can be shared across threads and analytics reads never
+    take write locks.
+    """
 
     def __init__(self, db_path: str = "data/validation.db"):
         """Initialize database connection.
@@ -218,6 +422,41 @@ class ValidationDatabase:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
         self._init_database()
+        self._pool = ConnectionPool(self.db_path)
+        self._read_pool = ConnectionPool(self.db_path, read_only=True)
+
+    @contextmanager
+    def shared_connection(self):
+        """
+        Yield the calling thread's pooled read-write connection.
+
+        Opening a connection (and setting its PRAGMAs) dominates the cost of
+        small writes, so bulk paths reuse the pooled one. Callers manage
+        transactions with immediate_transaction/deferred_transaction as usual.
+
+        Yields:
+            sqlite3.Connection owned by this database instance
+        """
+        with self._pool.acquire(timeout=60.0) as conn:
+            yield conn
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Yield the calling thread's pooled read-only connection.
+
+        For analytics queries; writes through it fail.
+
+        Yields:
+            Read-only sqlite3.Connection owned by this database instance
+        """
+        with self._read_pool.acquire() as conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close all pooled connections (they reopen on next use)."""
+        self._pool.close()
+        self._read_pool.close()
 
     def _init_database(self) -> None:
         """Initialize database with schema from schema.sql."""
@@ -226,6 +465,8 @@ class ValidationDatabase:
         conn = connect_with_retry(str(self.db_path))
         conn.execute("BEGIN EXCLUSIVE")  # Exclusive lock for schema initialization
         try:
+            had_summary = performance_summary.has_summary(conn)
+
             # Read and execute schema
             if schema_path.exists():
                 with open(schema_path) as f:
@@ -248,6 +489,12 @@ class ValidationDatabase:
             except Exception as e:
                 logger.warning(f"Could not add confidence_report column (may already exist): {e}")
 
+            # Migration: backfill the daily performance summary for existing validations
+            if not had_summary and performance_summary.has_summary(conn):
+                rows = performance_summary.rebuild_summary(conn.cursor())
+                if rows:
+                    logger.info(f"Backfilled {rows} daily performance summary rows")
+
             conn.commit()
         except Exception:
             conn.rollback()
@@ -277,10 +524,8 @@ class ValidationDatabase:
             # confidence_report is already a dict from model_dump()
             confidence_report_json = json.dumps(confidence_report)
 
-        conn = connect_with_retry(str(self.db_path))
-
         try:
-            with immediate_transaction(conn):
+            with self._pool.acquire() as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
 
                 # Convert generated_time to ISO 8601 format
@@ -316,8 +561,6 @@ class ValidationDatabase:
         except Exception as e:
             logger.error(f"Failed to save forecast {forecast_data.get('forecast_id')}: {e}")
             raise
-        finally:
-            conn.close()
 
         return forecast_data.get("forecast_id")
 
@@ -349,10 +592,8 @@ class ValidationDatabase:
         Returns:
             prediction_id: The ID of the saved prediction
         """
-        conn = connect_with_retry(str(self.db_path))
-
         try:
-            with immediate_transaction(conn):
+            with self._pool.acquire() as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -380,8 +621,6 @@ class ValidationDatabase:
         except Exception as e:
             logger.error(f"Failed to save prediction for forecast {forecast_id}: {e}")
             raise
-        finally:
-            conn.close()
 
         return prediction_id
 
@@ -400,10 +639,9 @@ class ValidationDatabase:
                 - category: Predicted category (optional)
                 - confidence: Confidence score (optional, default 0.7)
         """
-        conn = connect_with_retry(str(self.db_path), timeout=60.0)  # Extended timeout for batch
-
         try:
-            with immediate_transaction(conn):
+            # Extended timeout for batch
+            with self._pool.acquire(timeout=60.0) as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
 
                 # Prepare batch data for executemany
@@ -437,14 +675,12 @@ class ValidationDatabase:
         except Exception as e:
             logger.error(f"Batch prediction insert failed for forecast {forecast_id}: {e}")
             raise
-        finally:
-            conn.close()
 
     def get_forecast(self, forecast_id: str) -> dict[str, Any] | None:
         """Fetch a single forecast row by ID."""
-        with connect_with_retry(str(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_pool.acquire() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM forecasts WHERE forecast_id = ?", (forecast_id,))
             row = cursor.fetchone()
             if row is None:
@@ -454,9 +690,9 @@ class ValidationDatabase:
 
     def get_predictions_for_forecast(self, forecast_id: str) -> list[dict[str, Any]]:
         """Return predictions associated with a forecast."""
-        with connect_with_retry(str(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_pool.acquire() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute(
                 "SELECT * FROM predictions WHERE forecast_id = ? ORDER BY valid_time",
                 (forecast_id,),
@@ -486,10 +722,8 @@ class ValidationDatabase:
         Returns:
             actual_id: The ID of the saved observation
         """
-        conn = connect_with_retry(str(self.db_path))
-
         try:
-            with immediate_transaction(conn):
+            with self._pool.acquire() as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -513,13 +747,15 @@ class ValidationDatabase:
         except Exception as e:
             logger.error(f"Failed to save actual observation for buoy {buoy_id}: {e}")
             raise
-        finally:
-            conn.close()
 
         return actual_id
 
-    def save_actuals(self, actuals: list[dict[str, Any]]) -> None:
-        """Save multiple buoy observations to database using batch insert.
+    def save_actuals(self, actuals: list[dict[str, Any]], deduplicate: bool = True) -> list[int]:
+        """Save multiple buoy observations in one transaction on the shared connection.
+
+        Observations whose (buoy_id, observation_time) is already stored, or
+        repeats earlier in the batch, are not inserted again; they resolve to
+        the existing row's ID.
 
         Args:
             actuals: List of actual observation dictionaries with keys:
@@ -529,42 +765,89 @@ class ValidationDatabase:
                 - dominant_period: Observed dominant period (optional)
                 - direction: Observed wave direction (optional)
                 - source: Data source (optional, default 'NDBC')
+            deduplicate: Skip observations that are already stored
+
+        Returns:
+            Observation IDs in the same order as ``actuals``
         """
-        conn = connect_with_retry(str(self.db_path), timeout=60.0)  # Extended timeout for batch
+        if not actuals:
+            return []
+
+        rows = [
+            (
+                actual.get("buoy_id"),
+                format_timestamp(actual.get("observation_time")),
+                actual.get("wave_height"),
+                actual.get("dominant_period"),
+                actual.get("direction"),
+                actual.get("source", "NDBC"),
+            )
+            for actual in actuals
+        ]
 
+        actual_ids = []
         try:
-            with immediate_transaction(conn):
+            with self.shared_connection() as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
-
-                # Prepare batch data for executemany
-                batch_data = [
-                    (
-                        actual.get("buoy_id"),
-                        format_timestamp(actual.get("observation_time")),
-                        actual.get("wave_height"),
-                        actual.get("dominant_period"),
-                        actual.get("direction"),
-                        actual.get("source", "NDBC"),
-                    )
-                    for actual in actuals
-                ]
-
-                cursor.executemany(
-                    """
-                    INSERT INTO actuals (
-                        buoy_id, observation_time, wave_height,
-                        dominant_period, direction, source
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    batch_data,
+                known = self._existing_actual_ids(cursor, rows) if deduplicate else {}
+                inserted = 0
+
+                for row in rows:
+                    actual_id = known.get(row[:2])
+                    if actual_id is None:
+                        cursor.execute(
+                            """
+                            INSERT INTO actuals (
+                                buoy_id, observation_time, wave_height,
+                                dominant_period, direction, source
+                            ) VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                            row,
+                        )
+                        actual_id = cursor.lastrowid
+                        inserted += 1
+                        if deduplicate:
+                            known[row[:2]] = actual_id
+                    actual_ids.append(actual_id)
+
+                logger.info(
+                    f"Saved {inserted} actual observations "
+                    f"({len(rows) - inserted} already stored)"
                 )
-
-                logger.info(f"Saved {len(actuals)} actual observations")
         except Exception as e:
             logger.error(f"Batch actual insert failed: {e}")
             raise
-        finally:
-            conn.close()
+
+        return actual_ids
+
+    @staticmethod
+    def _existing_actual_ids(
+        cursor: sqlite3.Cursor, rows: list[tuple[Any, ...]]
+    ) -> dict[tuple[str, str], int]:
+        """Look up stored observation IDs for the (buoy_id, observation_time) keys in rows.
+
+        Uses one indexed range query per buoy rather than one query per row.
+        """
+        time_ranges: dict[str, tuple[str, str]] = {}
+        for buoy_id, observation_time, *_ in rows:
+            if buoy_id is None:
+                continue
+            low, high = time_ranges.get(buoy_id, (observation_time, observation_time))
+            time_ranges[buoy_id] = (min(low, observation_time), max(high, observation_time))
+
+        known = {}
+        for buoy_id, (low, high) in time_ranges.items():
+            cursor.execute(
+                """
+                SELECT buoy_id, observation_time, MIN(id) FROM actuals
+                WHERE buoy_id = ? AND observation_time BETWEEN ? AND ?
+                GROUP BY buoy_id, observation_time
+            """,
+                (buoy_id, low, high),
+            )
+            for stored_buoy, stored_time, actual_id in cursor.fetchall():
+                known[(stored_buoy, stored_time)] = actual_id
+        return known
 
     def save_validation(
         self,
@@ -594,10 +877,9 @@ class ValidationDatabase:
         Returns:
             validation_id: The ID of the saved validation
         """
-        conn = connect_with_retry(str(self.db_path))
-
+        validated_at = format_timestamp(datetime.now())
         try:
-            with immediate_transaction(conn):
+            with self._pool.acquire() as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -612,7 +894,7 @@ class ValidationDatabase:
                         forecast_id,
                         prediction_id,
                         actual_id,
-                        format_timestamp(datetime.now()),
+                        validated_at,
                         height_error,
                         period_error,
                         direction_error,
@@ -622,18 +904,31 @@ class ValidationDatabase:
                     ),
                 )
                 validation_id = cursor.lastrowid
+                performance_summary.record_validations(
+                    cursor,
+                    validated_at,
+                    [
+                        {
+                            "prediction_id": prediction_id,
+                            "height_error": height_error,
+                            "mae": mae,
+                            "rmse": rmse,
+                            "category_match": category_match,
+                        }
+                    ],
+                )
                 logger.info(f"Saved validation {validation_id} for forecast {forecast_id}")
         except Exception as e:
             logger.error(f"Failed to save validation for forecast {forecast_id}: {e}")
             raise
-        finally:
-            conn.close()
 
         return validation_id
 
     def save_validations(self, validations: list[dict[str, Any]]) -> None:
         """Save multiple validation results to database using batch insert.
 
+        The daily performance summary is updated in the same transaction.
+
         Args:
             validations: List of validation dictionaries with keys:
                 - forecast_id: ID of the forecast being validated
@@ -646,10 +941,9 @@ class ValidationDatabase:
                 - mae: Mean absolute error (optional)
                 - rmse: Root mean squared error (optional)
         """
-        conn = connect_with_retry(str(self.db_path), timeout=60.0)  # Extended timeout for batch
-
         try:
-            with immediate_transaction(conn):
+            # Extended timeout for batch
+            with self._pool.acquire(timeout=60.0) as conn, immediate_transaction(conn):
                 cursor = conn.cursor()
 
                 # Get current timestamp for all validations
@@ -682,13 +976,31 @@ class ValidationDatabase:
                 """,
                     batch_data,
                 )
+                performance_summary.record_validations(cursor, validated_at, validations)
 
                 logger.info(f"Saved {len(validations)} validation results")
         except Exception as e:
             logger.error(f"Batch validation insert failed: {e}")
             raise
-        finally:
-            conn.close()
+
+    def mark_forecasts_unmatched(self, forecast_ids: list[str]) -> None:
+        """Record that forecasts had no matching observations.
+
+        Unmatched forecasts are no longer returned by get_forecasts_needing_validation.
+
+        Args:
+            forecast_ids: IDs of the forecasts to mark
+        """
+        try:
+            with self._pool.acquire() as conn, immediate_transaction(conn):
+                conn.executemany(
+                    "UPDATE forecasts SET status = ? WHERE forecast_id = ?",
+                    [(UNMATCHED_STATUS, forecast_id) for forecast_id in forecast_ids],
+                )
+                logger.info(f"Marked {len(forecast_ids)} forecasts as unmatched")
+        except Exception as e:
+            logger.error(f"Failed to mark unmatched forecasts: {e}")
+            raise
 
     def get_forecasts_needing_validation(self, hours_after: int = 24) -> list[dict[str, Any]]:
         """Get forecasts that need validation (24+ hours old).
@@ -705,7 +1017,7 @@ class ValidationDatabase:
         cutoff_dt = datetime.now() - timedelta(hours=hours_after)
         cutoff = format_timestamp(cutoff_dt)
 
-        with connect_with_retry(str(self.db_path)) as conn:
+        with self._read_pool.acquire() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -714,9 +1026,10 @@ class ValidationDatabase:
                 LEFT JOIN validations v ON f.forecast_id = v.forecast_id
                 WHERE f.created_at < ?
                 AND v.id IS NULL
+                AND f.status IS NOT ?
                 ORDER BY f.created_at DESC
             """,
-                (cutoff,),
+                (cutoff, UNMATCHED_STATUS),
             )
 
             results = []
@@ -725,8 +1038,64 @@ class ValidationDatabase:
 
         return results
 
+    def get_rolling_performance(
+        self, windows: tuple[int, ...] = performance_summary.ROLLING_WINDOWS
+    ) -> dict[int, dict[str, dict[str, Any]]]:
+        """Rolling per-shore performance from the daily summary table.
+
+        Outliers (|height_error| >= 10 ft) are excluded.
+
+        Args:
+            windows: Window lengths in days (today counts as the first day)
+
+        Returns:
+            Dictionary mapping window length -> shore -> metrics dict with
+            validation_count, mae, rmse, bias and categorical_accuracy
+        """
+        results = {}
+        with self._read_pool.acquire() as conn:
+            for days in windows:
+                aggregates = performance_summary.query_shore_aggregates(conn, days)
+                results[days] = {
+                    shore: {
+                        "validation_count": agg.validation_count,
+                        "mae": agg.avg_mae,
+                        "rmse": agg.avg_rmse,
+                        "bias": agg.avg_bias,
+                        "categorical_accuracy": agg.categorical_accuracy,
+                    }
+                    for shore, agg in aggregates.items()
+                }
+        return results
+
+    def get_recent_mae(self, days: int = 7) -> float | None:
+        """Overall MAE over the last ``days`` days from the daily summary table.
+
+        Args:
+            days: Window length in days
+
+        Returns:
+            MAE in feet, or None if there are no validations in the window
+        """
+        with self._read_pool.acquire() as conn:
+            aggregates = performance_summary.query_shore_aggregates(conn, days)
+        return performance_summary.total(aggregates.values()).avg_mae
+
+    def rebuild_performance_summary(self) -> int:
+        """Recompute the daily performance summary from the validations table.
+
+        Use after editing validations outside save_validation(s).
+
+        Returns:
+            Number of summary rows written
+        """
+        with self._pool.acquire(timeout=60.0) as conn, immediate_transaction(conn):
+            rows = performance_summary.rebuild_summary(conn.cursor())
+        logger.info(f"Rebuilt daily performance summary ({rows} rows)")
+        return rows
+
     def checkpoint_wal(self) -> None:
         """Checkpoint the WAL file to move data to main database."""
-        with connect_with_retry(str(self.db_path)) as conn:
+        with self._pool.acquire() as conn:
             conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             logger.info("WAL checkpoint completed")
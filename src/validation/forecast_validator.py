@@ -2,10 +2,15 @@
 Forecast validation engine - compares predictions to ground truth observations.
 """
 
+import asyncio
 import logging
+from bisect import bisect_left
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 from .buoy_fetcher import BuoyDataFetcher
 
 
@@ -37,14 +42,38 @@ class ForecastValidator:
     # Direction tolerance (degrees)
     DIRECTION_TOLERANCE = 22.5
 
-    def __init__(self, database: "ValidationDatabase"):
+    # Prediction/observation matching
+    DEFAULT_MATCH_WINDOW_HOURS = 2.0
+    TIE_BREAKS = ("earlier", "later")
+
+    def __init__(
+        self,
+        database: "ValidationDatabase",
+        match_window_hours: float = DEFAULT_MATCH_WINDOW_HOURS,
+        tie_break: str = "earlier",
+        fetcher_factory: Callable[[], BuoyDataFetcher] | None = None,
+    ):
         """
         Initialize validator.
 
         Args:
             database: ValidationDatabase instance for storing results
+            match_window_hours: Maximum time between a prediction and its observation
+            tie_break: Which observation wins when two are equally close
+                ('earlier' or 'later')
+            fetcher_factory: Creates the BuoyDataFetcher used for observations
+                (defaults to a plain BuoyDataFetcher)
+
+        Raises:
+            ValueError: If tie_break is not one of TIE_BREAKS
         """
+        if tie_break not in self.TIE_BREAKS:
+            raise ValueError(f"Invalid tie_break '{tie_break}'. Expected one of: {self.TIE_BREAKS}")
+
         self.database = database
+        self.match_window = timedelta(hours=match_window_hours)
+        self.tie_break = tie_break
+        self.fetcher_factory = fetcher_factory
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def validate_forecast(self, forecast_id: str, hours_after: int = 24) -> dict[str, Any]:
@@ -70,7 +99,7 @@ class ForecastValidator:
         self.logger.info(f"Validating forecast {forecast_id} (min {hours_after}h after)")
 
         # Step 1: Get forecast and predictions from database
-        forecast_data = await self._get_forecast_data(forecast_id, hours_after)
+        forecast_data = await self.get_forecast_data(forecast_id, hours_after)
         if not forecast_data:
             raise ValueError(f"Forecast {forecast_id} not found or too recent")
 
@@ -118,6 +147,89 @@ class ForecastValidator:
 
         # Step 5: Save validation results to database
         validation_records = []
+        for record in self._validation_records(forecast_id, matches, metrics):
+            validation_id = self.database.save_validation(**record)
+            validation_records.append(
+                {
+                    "validation_id": validation_id,
+                    "prediction_id": record["prediction_id"],
+                    "actual_id": record["actual_id"],
+                    "height_error": record["height_error"],
+                    "period_error": record["period_error"],
+                    "direction_error": record["direction_error"],
+                    "category_match": record["category_match"],
+                }
+            )
+
+        # Return validation summary
+        return {
+            "forecast_id": forecast_id,
+            "validated_at": datetime.now().isoformat(),
+            "metrics": metrics,
+            "predictions_validated": len(matches),
+            "predictions_total": len(predictions),
+            "validations": validation_records,
+        }
+
+    def score_forecast(
+        self,
+        forecast_id: str,
+        predictions: list[dict[str, Any]],
+        timelines: dict[Any, tuple[list[datetime], list[dict[str, Any]]]],
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """
+        Match and score a forecast against prebuilt observation timelines without saving.
+
+        Used by batch validation, which fetches observations once for many
+        forecasts and writes the returned records in grouped transactions.
+
+        Args:
+            forecast_id: Forecast ID
+            predictions: Predictions from get_forecast_data
+            timelines: Observation timelines from build_timelines
+
+        Returns:
+            Tuple of (summary dict, validation records ready for
+            ValidationDatabase.save_validations)
+        """
+        matches = self._match_predictions_to_actuals(predictions, [], timelines=timelines)
+        if not matches:
+            return {
+                "forecast_id": forecast_id,
+                "success": False,
+                "error": "No matches between predictions and observations",
+                "predictions_total": len(predictions),
+            }, []
+
+        metrics = self._calculate_metrics(matches)
+        summary = {
+            "forecast_id": forecast_id,
+            "success": True,
+            "mae": metrics["mae"],
+            "rmse": metrics["rmse"],
+            "categorical_accuracy": metrics["categorical_accuracy"],
+            "direction_accuracy": metrics["direction_accuracy"],
+            "sample_size": metrics["sample_size"],
+            "predictions_validated": len(matches),
+            "predictions_total": len(predictions),
+        }
+        return summary, self._validation_records(forecast_id, matches, metrics)
+
+    def _validation_records(
+        self, forecast_id: str, matches: list[dict[str, Any]], metrics: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Compute per-pair errors for matched predictions.
+
+        Args:
+            forecast_id: Forecast ID
+            matches: Matched prediction-actual pairs
+            metrics: Forecast-level metrics from _calculate_metrics
+
+        Returns:
+            List of validation dictionaries (keyword arguments for save_validation)
+        """
+        records = []
         for match in matches:
             pred = match["prediction"]
             actual = match["actual"]
@@ -149,42 +261,23 @@ class ForecastValidator:
                 (pred_category == actual_category) if pred_category and actual_category else None
             )
 
-            # Save validation to database
-            validation_id = self.database.save_validation(
-                forecast_id=forecast_id,
-                prediction_id=pred["id"],
-                actual_id=actual["id"],
-                height_error=height_error,
-                period_error=period_error,
-                direction_error=direction_error,
-                category_match=category_match,
-                mae=metrics["mae"],
-                rmse=metrics["rmse"],
-            )
-
-            validation_records.append(
+            records.append(
                 {
-                    "validation_id": validation_id,
+                    "forecast_id": forecast_id,
                     "prediction_id": pred["id"],
                     "actual_id": actual["id"],
                     "height_error": height_error,
                     "period_error": period_error,
                     "direction_error": direction_error,
                     "category_match": category_match,
+                    "mae": metrics["mae"],
+                    "rmse": metrics["rmse"],
                 }
             )
 
-        # Return validation summary
-        return {
-            "forecast_id": forecast_id,
-            "validated_at": datetime.now().isoformat(),
-            "metrics": metrics,
-            "predictions_validated": len(matches),
-            "predictions_total": len(predictions),
-            "validations": validation_records,
-        }
+        return records
 
-    async def _get_forecast_data(self, forecast_id: str, hours_after: int) -> dict[str, Any] | None:
+    async def get_forecast_data(self, forecast_id: str, hours_after: int) -> dict[str, Any] | None:
         """
         Get forecast and predictions from database.
 
@@ -298,101 +391,186 @@ class ForecastValidator:
         end_time = max(valid_times) + timedelta(hours=2)  # 2h buffer after
 
         # Determine which shores we need
-        shores = set(p["shore"] for p in predictions if p.get("shore"))
+        shore_keys = {}
+        for shore in sorted(set(p["shore"] for p in predictions if p.get("shore"))):
+            # Normalize shore name
+            shore_key = shore.lower().replace(" ", "_")
+            if shore_key not in ["north_shore", "south_shore"]:
+                self.logger.warning(f"Unknown shore: {shore}, skipping")
+                continue
+            shore_keys[shore] = shore_key
+
+        # Fetch all shores concurrently
+        async with (self.fetcher_factory or BuoyDataFetcher)() as fetcher:
+            results = await asyncio.gather(
+                *(
+                    fetcher.fetch_observations(
+                        shore=shore_key, start_time=start_time, end_time=end_time
+                    )
+                    for shore_key in shore_keys.values()
+                ),
+                return_exceptions=True,
+            )
 
-        # Fetch observations for each shore
         all_observations = []
+        for shore, result in zip(shore_keys, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Error fetching observations for {shore}: {result}", exc_info=result
+                )
+                continue
+            for obs in result:
+                obs["shore"] = shore  # Add shore for matching
+            all_observations.extend(result)
 
-        async with BuoyDataFetcher() as fetcher:
-            for shore in shores:
-                # Normalize shore name
-                shore_key = shore.lower().replace(" ", "_")
-                if shore_key not in ["north_shore", "south_shore"]:
-                    self.logger.warning(f"Unknown shore: {shore}, skipping")
-                    continue
+        if not all_observations:
+            return []
 
-                try:
-                    observations = await fetcher.fetch_observations(
-                        shore=shore_key, start_time=start_time, end_time=end_time
-                    )
+        # Save new observations in one transaction; already stored ones keep their IDs
+        try:
+            actual_ids = self.database.save_actuals(all_observations)
+        except Exception as e:
+            self.logger.error(
+                f"Error saving observations, retrying one at a time: {e}", exc_info=True
+            )
+            return self._save_actuals_individually(all_observations)
 
-                    # Save observations to database and add IDs
-                    for obs in observations:
-                        actual_id = self.database.save_actual(
-                            buoy_id=obs["buoy_id"],
-                            observation_time=obs["observation_time"],
-                            wave_height=obs.get("wave_height"),
-                            dominant_period=obs.get("dominant_period"),
-                            direction=obs.get("direction"),
-                            source=obs.get("source", "NDBC"),
-                        )
-                        obs["id"] = actual_id
-                        obs["shore"] = shore  # Add shore for matching
-
-                    all_observations.extend(observations)
-
-                except Exception as e:
-                    self.logger.error(
-                        f"Error fetching observations for {shore}: {e}", exc_info=True
-                    )
+        for obs, actual_id in zip(all_observations, actual_ids, strict=True):
+            obs["id"] = actual_id
 
         return all_observations
 
+    def _save_actuals_individually(
+        self, observations: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Save observations one per transaction, dropping only those that fail.
+
+        Args:
+            observations: Observations whose bulk save failed
+
+        Returns:
+            Saved observations with database IDs
+        """
+        saved = []
+        for obs in observations:
+            try:
+                (obs["id"],) = self.database.save_actuals([obs])
+            except Exception as e:
+                self.logger.warning(f"Skipping observation from buoy {obs.get('buoy_id')}: {e}")
+                continue
+            saved.append(obs)
+        return saved
+
+    def build_timelines(
+        self, actuals: list[dict[str, Any]]
+    ) -> dict[Any, tuple[list[datetime], list[dict[str, Any]]]]:
+        """
+        Group usable observations by shore and sort each group by time.
+
+        The sort is stable, so observations with equal times keep their input
+        order. Timelines can be built once and reused across many forecasts.
+
+        Args:
+            actuals: List of actual observation dictionaries
+
+        Returns:
+            Dictionary mapping shore to (sorted times, observations in the same order)
+        """
+        by_shore: dict[Any, list[dict[str, Any]]] = {}
+        for actual in actuals:
+            if actual.get("observation_time") and actual.get("wave_height"):
+                by_shore.setdefault(actual.get("shore"), []).append(actual)
+
+        timelines = {}
+        for shore, shore_actuals in by_shore.items():
+            shore_actuals.sort(key=lambda actual: actual["observation_time"])
+            times = [actual["observation_time"] for actual in shore_actuals]
+            timelines[shore] = (times, shore_actuals)
+        return timelines
+
     def _match_predictions_to_actuals(
-        self, predictions: list[dict[str, Any]], actuals: list[dict[str, Any]]
+        self,
+        predictions: list[dict[str, Any]],
+        actuals: list[dict[str, Any]],
+        timelines: dict[Any, tuple[list[datetime], list[dict[str, Any]]]] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Match predictions to actual observations by time window and shore.
 
+        Observations are grouped by shore and sorted by time once, then each
+        prediction finds its nearest observation by binary search, so the cost
+        is O((P + A) log A) rather than O(P * A).
+
         Args:
             predictions: List of prediction dictionaries
             actuals: List of actual observation dictionaries
+            timelines: Prebuilt result of build_timelines (actuals is ignored if given)
 
         Returns:
             List of matched pairs: [{'prediction': pred, 'actual': actual}, ...]
         """
-        matches = []
-        time_window = timedelta(hours=2)  # Match within 2 hours
+        if timelines is None:
+            timelines = self.build_timelines(actuals)
 
+        matches = []
         for pred in predictions:
             if not pred.get("valid_time") or not pred.get("height"):
                 continue
 
-            best_match = None
-            best_time_diff = None
-
-            for actual in actuals:
-                # Must be same shore
-                if pred.get("shore") != actual.get("shore"):
-                    continue
-
-                # Must have observation time and wave height
-                if not actual.get("observation_time") or not actual.get("wave_height"):
-                    continue
-
-                # Calculate time difference
-                time_diff = abs(pred["valid_time"] - actual["observation_time"])
-
-                # Must be within time window
-                if time_diff > time_window:
-                    continue
-
-                # Keep closest match
-                if best_time_diff is None or time_diff < best_time_diff:
-                    best_match = actual
-                    best_time_diff = time_diff
+            timeline = timelines.get(pred.get("shore"))
+            if timeline is None:
+                continue
 
-            if best_match:
+            match = self._nearest_observation(pred["valid_time"], *timeline)
+            if match is not None:
+                actual, time_diff = match
                 matches.append(
                     {
                         "prediction": pred,
-                        "actual": best_match,
-                        "time_diff_hours": best_time_diff.total_seconds() / 3600,
+                        "actual": actual,
+                        "time_diff_hours": time_diff.total_seconds() / 3600,
                     }
                 )
 
         return matches
 
+    def _nearest_observation(
+        self, valid_time: datetime, times: list[datetime], actuals: list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], timedelta] | None:
+        """
+        Find the observation closest to a time within the match window.
+
+        Args:
+            valid_time: Prediction valid time
+            times: Sorted observation times
+            actuals: Observations in the same order as times
+
+        Returns:
+            Tuple of (observation, absolute time difference), or None if no
+            observation falls within the window
+        """
+        index = bisect_left(times, valid_time)
+        candidates = []
+
+        if index > 0:
+            # First of any observations sharing the closest earlier time
+            before = bisect_left(times, times[index - 1], 0, index)
+            candidates.append((valid_time - times[before], 0, before))
+        if index < len(times):
+            candidates.append((times[index] - valid_time, 1, index))
+
+        if not candidates:
+            return None
+
+        # Sort by distance, then by side according to the tie-break rule
+        prefer_later = self.tie_break == "later"
+        time_diff, _, best = min(candidates, key=lambda c: (c[0], -c[1] if prefer_later else c[1]))
+        if time_diff > self.match_window:
+            return None
+
+        return actuals[best], time_diff
+
     def _calculate_metrics(self, matches: list[dict[str, Any]]) -> dict[str, float]:
         """
         Calculate validation metrics from matched prediction-actual pairs.
@@ -417,51 +595,48 @@ class ForecastValidator:
                 "sample_size": 0,
             }
 
-        # Height errors
-        height_errors = []
-        for match in matches:
-            pred_height = match["prediction"].get("height")
-            actual_height = match["actual"].get("wave_height")
-            if pred_height is not None and actual_height is not None:
-                error = pred_height - actual_height
-                height_errors.append(error)
+        predictions = [match["prediction"] for match in matches]
+        actuals = [match["actual"] for match in matches]
 
-        # Calculate MAE and RMSE
+        pred_heights = self._float_array(pred.get("height") for pred in predictions)
+        actual_heights = self._float_array(actual.get("wave_height") for actual in actuals)
+
+        # Height errors
         mae = None
         rmse = None
-        if height_errors:
-            mae = sum(abs(e) for e in height_errors) / len(height_errors)
-            rmse = (sum(e**2 for e in height_errors) / len(height_errors)) ** 0.5
+        height_errors = (pred_heights - actual_heights)[
+            ~np.isnan(pred_heights) & ~np.isnan(actual_heights)
+        ]
+        if height_errors.size:
+            mae = float(np.mean(np.abs(height_errors)))
+            rmse = float(np.sqrt(np.mean(height_errors**2)))
 
         # Categorical accuracy
-        category_matches = []
-        for match in matches:
-            pred_category = match["prediction"].get("category")
-            actual_height = match["actual"].get("wave_height")
-            actual_category = self._categorize_height(actual_height)
-
-            if pred_category and actual_category:
-                category_matches.append(pred_category == actual_category)
+        pred_categories = np.array(
+            [pred.get("category") or "" for pred in predictions], dtype=object
+        )
+        actual_categories = self._categorize_heights(actual_heights)
+        has_category = (pred_categories != "") & ~np.isnan(actual_heights)
 
         categorical_accuracy = None
-        if category_matches:
-            categorical_accuracy = sum(category_matches) / len(category_matches)
+        if has_category.any():
+            categorical_accuracy = float(
+                np.mean(pred_categories[has_category] == actual_categories[has_category])
+            )
 
         # Direction accuracy
-        direction_matches = []
-        for match in matches:
-            pred_direction = match["prediction"].get("direction")
-            actual_direction = match["actual"].get("direction")
-
-            if pred_direction and actual_direction:
-                pred_deg = self._direction_to_degrees(pred_direction)
-                if pred_deg is not None:
-                    angle_diff = self._angular_difference(pred_deg, actual_direction)
-                    direction_matches.append(angle_diff <= self.DIRECTION_TOLERANCE)
+        pred_degrees = self._float_array(
+            self._direction_to_degrees(pred["direction"]) if pred.get("direction") else None
+            for pred in predictions
+        )
+        actual_degrees = self._float_array(actual.get("direction") or None for actual in actuals)
+        has_direction = ~np.isnan(pred_degrees) & ~np.isnan(actual_degrees)
 
         direction_accuracy = None
-        if direction_matches:
-            direction_accuracy = sum(direction_matches) / len(direction_matches)
+        if has_direction.any():
+            angle_diff = np.abs(pred_degrees[has_direction] - actual_degrees[has_direction])
+            angle_diff = np.where(angle_diff > 180, 360 - angle_diff, angle_diff)
+            direction_accuracy = float(np.mean(angle_diff <= self.DIRECTION_TOLERANCE))
 
         return {
             "mae": mae,
@@ -471,6 +646,27 @@ class ForecastValidator:
             "sample_size": len(matches),
         }
 
+    @staticmethod
+    def _float_array(values: Any) -> np.ndarray:
+        """Build a float array from optional numbers, with None as NaN."""
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    def _categorize_heights(self, heights: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _categorize_height.
+
+        Args:
+            heights: Wave heights in feet (NaN for missing)
+
+        Returns:
+            Object array of category strings ('' where the height is missing)
+        """
+        categories = np.full(heights.shape, "extra_large", dtype=object)
+        for category, (min_h, max_h) in self.CATEGORY_THRESHOLDS.items():
+            categories[(heights >= min_h) & (heights < max_h)] = category
+        categories[np.isnan(heights)] = ""
+        return categories
+
     def _categorize_height(self, height: float | None) -> str | None:
         """
         Categorize wave height into size category.
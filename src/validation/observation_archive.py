@@ -0,0 +1,279 @@
+"""
+Local archive of NDBC buoy observations.
+
+Each buoy gets a directory of monthly partitions. A partition is a flat binary
+file of fixed-size records (time, wave height, dominant period, direction)
+appended in time order, so:
+- The high-water mark is the time of the last record in the newest partition
+- New data is appended, never rewritten (a torn final record is ignored on read)
+- Range queries binary-search the time column of the partitions they touch
+
+Validation can then run offline against the archive, and repeat validations
+read from disk instead of re-downloading the 45-day realtime2 file.
+
+Appends take an exclusive lock on the buoy directory, so concurrent
+validations can share an archive. The archive also records when each buoy
+was last refreshed from NDBC, so download throttling holds across fetcher
+instances and processes.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock; appends run unlocked
+    fcntl = None
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),  # Seconds since the Unix epoch (UTC, as reported by NDBC)
+        ("wave_height", "<f8"),  # Feet
+        ("dominant_period", "<f8"),  # Seconds
+        ("direction", "<f8"),  # Degrees
+    ]
+)
+
+PARTITION_SUFFIX = ".obs"
+LOCK_FILE = ".lock"
+REFRESH_MARKER = ".refreshed"
+
+
+def _to_epoch(times: Iterable[datetime]) -> np.ndarray:
+    return np.array(list(times), dtype="datetime64[s]").astype(np.int64)
+
+
+def _from_epoch(seconds: int) -> datetime:
+    return np.datetime64(int(seconds), "s").astype(datetime)
+
+
+def _optional(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+class ObservationArchive:
+    """
+    Append-only, month-partitioned observation store per buoy.
+
+    Features:
+    - Compact fixed-width binary records (32 bytes per observation)
+    - High-water mark per buoy for incremental fetches
+    - Binary-search range queries
+    - Safe against interrupted appends (partial trailing records are skipped)
+    - Safe against concurrent appends (per-buoy file lock)
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Initialize the archive.
+
+        Args:
+            root: Directory holding one subdirectory per buoy
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger("validation.observation_archive")
+
+    def partitions(self, buoy_id: str) -> list[Path]:
+        """
+        List a buoy's partition files, oldest first.
+
+        Args:
+            buoy_id: Buoy identifier
+
+        Returns:
+            Sorted partition paths (named YYYY-MM.obs)
+        """
+        buoy_dir = self.root / buoy_id
+        if not buoy_dir.is_dir():
+            return []
+        return sorted(buoy_dir.glob(f"*{PARTITION_SUFFIX}"))
+
+    def high_water_mark(self, buoy_id: str) -> datetime | None:
+        """
+        Time of the newest archived observation for a buoy.
+
+        Args:
+            buoy_id: Buoy identifier
+
+        Returns:
+            Newest observation time, or None if nothing is archived
+        """
+        itemsize = RECORD_DTYPE.itemsize
+        for partition in reversed(self.partitions(buoy_id)):
+            size = partition.stat().st_size
+            usable = size - size % itemsize
+            if usable:
+                with open(partition, "rb") as f:
+                    f.seek(usable - itemsize)
+                    record = np.frombuffer(f.read(itemsize), dtype=RECORD_DTYPE)
+                return _from_epoch(record["time"][0])
+        return None
+
+    def append(self, buoy_id: str, observations: list[dict[str, Any]]) -> int:
+        """
+        Append observations newer than the high-water mark.
+
+        Older or duplicate observations are ignored, so overlapping fetches
+        can be appended safely.
+
+        Args:
+            buoy_id: Buoy identifier
+            observations: Observation dictionaries with observation_time,
+                wave_height, dominant_period and direction
+
+        Returns:
+            Number of records written
+        """
+        if not observations:
+            return 0
+
+        records = np.empty(len(observations), dtype=RECORD_DTYPE)
+        records["time"] = _to_epoch(obs["observation_time"] for obs in observations)
+        for field in ("wave_height", "dominant_period", "direction"):
+            records[field] = [
+                np.nan if obs.get(field) is None else obs[field] for obs in observations
+            ]
+
+        records = np.sort(records, order="time", kind="stable")
+        _, first = np.unique(records["time"], return_index=True)
+        records = records[first]
+
+        with self._locked(buoy_id):
+            # Re-read the high-water mark under the lock so a concurrent
+            # append cannot make us write the same records twice
+            high_water_mark = self.high_water_mark(buoy_id)
+            if high_water_mark is not None:
+                records = records[records["time"] > _to_epoch([high_water_mark])[0]]
+            if not len(records):
+                return 0
+
+            months = records["time"].astype("datetime64[s]").astype("datetime64[M]")
+            buoy_dir = self.root / buoy_id
+            for month in np.unique(months):
+                partition = buoy_dir / f"{month}{PARTITION_SUFFIX}"
+                with open(partition, "ab") as f:
+                    # Drop a torn record left by an interrupted append so new
+                    # records stay aligned
+                    torn = f.tell() % RECORD_DTYPE.itemsize
+                    if torn:
+                        f.truncate(f.tell() - torn)
+                    f.write(records[months == month].tobytes())
+
+        self.logger.debug(f"Archived {len(records)} observations for buoy {buoy_id}")
+        return len(records)
+
+    def query(self, buoy_id: str, start_time: datetime, end_time: datetime) -> list[dict[str, Any]]:
+        """
+        Read archived observations within a time range.
+
+        Args:
+            buoy_id: Buoy identifier
+            start_time: Start of range (inclusive)
+            end_time: End of range (inclusive)
+
+        Returns:
+            Observation dictionaries in time order, shaped like
+            BuoyDataFetcher results
+        """
+        start, end = _to_epoch([start_time, end_time])
+        first_month = np.datetime64(start_time, "M")
+        last_month = np.datetime64(end_time, "M")
+
+        observations = []
+        for partition in self.partitions(buoy_id):
+            month = np.datetime64(partition.stem, "M")
+            if month < first_month or month > last_month:
+                continue
+
+            records = self._read(partition)
+            lo = np.searchsorted(records["time"], start, side="left")
+            hi = np.searchsorted(records["time"], end, side="right")
+            for record in records[lo:hi]:
+                observations.append(
+                    {
+                        "buoy_id": buoy_id,
+                        "observation_time": _from_epoch(record["time"]),
+                        "wave_height": _optional(record["wave_height"]),
+                        "dominant_period": _optional(record["dominant_period"]),
+                        "direction": _optional(record["direction"]),
+                        "source": "NDBC",
+                    }
+                )
+
+        return observations
+
+    def last_refresh(self, buoy_id: str) -> float | None:
+        """
+        When a buoy was last refreshed from NDBC.
+
+        Args:
+            buoy_id: Buoy identifier
+
+        Returns:
+            Unix timestamp of the last refresh, or None if never refreshed
+        """
+        try:
+            return (self.root / buoy_id / REFRESH_MARKER).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def mark_refreshed(self, buoy_id: str) -> None:
+        """
+        Record that a buoy was just refreshed from NDBC.
+
+        Args:
+            buoy_id: Buoy identifier
+        """
+        buoy_dir = self.root / buoy_id
+        buoy_dir.mkdir(parents=True, exist_ok=True)
+        (buoy_dir / REFRESH_MARKER).touch()
+
+    @contextmanager
+    def _locked(self, buoy_id: str) -> Iterator[None]:
+        """Hold an exclusive lock on a buoy's partitions."""
+        buoy_dir = self.root / buoy_id
+        buoy_dir.mkdir(parents=True, exist_ok=True)
+        with open(buoy_dir / LOCK_FILE, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read(partition: Path) -> np.ndarray:
+        """Read whole records from a partition, ignoring a torn trailing write."""
+        data = partition.read_bytes()
+        usable = len(data) - len(data) % RECORD_DTYPE.itemsize
+        return np.frombuffer(data[:usable], dtype=RECORD_DTYPE)
+
+
+def create_observation_archive(config: Any) -> ObservationArchive | None:
+    """
+    Build the observation archive from configuration.
+
+    Reads ``validation.observation_archive`` (default True) and
+    ``validation.observation_archive_dir`` (default ``<data_directory>/archive/ndbc``).
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        ObservationArchive, or None when disabled
+    """
+    if not config.getboolean("validation", "observation_archive", True):
+        return None
+
+    archive_dir = config.get("validation", "observation_archive_dir") or (
+        Path(config.data_directory) / "archive" / "ndbc"
+    )
+    return ObservationArchive(archive_dir)
@@ -9,7 +9,10 @@ validation.db to enable adaptive prompt injection. Key features:
 - Outlier filtering to handle data quality issues
 - Human-readable prompt context generation
 
-Performance: <50ms for 3 queries on 10,000 validations (with proper indexing).
+Performance: databases created by ValidationDatabase carry a materialized
+daily per-shore summary (see performance_summary), so all metrics come from one
+query over a few dozen rows. Databases without it fall back to aggregating the
+validations table (<50ms for 3 queries on 10,000 validations with indexing).
 
 Example:
     >>> from src.validation.performance import build_performance_context
@@ -27,8 +30,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import performance_summary
+from .database import ConnectionPool
+from .performance_summary import OUTLIER_THRESHOLD_FT, ShoreAggregate
+
 logger = logging.getLogger(__name__)
 
+OAHU_SHORES = ["North Shore", "South Shore", "West Shore", "East Shore"]
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    return None if value is None else round(value, digits)
+
 
 class PerformanceAnalyzer:
     """Analyzes recent forecast performance for prompt adaptation.
@@ -41,7 +54,8 @@ class PerformanceAnalyzer:
         db_path: Path to SQLite validation database
 
     Performance Requirements:
-        - Requires idx_validations_validated_at index on validations.validated_at
+        - Reads the daily summary table when present (O(days), one query)
+        - Otherwise requires idx_validations_validated_at index on validations.validated_at
         - Query time <50ms @ 10K validations (with index)
         - Without index: 1.5s @ 10K validations (NOT ACCEPTABLE)
     """
@@ -53,9 +67,15 @@ class PerformanceAnalyzer:
             db_path: Path to validation database (must exist)
         """
         self.db_path = Path(db_path)
+        # Read-only, per-thread connections reused across queries and runs
+        self._pool = ConnectionPool(self.db_path, read_only=True)
         if not self.db_path.exists():
             logger.warning(f"Validation database not found: {db_path}")
 
+    def close(self) -> None:
+        """Close pooled read-only connections."""
+        self._pool.close()
+
     def get_recent_performance(
         self, days: int = 7, min_samples: int = 10, outlier_threshold: float = 10.0
     ) -> dict[str, Any]:
@@ -111,7 +131,11 @@ class PerformanceAnalyzer:
             return self._empty_result(days, "Database not found")
 
         try:
-            overall = self._query_overall_performance(days, outlier_threshold)
+            summary = self._query_summary(days, outlier_threshold, min_samples=3)
+            if summary:
+                overall, by_shore, bias_alerts = summary
+            else:
+                overall = self._query_overall_performance(days, outlier_threshold)
 
             # Check for sufficient data
             if overall["total_validations"] < min_samples:
@@ -135,8 +159,9 @@ class PerformanceAnalyzer:
                 )
 
             # Fetch detailed metrics
-            by_shore = self._query_shore_performance(days, outlier_threshold)
-            bias_alerts = self._query_bias_detection(days, outlier_threshold)
+            if not summary:
+                by_shore = self._query_shore_performance(days, outlier_threshold)
+                bias_alerts = self._query_bias_detection(days, outlier_threshold)
 
             return {
                 "has_data": True,
@@ -155,6 +180,81 @@ class PerformanceAnalyzer:
             logger.error(f"Performance query failed: {e}", exc_info=True)
             return self._empty_result(days, f"Query error: {str(e)}")
 
+    def _query_summary(
+        self,
+        days: int,
+        outlier_threshold: float,
+        min_samples: int = 3,
+        bias_threshold: float = 1.0,
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any] | None], list[dict[str, Any]]] | None:
+        """Compute overall, shore-level and bias metrics from the daily summary table.
+
+        Produces the same structures as the three raw queries from a single
+        query over the summary buckets. Windows are whole days: the last
+        ``days`` calendar days including today.
+
+        Args:
+            days: Lookback window
+            outlier_threshold: Exclude |height_error| > this value; the summary
+                only supports the standard threshold
+            min_samples: Minimum validations for a bias alert
+            bias_threshold: Absolute bias threshold (feet)
+
+        Returns:
+            (overall, by_shore, bias_alerts), or None if the database has no
+            summary table or a non-standard outlier threshold was requested
+        """
+        if outlier_threshold != OUTLIER_THRESHOLD_FT:
+            return None
+
+        with self._pool.acquire() as conn:
+            if not performance_summary.has_summary(conn):
+                return None
+            aggregates = performance_summary.query_shore_aggregates(conn, days)
+
+        overall_agg = performance_summary.total(aggregates.values())
+        overall = {
+            "total_validations": overall_agg.validation_count,
+            "overall_mae": _round(overall_agg.avg_mae, 2),
+            "overall_rmse": _round(overall_agg.avg_rmse, 2),
+            "overall_categorical": _round(overall_agg.categorical_accuracy, 3),
+            "avg_bias": _round(overall_agg.avg_bias, 2),
+        }
+
+        by_shore: dict[str, dict[str, Any] | None] = {shore: None for shore in OAHU_SHORES}
+        for shore, agg in aggregates.items():
+            by_shore[shore] = {
+                "shore": shore,
+                "validation_count": agg.validation_count,
+                "avg_mae": _round(agg.avg_mae, 2),
+                "avg_rmse": _round(agg.avg_rmse, 2),
+                "avg_height_error": _round(agg.avg_bias, 2),
+                "categorical_accuracy": _round(agg.categorical_accuracy, 3),
+            }
+
+        return overall, by_shore, self._bias_alerts(aggregates, min_samples, bias_threshold)
+
+    @staticmethod
+    def _bias_alerts(
+        aggregates: dict[str, ShoreAggregate], min_samples: int, bias_threshold: float
+    ) -> list[dict[str, Any]]:
+        """Shores with significant bias, most severe first (see _query_bias_detection)."""
+        alerts = []
+        for shore, agg in aggregates.items():
+            bias = agg.avg_bias
+            if agg.validation_count < min_samples or bias is None or abs(bias) <= bias_threshold:
+                continue
+            alerts.append(
+                {
+                    "shore": shore,
+                    "avg_bias": round(bias, 2),
+                    "sample_size": agg.validation_count,
+                    "bias_category": "OVERPREDICTING" if bias > 0 else "UNDERPREDICTING",
+                }
+            )
+        alerts.sort(key=lambda alert: abs(aggregates[alert["shore"]].avg_bias), reverse=True)
+        return alerts
+
     def _query_overall_performance(self, days: int, outlier_threshold: float) -> dict[str, Any]:
         """Execute Query 2: Overall system performance.
 
@@ -170,9 +270,10 @@ class PerformanceAnalyzer:
             Dict with keys: total_validations, overall_mae, overall_rmse,
             overall_categorical, avg_bias
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._pool.acquire() as conn:
+            # Cursor-local so the pooled connection keeps returning tuples
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             cursor.execute(
                 """
@@ -223,9 +324,9 @@ class PerformanceAnalyzer:
                 'East Shore': {...}
             }
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._pool.acquire() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             cursor.execute(
                 """
@@ -249,7 +350,6 @@ class PerformanceAnalyzer:
             results = cursor.fetchall()
 
             # Normalize to ensure all Oahu shores present (None if no data)
-            OAHU_SHORES = ["North Shore", "South Shore", "West Shore", "East Shore"]
             by_shore = {shore: None for shore in OAHU_SHORES}
 
             for row in results:
@@ -295,9 +395,9 @@ class PerformanceAnalyzer:
                 }
             ]
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._pool.acquire() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             cursor.execute(
                 """
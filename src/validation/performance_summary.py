@@ -0,0 +1,239 @@
+"""
+Materialized daily performance summary for the validation database.
+
+Recent-performance queries used to re-aggregate the full validations ⋈
+predictions join on every forecast run. Instead, ValidationDatabase keeps a
+small summary table up to date as validations are saved: one row per
+(day, shore, outlier) bucket holding counts and sums. Rolling 7/14/30-day
+metrics are then computed from a few dozen rows.
+
+Buckets split validations into inliers (|height_error| < OUTLIER_THRESHOLD_FT)
+and everything else, so readers can apply the standard outlier filter or
+ignore it. Days are the date part of ``validated_at`` (local time, as stored).
+"""
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import Any
+
+SUMMARY_TABLE = "shore_daily_performance"
+
+# Validations with |height_error| at or above this (or without a height error)
+# are bucketed as outliers
+OUTLIER_THRESHOLD_FT = 10.0
+
+ROLLING_WINDOWS = (7, 14, 30)
+
+
+@dataclass
+class ShoreAggregate:
+    """
+    Additive validation statistics for one shore over some set of days.
+
+    Each metric keeps a sum and a count of non-null values so buckets can be
+    merged exactly.
+    """
+
+    validation_count: int = 0
+    mae_count: int = 0
+    mae_sum: float = 0.0
+    rmse_count: int = 0
+    rmse_sum: float = 0.0
+    error_count: int = 0
+    error_sum: float = 0.0
+    category_count: int = 0
+    category_hits: int = 0
+
+    def add(self, other: "ShoreAggregate") -> None:
+        """Merge another aggregate into this one."""
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+    @property
+    def avg_mae(self) -> float | None:
+        return self.mae_sum / self.mae_count if self.mae_count else None
+
+    @property
+    def avg_rmse(self) -> float | None:
+        return self.rmse_sum / self.rmse_count if self.rmse_count else None
+
+    @property
+    def avg_bias(self) -> float | None:
+        return self.error_sum / self.error_count if self.error_count else None
+
+    @property
+    def categorical_accuracy(self) -> float | None:
+        """Share of validations with a category match (missing values count as misses)."""
+        return self.category_hits / self.validation_count if self.validation_count else None
+
+
+AGGREGATE_COLUMNS = tuple(field.name for field in fields(ShoreAggregate))
+
+
+def _bucket_key(validated_at: str, shore: str, height_error: float | None) -> tuple[str, str, int]:
+    outlier = height_error is None or abs(height_error) >= OUTLIER_THRESHOLD_FT
+    return validated_at[:10], shore, int(outlier)
+
+
+def _aggregate_rows(
+    rows: Iterable[tuple[str, str, float | None, float | None, float | None, Any]],
+) -> dict[tuple[str, str, int], ShoreAggregate]:
+    """Aggregate (validated_at, shore, height_error, mae, rmse, category_match) rows into buckets."""
+    buckets: dict[tuple[str, str, int], ShoreAggregate] = {}
+    for validated_at, shore, height_error, mae, rmse, category_match in rows:
+        bucket = buckets.setdefault(
+            _bucket_key(validated_at, shore, height_error), ShoreAggregate()
+        )
+        bucket.validation_count += 1
+        if mae is not None:
+            bucket.mae_count += 1
+            bucket.mae_sum += mae
+        if rmse is not None:
+            bucket.rmse_count += 1
+            bucket.rmse_sum += rmse
+        if height_error is not None:
+            bucket.error_count += 1
+            bucket.error_sum += height_error
+        if category_match is not None:
+            bucket.category_count += 1
+            bucket.category_hits += int(bool(category_match))
+    return buckets
+
+
+def _upsert(cursor: sqlite3.Cursor, buckets: Mapping[tuple[str, str, int], ShoreAggregate]):
+    columns = ", ".join(AGGREGATE_COLUMNS)
+    placeholders = ", ".join("?" for _ in AGGREGATE_COLUMNS)
+    increments = ", ".join(f"{name} = {name} + excluded.{name}" for name in AGGREGATE_COLUMNS)
+    cursor.executemany(
+        f"""
+        INSERT INTO {SUMMARY_TABLE} (day, shore, outlier, {columns})
+        VALUES (?, ?, ?, {placeholders})
+        ON CONFLICT (day, shore, outlier) DO UPDATE SET {increments}
+    """,
+        [
+            (*key, *(getattr(bucket, name) for name in AGGREGATE_COLUMNS))
+            for key, bucket in buckets.items()
+        ],
+    )
+
+
+def record_validations(
+    cursor: sqlite3.Cursor, validated_at: str, validations: list[Mapping[str, Any]]
+) -> None:
+    """
+    Add newly inserted validations to the summary table.
+
+    Must run in the same transaction as the validation inserts so the summary
+    never drifts from the validations table.
+
+    Args:
+        cursor: Cursor inside the write transaction
+        validated_at: Formatted validation timestamp shared by the batch
+        validations: Validation dictionaries (prediction_id, height_error, mae,
+            rmse, category_match)
+    """
+    prediction_ids = {val.get("prediction_id") for val in validations} - {None}
+    if not prediction_ids:
+        return
+
+    shores: dict[int, str] = {}
+    ids = list(prediction_ids)
+    for start in range(0, len(ids), 500):
+        chunk = ids[start : start + 500]
+        cursor.execute(
+            f"SELECT id, shore FROM predictions WHERE id IN ({', '.join('?' for _ in chunk)})",
+            chunk,
+        )
+        shores.update(cursor.fetchall())
+
+    _upsert(
+        cursor,
+        _aggregate_rows(
+            (
+                validated_at,
+                shores[val["prediction_id"]],
+                val.get("height_error"),
+                val.get("mae"),
+                val.get("rmse"),
+                val.get("category_match"),
+            )
+            for val in validations
+            if val.get("prediction_id") in shores
+        ),
+    )
+
+
+def rebuild_summary(cursor: sqlite3.Cursor) -> int:
+    """
+    Recompute the summary table from the validations table.
+
+    Args:
+        cursor: Cursor inside a write transaction
+
+    Returns:
+        Number of summary rows written
+    """
+    cursor.execute(f"DELETE FROM {SUMMARY_TABLE}")
+    cursor.execute(
+        """
+        SELECT v.validated_at, p.shore, v.height_error, v.mae, v.rmse, v.category_match
+        FROM validations v
+        JOIN predictions p ON v.prediction_id = p.id
+    """
+    )
+    buckets = _aggregate_rows(cursor.fetchall())
+    _upsert(cursor, buckets)
+    return len(buckets)
+
+
+def has_summary(conn: sqlite3.Connection) -> bool:
+    """Check whether the database has the summary table (older or ad-hoc schemas may not)."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SUMMARY_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def window_start(days: int, today: datetime | None = None) -> str:
+    """First day (YYYY-MM-DD) of a rolling window of ``days`` days ending today."""
+    today = today or datetime.now()
+    return (today.date() - timedelta(days=max(days, 1) - 1)).isoformat()
+
+
+def query_shore_aggregates(
+    conn: sqlite3.Connection, days: int, include_outliers: bool = False
+) -> dict[str, ShoreAggregate]:
+    """
+    Sum the summary buckets of a rolling window per shore.
+
+    Args:
+        conn: Open database connection
+        days: Window length in days (today counts as the first day)
+        include_outliers: Include validations outside the outlier threshold
+
+    Returns:
+        Dictionary mapping shore name to its aggregate over the window
+    """
+    query = f"""
+        SELECT shore, {", ".join(f"SUM({name})" for name in AGGREGATE_COLUMNS)}
+        FROM {SUMMARY_TABLE}
+        WHERE day >= ?
+    """
+    if not include_outliers:
+        query += " AND outlier = 0"
+    query += " GROUP BY shore ORDER BY shore"
+
+    return {
+        shore: ShoreAggregate(*values)
+        for shore, *values in conn.execute(query, (window_start(days),)).fetchall()
+    }
+
+
+def total(aggregates: Iterable[ShoreAggregate]) -> ShoreAggregate:
+    """Merge per-shore aggregates into a single overall aggregate."""
+    overall = ShoreAggregate()
+    for aggregate in aggregates:
+        overall.add(aggregate)
+    return overall
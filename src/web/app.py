@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -10,7 +9,7 @@ from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 
 # Rate limiting imports
 try:  # pragma: no cover - dependency optional in some environments
@@ -68,6 +67,8 @@ except ImportError:  # Fallback when slowapi is unavailable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.security import SecurityError
 
+from .catalog import CachedDocument, ForecastCatalog
+
 
 def validate_forecast_id(forecast_id: str) -> str:
     """
@@ -141,6 +142,11 @@ def sanitize_and_validate_path(user_input: str, base_dir: Path, should_exist: bo
 OUTPUT_ROOT = Path(os.getenv("SURFCAST_OUTPUT_DIR", "output"))
 OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
 
+# Forecast listing and JSON payloads are cached in-process; the output
+# directory is rescanned at most this often
+CATALOG_POLL_SECONDS = float(os.getenv("SURFCAST_CATALOG_POLL_SECONDS", "2"))
+catalog = ForecastCatalog(OUTPUT_ROOT, poll_interval=CATALOG_POLL_SECONDS)
+
 # Initialize rate limiter
 # For production with multiple workers, use Redis: storage_uri="redis://localhost:6379"
 limiter = Limiter(
@@ -170,58 +176,24 @@ async def custom_rate_limit_handler(request: Request, exc: RateLimitExceeded):
     )
 
 
-def _forecast_dirs() -> list[Path]:
-    candidates = [p for p in OUTPUT_ROOT.iterdir() if p.is_dir()]
-    return sorted(candidates, key=lambda p: p.stat().st_mtime, reverse=True)
+def _cached_response(request: Request, document: CachedDocument, media_type: str) -> Response:
+    """Serve a cached document, answering conditional requests with 304."""
+    headers = {
+        "ETag": document.etag,
+        "Last-Modified": document.last_modified_http,
+        "Cache-Control": "no-cache",
+    }
+    if document.is_fresh(
+        request.headers.get("if-none-match"), request.headers.get("if-modified-since")
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=document.body, media_type=media_type, headers=headers)
 
 
 @app.get("/", response_class=HTMLResponse)
 @limiter.limit("200 per hour")  # Index page - generous limit
-async def index(request: Request) -> HTMLResponse:
-    rows = []
-    for directory in _forecast_dirs():
-        forecast_id = directory.name
-        meta_path = directory / "forecast_data.json"
-        generated = "Unknown"
-        if meta_path.exists():
-            try:
-                payload = json.loads(meta_path.read_text())
-                generated = payload.get("generated_time", generated)
-            except Exception:
-                pass
-        rows.append((forecast_id, generated))
-
-    if not rows:
-        body = "<p>No forecasts generated yet. Run the pipeline to create one.</p>"
-    else:
-        items = "".join(
-            f'<li><a href="/forecasts/{fid}">{fid}</a> <small>({generated})</small></li>'
-            for fid, generated in rows
-        )
-        body = f"<ul>{items}</ul>"
-
-    html = f"""<!DOCTYPE html>
-<html lang=\"en\">
-<head>
-  <meta charset=\"utf-8\">
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
-  <title>SurfCastAI Forecasts</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 0 auto; max-width: 640px; padding: 24px; background: #f5f7fa; }}
-    h1 {{ text-align: center; color: #0066cc; }}
-    ul {{ list-style: none; padding: 0; }}
-    li {{ background: #fff; margin-bottom: 12px; padding: 12px; border-radius: 6px; box-shadow: 0 1px 4px rgba(0,0,0,0.08); }}
-    a {{ color: #0066cc; text-decoration: none; font-weight: 600; }}
-    a:hover {{ text-decoration: underline; }}
-    small {{ color: #666; }}
-  </style>
-</head>
-<body>
-  <h1>SurfCastAI Forecasts</h1>
-  {body}
-</body>
-</html>"""
-    return HTMLResponse(html)
+async def index(request: Request) -> Response:
+    return _cached_response(request, catalog.index(), "text/html; charset=utf-8")
 
 
 @app.get("/forecasts/{forecast_id}", response_class=HTMLResponse)
@@ -253,21 +225,20 @@ async def serve_forecast(forecast_id: str, request: Request) -> HTMLResponse:
 
 @app.get("/api/forecasts/latest", response_class=JSONResponse)
 @limiter.limit("100 per hour")  # Latest forecast API - moderate limit
-async def latest_forecast(request: Request) -> JSONResponse:
-    directories = _forecast_dirs()
-    if not directories:
+async def latest_forecast(request: Request) -> Response:
+    latest = catalog.latest()
+    if latest is None:
         raise HTTPException(status_code=404, detail="No forecasts available")
-    latest_dir = directories[0]
-    json_path = latest_dir / "forecast_data.json"
-    if not json_path.exists():
-        raise HTTPException(status_code=404, detail="Forecast data missing")
-    payload = json.loads(json_path.read_text())
-    return JSONResponse(payload)
+    try:
+        document = catalog.payload(latest.path / "forecast_data.json")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Forecast data missing") from None
+    return _cached_response(request, document, "application/json")
 
 
 @app.get("/api/forecasts/{forecast_id}", response_class=JSONResponse)
 @limiter.limit("60 per hour")  # JSON API - moderate limit
-async def forecast_detail(forecast_id: str, request: Request) -> JSONResponse:
+async def forecast_detail(forecast_id: str, request: Request) -> Response:
     try:
         # Validate forecast_id to prevent path traversal
         forecast_id = validate_forecast_id(forecast_id)
@@ -283,8 +254,8 @@ async def forecast_detail(forecast_id: str, request: Request) -> JSONResponse:
                 status_code=403, detail="Access denied: path outside output directory"
             )
 
-        payload = json.loads(validated_path.read_text())
-        return JSONResponse(payload)
+        document = catalog.payload(validated_path)
+        return _cached_response(request, document, "application/json")
     except SecurityError:
         raise HTTPException(status_code=403, detail="Access denied: Invalid path")
     except HTTPException:
@@ -334,5 +305,5 @@ async def health() -> dict:
     return {
         "status": "ok",
         "timestamp": datetime.utcnow().isoformat() + "Z",
-        "forecasts": len(_forecast_dirs()),
+        "forecasts": len(catalog.entries()),
     }
@@ -0,0 +1,261 @@
+"""
+In-process catalog of generated forecasts for the web viewer.
+
+The output directory is scanned at most once per poll interval. A scan stats
+each forecast directory (and its ``forecast_data.json``) but only re-reads
+JSON for directories that changed since the last scan, so the index stays
+cheap with thousands of archived forecasts. The rendered index page, the
+forecast JSON payloads and their validators (ETag / Last-Modified) are kept
+in memory so conditional requests can be answered with 304 without touching
+the files again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+FORECAST_DATA_FILE = "forecast_data.json"
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """Response body with its HTTP validators."""
+
+    body: bytes
+    etag: str
+    last_modified: float  # Unix timestamp
+
+    @property
+    def last_modified_http(self) -> str:
+        return formatdate(self.last_modified, usegmt=True)
+
+    def is_fresh(self, if_none_match: str | None, if_modified_since: str | None) -> bool:
+        """
+        Whether a client's cached copy is still current (RFC 9110 section 13.2.2).
+
+        Args:
+            if_none_match: If-None-Match request header
+            if_modified_since: If-Modified-Since request header
+
+        Returns:
+            True if a 304 Not Modified response should be sent
+        """
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag.removeprefix("W/") in tags
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(self.last_modified) <= since
+        return False
+
+
+@dataclass(frozen=True)
+class ForecastEntry:
+    """One forecast output directory."""
+
+    forecast_id: str
+    path: Path
+    mtime: float
+    generated_time: str
+    # (mtime_ns, size) of forecast_data.json, None when it doesn't exist
+    data_stat: tuple[int, int] | None
+
+
+class ForecastCatalog:
+    """
+    Cached listing of forecast output directories.
+
+    Features:
+    - Rescans at most every ``poll_interval`` seconds
+    - Re-reads ``forecast_data.json`` only for changed directories
+    - Precomputed index HTML with a content-derived ETag
+    - Bounded LRU of forecast JSON payloads keyed by file mtime and size
+    """
+
+    def __init__(self, root: Path, poll_interval: float = 2.0, max_payloads: int = 128):
+        """
+        Initialize the catalog.
+
+        Args:
+            root: Forecast output directory
+            poll_interval: Minimum seconds between directory scans
+            max_payloads: Number of forecast JSON payloads kept in memory
+        """
+        self.root = Path(root)
+        self.poll_interval = poll_interval
+        self.max_payloads = max_payloads
+        self._lock = threading.Lock()
+        self._entries: list[ForecastEntry] = []
+        self._by_id: dict[str, ForecastEntry] = {}
+        self._index: CachedDocument | None = None
+        self._scanned_at: float | None = None
+        self._payloads: OrderedDict[str, tuple[tuple[int, int], CachedDocument]] = OrderedDict()
+        self.scans = 0
+        self.json_reads = 0
+
+    def entries(self) -> list[ForecastEntry]:
+        """Forecast directories, newest first."""
+        self._refresh()
+        return self._entries
+
+    def latest(self) -> ForecastEntry | None:
+        """Most recently modified forecast directory, if any."""
+        entries = self.entries()
+        return entries[0] if entries else None
+
+    def index(self) -> CachedDocument:
+        """Rendered index page."""
+        self._refresh()
+        return self._index
+
+    def payload(self, json_path: Path) -> CachedDocument:
+        """
+        Contents of a forecast JSON file, cached by mtime and size.
+
+        Args:
+            json_path: Validated path to a ``forecast_data.json``
+
+        Returns:
+            CachedDocument with the raw JSON bytes
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not valid JSON
+        """
+        stat = json_path.stat()
+        key = str(json_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._payloads.get(key)
+            if cached is not None and cached[0] == version:
+                self._payloads.move_to_end(key)
+                return cached[1]
+
+        body = json_path.read_bytes()
+        json.loads(body)  # Reject corrupt files rather than serving them
+        self.json_reads += 1
+        document = CachedDocument(
+            body=body,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            last_modified=stat.st_mtime,
+        )
+        with self._lock:
+            self._payloads[key] = (version, document)
+            self._payloads.move_to_end(key)
+            while len(self._payloads) > self.max_payloads:
+                self._payloads.popitem(last=False)
+        return document
+
+    def invalidate(self) -> None:
+        """Force a rescan on the next access."""
+        with self._lock:
+            self._scanned_at = None
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self._scanned_at is not None and now - self._scanned_at < self.poll_interval:
+                return
+            self._scan()
+            self._scanned_at = now
+
+    def _scan(self) -> None:
+        entries = []
+        last_modified = self._stat_mtime(self.root) or 0.0
+        try:
+            items = list(os.scandir(self.root))
+        except FileNotFoundError:
+            items = []
+        for item in items:
+            # A forecast directory can be removed between scandir and stat
+            try:
+                if not item.is_dir():
+                    continue
+                mtime = item.stat().st_mtime
+            except OSError:
+                continue
+            data_path = Path(item.path) / FORECAST_DATA_FILE
+            try:
+                data = data_path.stat()
+                data_stat = (data.st_mtime_ns, data.st_size)
+                last_modified = max(last_modified, data.st_mtime)
+            except OSError:
+                data_stat = None
+
+            previous = self._by_id.get(item.name)
+            if previous is not None and previous.data_stat == data_stat:
+                generated = previous.generated_time
+            else:
+                generated = self._read_generated_time(data_path) if data_stat else "Unknown"
+            entries.append(ForecastEntry(item.name, Path(item.path), mtime, generated, data_stat))
+            last_modified = max(last_modified, mtime)
+
+        entries.sort(key=lambda entry: entry.mtime, reverse=True)
+        self._entries = entries
+        self._by_id = {entry.forecast_id: entry for entry in entries}
+        body = render_index(entries).encode("utf-8")
+        if self._index is None or self._index.body != body:
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            self._index = CachedDocument(body, etag, last_modified)
+        self.scans += 1
+
+    def _read_generated_time(self, path: Path) -> str:
+        self.json_reads += 1
+        try:
+            return json.loads(path.read_text()).get("generated_time", "Unknown")
+        except Exception:
+            return "Unknown"
+
+    @staticmethod
+    def _stat_mtime(path: Path) -> float | None:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+
+def render_index(entries: list[ForecastEntry]) -> str:
+    """Render the forecast index page."""
+    if not entries:
+        body = "<p>No forecasts generated yet. Run the pipeline to create one.</p>"
+    else:
+        items = "".join(
+            f'<li><a href="/forecasts/{entry.forecast_id}">{entry.forecast_id}</a> '
+            f"<small>({html.escape(str(entry.generated_time))})</small></li>"
+            for entry in entries
+        )
+        body = f"<ul>{items}</ul>"
+
+    return f"""<!DOCTYPE html>
+<html lang=\"en\">
+<head>
+  <meta charset=\"utf-8\">
+  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
+  <title>SurfCastAI Forecasts</title>
+  <style>
+    body {{ font-family: Arial, sans-serif; margin: 0 auto; max-width: 640px; padding: 24px; background: #f5f7fa; }}
+    h1 {{ text-align: center; color: #0066cc; }}
+    ul {{ list-style: none; padding: 0; }}
+    li {{ background: #fff; margin-bottom: 12px; padding: 12px; border-radius: 6px; box-shadow: 0 1px 4px rgba(0,0,0,0.08); }}
+    a {{ color: #0066cc; text-decoration: none; font-weight: 600; }}
+    a:hover {{ text-decoration: underline; }}
+    small {{ color: #666; }}
+  </style>
+</head>
+<body>
+  <h1>SurfCastAI Forecasts</h1>
+  {body}
+</body>
+</html>"""
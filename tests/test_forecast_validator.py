@@ -5,12 +5,14 @@ Tests validation logic, metrics calculation (MAE, RMSE, categorical accuracy,
 direction accuracy), and integration with ValidationDatabase.
 """
 
+import asyncio
 import sqlite3
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from src.validation import ForecastValidator, ValidationDatabase
@@ -247,6 +249,105 @@ class TestForecastValidator:
         assert metrics["direction_accuracy"] is None
         assert metrics["sample_size"] == 0
 
+    def test_match_window_and_tie_break(self, temp_db):
+        """Test configurable match window and tie-breaking between equidistant observations."""
+        base_time = datetime(2025, 10, 7, 12, 0, 0)
+        predictions = [{"id": 1, "shore": "North Shore", "valid_time": base_time, "height": 6.0}]
+        actuals = [
+            {
+                "id": later,
+                "shore": "North Shore",
+                "observation_time": base_time + timedelta(minutes=offset),
+                "wave_height": 5.0,
+            }
+            for later, offset in ((102, 90), (101, -90))
+        ]
+
+        earlier = ForecastValidator(temp_db)._match_predictions_to_actuals(predictions, actuals)
+        assert earlier[0]["actual"]["id"] == 101
+        assert earlier[0]["time_diff_hours"] == 1.5
+
+        later = ForecastValidator(temp_db, tie_break="later")._match_predictions_to_actuals(
+            predictions, actuals
+        )
+        assert later[0]["actual"]["id"] == 102
+
+        narrow = ForecastValidator(temp_db, match_window_hours=1.0)
+        assert narrow._match_predictions_to_actuals(predictions, actuals) == []
+
+        with pytest.raises(ValueError):
+            ForecastValidator(temp_db, tie_break="closest")
+
+    def test_match_agrees_with_exhaustive_search(self, validator):
+        """Test the sorted matcher against a brute-force nearest-observation search."""
+        rng = np.random.default_rng(7)
+        base_time = datetime(2025, 10, 1)
+        shores = ["North Shore", "South Shore"]
+
+        actuals = [
+            {
+                "id": i,
+                "shore": shores[i % 2],
+                "observation_time": base_time + timedelta(minutes=int(minutes)),
+                "wave_height": 5.0,
+            }
+            for i, minutes in enumerate(rng.choice(30 * 24 * 60, size=400, replace=False))
+        ]
+        predictions = [
+            {
+                "id": i,
+                "shore": shores[i % 3 % 2],
+                "valid_time": base_time + timedelta(hours=3 * i),
+                "height": 6.0,
+            }
+            for i in range(240)
+        ]
+
+        matches = validator._match_predictions_to_actuals(predictions, actuals)
+
+        expected = {}
+        for pred in predictions:
+            # Equidistant observations resolve to the earlier one
+            candidates = [
+                (abs(pred["valid_time"] - a["observation_time"]), a["observation_time"], a["id"])
+                for a in actuals
+                if a["shore"] == pred["shore"]
+            ]
+            diff, _, actual_id = min(candidates)
+            if diff <= timedelta(hours=2):
+                expected[pred["id"]] = actual_id
+
+        assert {m["prediction"]["id"]: m["actual"]["id"] for m in matches} == expected
+
+    def test_calculate_metrics_skips_missing_values(self, validator):
+        """Test that pairs missing a value are left out of that metric only."""
+        matches = [
+            {
+                "prediction": {"height": 8.0, "direction": "NW", "category": "large"},
+                "actual": {"wave_height": 9.0, "direction": 350.0},
+            },
+            {
+                "prediction": {"height": None, "direction": None, "category": None},
+                "actual": {"wave_height": 4.0, "direction": 180.0},
+            },
+            {
+                "prediction": {"height": 5.0, "direction": "BOGUS", "category": "small"},
+                "actual": {"wave_height": None, "direction": None},
+            },
+        ]
+
+        metrics = validator._calculate_metrics(matches)
+
+        assert metrics["mae"] == 1.0
+        assert metrics["rmse"] == 1.0
+        assert metrics["categorical_accuracy"] == 1.0
+        assert metrics["direction_accuracy"] == 0.0
+        assert metrics["sample_size"] == 3
+        # Plain floats, not np.float64, so metrics serialize cleanly
+        for key in ("mae", "rmse"):
+            assert isinstance(metrics[key], float)
+            assert not isinstance(metrics[key], np.floating)
+
     @pytest.mark.asyncio
     async def test_get_forecast_data(self, validator, temp_db):
         """Test forecast data retrieval from database."""
@@ -279,7 +380,7 @@ class TestForecastValidator:
         )
 
         # Get forecast data
-        data = await validator._get_forecast_data(forecast_id, hours_after=24)
+        data = await validator.get_forecast_data(forecast_id, hours_after=24)
 
         assert data is not None
         assert data["forecast_id"] == forecast_id
@@ -309,13 +410,13 @@ class TestForecastValidator:
         )
 
         # Should return None for recent forecasts
-        data = await validator._get_forecast_data(forecast_id, hours_after=24)
+        data = await validator.get_forecast_data(forecast_id, hours_after=24)
         assert data is None
 
     @pytest.mark.asyncio
     async def test_get_forecast_data_not_found(self, validator):
         """Test forecast not found in database."""
-        data = await validator._get_forecast_data("nonexistent-forecast", hours_after=24)
+        data = await validator.get_forecast_data("nonexistent-forecast", hours_after=24)
         assert data is None
 
     @pytest.mark.asyncio
@@ -378,6 +479,63 @@ class TestForecastValidator:
             assert all("id" in obs for obs in actuals)
             assert all("shore" in obs for obs in actuals)
 
+    @pytest.mark.asyncio
+    async def test_fetch_actual_observations_concurrent_bulk_save(self, validator, temp_db):
+        """Test that shores are fetched concurrently and observations are saved in bulk."""
+        base_time = datetime(2025, 10, 7, 12, 0, 0)
+        predictions = [
+            {"shore": "North Shore", "valid_time": base_time},
+            {"shore": "South Shore", "valid_time": base_time},
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def mock_fetch_observations(shore, start_time, end_time):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            buoy_id = "51001" if shore == "north_shore" else "51003"
+            return [{"buoy_id": buoy_id, "observation_time": base_time, "wave_height": 5.0}]
+
+        with patch("src.validation.forecast_validator.BuoyDataFetcher") as MockFetcher:
+            mock_fetcher = MockFetcher.return_value.__aenter__.return_value
+            mock_fetcher.fetch_observations = AsyncMock(side_effect=mock_fetch_observations)
+
+            with patch.object(temp_db, "save_actual") as save_actual:
+                first = await validator._fetch_actual_observations(predictions)
+                second = await validator._fetch_actual_observations(predictions)
+
+        assert peak == 2
+        save_actual.assert_not_called()
+        assert [obs["id"] for obs in first] == [obs["id"] for obs in second]
+        with sqlite3.connect(temp_db.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM actuals").fetchone()[0] == 2
+
+    def test_fetch_actual_observations_keeps_rows_when_bulk_save_fails(self, validator, temp_db):
+        """One unsaveable observation does not discard the other shores' data."""
+        base_time = datetime(2025, 10, 7, 12, 0, 0)
+        predictions = [
+            {"shore": "North Shore", "valid_time": base_time},
+            {"shore": "South Shore", "valid_time": base_time},
+        ]
+
+        async def mock_fetch_observations(shore, start_time, end_time):
+            buoy_id = "51001" if shore == "north_shore" else None
+            return [{"buoy_id": buoy_id, "observation_time": base_time, "wave_height": 5.0}]
+
+        with patch("src.validation.forecast_validator.BuoyDataFetcher") as MockFetcher:
+            mock_fetcher = MockFetcher.return_value.__aenter__.return_value
+            mock_fetcher.fetch_observations = AsyncMock(side_effect=mock_fetch_observations)
+
+            actuals = asyncio.run(validator._fetch_actual_observations(predictions))
+
+        assert [(obs["buoy_id"], obs["shore"]) for obs in actuals] == [("51001", "North Shore")]
+        assert isinstance(actuals[0]["id"], int)
+        with sqlite3.connect(temp_db.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM actuals").fetchone()[0] == 1
+
     @pytest.mark.asyncio
     async def test_validate_forecast_integration(self, validator, temp_db):
         """Integration test for complete validation flow."""
@@ -223,6 +223,7 @@ class TestBaseAgent(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(metadata['file_path'], '/tmp/data/test.json')
         self.assertEqual(metadata['size_bytes'], 1024)
         self.assertEqual(metadata['type'], 'json')
+        self.assertTrue(agent.http_client.download.call_args.kwargs['stream'])
 
     async def test_download_file_failure(self):
         """Test failed file download."""
@@ -68,6 +68,40 @@ def test_cdip_agent_enriches_metadata(tmp_path):
     assert entry["raw_last_updated"] == "2025-10-15T12:05:00Z"
 
 
+def test_cdip_agent_removes_unparseable_netcdf(tmp_path):
+    """A streamed netCDF file that fails to parse is not left in the output directory."""
+    config = MagicMock()
+    config.get.return_value = {
+        "sources": [
+            {
+                "id": "waimea_106",
+                "format": "cdip_netcdf",
+                "url": "https://thredds.cdip.ucsd.edu/thredds/fileServer/cdip/realtime/106p1_rt.nc",
+            }
+        ]
+    }
+    agent = CDIPAgent(config)
+    agent.ensure_http_client = AsyncMock()
+
+    async def stream_download(url, custom_file_path=None, stream=False, **kwargs):
+        custom_file_path.write_bytes(b"<html>not netCDF</html>")
+        return SimpleNamespace(
+            success=True,
+            content=None,
+            file_path=str(custom_file_path),
+            content_type="text/html",
+            status_code=200,
+            error=None,
+        )
+
+    agent.http_client = SimpleNamespace(download=AsyncMock(side_effect=stream_download))
+
+    entry = asyncio.run(agent.collect(tmp_path))[0]
+
+    assert entry["error"]
+    assert not (tmp_path / "nearshore_buoys" / "waimea_106.nc").exists()
+
+
 def test_cdip_agent_netcdf_format(tmp_path):
     """Test CDIP THREDDS netCDF parsing."""
     pytest.importorskip("xarray")
@@ -118,20 +152,26 @@ def test_cdip_agent_netcdf_format(tmp_path):
         with open(tmp.name, "rb") as f:
             nc_content = f.read()
 
-    download_result = SimpleNamespace(
-        success=True,
-        content=nc_content,
-        content_type="application/x-netcdf",
-        status_code=200,
-        error=None,
-    )
-
-    agent.http_client = SimpleNamespace(download=AsyncMock(return_value=download_result))
+    async def stream_download(url, custom_file_path=None, stream=False, **kwargs):
+        # netCDF is streamed to its final path rather than returned in memory
+        assert stream
+        custom_file_path.write_bytes(nc_content)
+        return SimpleNamespace(
+            success=True,
+            content=None,
+            file_path=str(custom_file_path),
+            content_type="application/x-netcdf",
+            status_code=200,
+            error=None,
+        )
+
+    agent.http_client = SimpleNamespace(download=AsyncMock(side_effect=stream_download))
 
     metadata = asyncio.run(agent.collect(tmp_path))
 
     assert metadata
     entry = metadata[0]
+    assert entry["file_path"] == str(tmp_path / "nearshore_buoys" / "waimea_106.nc")
     assert entry["station_id"] == "waimea_106"
     assert entry["station_name"] == "Waimea Bay"
     assert entry["station_lat"] == pytest.approx(21.65)
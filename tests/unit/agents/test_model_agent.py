@@ -7,6 +7,7 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
 from src.agents.model_agent import ModelAgent
@@ -142,3 +143,116 @@ def test_model_agent_recognizes_erddap_urls():
 
     assert model_type_global == "ww3"
     assert location_global == "global"
+
+
+def test_model_agent_erddap_subsets_get_distinct_files(tmp_path):
+    """Subsets of one dataset must not overwrite each other's download."""
+    agent = _build_agent(tmp_path)
+    download_result = SimpleNamespace(success=False, error="offline")
+    download = AsyncMock(return_value=download_result)
+    agent.http_client = SimpleNamespace(download=download)
+    base = "https://pae-paha.pacioos.hawaii.edu/erddap/griddap/ww3_hawaii.csv"
+    urls = [
+        f"{base}?Thgt[(last)][0][(21.5):(21.8)][(201.7):(202.1)]",
+        f"{base}?Thgt[(last)][0][(21.2):(21.3)][(202.1):(202.2)]",
+    ]
+
+    for url in urls:
+        asyncio.run(agent._process_model_data_file(url, tmp_path, "ww3", "hawaii"))
+
+    paths = [call.kwargs["custom_file_path"] for call in download.call_args_list]
+    assert len(set(paths)) == 2
+    assert all(path.name.startswith("model_ww3_hawaii_ww3_hawaii_") for path in paths)
+    assert all(path.suffix == ".csv" for path in paths)
+
+
+def test_model_agent_erddap_csv_skips_missing_values(tmp_path):
+    """Land points (NaN) and empty cells are excluded from the statistics."""
+    agent = _build_agent(tmp_path)
+    csv_path = tmp_path / "ww3_land.csv"
+    csv_path.write_bytes(
+        b"# Dataset: ww3_hawaii\r\n"
+        b"time,depth,latitude,longitude,Thgt,Tper,Tdir,shgt,sper,sdir\r\n"
+        b"UTC,m,degrees_north,degrees_east,meters,seconds,degrees,meters,seconds,degrees\r\n"
+        b"2025-10-22T18:00:00Z,0.0,21.0,200.0,2.0,12.0,300,1.5,14.0,310\r\n"
+        b"2025-10-22T18:00:00Z,0.0,21.0,200.05,NaN,NaN,NaN,NaN,NaN,NaN\r\n"
+        b"2025-10-22T18:00:00Z,0.0,21.05,200.0,3.0,,320,,,\r\n"
+        b"2025-10-23T00:00:00Z,0.0,21.0,200.0,NaN,NaN,NaN,NaN,NaN,NaN\r\n"
+    )
+
+    summary = agent._parse_ww3_csv(csv_path)
+
+    assert summary["metadata"] == {"dataset": "ww3_hawaii"}
+    assert summary["units"]["latitude"] == "degrees_north"
+    assert summary["rows"] == 4
+    assert summary["time_steps"] == 2
+    # The all-land time step has no event
+    assert len(summary["events"]) == 1
+    event = summary["events"][0]
+    assert event["grid_points"] == 3
+    assert event["thgt_mean_m"] == pytest.approx(2.5)
+    assert event["thgt_min_m"] == pytest.approx(2.0)
+    assert event["tper_mean_s"] == pytest.approx(12.0)
+    assert event["shgt_mean_m"] == pytest.approx(1.5)
+    assert summary["total_height_max_m"] == pytest.approx(3.0)
+    assert summary["peak_direction_range_deg"] == [300.0, 320.0]
+
+
+def test_model_agent_erddap_csv_groups_large_grid_by_time(tmp_path):
+    """Regional pulls are grouped per time step, in time order, regardless of row order."""
+    agent = _build_agent(tmp_path)
+    steps, points = 24, 1600
+    rng = np.random.default_rng(0)
+    heights = rng.uniform(0.5, 4.0, (steps, points)).round(3)
+    times = [f"2025-10-{15 + t // 24:02d}T{t % 24:02d}:00:00Z" for t in range(steps)]
+    order = rng.permutation(steps * points)
+    lines = [
+        "time,depth,latitude,longitude,Thgt,Tper,Tdir,shgt,sper,sdir",
+        "UTC,m,degrees_north,degrees_east,meters,seconds,degrees,meters,seconds,degrees",
+    ]
+    for index in order:
+        step, point = divmod(int(index), points)
+        lines.append(
+            f"{times[step]},0.0,{20 + point // 40 * 0.05:.2f},{200 + point % 40 * 0.05:.2f},"
+            f"{heights[step, point]},13.0,315,1.0,14.0,310"
+        )
+    csv_path = tmp_path / "ww3_region.csv"
+    csv_path.write_text("\n".join(lines) + "\n")
+
+    summary = agent._parse_ww3_csv(csv_path)
+
+    assert summary["rows"] == steps * points
+    assert summary["time_steps"] == steps
+    assert summary["grid_points_per_time"] == points
+    assert [event["timestamp"] for event in summary["events"]] == times[:12]
+    for step, event in enumerate(summary["events"]):
+        assert event["thgt_mean_m"] == pytest.approx(heights[step].mean())
+        assert event["thgt_max_m"] == pytest.approx(heights[step].max())
+    assert summary["total_height_max_m"] == pytest.approx(heights[:12].max())
+
+
+def test_model_agent_nomads_csv_with_ragged_rows(tmp_path):
+    """Short rows are dropped and empty cells become None, as with the row parser."""
+    agent = _build_agent(tmp_path)
+    csv_path = tmp_path / "ww3_ragged.csv"
+    csv_path.write_text(
+        "Date,Significant Wave Height,Peak Period,Peak Direction\n"
+        "2025-10-15T00:00Z,2.5,,320\n"
+        "2025-10-15T03:00Z,2.7\n"
+        "  # Run Time: 2025-10-15T00:00Z\n"
+        "2025-10-15T06:00Z,3.1,16,325,extra\n"
+    )
+
+    summary = agent._parse_ww3_csv(csv_path)
+
+    assert summary["format"] == "nomads"
+    assert summary["rows"] == 2
+    assert summary["metadata"] == {"run_time": "2025-10-15T00:00Z"}
+    assert summary["significant_height_max"] == pytest.approx(3.1)
+    assert summary["peak_period_range"] == [16.0, 16.0]
+    assert summary["events"][0] == {
+        "timestamp": "2025-10-15T00:00Z",
+        "hs_m": 2.5,
+        "tp_s": None,
+        "dp_deg": 320.0,
+    }
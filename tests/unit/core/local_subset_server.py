@@ -0,0 +1,202 @@
+"""
+File-based stand-in for THREDDS OPeNDAP and ERDDAP griddap servers.
+
+Serves netCDF files from a local directory through the ``HTTPClient.download``
+interface so agents can be tested against real constraint expressions:
+
+- ``<base>/thredds/dodsC/<path>`` + ``.dds`` / ``.das`` / ``.ascii?<constraint>``
+- ``<base>/thredds/fileServer/<path>`` (whole file)
+- ``<base>/erddap/griddap/<dataset>.csv?<constraint>`` (``<dataset>.nc`` on disk)
+
+Requires xarray and netCDF4.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+import numpy as np
+import xarray as xr
+
+from src.core.http_client import DownloadResult
+
+_PROJECTION_RE = re.compile(r"(\w+)((?:\[[^\]]*\])*)")
+_DAP_TYPES = {"f": "Float", "i": "Int", "u": "UInt"}
+
+
+class LocalSubsetServer:
+    """Answer OPeNDAP / ERDDAP requests from netCDF files under ``root``."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.requests: list[str] = []
+        self.bytes_served = 0
+
+    async def download(
+        self,
+        url: str,
+        save_to_disk: bool = True,
+        custom_file_path: Path | None = None,
+        stream: bool = False,
+    ) -> DownloadResult:
+        self.requests.append(url)
+        result = DownloadResult(url)
+        try:
+            body, content_type = self._respond(url)
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            result.status_code = 404
+            result.error = f"HTTP 404: {e}"
+            return result
+
+        self.bytes_served += len(body)
+        result.success = True
+        result.status_code = 200
+        result.content_type = content_type
+        result.size_bytes = len(body)
+        if stream or (save_to_disk and custom_file_path is not None):
+            custom_file_path.write_bytes(body)
+            result.file_path = str(custom_file_path)
+        if not stream:
+            result.content = body
+        return result
+
+    def _respond(self, url: str) -> tuple[bytes, str]:
+        parsed = urlparse(url)
+        path, query = unquote(parsed.path), unquote(parsed.query)
+
+        if "/thredds/fileServer/" in path:
+            return self._file(path.split("/thredds/fileServer/", 1)[1]).read_bytes(), (
+                "application/x-netcdf"
+            )
+        if "/thredds/dodsC/" in path:
+            relative, _, suffix = path.split("/thredds/dodsC/", 1)[1].rpartition(".")
+            with xr.open_dataset(self._file(relative), decode_times=False) as ds:
+                if suffix == "dds":
+                    return self._dds(ds).encode(), "text/plain"
+                if suffix == "das":
+                    return self._das(ds).encode(), "text/plain"
+                if suffix == "ascii":
+                    body = self._dds(ds) + "\n" + "-" * 45 + "\n" + self._ascii(ds, query)
+                    return body.encode(), "text/plain"
+            raise ValueError(f"unsupported OPeNDAP response .{suffix}")
+        if "/erddap/griddap/" in path:
+            dataset, _, suffix = path.split("/erddap/griddap/", 1)[1].rpartition(".")
+            if suffix != "csv":
+                raise ValueError(f"unsupported ERDDAP response .{suffix}")
+            with xr.open_dataset(self._file(f"{dataset}.nc")) as ds:
+                return self._erddap_csv(ds, query).encode(), "text/csv"
+        raise FileNotFoundError(path)
+
+    def _file(self, relative: str) -> Path:
+        path = (self.root / relative).resolve()
+        if not path.is_file() or self.root.resolve() not in path.parents:
+            raise FileNotFoundError(relative)
+        return path
+
+    @staticmethod
+    def _dap_type(values: np.ndarray) -> str:
+        return _DAP_TYPES.get(values.dtype.kind, "Float") + str(values.dtype.itemsize * 8)
+
+    def _dds(self, ds: xr.Dataset) -> str:
+        lines = ["Dataset {"]
+        for name, variable in ds.variables.items():
+            dims = "".join(f"[{dim} = {ds.sizes[dim]}]" for dim in variable.dims)
+            lines.append(f"    {self._dap_type(variable.values)} {name}{dims};")
+        lines.append("} local;")
+        return "\n".join(lines)
+
+    def _das(self, ds: xr.Dataset) -> str:
+        lines = ["Attributes {"]
+        containers = [(name, variable.attrs) for name, variable in ds.variables.items()]
+        for name, attrs in containers + [("NC_GLOBAL", ds.attrs)]:
+            lines.append(f"    {name} {{")
+            for key, value in attrs.items():
+                if isinstance(value, str):
+                    lines.append(f'        String {key} "{value}";')
+                else:
+                    values = np.atleast_1d(value)
+                    joined = ", ".join(str(v) for v in values.tolist())
+                    lines.append(f"        {self._dap_type(values)} {key} {joined};")
+            lines.append("    }")
+        lines.append("}")
+        return "\n".join(lines)
+
+    def _ascii(self, ds: xr.Dataset, constraint: str) -> str:
+        blocks = []
+        for name, hyperslab in _PROJECTION_RE.findall(constraint):
+            values = ds[name].values
+            slices = tuple(
+                slice(int(start), int(stop) + 1, int(step))
+                for start, step, stop in re.findall(r"\[(\d+):(\d+):(\d+)\]", hyperslab)
+            )
+            values = values[slices] if slices else values
+            header = name + "".join(f"[{size}]" for size in values.shape)
+            if values.ndim <= 1:
+                rows = [", ".join(str(v) for v in np.atleast_1d(values).tolist())]
+            else:
+                rows = [
+                    "".join(f"[{i}]" for i in index)
+                    + ", "
+                    + ", ".join(str(v) for v in values[index].tolist())
+                    for index in itertools.product(*(range(n) for n in values.shape[:-1]))
+                ]
+            blocks.append("\n".join([header] + rows))
+        return "\n\n".join(blocks) + "\n"
+
+    def _erddap_csv(self, ds: xr.Dataset, query: str) -> str:
+        projections = _PROJECTION_RE.findall(query)
+        names = [name for name, _ in projections]
+        axes = list(ds[names[0]].dims)
+        selectors = re.findall(r"\[([^\]]*)\]", projections[0][1])
+        indices = [
+            self._select(ds[axis].values, selector)
+            for axis, selector in zip(axes, selectors, strict=True)
+        ]
+
+        lines = [
+            ",".join(axes + names),
+            ",".join(
+                [ds[axis].attrs.get("units", "UTC") for axis in axes]
+                + [ds[name].attrs.get("units", "") for name in names]
+            ),
+        ]
+        for point in itertools.product(*indices):
+            coords = [self._format(ds[axis].values[i]) for axis, i in zip(axes, point, strict=True)]
+            values = [self._format(ds[name].values[point]) for name in names]
+            lines.append(",".join(coords + values))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _select(axis: np.ndarray, selector: str) -> list[int]:
+        """Resolve an ERDDAP axis selector (index or value form) to indices."""
+        last = len(axis) - 1
+
+        def index(token: str) -> int:
+            token = token.strip()
+            if token.startswith("("):
+                value = token.strip("()")
+                target = (
+                    np.datetime64(value.rstrip("Z"))
+                    if np.issubdtype(axis.dtype, np.datetime64)
+                    else float(value)
+                )
+                return int(np.argmin(np.abs(axis - target)))
+            if token.startswith("last"):
+                return last - int(token[4:].lstrip("-") or 0)
+            return int(token)
+
+        parts = re.split(r":(?![^(]*\))", selector)
+        if len(parts) == 1:
+            return [index(parts[0])]
+        start, stop = index(parts[0]), index(parts[-1])
+        step = int(parts[1]) if len(parts) == 3 else 1
+        return list(range(start, stop + 1, step))
+
+    @staticmethod
+    def _format(value) -> str:
+        if isinstance(value, np.datetime64):
+            return np.datetime_as_string(value, unit="s") + "Z"
+        return f"{float(value):g}"
@@ -71,5 +71,64 @@ class TestBundleRetention(unittest.TestCase):
         self.assertNotIn(old_incomplete.name, removed_ids)
 
 
+class TestBundleDeduplication(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = TemporaryDirectory()
+        self.data_root = Path(self.tempdir.name)
+        self.manager = BundleManager(self.data_root)
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def _write_bundle(self, bundle_id: str, chart: bytes) -> Path:
+        bundle_dir = _create_bundle(self.data_root, bundle_id, complete=True, age_days=0)
+        (bundle_dir / "charts").mkdir()
+        (bundle_dir / "charts" / "surface.gif").write_bytes(chart)
+        (bundle_dir / "charts" / "metadata.json").write_text("[]")
+        return bundle_dir
+
+    def test_identical_files_share_one_blob(self) -> None:
+        first = self._write_bundle("bundle-1", b"chart-v1")
+        second = self._write_bundle("bundle-2", b"chart-v1")
+
+        self.manager.deduplicate_bundle("bundle-1")
+        stats = self.manager.deduplicate_bundle("bundle-2")
+
+        self.assertEqual(stats["deduplicated"], 1)
+        self.assertEqual(stats["bytes_saved"], len(b"chart-v1"))
+        self.assertTrue(
+            os.path.samefile(first / "charts" / "surface.gif", second / "charts" / "surface.gif")
+        )
+        self.assertEqual(
+            self.manager.get_bundle_manifest("bundle-2"),
+            self.manager.get_bundle_manifest("bundle-1"),
+        )
+        # Metadata and processed outputs stay private to the bundle
+        self.assertNotIn("charts/metadata.json", self.manager.get_bundle_manifest("bundle-1"))
+        self.assertEqual(self.manager.blob_reference_counts().most_common(1)[0][1], 2)
+
+    def test_blobs_are_released_when_last_reference_is_removed(self) -> None:
+        self._write_bundle("bundle-1", b"shared")
+        second = self._write_bundle("bundle-2", b"shared")
+        for bundle_id in ("bundle-1", "bundle-2"):
+            self.manager.deduplicate_bundle(bundle_id)
+        digest = next(iter(self.manager.get_bundle_manifest("bundle-1").values()))
+        blob = self.manager.blob_store.blob_path(digest)
+
+        self.assertTrue(self.manager._remove_bundle("bundle-1"))
+        self.assertTrue(blob.exists())
+        self.assertEqual((second / "charts" / "surface.gif").read_bytes(), b"shared")
+
+        self.assertTrue(self.manager._remove_bundle("bundle-2"))
+        self.assertFalse(blob.exists())
+
+    def test_blob_dir_is_not_listed_as_bundle(self) -> None:
+        self._write_bundle("bundle-1", b"data")
+        self.manager.deduplicate_bundle("bundle-1")
+
+        bundle_ids = {b["bundle_id"] for b in self.manager.list_bundles(include_incomplete=True)}
+        self.assertEqual(bundle_ids, {"bundle-1"})
+
+
 if __name__ == "__main__":
     unittest.main()
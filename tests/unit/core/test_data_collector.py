@@ -1,6 +1,7 @@
 """Tests for DataCollector metrics resets."""
 
 import asyncio
+import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -85,5 +86,135 @@ class TestDataCollectorStatsReset(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(second_result["stats"]["agents"]["dummy"]["failed"], expected_failed)
 
 
+class _StreamingAgent:
+    """Agent stub that yields records one at a time, optionally after a delay."""
+
+    def __init__(self, count: int, delay: float = 0.0, fail_after: int | None = None) -> None:
+        self.count = count
+        self.delay = delay
+        self.fail_after = fail_after
+
+    async def collect_stream(self, agent_dir: Path):
+        for i in range(self.count):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("agent exploded")
+            await asyncio.sleep(self.delay)
+            yield {"name": f"file_{i}", "status": "success", "size_bytes": 100}
+
+
+class TestDataCollectorStreaming(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.config = Config()
+        self.config._config = {
+            "general": {"data_directory": self.temp_dir.name},
+            "data_collection": {"stream_queue_size": 2},
+            "data_sources": {},
+        }
+        self.collector = DataCollector(self.config)
+
+    async def asyncTearDown(self) -> None:
+        await asyncio.sleep(0)
+        self.temp_dir.cleanup()
+
+    async def test_records_are_journaled_and_metadata_written(self) -> None:
+        self.collector.agents = {"fast": _StreamingAgent(5), "legacy": _DummyAgent()}
+        self.collector.agents["legacy"].metadata = [{"status": "success", "size_bytes": 10}]
+
+        result = await self.collector.collect_data()
+
+        bundle_dir = Path(result["bundle_dir"])
+        self.assertEqual(result["stats"]["total_files"], 6)
+        self.assertEqual(result["stats"]["total_size_bytes"], 510)
+        self.assertEqual(result["metadata"]["collection_status"], "complete")
+
+        journal_lines = (bundle_dir / "metadata_journal.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in journal_lines]
+        self.assertEqual(sum(1 for r in records if "record" in r), 6)
+
+        self.assertEqual(len(json.loads((bundle_dir / "fast" / "metadata.json").read_text())), 5)
+        self.assertEqual(len(json.loads((bundle_dir / "all_metadata.json").read_text())), 6)
+        self.assertEqual(list(bundle_dir.rglob("*.partial")), [])
+
+    async def test_completion_callback_fires_before_slow_agents_finish(self) -> None:
+        self.collector.agents = {
+            "slow": _StreamingAgent(3, delay=0.05),
+            "fast": _StreamingAgent(1),
+        }
+        completed: list[str] = []
+
+        async def on_complete(agent_name: str, stats: dict) -> None:
+            completed.append(agent_name)
+            if agent_name == "fast":
+                # Finished agent's metadata is already on disk and usable
+                metadata_path = next(Path(self.temp_dir.name).glob("*/fast/metadata.json"))
+                self.assertEqual(len(json.loads(metadata_path.read_text())), 1)
+
+        await self.collector.collect_data(on_agent_complete=on_complete)
+
+        self.assertEqual(completed, ["fast", "slow"])
+
+    async def test_slow_completion_callback_does_not_stall_draining(self) -> None:
+        self.collector.agents = {
+            "slow": _StreamingAgent(10, delay=0.01),
+            "fast": _StreamingAgent(1),
+        }
+        completed: list[str] = []
+
+        async def on_complete(agent_name: str, stats: dict) -> None:
+            if agent_name == "fast":
+                # Only returns once the other agent has been drained past the bounded queue
+                while not list(Path(self.temp_dir.name).glob("*/slow/metadata.json")):
+                    await asyncio.sleep(0.01)
+            completed.append(agent_name)
+
+        await asyncio.wait_for(self.collector.collect_data(on_agent_complete=on_complete), 5)
+
+        self.assertEqual(completed, ["slow", "fast"])
+
+    async def test_failed_agent_keeps_partial_records(self) -> None:
+        self.collector.agents = {
+            "flaky": _StreamingAgent(4, fail_after=2),
+            "steady": _StreamingAgent(3),
+        }
+
+        result = await self.collector.collect_data()
+
+        agent_result = result["metadata"]["agent_results"]["flaky"]
+        self.assertEqual(agent_result["status"], "error")
+        self.assertEqual(agent_result["files_collected"], 2)
+        self.assertEqual(agent_result["partial_stats"]["successful"], 2)
+        bundle_dir = Path(result["bundle_dir"])
+        self.assertEqual(len(json.loads((bundle_dir / "flaky" / "metadata.json").read_text())), 2)
+
+        # The failed agent is reported separately, outside the success/row totals
+        stats = result["metadata"]["stats"]
+        self.assertEqual(stats["failed_agents"], ["flaky"])
+        self.assertEqual((stats["total_files"], stats["successful_files"]), (3, 3))
+        self.assertNotIn("flaky", result["stats"]["agents"])
+        events = [
+            json.loads(line)
+            for line in (bundle_dir / "metadata_journal.jsonl").read_text().splitlines()
+        ]
+        self.assertIn(
+            {"agent": "flaky", "event": "error", "error": "agent exploded"},
+            [event for event in events if "event" in event],
+        )
+
+    async def test_batch_mode_matches_streaming_stats(self) -> None:
+        self.config._config["data_collection"]["streaming"] = False
+        agent = _DummyAgent()
+        agent.metadata = [{"status": "success", "size_bytes": 1}, {"status": "failed"}]
+        self.collector.agents = {"dummy": agent}
+
+        result = await self.collector.collect_data()
+
+        self.assertEqual(result["stats"]["successful_files"], 1)
+        self.assertEqual(result["stats"]["failed_files"], 1)
+        bundle_dir = Path(result["bundle_dir"])
+        self.assertFalse((bundle_dir / "metadata_journal.jsonl").exists())
+        self.assertEqual(len(json.loads((bundle_dir / "all_metadata.json").read_text())), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
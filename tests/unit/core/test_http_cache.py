@@ -0,0 +1,197 @@
+"""
+Unit tests for the HTTP validator cache and HTTPClient conditional GETs.
+"""
+
+import asyncio
+import hashlib
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+
+from src.core.http_cache import HTTPValidatorCache
+from src.core.http_client import HTTPClient
+from src.core.rate_limiter import RateLimitConfig, RateLimiter
+
+URL = "http://example.com/data/51001.txt"
+
+
+def _response(status: int, body: bytes = b"", headers: dict | None = None) -> AsyncMock:
+    response = AsyncMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=body)
+    return response
+
+
+class TestHTTPValidatorCache(unittest.TestCase):
+    """Tests for the HTTPValidatorCache class."""
+
+    def setUp(self):
+        self.tempdir = TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        self.cache = HTTPValidatorCache(self.root / "cache")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_store_requires_validators_or_freshness(self):
+        self.assertIsNone(self.cache.store(URL, b"body", {}, 4))
+        self.assertIsNone(self.cache.lookup(URL))
+
+        entry = self.cache.store(URL, b"body", {"ETag": '"abc"'}, 4)
+        self.assertEqual(entry.conditional_headers(), {"If-None-Match": '"abc"'})
+        self.assertEqual(self.cache.lookup(URL).etag, '"abc"')
+
+    def test_no_store_invalidates_existing_entry(self):
+        self.cache.store(URL, b"body", {"ETag": '"abc"'}, 4)
+        self.cache.store(URL, b"body", {"ETag": '"abc"', "Cache-Control": "no-store"}, 4)
+        self.assertIsNone(self.cache.lookup(URL))
+
+    def test_max_age_makes_entry_fresh(self):
+        entry = self.cache.store(URL, b"body", {"Cache-Control": "public, max-age=600"}, 4)
+        self.assertTrue(entry.is_fresh)
+
+    def test_replacing_body_keeps_linked_copies_intact(self):
+        entry = self.cache.store(URL, b"old", {"ETag": '"v1"'}, 3)
+        bundle_file = self.cache.materialize(entry, self.root / "bundle-1" / "51001.txt")
+
+        self.cache.store(URL, b"new", {"ETag": '"v2"'}, 3)
+
+        self.assertEqual(bundle_file.read_bytes(), b"old")
+        self.assertEqual(self.cache.read_body(self.cache.lookup(URL)), b"new")
+
+    def test_copy_mode_does_not_share_inode(self):
+        cache = HTTPValidatorCache(self.root / "copy-cache", link_mode="copy")
+        entry = cache.store(URL, b"body", {"ETag": '"abc"'}, 4)
+        target = cache.materialize(entry, self.root / "out.txt")
+        self.assertEqual(target.read_bytes(), b"body")
+        self.assertNotEqual(target.stat().st_ino, cache.body_path(URL).stat().st_ino)
+
+    def test_store_file_adopts_streamed_body_by_link(self):
+        streamed = self.root / "bundle-1" / "51001.nc"
+        streamed.parent.mkdir()
+        streamed.write_bytes(b"netcdf")
+
+        entry = self.cache.store_file(URL, streamed, {"ETag": '"v1"'}, 6, sha256="abc")
+
+        self.assertEqual((entry.body_size, entry.sha256), (6, "abc"))
+        self.assertEqual(self.cache.body_path(URL).stat().st_ino, streamed.stat().st_ino)
+        self.assertEqual(self.cache.lookup(URL).sha256, "abc")
+        self.assertIsNone(self.cache.store_file(URL, streamed, {"Cache-Control": "no-store"}, 6))
+        self.assertIsNone(self.cache.lookup(URL))
+        self.assertTrue(streamed.exists())
+
+
+class TestHTTPClientRevalidation(unittest.IsolatedAsyncioTestCase):
+    """Tests for conditional GET handling in HTTPClient."""
+
+    def setUp(self):
+        self.tempdir = TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        self.cache = HTTPValidatorCache(self.root / "cache" / "http")
+        self.client = HTTPClient(
+            rate_limiter=RateLimiter(
+                default_config=RateLimitConfig(requests_per_second=10.0, burst_size=10)
+            ),
+            output_dir=self.root,
+            cache=self.cache,
+        )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    async def test_not_modified_reuses_cached_body(self):
+        first = _response(200, b"WVHT 2.0", {"Content-Type": "text/plain", "ETag": '"v1"'})
+        not_modified = _response(304, headers={"ETag": '"v1"'})
+
+        async with self.client:
+            with patch.object(
+                self.client._session, "get", side_effect=[first, not_modified]
+            ) as get:
+                initial = await self.client.download(URL, custom_file_path=self.root / "b1" / "x")
+                with patch.object(self.cache, "read_body", side_effect=AssertionError):
+                    repeat = await self.client.download(
+                        URL, custom_file_path=self.root / "b2" / "x"
+                    )
+
+        self.assertFalse(initial.cache_hit)
+        self.assertTrue(repeat.success)
+        self.assertTrue(repeat.cache_hit)
+        self.assertEqual(repeat.status_code, 304)
+        # The output is linked from the cache file; the body is only read on demand
+        self.assertEqual(
+            Path(repeat.file_path).stat().st_ino, self.cache.body_path(URL).stat().st_ino
+        )
+        self.assertIsNone(repeat._content)
+        self.assertEqual(repeat.content, b"WVHT 2.0")
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+        stats = self.client.get_statistics()
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["bytes_saved"], len(b"WVHT 2.0"))
+        self.assertEqual(stats["total_downloads"], 2)
+
+    async def test_fresh_entry_skips_request_and_rate_limiter(self):
+        self.cache.store(URL, b"cached", {"Cache-Control": "max-age=3600"}, 6)
+
+        async with self.client:
+            with (
+                patch.object(self.client._session, "get") as get,
+                patch.object(self.client.rate_limiter, "acquire") as acquire,
+            ):
+                result = await self.client.download(URL, save_to_disk=False)
+
+        get.assert_not_called()
+        acquire.assert_not_called()
+        self.assertTrue(result.cache_hit)
+        self.assertEqual(result.content, b"cached")
+        self.assertIsNone(result.file_path)
+
+    async def test_modified_response_replaces_cache_entry(self):
+        self.cache.store(URL, b"old", {"ETag": '"v1"'}, 3)
+        changed = _response(200, b"new", {"Content-Type": "text/plain", "ETag": '"v2"'})
+
+        async with self.client:
+            with patch.object(self.client._session, "get", return_value=changed):
+                result = await self.client.download(URL, save_to_disk=False)
+
+        self.assertFalse(result.cache_hit)
+        self.assertEqual(result.content, b"new")
+        self.assertEqual(self.cache.lookup(URL).etag, '"v2"')
+        self.assertEqual(self.client.get_statistics()["bytes_saved"], 0)
+
+    async def test_streamed_download_is_cached_and_revalidated(self):
+        body = b"WVHT 2.0\n" * 1000
+        reader = aiohttp.StreamReader(
+            Mock(_reading_paused=False), 2**16, loop=asyncio.get_running_loop()
+        )
+        reader.feed_data(body)
+        reader.feed_eof()
+        first = _response(200, headers={"Content-Type": "text/plain", "ETag": '"v1"'})
+        first.content = reader
+        not_modified = _response(304, headers={"ETag": '"v1"'})
+
+        async with self.client:
+            with patch.object(self.client._session, "get", side_effect=[first, not_modified]):
+                initial = await self.client.download(
+                    URL, custom_file_path=self.root / "b1" / "x", stream=True
+                )
+                repeat = await self.client.download(
+                    URL, save_to_disk=False, custom_file_path=self.root / "b2" / "x", stream=True
+                )
+
+        digest = hashlib.sha256(body).hexdigest()
+        self.assertEqual(initial.content_hash, digest)
+        self.assertEqual(self.cache.lookup(URL).sha256, digest)
+        self.assertEqual(self.cache.body_path(URL).read_bytes(), body)
+        self.assertTrue(repeat.cache_hit)
+        self.assertIsNone(repeat.content)
+        self.assertEqual(repeat.content_hash, digest)
+        self.assertEqual(Path(repeat.file_path).read_bytes(), body)
+
+
+if __name__ == "__main__":
+    unittest.main()
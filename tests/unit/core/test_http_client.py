@@ -6,6 +6,7 @@ import unittest
 from unittest.mock import MagicMock, patch, AsyncMock, Mock
 import asyncio
 import aiohttp
+import hashlib
 import os
 import sys
 from pathlib import Path
@@ -338,6 +339,69 @@ class TestHTTPClient(unittest.IsolatedAsyncioTestCase):
                 self.assertIsNone(result.file_path)
                 self.assertEqual(result.content, b'test content')
 
+    def _stream_response(self, body, error=None):
+        """Build a 200 response whose body is only available through a real StreamReader."""
+        reader = aiohttp.StreamReader(
+            Mock(_reading_paused=False), 2**16, loop=asyncio.get_running_loop()
+        )
+        reader.feed_data(body)
+        if error is not None:
+            reader.set_exception(error)
+        else:
+            reader.feed_eof()
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {'Content-Type': 'application/x-netcdf'}
+        mock_response.content = reader
+        mock_response.read = AsyncMock(side_effect=AssertionError("body must not be buffered"))
+        return mock_response
+
+    async def test_stream_download_writes_chunks_to_disk(self):
+        """Test streaming downloads hash and write the body without buffering it."""
+        client = HTTPClient(rate_limiter=self.rate_limiter, output_dir=self.temp_dir, chunk_size=1000)
+        body = os.urandom(10_500)
+        target = Path(self.temp_dir) / 'nc' / 'waimea.nc'
+
+        async with client:
+            with patch.object(client._session, 'get', return_value=self._stream_response(body)):
+                result = await client.download(
+                    "http://example.com/waimea.nc", save_to_disk=False,
+                    custom_file_path=target, stream=True
+                )
+
+        self.assertTrue(result.success)
+        self.assertIsNone(result.content)
+        self.assertEqual(result.file_path, str(target))
+        self.assertEqual(result.size_bytes, len(body))
+        self.assertEqual(result.content_hash, hashlib.sha256(body).hexdigest())
+        self.assertEqual(target.read_bytes(), body)
+        self.assertEqual(os.listdir(target.parent), ['waimea.nc'])
+        # Same permissions as a file created with open(), not mkstemp's 0600
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(target.stat().st_mode & 0o777, 0o666 & ~umask)
+
+    async def test_interrupted_stream_keeps_previous_file(self):
+        """Test a failed stream leaves neither a partial file nor a clobbered target."""
+        client = HTTPClient(
+            rate_limiter=self.rate_limiter, output_dir=self.temp_dir, retry_attempts=0
+        )
+        target = Path(self.temp_dir) / 'interrupted' / 'waimea.nc'
+        target.parent.mkdir(exist_ok=True)
+        target.write_bytes(b'previous run')
+        response = self._stream_response(b'partial', aiohttp.ClientPayloadError("cut off"))
+
+        async with client:
+            with patch.object(client._session, 'get', return_value=response):
+                result = await client.download(
+                    "http://example.com/waimea.nc", custom_file_path=target, stream=True
+                )
+
+        self.assertFalse(result.success)
+        self.assertIn('cut off', result.error)
+        self.assertEqual(target.read_bytes(), b'previous run')
+        self.assertEqual(os.listdir(target.parent), ['waimea.nc'])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,152 @@
+"""Unit tests for vision image preparation and caching."""
+
+import base64
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.core.config import Config
+from src.core.image_prep import (
+    ImagePreparer,
+    create_image_preparer,
+    image_tokens,
+    target_size,
+)
+from src.core.openai_client import OpenAIClient
+
+
+def _decode(data_url: str) -> tuple[str, Image.Image]:
+    header, payload = data_url.split(",", 1)
+    return header, Image.open(io.BytesIO(base64.b64decode(payload)))
+
+
+class TestImageSizing(unittest.TestCase):
+    def test_target_size_matches_api_scaling(self):
+        self.assertEqual(target_size(4096, 2048, "high"), (1536, 768))
+        self.assertEqual(target_size(4096, 2048, "auto"), (1536, 768))
+        self.assertEqual(target_size(1024, 2048, "low"), (256, 512))
+        # Never upscaled
+        self.assertEqual(target_size(300, 200, "high"), (300, 200))
+
+    def test_image_tokens(self):
+        self.assertEqual(image_tokens(4096, 2048, "high"), 85 + 170 * 6)
+        self.assertEqual(image_tokens(300, 200, "auto"), 85 + 170)
+        self.assertEqual(image_tokens(4096, 2048, "low"), 85)
+
+
+class TestImagePreparer(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        self.preparer = ImagePreparer()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _chart(self, name: str = "chart.png", size=(3000, 2000)) -> Path:
+        image = Image.new("RGB", size, "white")
+        draw = ImageDraw.Draw(image)
+        for offset in range(0, size[0], 100):
+            draw.line((offset, 0, size[0] - offset, size[1]), fill="blue", width=3)
+        path = self.root / name
+        image.save(path)
+        return path
+
+    def _photo(self, name: str = "satellite.jpg", size=(2400, 1800)) -> Path:
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 255, (size[1], size[0], 3), dtype=np.uint8)
+        path = self.root / name
+        Image.fromarray(pixels).save(path, format="PNG" if name.endswith(".png") else "JPEG")
+        return path
+
+    def test_chart_is_resized_as_png_and_cached_per_detail(self):
+        path = self._chart()
+
+        high = self.preparer.prepare(path, "high")
+        mime, image = _decode(high.data_url)
+        self.assertEqual(mime, "data:image/png;base64")
+        self.assertEqual(image.size, (1152, 768))
+        self.assertEqual((high.width, high.height), (1152, 768))
+        self.assertEqual(high.tokens, 85 + 170 * 6)
+        self.assertLess(len(high.data_url), path.stat().st_size * 4 / 3)
+
+        self.assertIs(self.preparer.prepare(str(path), "high"), high)
+        low = self.preparer.prepare(path, "low")
+        self.assertEqual(_decode(low.data_url)[1].size, (512, 341))
+        self.assertEqual(self.preparer.get_stats()["hits"], 1)
+        self.assertEqual(self.preparer.get_stats()["misses"], 2)
+
+    def test_photographic_image_is_encoded_as_jpeg(self):
+        prepared = self.preparer.prepare(self._photo("satellite.png"), "auto")
+
+        mime, image = _decode(prepared.data_url)
+        self.assertEqual(mime, "data:image/jpeg;base64")
+        self.assertEqual(image.size, (1024, 768))
+
+    def test_small_image_keeps_original_bytes_when_smaller(self):
+        path = self._photo("small.jpg", size=(200, 150))
+
+        prepared = self.preparer.prepare(path, "high")
+
+        self.assertEqual(base64.b64decode(prepared.data_url.split(",", 1)[1]), path.read_bytes())
+        self.assertEqual((prepared.width, prepared.height), (200, 150))
+
+    def test_undecodable_image_is_sent_as_is(self):
+        path = self.root / "broken.png"
+        path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+
+        prepared = self.preparer.prepare(path, "high")
+
+        self.assertEqual(
+            prepared.data_url.split(",", 1)[1], base64.b64encode(path.read_bytes()).decode()
+        )
+        self.assertIsNone(prepared.tokens)
+        self.assertIsNone(self.preparer.estimate_tokens(path, "high"))
+
+        with self.assertRaises(FileNotFoundError):
+            self.preparer.prepare(self.root / "missing.png")
+        with self.assertRaises(ValueError):
+            self.preparer.prepare(self.root / "chart.bmp")
+
+    def test_cache_is_bounded_least_recently_used_first(self):
+        first, second, third = (self._chart(f"chart{i}.png", size=(800 + i, 600)) for i in range(3))
+        entry_size = len(self.preparer.prepare(first, "low").data_url)
+        self.preparer = ImagePreparer(max_cache_bytes=int(entry_size * 2.5))
+
+        self.preparer.prepare(first, "low")
+        self.preparer.prepare(second, "low")
+        self.preparer.prepare(first, "low")  # Refresh first
+        self.preparer.prepare(third, "low")  # Evicts second
+
+        self.assertEqual(self.preparer.get_stats()["entries"], 2)
+        self.preparer.prepare(first, "low")
+        self.assertEqual(self.preparer.get_stats()["hits"], 2)
+        self.preparer.prepare(second, "low")
+        self.assertEqual(self.preparer.get_stats()["misses"], 4)
+
+    def test_openai_client_sends_prepared_images(self):
+        path = self._chart()
+        client = OpenAIClient(
+            api_key="test-key", model="gpt-5-nano", max_tokens=100, image_preparer=self.preparer
+        )
+
+        data_url = client._convert_image_to_data_url(str(path), "low")
+
+        self.assertEqual(_decode(data_url)[1].size, (512, 341))
+        self.assertEqual(client._image_digest("data/none.png", self.preparer), "data/none.png")
+
+    def test_factory_respects_config(self):
+        config = Config()
+        config._config = {"forecast": {"image_cache_mb": 8}}
+        self.assertEqual(create_image_preparer(config).max_cache_bytes, 8 * 1024 * 1024)
+
+        config._config["forecast"]["image_preprocessing"] = False
+        self.assertIsNone(create_image_preparer(config))
+
+
+if __name__ == "__main__":
+    unittest.main()
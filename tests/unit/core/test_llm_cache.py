@@ -0,0 +1,167 @@
+"""
+Unit tests for the persistent LLM response cache and its OpenAIClient integration.
+"""
+
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.core.config import Config
+from src.core.llm_cache import LLMResponseCache, create_llm_cache
+from src.core.openai_client import OpenAIClient
+
+
+def _mock_openai(content: str = "Forecast text") -> tuple[Mock, AsyncMock]:
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content))]
+    response.usage = Mock(prompt_tokens=1000, completion_tokens=200)
+    client = AsyncMock()
+    client.chat.completions.create = AsyncMock(return_value=response)
+    return Mock(return_value=client), client
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Tests for the LLMResponseCache class."""
+
+    def setUp(self):
+        self.tempdir = TemporaryDirectory()
+        self.db_path = Path(self.tempdir.name) / "llm" / "responses.sqlite3"
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_round_trip(self):
+        cache = LLMResponseCache(self.db_path)
+        cache.put("k1", "gpt-5-nano", "hello", 10, 5)
+
+        entry = cache.get("k1")
+        self.assertEqual((entry.content, entry.input_tokens, entry.output_tokens), ("hello", 10, 5))
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_expired_entries_are_dropped(self):
+        cache = LLMResponseCache(self.db_path, ttl_seconds=60)
+        cache.put("k1", "gpt-5-nano", "hello")
+
+        with patch("src.core.llm_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get("k1"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_size_limit_evicts_least_recently_used(self):
+        cache = LLMResponseCache(self.db_path, max_bytes=10)
+        cache.put("old", "m", "aaaa")
+        cache.put("new", "m", "bbbb")
+        cache.get("old")  # Touch so "new" becomes least recently used
+        cache.put("newest", "m", "cccc")
+
+        self.assertIsNotNone(cache.get("old"))
+        self.assertIsNone(cache.get("new"))
+        self.assertIsNotNone(cache.get("newest"))
+
+    def test_key_covers_model_settings_and_images(self):
+        base = LLMResponseCache.make_key("m", {"temperature": 0.7}, "sys", "user", ["abc"])
+
+        self.assertEqual(
+            base, LLMResponseCache.make_key("m", {"temperature": 0.7}, "sys", "user", ["abc"])
+        )
+        self.assertNotEqual(
+            base, LLMResponseCache.make_key("m2", {"temperature": 0.7}, "sys", "user", ["abc"])
+        )
+        self.assertNotEqual(
+            base, LLMResponseCache.make_key("m", {"temperature": 0.3}, "sys", "user", ["abc"])
+        )
+        self.assertNotEqual(
+            base, LLMResponseCache.make_key("m", {"temperature": 0.7}, "sys", "user", ["def"])
+        )
+
+    def test_factory_respects_mode(self):
+        config = Config()
+        config._config = {"general": {"data_directory": self.tempdir.name}, "openai": {}}
+        self.assertIsNone(create_llm_cache(config))
+
+        config._config["openai"]["response_cache_mode"] = "read"
+        cache = create_llm_cache(config)
+        self.assertTrue(cache.reads)
+        self.assertFalse(cache.writes)
+        self.assertEqual(cache.db_path.parent, Path(self.tempdir.name) / "cache" / "llm")
+
+        config._config["openai"]["response_cache_mode"] = "bogus"
+        self.assertIsNone(create_llm_cache(config))
+
+
+class TestOpenAIClientResponseCache(unittest.IsolatedAsyncioTestCase):
+    """Tests for response caching in OpenAIClient."""
+
+    def setUp(self):
+        self.tempdir = TemporaryDirectory()
+        self.db_path = Path(self.tempdir.name) / "responses.sqlite3"
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _client(self, mode: str) -> OpenAIClient:
+        return OpenAIClient(
+            api_key="test-key",
+            model="gpt-5-nano",
+            max_tokens=1000,
+            cache=LLMResponseCache(self.db_path, mode=mode),
+            settings={"verbosity": "high"},
+        )
+
+    async def test_rerun_is_served_from_cache(self):
+        openai_class, openai_client = _mock_openai()
+
+        with patch("openai.AsyncOpenAI", openai_class):
+            first = self._client("readwrite")
+            await first.call_openai_api("system", "user")
+
+            second = self._client("readwrite")
+            result = await second.call_openai_api("system", "user")
+
+        self.assertEqual(result, "Forecast text")
+        self.assertEqual(openai_client.chat.completions.create.await_count, 1)
+
+        metrics = await second.get_metrics()
+        self.assertEqual(metrics["api_calls"], 0)
+        self.assertEqual((metrics["cache_hits"], metrics["cache_misses"]), (1, 0))
+        self.assertEqual(metrics["saved_input_tokens"], 1000)
+        self.assertEqual(metrics["saved_output_tokens"], 200)
+        self.assertGreater(metrics["saved_cost"], 0)
+
+        first_metrics = await first.get_metrics()
+        self.assertEqual((first_metrics["cache_hits"], first_metrics["cache_misses"]), (0, 1))
+
+    async def test_read_mode_does_not_store_and_errors_are_not_cached(self):
+        openai_class, openai_client = _mock_openai()
+
+        with patch("openai.AsyncOpenAI", openai_class):
+            await self._client("read").call_openai_api("system", "user")
+            await self._client("write").call_openai_api("system", "other")
+            openai_client.chat.completions.create.side_effect = RuntimeError("boom")
+            await self._client("readwrite").call_openai_api("system", "failing")
+
+        self.assertEqual(LLMResponseCache(self.db_path).stats()["entries"], 1)
+
+    async def test_image_content_changes_key(self):
+        image_dir = Path("data") / "_llm_cache_test"
+        image_dir.mkdir(parents=True, exist_ok=True)
+        image = image_dir / "chart.png"
+        try:
+            client = self._client("readwrite")
+            image.write_bytes(b"v1")
+            key_v1 = client._cache_key("s", "u", [str(image)], "high")
+            image.write_bytes(b"v2")
+            self.assertNotEqual(key_v1, client._cache_key("s", "u", [str(image)], "high"))
+            self.assertNotEqual(
+                client._cache_key("s", "u", [str(image)], "high"),
+                client._cache_key("s", "u", [str(image)], "low"),
+            )
+        finally:
+            image.unlink(missing_ok=True)
+            image_dir.rmdir()
+
+
+if __name__ == "__main__":
+    unittest.main()
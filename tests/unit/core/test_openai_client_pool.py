@@ -0,0 +1,170 @@
+"""Tests for pooled OpenAIClient connections against a local stub server."""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+
+from src.core.openai_client import CLIENT_POOL, LatencyHistogram, OpenAIClient
+from src.core.rate_limiter import RateLimitConfig
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-5-nano",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+    }
+
+
+class StubServer:
+    """Minimal OpenAI-compatible chat completions endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.peers: set[tuple] = set()
+        self.status_queue: list[int] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            status = self.status_queue.pop(0) if self.status_queue else 200
+            if status != 200:
+                return web.json_response(
+                    {"error": {"message": "stub error", "type": "stub", "code": None}},
+                    status=status,
+                    headers={"retry-after-ms": "10"},
+                )
+            return web.json_response(_completion(f"reply {self.requests}"))
+        finally:
+            self.in_flight -= 1
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self) -> None:
+        await self.runner.cleanup()
+
+
+class TestPooledOpenAIClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = StubServer()
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await CLIENT_POOL.close()
+        await self.server.stop()
+
+    def _client(self, **kwargs) -> OpenAIClient:
+        kwargs.setdefault("rate_limit", RateLimitConfig(requests_per_second=1000, burst_size=100))
+        return OpenAIClient(
+            api_key="stub-key",
+            model="gpt-5-nano",
+            max_tokens=100,
+            base_url=self.server.base_url,
+            **kwargs,
+        )
+
+    async def test_connection_is_reused_across_calls_and_instances(self):
+        first, second = self._client(), self._client()
+
+        results = [
+            await first.call_openai_api("system", "one"),
+            await second.call_openai_api("system", "two"),
+            await first.call_openai_api("system", "three"),
+        ]
+
+        self.assertEqual(results, ["reply 1", "reply 2", "reply 3"])
+        # One keep-alive connection served every request
+        self.assertEqual(len(self.server.peers), 1)
+
+        metrics = await first.get_metrics()
+        self.assertEqual(metrics["api_calls"], 2)
+        self.assertEqual(metrics["latency"]["total"]["count"], 2)
+        self.assertEqual(metrics["latency"]["ttfb"]["count"], 2)
+        self.assertLessEqual(metrics["latency"]["ttfb"]["max"], metrics["latency"]["total"]["max"])
+
+    async def test_rate_limited_requests_throttle_and_retry(self):
+        self.server.status_queue = [429, 429]
+        client = self._client()
+
+        result = await client.call_openai_api("system", "user")
+
+        self.assertEqual(result, "reply 3")
+        metrics = await client.get_metrics()
+        self.assertEqual((metrics["rate_limited"], metrics["retries"]), (2, 2))
+        self.assertEqual(metrics["latency"]["total"]["count"], 1)
+
+        from openai import AsyncOpenAI
+
+        bucket = CLIENT_POOL.get(
+            AsyncOpenAI, client.api_key, client.base_url, client.max_concurrency, client.rate_limit
+        ).bucket
+        self.assertLess(bucket.rate_scale, 1.0)
+
+    async def test_retries_are_bounded_and_client_errors_are_not_retried(self):
+        self.server.status_queue = [503, 503]
+        client = self._client(max_retries=1)
+        result = await client.call_openai_api("system", "user")
+        self.assertTrue(result.startswith("Error generating forecast"))
+        self.assertEqual(self.server.requests, 2)
+
+        self.server.status_queue = [400]
+        result = await client.call_openai_api("system", "user")
+        self.assertTrue(result.startswith("Error generating forecast"))
+        self.assertEqual(self.server.requests, 3)
+
+    async def test_concurrency_is_capped_per_provider(self):
+        self.server.delay = 0.05
+        clients = [self._client(max_concurrency=2) for _ in range(3)]
+
+        results = await asyncio.gather(
+            *(client.call_openai_api("system", f"user {i}") for i, client in enumerate(clients * 2))
+        )
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(self.server.max_in_flight, 2)
+        self.assertLessEqual(len(self.server.peers), 2)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(bounds=(0.1, 1.0, 10.0))
+        for seconds in (0.05, 0.2, 0.3, 0.5, 20.0):
+            histogram.observe(seconds)
+
+        summary = histogram.to_dict()
+        self.assertEqual(summary["buckets"], {"le_0.1": 1, "le_1": 3, "le_10": 0, "le_inf": 1})
+        self.assertEqual(summary["p50"], 1.0)
+        self.assertEqual(summary["p95"], 20.0)
+        self.assertEqual(summary["count"], 5)
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -185,6 +185,33 @@ class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
         self.assertIn('config', stats)
         self.assertEqual(stats['config']['requests_per_second'], 2.0)
 
+    async def test_throttle_and_recover(self):
+        """Test adaptive backoff after 429 responses."""
+        config = RateLimitConfig(requests_per_second=4.0, burst_size=4)
+        bucket = TokenBucket(config)
+
+        # Without a hint, block for one interval at the halved rate
+        delay = bucket.throttle()
+        self.assertAlmostEqual(delay, 0.5)
+        self.assertEqual(bucket.rate, 2.0)
+        self.assertTrue(bucket.is_blocked)
+        self.assertEqual(bucket.tokens, 0)
+
+        # A server hint wins, and the rate never drops below the floor
+        for _ in range(10):
+            bucket.throttle(retry_after=30.0)
+        self.assertGreater(bucket.blocked_until, time.time() + 29)
+        self.assertAlmostEqual(bucket.rate, 4.0 * TokenBucket.MIN_RATE_SCALE)
+
+        for _ in range(20):
+            bucket.recover(step=0.1)
+        self.assertEqual(bucket.rate, 4.0)
+
+        bucket.throttle()
+        bucket.reset()
+        self.assertEqual(bucket.get_stats()['rate_scale'], 1.0)
+        self.assertFalse(bucket.is_blocked)
+
 
 class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
     """Tests for the RateLimiter class."""
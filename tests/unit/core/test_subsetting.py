@@ -0,0 +1,288 @@
+"""Unit tests for OPeNDAP/ERDDAP constraint building and server-side subsetting in agents."""
+
+import asyncio
+import importlib.util
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from src.core.subsetting import (
+    cf_datetimes,
+    erddap_griddap_url,
+    opendap_constraint,
+    parse_dap_ascii,
+    parse_das,
+    parse_dds,
+)
+
+HAS_NETCDF = all(importlib.util.find_spec(name) for name in ("xarray", "netCDF4"))
+
+DDS = """Dataset {
+    Float32 waveHs[waveTime = 1440];
+    Grid {
+     ARRAY:
+        Float32 waveEnergyDensity[waveTime = 1440][waveFrequency = 64];
+     MAPS:
+        Int32 waveTime[waveTime = 1440];
+        Float32 waveFrequency[waveFrequency = 64];
+    } waveEnergyDensity;
+    Float32 metaWaterDepth;
+} cdip/realtime/239p1_rt.nc;
+"""
+
+# THREDDS returns Grid members as "grid.member" blocks
+ASCII = """Dataset {
+    Float32 waveHs[waveTime = 2];
+} cdip/realtime/239p1_rt.nc;
+---------------------------------------------
+waveHs[2]
+2.1, 2.4
+
+waveEnergyDensity.waveEnergyDensity[2][3]
+[0], 1.0, 1.5, 0.5
+[1], 1.2, 1.6, 0.4
+
+waveEnergyDensity.waveTime[2]
+1760522400, 1760524200
+
+metaWaterDepth, 53.0
+"""
+
+DAS = """Attributes {
+    waveTime {
+        String units "seconds since 1970-01-01 00:00:00 UTC";
+        Int32 _FillValue -99999;
+    }
+    NC_GLOBAL {
+        String station_name "Waimea Bay, HI";
+        Float32 latitude 21.6694;
+        Float64 time_coverage 1.0, 2.0;
+    }
+}
+"""
+
+
+class TestConstraintBuilders(unittest.TestCase):
+    """Tests for constraint expressions and DAP2 response parsing."""
+
+    def test_opendap_constraint_limits_time_dimensions(self):
+        variables = parse_dds(DDS)
+
+        self.assertEqual(variables["waveEnergyDensity"].shape, (1440, 64))
+        self.assertEqual(variables["metaWaterDepth"].dims, ())
+        self.assertEqual(
+            opendap_constraint(
+                variables, ["waveHs", "waveEnergyDensity", "waveFrequency", "missing"], 2
+            ),
+            "waveHs[1438:1:1439],waveEnergyDensity[1438:1:1439][0:1:63],waveFrequency[0:1:63]",
+        )
+
+    def test_parse_dap_ascii_arrays_grids_and_scalars(self):
+        arrays = parse_dap_ascii(ASCII)
+
+        np.testing.assert_allclose(arrays["waveHs"], [2.1, 2.4])
+        self.assertEqual(arrays["waveEnergyDensity"].shape, (2, 3))
+        np.testing.assert_allclose(arrays["waveEnergyDensity"][-1], [1.2, 1.6, 0.4])
+        np.testing.assert_allclose(arrays["waveTime"], [1760522400, 1760524200])
+        np.testing.assert_allclose(arrays["metaWaterDepth"], [53.0])
+
+    def test_parse_das_and_cf_times(self):
+        attributes = parse_das(DAS)
+
+        self.assertEqual(attributes["NC_GLOBAL"]["station_name"], "Waimea Bay, HI")
+        self.assertAlmostEqual(attributes["NC_GLOBAL"]["latitude"], 21.6694)
+        self.assertEqual(attributes["NC_GLOBAL"]["time_coverage"], [1.0, 2.0])
+        times = cf_datetimes([1760522400, 1760524200], attributes["waveTime"]["units"])
+        self.assertEqual(str(times[-1]), "2025-10-15T10:30:00")
+        self.assertEqual(
+            str(cf_datetimes([1.5], "hours since 2025-1-2 6:30")[0]), "2025-01-02T08:00:00"
+        )
+
+    def test_erddap_griddap_url(self):
+        url = erddap_griddap_url(
+            "https://example.com/erddap/griddap/ww3_hawaii",
+            ["Thgt", "Tper"],
+            time_steps=12,
+            latitude=(21.2, 21.8),
+            longitude=(201.8, 202.4),
+            stride=2,
+        )
+        box = "[last-11:1:last][0:1:last][(21.2):2:(21.8)][(201.8):2:(202.4)]"
+        self.assertEqual(
+            url,
+            f"https://example.com/erddap/griddap/ww3_hawaii.csv?Thgt{box},Tper{box}",
+        )
+
+        ranged = erddap_griddap_url(
+            "https://example.com/erddap/griddap/ww3_hawaii",
+            ["Thgt"],
+            time_range=("2025-10-15T00:00:00Z", "2025-10-16T00:00:00Z"),
+            depth=0.0,
+            axes=("time", "depth"),
+        )
+        self.assertTrue(
+            ranged.endswith("?Thgt[(2025-10-15T00:00:00Z):1:(2025-10-16T00:00:00Z)][(0.0)]")
+        )
+
+
+@unittest.skipUnless(HAS_NETCDF, "xarray and netCDF4 required")
+class TestAgentsAgainstLocalServer(unittest.TestCase):
+    """Agents request only the needed hyperslab from a file-based stand-in server."""
+
+    def setUp(self):
+        from tests.unit.core.local_subset_server import LocalSubsetServer
+
+        self.tempdir = TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        self.server = LocalSubsetServer(self.root / "srv")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _write(self, dataset, relative: str) -> Path:
+        path = self.root / "srv" / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dataset.to_netcdf(path)
+        return path
+
+    def test_cdip_agent_fetches_latest_records_over_opendap(self):
+        import xarray as xr
+
+        from src.agents.cdip_agent import CDIPAgent
+
+        records, bins = 2000, 64
+        times = 1760000000 + 1800 * np.arange(records)
+        heights = np.linspace(1.0, 3.0, records, dtype="float32")
+        dataset = xr.Dataset(
+            {
+                "waveHs": (["waveTime"], heights),
+                "waveTp": (["waveTime"], np.full(records, 14.0, dtype="float32")),
+                "waveDp": (["waveTime"], np.full(records, 315.0, dtype="float32")),
+                "waveEnergyDensity": (
+                    ["waveTime", "waveFrequency"],
+                    np.random.default_rng(0).random((records, bins), dtype="float32"),
+                ),
+            },
+            coords={
+                "waveTime": (
+                    ["waveTime"],
+                    times,
+                    {"units": "seconds since 1970-01-01 00:00:00 UTC"},
+                ),
+                "waveFrequency": (["waveFrequency"], np.linspace(0.025, 0.58, bins)),
+            },
+            attrs={"station_name": "Waimea Bay", "latitude": 21.67, "longitude": -158.12},
+        )
+        full_file = self._write(dataset, "cdip/realtime/239p1_rt.nc")
+
+        config = MagicMock()
+        config.get.return_value = {
+            "sources": [
+                {
+                    "id": "239",
+                    "format": "cdip_netcdf",
+                    "url": "https://thredds.example.org/thredds/dodsC/cdip/realtime/239p1_rt.nc",
+                }
+            ]
+        }
+        agent = CDIPAgent(config)
+        agent.ensure_http_client = AsyncMock()
+        agent.http_client = self.server
+
+        data_dir = self.root / "data"
+        data_dir.mkdir()
+        entry = asyncio.run(agent.collect(data_dir))[0]
+
+        self.assertEqual(
+            [url.rsplit(".nc", 1)[1].split("?")[0] for url in self.server.requests],
+            [".dds", ".das", ".ascii"],
+        )
+        self.assertIn("waveEnergyDensity[1999:1:1999][0:1:63]", entry["opendap_constraint"])
+        self.assertEqual(entry["source_format"], "cdip_opendap")
+        self.assertEqual(entry["station_name"], "Waimea Bay")
+        self.assertAlmostEqual(entry["significant_height_m"], 3.0, places=5)
+        self.assertEqual(entry["peak_period_s"], 14.0)
+        self.assertEqual(entry["spectral_bins"], bins)
+        self.assertEqual(entry["observation_timestamp"], str(np.datetime64(int(times[-1]), "s")))
+        saved = json.loads(Path(entry["file_path"]).read_text())
+        self.assertEqual(len(saved["spectra"]["energies"]), bins)
+        self.assertLess(self.server.bytes_served * 20, full_file.stat().st_size)
+
+    def test_model_agent_requests_erddap_hyperslab(self):
+        import xarray as xr
+
+        from src.agents.model_agent import ModelAgent
+        from src.core.config import Config
+
+        steps, size = 48, 40
+        shape = (steps, 1, size, size)
+        dataset = xr.Dataset(
+            {
+                name: (
+                    ["time", "depth", "latitude", "longitude"],
+                    np.full(shape, value, dtype="float32"),
+                    {"units": units},
+                )
+                for name, value, units in [
+                    ("Thgt", 2.5, "meters"),
+                    ("Tper", 13.0, "seconds"),
+                    ("Tdir", 315.0, "degrees"),
+                ]
+            },
+            coords={
+                "time": np.datetime64("2025-10-15T00:00", "ns")
+                + np.arange(steps) * np.timedelta64(1, "h"),
+                "depth": ("depth", [0.0], {"units": "m"}),
+                "latitude": ("latitude", 20.0 + 0.05 * np.arange(size), {"units": "degrees_north"}),
+                "longitude": (
+                    "longitude",
+                    201.0 + 0.05 * np.arange(size),
+                    {"units": "degrees_east"},
+                ),
+            },
+        )
+        self._write(dataset, "ww3_hawaii.nc")
+
+        config = Config()
+        config._config = {
+            "data_sources": {
+                "models": {
+                    "urls": [],
+                    "subsets": [
+                        {
+                            "dataset": "https://erddap.example.org/erddap/griddap/ww3_hawaii",
+                            "variables": ["Thgt", "Tper", "Tdir"],
+                            "time_steps": 12,
+                            "latitude": [21.0, 21.1],
+                            "longitude": [201.5, 201.6],
+                        },
+                        {"variables": ["Thgt"]},
+                    ],
+                }
+            }
+        }
+        agent = ModelAgent(config)
+        agent.ensure_http_client = AsyncMock()
+        agent.http_client = self.server
+
+        model_dir = self.root / "models"
+        model_dir.mkdir()
+        metadata = asyncio.run(agent.collect(model_dir))
+
+        self.assertEqual(len(metadata), 1)
+        summary = metadata[0]["parsed_summary"]
+        self.assertEqual(summary["format"], "erddap")
+        self.assertEqual(summary["time_steps"], 12)
+        self.assertEqual(summary["grid_points_per_time"], 9)
+        self.assertEqual(summary["events"][0]["timestamp"], "2025-10-16T12:00:00Z")
+        self.assertAlmostEqual(summary["total_height_max_m"], 2.5)
+        # 12 steps x 3 x 3 points instead of 48 x 40 x 40
+        self.assertEqual(summary["rows"], 108)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Unit tests for the shared agent worker pool."""
+
+import asyncio
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from src.agents.buoy_agent import BuoyAgent
+from src.core.config import Config
+from src.core.worker_pool import WorkerPool, get_worker_pool, shutdown_worker_pools
+
+NDBC_TEXT = """#YY  MM DD hh mm WDIR WSPD GST  WVHT   DPD   APD MWD   PRES  ATMP  WTMP
+#yr  mo dy hr mn degT m/s  m/s     m   sec   sec degT   hPa  degC  degC
+2025 10 15 06 00  70  6.0  8.0   2.5    14   9.0 315 1015.0  25.0  26.0
+2025 10 15 05 00  70  6.0  8.0   2.4    14   9.0 315 1015.0  25.0  26.0
+"""
+
+
+def _burn(seconds: float) -> int:
+    """Busy-loop for roughly the given CPU time; returns the worker's pid."""
+    deadline = time.thread_time() + seconds
+    while time.thread_time() < deadline:
+        pass
+    return os.getpid()
+
+
+def _config(**data_collection) -> Config:
+    config = Config()
+    config._config = {"data_collection": data_collection}
+    return config
+
+
+class TestWorkerPool(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        shutdown_worker_pools()
+
+    async def test_thread_pool_keeps_event_loop_responsive(self):
+        pool = WorkerPool("thread", max_workers=2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        try:
+            pid, cpu_seconds = await pool.run(_burn, 0.2)
+        finally:
+            task.cancel()
+            pool.shutdown()
+
+        self.assertEqual(pid, os.getpid())
+        self.assertGreaterEqual(cpu_seconds, 0.2)
+        self.assertGreater(ticks, 5)
+
+    async def test_inline_runs_on_calling_thread(self):
+        pool = WorkerPool("inline")
+
+        ident, cpu_seconds = await pool.run(threading.get_ident)
+
+        self.assertEqual(ident, threading.get_ident())
+        self.assertGreaterEqual(cpu_seconds, 0.0)
+
+    async def test_process_pool_with_thread_fallback(self):
+        pool = WorkerPool("process", max_workers=1)
+        try:
+            pid, cpu_seconds = await pool.run(_burn, 0.05)
+            self.assertNotEqual(pid, os.getpid())
+            self.assertGreaterEqual(cpu_seconds, 0.05)
+
+            # Lambdas can't be pickled, so they run on the thread pool
+            ident, _ = await pool.run(lambda: threading.get_ident())
+            self.assertNotEqual(ident, threading.get_ident())
+        finally:
+            pool.shutdown()
+
+    def test_shared_pool_per_configuration(self):
+        pool = get_worker_pool(_config(parse_workers=2))
+
+        self.assertIs(get_worker_pool(_config(parse_workers=2)), pool)
+        self.assertEqual((pool.kind, pool.max_workers), ("thread", 2))
+        self.assertEqual(get_worker_pool(_config(parse_executor="process")).kind, "process")
+        self.assertEqual(get_worker_pool(_config(parse_executor="bogus")).kind, "thread")
+        with self.assertRaises(ValueError):
+            WorkerPool("bogus")
+
+    async def test_collect_data_shuts_down_shared_pools(self):
+        from src.main import collect_data
+
+        pool = get_worker_pool(_config())
+        with patch("src.main.DataCollector") as collector_cls:
+            collector_cls.return_value.collect_data = AsyncMock(side_effect=RuntimeError("boom"))
+            with self.assertRaises(RuntimeError):
+                await collect_data(_config(), logging.getLogger("test"))
+
+        self.assertIsNot(get_worker_pool(_config()), pool)
+
+
+class TestAgentCpuAccounting(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        shutdown_worker_pools()
+
+    async def test_run_cpu_bound_records_agent_cpu_time(self):
+        agent = BuoyAgent(_config(parse_workers=2))
+
+        pid = await agent.run_cpu_bound(_burn, 0.05)
+        parsed = await agent.run_cpu_bound(agent._parse_text_buoy, NDBC_TEXT, "51001")
+
+        self.assertEqual(pid, os.getpid())
+        self.assertEqual(len(parsed["observations"]), 2)
+        stats = agent.get_cpu_stats()
+        self.assertEqual(stats["calls"], 2)
+        self.assertGreaterEqual(stats["cpu_seconds"], 0.05)
+        self.assertGreaterEqual(stats["wall_seconds"], stats["cpu_seconds"] - 0.01)
+
+        agent.reset_cpu_stats()
+        self.assertEqual(agent.get_cpu_stats()["calls"], 0)
+
+    async def test_agent_parsers_run_in_worker_processes(self):
+        agent = BuoyAgent(_config(parse_executor="process", parse_workers=1))
+        agent.http_client = object()  # Stands in for a live, unpicklable client
+
+        parsed = await agent.run_cpu_bound(agent._parse_text_buoy, NDBC_TEXT, "51001")
+
+        self.assertEqual(parsed["current_conditions"]["wave_height"], "2.5")
+        self.assertIsNone(pickle.loads(pickle.dumps(agent)).http_client)
+        self.assertIsNotNone(agent.http_client)
+        self.assertEqual(agent.get_cpu_stats()["calls"], 1)
+
+    async def test_spectral_parse_goes_through_pool(self):
+        agent = BuoyAgent(_config())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            metadata = await agent._handle_spectral_buoy(
+                "51001", "https://example.com/51001.spec", "0.05 1.2\n0.10 3.4\n", Path(tmp)
+            )
+
+        self.assertEqual(metadata["spectrum_points"], 2)
+        self.assertEqual(agent.get_cpu_stats()["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
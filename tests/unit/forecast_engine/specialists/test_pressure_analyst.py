@@ -605,6 +605,33 @@ class TestPressureAnalystSwellPredictions:
         # Assert
         assert enhanced[0]["propagation_method"] == "physics_based"
 
+    def test_enhance_swell_predictions_propagates_in_one_batch(self, pressure_analyst):
+        """All swells go through a single propagate() call, matching the scalar physics."""
+        calculator = pressure_analyst.swell_calculator
+        swells = [
+            {
+                "source_system": f"low_{i}",
+                "source_lat": lat,
+                "source_lon": lon,
+                "estimated_period": period,
+            }
+            for i, (lat, lon, period) in enumerate(
+                [(45.0, -160.0, "14s"), (50.0, 160.0, "16-18s"), (35.0, -175.0, "12s")]
+            )
+        ]
+
+        with (
+            patch.object(calculator, "propagate", wraps=calculator.propagate) as propagate,
+            patch.object(calculator, "calculate_arrival", side_effect=AssertionError),
+        ):
+            enhanced = pressure_analyst._enhance_swell_predictions(swells, [])
+
+        assert propagate.call_count == 1
+        _, details = calculator.calculate_arrival(50.0, 160.0, 17.0, datetime(2025, 10, 8))
+        assert enhanced[1]["travel_time_hrs"] == round(details["travel_time_hours"], 1)
+        assert enhanced[1]["distance_nm"] == round(details["distance_nm"], 0)
+        assert all(swell["propagation_method"] == "physics_based" for swell in enhanced)
+
 
 # =============================================================================
 # PHYSICS CALCULATION TESTS (4 tests)
@@ -16,7 +16,9 @@ from pathlib import Path
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
+from PIL import Image
 
+from src.core.image_prep import ImagePreparer
 from src.forecast_engine.data_manager import ForecastDataManager
 from src.processing.models.swell_event import (
     ForecastLocation,
@@ -1135,6 +1137,37 @@ def test_estimate_tokens_no_images(data_manager):
     assert result < 20000, "Should not include image tokens"
 
 
+def test_estimate_tokens_uses_prepared_image_dimensions(mock_logger, tmp_path):
+    """Test image tokens come from real post-resize dimensions with an image preparer."""
+    # Arrange
+    chart = tmp_path / "chart.png"
+    Image.new("RGB", (4096, 2048), "white").save(chart)
+    manager = ForecastDataManager(
+        image_detail_pressure="high",
+        image_detail_sst="low",
+        logger=mock_logger,
+        image_preparer=ImagePreparer(),
+    )
+    forecast_data = {
+        "swell_events": [],
+        "shore_data": {},
+        "images": {
+            "pressure_charts": [str(chart), str(tmp_path / "missing.png")],
+            "sst_charts": [str(chart)],
+        },
+    }
+
+    # Act
+    with_preparer = manager.estimate_tokens(forecast_data)
+    manager.image_preparer = None
+    without_preparer = manager.estimate_tokens(forecast_data)
+
+    # Assert
+    # 1536x768 after resize = 6 tiles (1105) + missing file fallback (3000) + low (85)
+    # instead of 3000 + 3000 + 500
+    assert without_preparer - with_preparer == (3000 + 3000 + 500) - (1105 + 3000 + 85)
+
+
 def test_estimate_tokens_logs_breakdown(data_manager, mock_logger):
     """Test that token estimation logs breakdown."""
     # Arrange
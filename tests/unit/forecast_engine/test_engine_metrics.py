@@ -68,7 +68,7 @@ class TestForecastEngineMetrics(unittest.IsolatedAsyncioTestCase):
             ]
         )
 
-        async def fake_main(forecast_data):
+        async def fake_main(forecast_data, **kwargs):
             values = next(run_metrics)
             # Update OpenAIClient metrics
             self.engine.openai_client.total_cost += values["cost"]
@@ -78,10 +78,10 @@ class TestForecastEngineMetrics(unittest.IsolatedAsyncioTestCase):
             self.engine.estimated_tokens += values["estimated_tokens"]
             return "main-forecast"
 
-        async def fake_shore(shore_key, forecast_data):
+        async def fake_shore(shore_key, forecast_data, **kwargs):
             return f"{shore_key}-forecast"
 
-        async def fake_daily(forecast_data):
+        async def fake_daily(forecast_data, **kwargs):
             return "daily-forecast"
 
         def fake_prepare(swell_forecast):
@@ -0,0 +1,169 @@
+"""Unit tests for the forecast generation dependency scheduler."""
+
+import asyncio
+import unittest
+from datetime import datetime
+
+from src.core import Config
+from src.forecast_engine import ForecastEngine
+from src.forecast_engine.forecast_engine import SHORE_FORECASTS
+from src.forecast_engine.generation_scheduler import GenerationScheduler, GenerationStep
+from src.processing.models.swell_event import SwellForecast
+
+
+def _step(name, events, requires=(), delay=0.0, limited=True, value=None):
+    async def run(inputs):
+        events.append(("start", name))
+        await asyncio.sleep(delay)
+        events.append(("end", name))
+        return value if value is not None else {"name": name, "inputs": inputs}
+
+    return GenerationStep(name, run, requires=tuple(requires), limited=limited)
+
+
+class TestGenerationScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_steps_wait_only_for_their_inputs(self) -> None:
+        events = []
+        steps = [
+            _step("slow", events, delay=0.05, value="slow-output"),
+            _step("dependent", events, requires=("slow", "context")),
+            _step("independent", events),
+        ]
+
+        results = await GenerationScheduler(max_concurrency=4).run(steps, inputs={"context": "ctx"})
+
+        self.assertLess(events.index(("end", "independent")), events.index(("end", "slow")))
+        self.assertLess(events.index(("end", "slow")), events.index(("start", "dependent")))
+        self.assertEqual(results["dependent"]["inputs"], {"slow": "slow-output", "context": "ctx"})
+
+    async def test_concurrency_limit_applies_to_limited_steps(self) -> None:
+        running = 0
+        peak = 0
+
+        async def run(_):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        steps = [GenerationStep(f"call_{i}", run) for i in range(6)]
+        steps.append(_step("lookup", [], limited=False))
+
+        scheduler = GenerationScheduler(max_concurrency=2)
+        await scheduler.run(steps)
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(set(scheduler.timings), {step.name for step in steps})
+
+    async def test_invalid_graphs_are_rejected(self) -> None:
+        scheduler = GenerationScheduler()
+        with self.assertRaisesRegex(ValueError, "unknown"):
+            await scheduler.run([_step("a", [], requires=("missing",))])
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            await scheduler.run([_step("a", [], requires=("b",)), _step("b", [], requires=("a",))])
+        with self.assertRaisesRegex(ValueError, "Duplicate"):
+            await scheduler.run([_step("a", []), _step("a", [])])
+        with self.assertRaises(ValueError):
+            GenerationScheduler(max_concurrency=0)
+
+    async def test_failure_cancels_pending_steps(self) -> None:
+        events = []
+
+        async def fail(_):
+            raise RuntimeError("boom")
+
+        steps = [
+            GenerationStep("broken", fail),
+            _step("waiting", events, requires=("broken",)),
+            _step("slow", events, delay=1.0),
+        ]
+
+        with self.assertRaisesRegex(RuntimeError, "boom"):
+            await GenerationScheduler().run(steps)
+        self.assertNotIn(("start", "waiting"), events)
+        self.assertNotIn(("end", "slow"), events)
+
+
+class TestForecastEngineScheduling(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        config = Config()
+        config._config = {
+            "forecast": {
+                "use_local_generator": True,
+                "refinement_cycles": 0,
+                "templates_dir": None,
+                "image_detail_levels": {},
+                "max_concurrent_generations": 3,
+                "arrival_context_shores": "north_shore,west_shore",
+            },
+            "openai": {"model": "gpt-5-nano", "analysis_models": []},
+        }
+        self.engine = ForecastEngine(config)
+        self.engine.validation_feedback = None
+        self.events = []
+        self.calls = {}
+
+        async def fake_images(forecast_data):
+            self.events.append("images:start")
+            await asyncio.sleep(0.05)
+            forecast_data["storm_arrivals"] = [{"storm_id": "kamchatka_low"}]
+            self.events.append("images:end")
+            return "chart analysis"
+
+        async def fake_main(forecast_data, **kwargs):
+            self.calls["main_forecast"] = kwargs
+            self.events.append("main")
+            return "main-forecast"
+
+        async def fake_shore(shore, forecast_data, **kwargs):
+            self.calls[shore] = (kwargs, list(forecast_data.get("storm_arrivals", [])))
+            self.events.append(shore)
+            return f"{shore}-forecast"
+
+        async def fake_daily(forecast_data, **kwargs):
+            self.events.append("daily")
+            return "daily-forecast"
+
+        self.engine.use_local_generator = False
+        self.engine._main_forecast_digest = lambda forecast_data: {}
+        self.engine._analyze_images = fake_images
+        self.engine._generate_main_forecast = fake_main
+        self.engine._generate_shore_forecast = fake_shore
+        self.engine._generate_daily_forecast = fake_daily
+        self.engine.data_manager.prepare_forecast_data = lambda swell_forecast: {
+            "confidence": {},
+            "seasonal_context": {"current_season": "winter"},
+        }
+
+    async def test_shores_without_arrivals_do_not_wait_for_image_analysis(self) -> None:
+        forecast = SwellForecast(forecast_id="dag", generated_time=datetime.now().isoformat())
+        result = await self.engine.generate_forecast(forecast)
+
+        self.assertEqual(result["south_shore"], "south_shore-forecast")
+        self.assertEqual(result["daily"], "daily-forecast")
+        end = self.events.index("images:end")
+        for shore in ("south_shore", "east_shore"):
+            self.assertLess(self.events.index(shore), end)
+            self.assertFalse(self.calls[shore][0]["include_arrivals"])
+        for step in ("north_shore", "west_shore", "daily", "main"):
+            self.assertGreater(self.events.index(step), end)
+
+        north_kwargs, north_arrivals = self.calls["north_shore"]
+        self.assertTrue(north_kwargs["include_arrivals"])
+        self.assertEqual(north_arrivals, [{"storm_id": "kamchatka_low"}])
+        self.assertEqual(self.calls["main_forecast"]["image_analysis"], "chart analysis")
+        self.assertEqual(self.calls["main_forecast"]["adaptive_context"], "")
+        self.assertEqual(result["metadata"]["storm_arrivals"], [{"storm_id": "kamchatka_low"}])
+
+    def test_arrival_context_shores_default_and_empty(self) -> None:
+        del self.engine.config._config["forecast"]["arrival_context_shores"]
+        engine = ForecastEngine(self.engine.config)
+        self.assertEqual(engine.arrival_context_shores, set(SHORE_FORECASTS))
+
+        self.engine.config._config["forecast"]["arrival_context_shores"] = ""
+        self.assertEqual(ForecastEngine(self.engine.config).arrival_context_shores, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
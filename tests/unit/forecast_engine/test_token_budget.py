@@ -0,0 +1,170 @@
+"""Unit tests for forecast prompt token accounting and budget trimming."""
+
+import unittest
+
+from src.core import Config
+from src.forecast_engine import ForecastEngine
+from src.forecast_engine.context_builder import build_context, join_digest_sections
+from src.forecast_engine.data_manager import ForecastDataManager
+from src.forecast_engine.prompt_templates import PromptTemplates
+from src.forecast_engine.token_budget import (
+    OUTPUT_TOKEN_RESERVE,
+    TokenEstimate,
+    count_tokens,
+    trim_to_budget,
+)
+
+
+def _forecast_data() -> dict:
+    sections = {
+        "data_quality": "=== DATA QUALITY & CONFIDENCE ===\nConfidence: 0.80/1.00 (High).",
+        "swell_matrix": "=== SWELL MATRIX (HST) ===\n" + "NW 315 deg 14s 6.0ft\n" * 20,
+        "timeline": "=== 3-DAY TIMELINE ESTIMATE (HST) ===\n" + "Day 1: building\n" * 10,
+        "weather": "=== WEATHER SNAPSHOT ===\nTrades 15-20 kt.",
+        "tides": "=== TIDES ===\nHigh 1.8 ft at 06:12, low 0.2 ft at 12:40.",
+        "upper_air": "=== UPPER-AIR DIAGNOSTICS ===\n"
+        + "250 mb jet 140 kt over the dateline\n" * 30,
+        "climatology": "=== CLIMATOLOGY REFERENCES ===\n" + "October average 4-6 ft\n" * 40,
+        "tropical": "=== TROPICAL & SYNOPTIC NOTES ===\nNo active systems.",
+    }
+    return {
+        "start_date": "2025-10-15",
+        "end_date": "2025-10-18",
+        "swell_events": [],
+        "shore_data": {},
+        "shores": ["North Shore", "South Shore"],
+        "metadata": {},
+        "images": {},
+        "digest_sections": sections,
+        "data_digest": join_digest_sections(sections),
+    }
+
+
+class TestCountTokens(unittest.TestCase):
+    def test_counts_are_memoized_and_grow_with_text(self):
+        text = "NW swell at 6.0ft (Hawaiian), period: 14.0s, arriving 2025-10-15T06:00"
+        count_tokens.cache_clear()
+
+        first = count_tokens(text)
+        self.assertEqual(count_tokens(text), first)
+        self.assertEqual(count_tokens.cache_info().hits, 1)
+
+        self.assertEqual(count_tokens(""), 0)
+        self.assertGreater(first, 10)
+        self.assertLess(first, len(text))
+        self.assertGreater(count_tokens(text * 2), first)
+
+
+class TestDigestSections(unittest.TestCase):
+    def test_build_context_sections_rebuild_the_digest(self):
+        context = build_context(
+            {"metadata": {}, "swell_events": [], "shore_data": {}, "confidence": {}}
+        )
+
+        sections = context["digest_sections"]
+        self.assertEqual(list(sections)[:2], ["data_quality", "swell_matrix"])
+        self.assertEqual(join_digest_sections(sections), context["data_digest"])
+
+
+class TestTokenBudget(unittest.TestCase):
+    def setUp(self):
+        self.manager = ForecastDataManager(templates=PromptTemplates())
+
+    def test_estimate_counts_rendered_prompt_per_section(self):
+        forecast_data = _forecast_data()
+
+        estimate = self.manager.estimate_token_usage(forecast_data)
+
+        self.assertIn("system_prompt", estimate.prompt)
+        self.assertGreater(estimate.prompt["user_prompt"], 0)
+        for name, text in forecast_data["digest_sections"].items():
+            self.assertEqual(estimate.prompt[f"digest:{name}"], count_tokens(text))
+        self.assertEqual(estimate.output, OUTPUT_TOKEN_RESERVE)
+        self.assertEqual(self.manager.estimate_tokens(forecast_data), estimate.total)
+
+    def test_trim_drops_lowest_value_sections_first(self):
+        forecast_data = _forecast_data()
+        estimate = self.manager.estimate_token_usage(forecast_data)
+        budget = estimate.total - estimate.prompt["digest:climatology"] - 1
+
+        dropped = self.manager.trim_to_budget(forecast_data, estimate, budget)
+
+        self.assertEqual(dropped, ["climatology", "upper_air"])
+        self.assertLessEqual(estimate.total, budget)
+        self.assertNotIn("CLIMATOLOGY", forecast_data["data_digest"])
+        self.assertNotIn("UPPER-AIR", forecast_data["data_digest"])
+        self.assertIn("TIDES", forecast_data["data_digest"])
+        self.assertEqual(estimate.total, self.manager.estimate_tokens(forecast_data))
+
+    def test_trim_never_drops_core_sections(self):
+        forecast_data = _forecast_data()
+        estimate = TokenEstimate(
+            prompt={f"digest:{name}": 100 for name in forecast_data["digest_sections"]}
+        )
+
+        dropped = trim_to_budget(forecast_data, estimate, budget=0)
+
+        self.assertEqual(len(dropped), 6)
+        self.assertEqual(list(forecast_data["digest_sections"]), ["data_quality", "swell_matrix"])
+
+
+class TestEngineBudgetStrategy(unittest.TestCase):
+    def _engine(self, strategy: str) -> ForecastEngine:
+        config = Config()
+        config._config = {
+            "forecast": {
+                "use_local_generator": False,
+                "use_specialist_team": False,
+                "refinement_cycles": 0,
+                "templates_dir": None,
+                "image_detail_levels": {},
+                "budget_strategy": strategy,
+            },
+            "openai": {"model": "gpt-5-nano", "analysis_models": []},
+        }
+        return ForecastEngine(config)
+
+    def test_trim_mode_fits_budget_instead_of_falling_back(self):
+        forecast_data = _forecast_data()
+        engine = self._engine("trim")
+        full = engine.data_manager.estimate_token_usage(_forecast_data()).total
+        engine.token_budget = engine.warn_threshold = full - 1
+
+        digest = engine._main_forecast_digest(forecast_data)
+
+        self.assertNotIn("CLIMATOLOGY", digest["data_digest"])
+        self.assertLessEqual(engine.estimated_tokens, engine.token_budget)
+
+    def test_trim_leaves_shared_digest_for_other_prompts(self):
+        forecast_data = _forecast_data()
+        forecast_data["shore_data"] = {"north_shore": {"swell_events": []}}
+        engine = self._engine("trim")
+        full = engine.data_manager.estimate_token_usage(_forecast_data()).total
+        engine.token_budget = engine.warn_threshold = full - 1
+        shore_prompt = engine.templates.get_shore_prompt("north_shore", forecast_data)
+        self.assertIn("CLIMATOLOGY", shore_prompt)
+
+        digest = engine._main_forecast_digest(forecast_data)
+
+        self.assertEqual(
+            forecast_data, {**_forecast_data(), "shore_data": forecast_data["shore_data"]}
+        )
+        self.assertEqual(
+            engine.templates.get_shore_prompt("north_shore", forecast_data), shore_prompt
+        )
+        self.assertNotIn(
+            "CLIMATOLOGY", engine.templates.get_caldwell_prompt({**forecast_data, **digest})
+        )
+
+    def test_fallback_mode_uses_local_generator(self):
+        forecast_data = _forecast_data()
+        engine = self._engine("fallback")
+        full = engine.data_manager.estimate_token_usage(_forecast_data()).total
+        engine.token_budget = engine.warn_threshold = full - 1
+
+        self.assertIsNone(engine._main_forecast_digest(forecast_data))
+        self.assertIn("CLIMATOLOGY", forecast_data["data_digest"])
+
+
+if __name__ == "__main__":
+    unittest.main()
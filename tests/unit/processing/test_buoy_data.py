@@ -0,0 +1,97 @@
+"""
+Unit tests for the columnar ObservationSeries behind BuoyData.
+"""
+
+import pickle
+import unittest
+
+import numpy as np
+
+from src.processing.models.buoy_data import BuoyData, BuoyObservation, ObservationSeries
+
+
+def _payload() -> dict:
+    return {
+        "station_id": "51001",
+        "observations": [
+            {"timestamp": "2025-01-01T12:00:00", "wave_height": 2.0, "dominant_period": 14.0},
+            {"timestamp": "2025-01-01T11:00:00", "wave_height": None, "dominant_period": 13.0},
+            {"Date": "2025-01-01T10:00:00Z", "WVHT": "1.5", "DPD": "MM"},
+        ],
+    }
+
+
+class TestObservationSeries(unittest.TestCase):
+    """Tests for the ObservationSeries class."""
+
+    def test_from_dict_builds_columns_without_objects(self):
+        buoy = BuoyData.from_dict(_payload())
+        series = buoy.observations
+
+        self.assertIsInstance(series, ObservationSeries)
+        self.assertEqual(len(series), 3)
+        np.testing.assert_array_equal(series.column("wave_height"), [2.0, np.nan, 1.5])
+        np.testing.assert_array_equal(series.column("dominant_period"), [14.0, 13.0, np.nan])
+        self.assertEqual(series._objects, {})
+        # Raw NDBC records keep their original payload
+        self.assertEqual(series[2].raw_data["WVHT"], "1.5")
+
+    def test_epoch_matches_datetime_parsing(self):
+        series = BuoyData.from_dict(_payload()).observations
+        self.assertEqual(series.epoch[1] - series.epoch[0], -3600.0)
+        self.assertTrue(np.isnan(ObservationSeries(["not a time"]).epoch[0]))
+
+    def test_materialized_edits_flow_back_to_columns(self):
+        buoy = BuoyData.from_dict(_payload())
+        buoy.observations[1].wave_height = 3.0
+        buoy.observations.append(BuoyObservation(timestamp="2025-01-01T09:00:00", pressure=1012))
+
+        self.assertEqual(buoy.observations.column("wave_height")[1], 3.0)
+        self.assertEqual(buoy.observations.column("pressure")[3], 1012.0)
+        self.assertEqual(buoy.to_dict()["observations"][1]["wave_height"], 3.0)
+
+    def test_clean_reads_skip_write_back(self):
+        series = BuoyData.from_dict(_payload()).observations
+        held = series[1]
+        series.append(BuoyObservation(timestamp="2025-01-01T09:00:00", wave_height=1.0))
+        series.column("wave_height")
+
+        # No edits since the last read: the columns are not written again
+        for values in series._columns.values():
+            values.flags.writeable = False
+        series.column("wave_height")
+        for values in series._columns.values():
+            values.flags.writeable = True
+
+        # Edits through objects handed out earlier still flow back
+        held.wave_height = 4.0
+        np.testing.assert_array_equal(series.column("wave_height"), [2.0, 4.0, 1.5, 1.0])
+
+    def test_list_assignment_is_converted(self):
+        buoy = BuoyData(station_id="51002")
+        buoy.observations = [BuoyObservation(timestamp="t", wave_height=1.0)]
+
+        self.assertIsInstance(buoy.observations, ObservationSeries)
+        self.assertEqual(buoy.observations, [BuoyObservation(timestamp="t", wave_height=1.0)])
+
+    def test_select_and_set_missing(self):
+        series = BuoyData.from_dict(_payload()).observations
+        first = series[0]
+        series.set_missing("wave_height", np.array([True, False, False]))
+        series.select([2, 0])
+
+        self.assertIsNone(first.wave_height)
+        self.assertIs(series[1], first)
+        self.assertEqual(series.timestamps, ["2025-01-01T10:00:00Z", "2025-01-01T12:00:00"])
+        del series[0]
+        self.assertEqual(len(series), 1)
+
+    def test_round_trip_and_pickle(self):
+        buoy = BuoyData.from_dict(_payload())
+        restored = BuoyData.from_json(buoy.to_json())
+        self.assertEqual(restored.to_dict(), buoy.to_dict())
+        self.assertEqual(pickle.loads(pickle.dumps(buoy)).to_dict(), buoy.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
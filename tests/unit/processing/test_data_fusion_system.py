@@ -183,6 +183,22 @@ class TestDataFusionSystem(unittest.TestCase):
         self.assertEqual(len(result), 1, "Should extract 1 model data object")
         self.assertEqual(result[0].model_id, "swan", "Model ID should match")
 
+    def test_extract_from_dicts(self):
+        """Test extraction of dictionaries in the to_dict() layout."""
+        data = {
+            "buoy_data": [self.sample_buoy_data.to_dict()],
+            "weather_data": [self.sample_weather_data.to_dict()],
+            "model_data": [self.sample_model_data.to_dict()],
+        }
+
+        buoys = self.fusion_system._extract_buoy_data(data)
+        weather = self.fusion_system._extract_weather_data(data)
+        models = self.fusion_system._extract_model_data(data)
+
+        self.assertEqual(buoys[0].to_dict(), self.sample_buoy_data.to_dict())
+        self.assertEqual(weather[0].to_dict(), self.sample_weather_data.to_dict())
+        self.assertEqual(models[0].to_dict(), self.sample_model_data.to_dict())
+
     def test_identify_swell_events(self):
         """Test swell event identification."""
         buoy_data = self.fusion_system._extract_buoy_data(self.sample_fusion_data)
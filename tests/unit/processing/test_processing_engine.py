@@ -0,0 +1,180 @@
+"""
+Unit tests for the parallel, incremental ProcessingEngine.
+"""
+
+import json
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from src.core.config import Config
+from src.processing.buoy_processor import BuoyProcessor
+from src.processing.models.buoy_data import BuoyData
+from src.processing.processing_engine import ProcessingEngine, _get_processor
+
+
+def _frozen_datetime(now: datetime) -> type[datetime]:
+    """datetime subclass whose now() returns a fixed time."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    return FrozenDatetime
+
+
+def _buoy_payload(station_id: str, height: float) -> dict:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    return {
+        "station_id": station_id,
+        "name": f"Buoy {station_id}",
+        "latitude": 21.0,
+        "longitude": -158.0,
+        "observations": [
+            {
+                "timestamp": (now - timedelta(hours=i)).isoformat(),
+                "wave_height": height,
+                "dominant_period": 12.0,
+                "wave_direction": 315.0,
+            }
+            for i in range(6)
+        ],
+    }
+
+
+class TestProcessingEngine(unittest.TestCase):
+    """Tests for the ProcessingEngine class."""
+
+    def setUp(self):
+        self.tempdir = TemporaryDirectory()
+        self.data_dir = Path(self.tempdir.name)
+        self.config = Config()
+        self.config._config = {"general": {"data_directory": str(self.data_dir)}}
+
+        self.bundle_id = "bundle-1"
+        bundle = self.data_dir / self.bundle_id
+        (bundle / "buoys").mkdir(parents=True)
+        (bundle / "tides").mkdir()
+        for station, height in (("51001", 2.0), ("51201", 1.5)):
+            (bundle / "buoys" / f"buoy_{station}.json").write_text(
+                json.dumps(_buoy_payload(station, height))
+            )
+        (bundle / "tides" / "tide_1612340.json").write_text(json.dumps([{"t": 1}, {"t": 2}]))
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_processes_stages_and_supplemental_in_process(self):
+        engine = ProcessingEngine(self.config, max_workers=1)
+        results = engine.process_bundle(self.bundle_id)
+
+        buoy_results = results.stage_results["buoy"]
+        self.assertEqual(len(buoy_results), 2)
+        self.assertTrue(all(r.success for r in buoy_results))
+        self.assertIsInstance(buoy_results[0].data, BuoyData)
+        self.assertEqual(results.supplemental["tide_data"], [{"t": 1}, {"t": 2}])
+        self.assertEqual(results.supplemental["metar_data"], [])
+        # Stages without files report a failed result, like DataProcessor.process_bundle
+        self.assertFalse(results.stage_results["weather"][0].success)
+        self.assertEqual(results.cache_misses, 2)
+
+    def test_process_pool_matches_in_process_results(self):
+        serial = ProcessingEngine(self.config, max_workers=1, use_cache=False)
+        parallel = ProcessingEngine(self.config, max_workers=2, use_cache=False)
+
+        serial_results = serial.process_bundle(self.bundle_id).stage_results["buoy"]
+        parallel_results = parallel.process_bundle(self.bundle_id).stage_results["buoy"]
+
+        # Analysis metadata carries wall-clock timestamps, so compare the observations
+        self.assertEqual(
+            [(r.data.station_id, r.data.to_dict()["observations"]) for r in serial_results],
+            [(r.data.station_id, r.data.to_dict()["observations"]) for r in parallel_results],
+        )
+
+    def test_unchanged_files_are_reused_from_cache(self):
+        ProcessingEngine(self.config, max_workers=1).process_bundle(self.bundle_id)
+
+        # Second bundle: one identical file, one changed file
+        bundle = self.data_dir / "bundle-2"
+        (bundle / "buoys").mkdir(parents=True)
+        (bundle / "buoys" / "buoy_51001.json").write_text(json.dumps(_buoy_payload("51001", 2.0)))
+        (bundle / "buoys" / "buoy_51201.json").write_text(json.dumps(_buoy_payload("51201", 3.0)))
+
+        with patch.object(
+            BuoyProcessor, "process_file", autospec=True, side_effect=BuoyProcessor.process_file
+        ) as process_file:
+            results = ProcessingEngine(self.config, max_workers=1).process_bundle("bundle-2")
+
+        self.assertEqual(results.cache_hits, 1)
+        self.assertEqual(results.cache_misses, 1)
+        self.assertEqual(process_file.call_count, 1)
+        self.assertTrue(all(r.success for r in results.stage_results["buoy"]))
+
+    def test_cache_is_pruned_to_last_bundle(self):
+        ProcessingEngine(self.config, max_workers=1).process_bundle(self.bundle_id)
+        cache_dir = self.data_dir / "cache" / "processing"
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 2)
+
+        bundle = self.data_dir / "bundle-2"
+        (bundle / "buoys").mkdir(parents=True)
+        (bundle / "buoys" / "buoy_51001.json").write_text(json.dumps(_buoy_payload("51001", 4.0)))
+        ProcessingEngine(self.config, max_workers=1).process_bundle("bundle-2")
+
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+
+    def test_cached_results_recompute_freshness(self):
+        with patch(
+            "src.processing.buoy_processor.datetime",
+            _frozen_datetime(datetime(2025, 1, 1, 13, 0, 0)),
+        ):
+            first = ProcessingEngine(self.config, max_workers=1).process_bundle(self.bundle_id)
+        first_analysis = first.stage_results["buoy"][0].data.metadata["analysis"]
+        self.assertAlmostEqual(first_analysis["hours_since_update"], 1.0)
+
+        with patch(
+            "src.processing.buoy_processor.datetime",
+            _frozen_datetime(datetime(2025, 1, 2, 12, 0, 0)),
+        ):
+            second = ProcessingEngine(self.config, max_workers=1).process_bundle(self.bundle_id)
+
+        self.assertEqual(second.cache_hits, 2)
+        result = second.stage_results["buoy"][0]
+        self.assertAlmostEqual(result.data.metadata["analysis"]["hours_since_update"], 24.0)
+        self.assertEqual(result.metadata["analysis"]["quality_details"]["freshness_score"], 0.0)
+        self.assertIn("Buoy data is 24.0 hours old", result.warnings)
+
+    def test_failed_results_are_not_cached(self):
+        bundle = self.data_dir / self.bundle_id
+        (bundle / "buoys" / "buoy_99999.json").write_text("{not json")
+
+        first = ProcessingEngine(self.config, max_workers=1).process_bundle(self.bundle_id)
+        second = ProcessingEngine(self.config, max_workers=1).process_bundle(self.bundle_id)
+
+        self.assertEqual(first.cache_misses, 3)
+        self.assertEqual((second.cache_hits, second.cache_misses), (2, 1))
+        self.assertEqual(len(list((self.data_dir / "cache" / "processing").glob("*.pkl"))), 2)
+
+    def test_worker_processors_follow_configuration(self):
+        processor = _get_processor(BuoyProcessor, self.config)
+        self.assertIs(_get_processor(BuoyProcessor, self.config), processor)
+
+        changed = Config()
+        changed._config = {
+            "general": {"data_directory": str(self.data_dir)},
+            "processing": {"buoy_max_age_hours": 12},
+        }
+        rebuilt = _get_processor(BuoyProcessor, changed)
+        self.assertIsNot(rebuilt, processor)
+        self.assertIs(rebuilt.config, changed)
+
+    def test_missing_bundle_returns_errors(self):
+        results = ProcessingEngine(self.config, max_workers=1).process_bundle("missing")
+        self.assertFalse(results.stage_results["buoy"][0].success)
+        self.assertIn("Bundle not found", results.stage_results["buoy"][0].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
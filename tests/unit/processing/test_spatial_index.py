@@ -0,0 +1,81 @@
+"""
+Unit tests for the model grid spatial index.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.core.config import Config
+from src.processing.models.wave_model import ModelPoint
+from src.processing.spatial_index import SpatialIndex, SpatialIndexCache, haversine_km
+from src.processing.wave_model_processor import WaveModelProcessor
+
+SHORE = (21.6639, -158.0529)
+
+
+def _grid(step: float = 0.25) -> tuple[np.ndarray, np.ndarray]:
+    lat, lon = np.meshgrid(np.arange(18.0, 24.0, step), np.arange(-162.0, -153.0, step))
+    return lat.ravel(), lon.ravel()
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Tests for the SpatialIndex class."""
+
+    def setUp(self):
+        self.lat, self.lon = _grid()
+        self.index = SpatialIndex(self.lat, self.lon)
+
+    def test_radius_query_matches_brute_force(self):
+        distances = haversine_km(*SHORE, self.lat, self.lon)
+        for radius in (10.0, 50.0, 200.0):
+            expected = np.flatnonzero(distances <= radius)
+            np.testing.assert_array_equal(self.index.query_radius(*SHORE, radius), expected)
+
+    def test_nearest_query(self):
+        distances, indices = self.index.query_nearest(*SHORE, k=3)
+        brute = haversine_km(*SHORE, self.lat, self.lon)
+
+        np.testing.assert_array_equal(indices, np.argsort(brute)[:3])
+        np.testing.assert_allclose(distances, np.sort(brute)[:3])
+
+    def test_missing_coordinates_are_skipped(self):
+        index = SpatialIndex([21.6, np.nan, 21.7], [-158.0, -158.0, -158.1])
+        np.testing.assert_array_equal(index.query_radius(*SHORE, 50.0), [0, 2])
+        self.assertEqual(sorted(index.query_nearest(*SHORE, k=5)[1].tolist()), [0, 2])
+
+    def test_cache_reuses_index_for_same_grid(self):
+        cache = SpatialIndexCache(max_entries=1)
+        first = cache.get(self.lat, self.lon)
+
+        self.assertIs(cache.get(self.lat.tolist(), self.lon.tolist()), first)
+        self.assertIsNot(cache.get(self.lat + 0.01, self.lon), first)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 2, 1))
+
+
+class TestWaveModelProcessorSpatialQueries(unittest.TestCase):
+    """Tests for WaveModelProcessor shore lookups through the spatial index."""
+
+    def setUp(self):
+        self.processor = WaveModelProcessor(MagicMock(spec=Config))
+        lat, lon = _grid(step=0.1)
+        self.points = [
+            ModelPoint(latitude=a, longitude=b, wave_height=1.0)
+            for a, b in zip(lat, lon, strict=True)
+        ]
+
+    def test_points_near_shore_match_haversine_loop(self):
+        expected = [
+            p
+            for p in self.points
+            if self.processor._haversine_distance(*SHORE, p.latitude, p.longitude) <= 50.0
+        ]
+
+        self.assertEqual(self.processor._find_points_near_shore(self.points, *SHORE), expected)
+        self.processor._find_points_near_shore(self.points, 21.3, -157.8)
+        self.assertEqual(self.processor.spatial_indexes.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -23,6 +24,7 @@ from src.processing.spectral_analyzer import (
     SpectralAnalyzer,
     SpectralPeak,
     analyze_spec_file,
+    analyze_spec_history,
 )
 
 
@@ -480,6 +482,99 @@ class TestConvenienceFunction:
         assert len(result.peaks) <= 2
 
 
+SPEC_HISTORY = """#YY  MM DD hh mm WVHT  SwH  SwP  WWH  WWP SwD WWD  STEEPNESS  APD MWD
+#yr  mo dy hr mn    m    m  sec    m  sec  -  degT     -      sec degT
+2025 10 10 12 00  1.5  0.8 10.5  1.0  9.9 NNE  N    AVERAGE  8.5  15
+2025 10 10 11 30  1.4  0.7 14.5  1.1  9.9  NW   E    AVERAGE  8.3 310
+2025 10 10 11 00   MM   MM   MM   MM   MM  MM  MM        N/A   MM  MM
+"""
+
+DATA_SPEC = """#YY  MM DD hh mm Sep_Freq  < spec_1 (freq_1) spec_2 (freq_2) ... >
+2025 10 10 12 00 0.120 0.0 (0.033) 0.5 (0.050) 4.0 (0.060) 1.0 (0.075) 0.2 (0.090) 2.0 (0.100) 999.0 (0.110)
+2025 10 10 11 30 9.999 0.0 (0.033) 3.0 (0.050) 1.0 (0.060) 1.0 (0.075) 0.2 (0.090) 0.1 (0.100) 0.0 (0.110)
+2025 10 10 11 00 0.120 0.0 (0.033) 3.0 (0.050)
+"""
+
+SWDIR = """#YY  MM DD hh mm alpha1 (freq_1) alpha1 (freq_2) ...
+2025 10 10 12 00 999.0 (0.033) 300.0 (0.050) 310.0 (0.060) 200.0 (0.075) 190.0 (0.090) 180.0 (0.100) 999.0 (0.110)
+"""
+
+
+class TestBatchSpectralParsing:
+    """Tests for whole-file .spec history and raw spectra parsing."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        """Write .spec, .data_spec and .swdir files for one station."""
+        (tmp_path / "51201.spec").write_text(SPEC_HISTORY)
+        (tmp_path / "51201.data_spec").write_text(DATA_SPEC)
+        (tmp_path / "51201.swdir").write_text(SWDIR)
+        return tmp_path
+
+    def test_spec_history_matrix(self, data_dir):
+        """All observations are parsed into a time x field matrix."""
+        series = SpectralAnalyzer().parse_spec_history(str(data_dir / "51201.spec"))
+
+        assert series.buoy_id == "51201"
+        assert series.timestamps[0] == "2025-10-10T12:00:00Z"
+        assert series.values.shape == (3, 9)
+        np.testing.assert_array_equal(series.column("swell_direction"), [22.5, 315.0, np.nan])
+        assert series.column("mean_direction")[1] == 310.0
+        assert np.isnan(series.values[2]).all()
+
+    def test_history_matches_single_observation_parser(self, data_dir):
+        """The batch path applies the same component rules as parse_spec_file."""
+        path = str(data_dir / "51201.spec")
+        results = analyze_spec_history(path)
+
+        assert results[0] == analyze_spec_file(path)
+        assert [len(r.peaks) for r in results] == [1, 2, 0]
+        assert results[1].dominant_peak.component_type == "wind_wave"
+
+    def test_raw_spectra_matrix(self, data_dir):
+        """Raw spectra become a time x frequency matrix with missing bins as NaN."""
+        matrix = SpectralAnalyzer().parse_raw_spectra(str(data_dir / "51201.data_spec"))
+
+        assert matrix.kind == "density"
+        assert matrix.values.shape == (2, 7)
+        np.testing.assert_allclose(matrix.frequencies[:3], [0.033, 0.05, 0.06])
+        assert np.isnan(matrix.values[0, -1])
+        assert matrix.separation_frequency[0] == 0.12
+        assert np.isnan(matrix.separation_frequency[1])
+
+    def test_vectorized_peak_detection(self, data_dir):
+        """Peaks are found per timestamp, strongest first, with aligned directions."""
+        peaks = SpectralAnalyzer().analyze_raw_spectra(
+            str(data_dir / "51201.data_spec"), str(data_dir / "51201.swdir")
+        )
+
+        assert peaks.frequency_hz.shape == (2, 5)
+        assert peaks.counts.tolist() == [2, 1]
+        np.testing.assert_allclose(peaks.period_seconds[0, :2], [1 / 0.06, 10.0])
+        np.testing.assert_array_equal(peaks.direction_degrees[0, :2], [310.0, 180.0])
+        assert peaks.energy_density[1, 0] == 3.0
+        # No direction file entry for the second observation
+        assert np.isnan(peaks.direction_degrees[1, 0])
+
+    def test_peak_separation(self):
+        """Candidates too close in period to a stronger peak are suppressed."""
+        text = "2025 10 10 12 00 " + " ".join(
+            f"{e} ({f})" for e, f in [(1.0, 0.05), (0.5, 0.055), (0.8, 0.06), (0.2, 0.07)]
+        )
+        analyzer = SpectralAnalyzer(min_separation_period=2.0)
+        matrix = analyzer.parse_raw_spectra_text(text, buoy_id="51201", kind="density")
+
+        # 20s and 16.7s peaks are 3.3s apart
+        assert analyzer.find_spectral_peaks(matrix).counts.tolist() == [2]
+        strict = SpectralAnalyzer(min_separation_period=4.0)
+        assert strict.find_spectral_peaks(matrix).counts.tolist() == [1]
+
+    def test_missing_raw_file(self):
+        """Missing files return None."""
+        assert SpectralAnalyzer().parse_raw_spectra("/nonexistent/51201.data_spec") is None
+        assert SpectralAnalyzer().analyze_spec_history("/nonexistent/51201.spec") == []
+
+
 class TestRealWorldData:
     """Integration tests with real .spec file data."""
 
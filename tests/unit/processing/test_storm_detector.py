@@ -484,6 +484,36 @@ class TestIntegration:
         assert arrivals[0]["group_velocity_knots"] > 0
         assert arrivals[0]["distance_nm"] > 0
 
+    def test_arrivals_match_scalar_propagation(self):
+        """Batched arrivals match calculate_arrival and include per-shore timing."""
+        detector = StormDetector()
+        calc = SwellPropagationCalculator()
+        storm = StormInfo(
+            storm_id="test_001",
+            location={"lat": 45.0, "lon": 155.0},
+            wind_speed_kt=50.0,
+            detection_time="2025-10-08T12:00:00Z",
+            confidence=0.9,
+        )
+
+        arrival = detector.calculate_hawaii_arrivals([storm])[0]
+        expected, details = calc.calculate_arrival(
+            45.0,
+            155.0,
+            arrival["estimated_period_seconds"],
+            datetime.fromisoformat("2025-10-08T12:00:00+00:00"),
+        )
+
+        assert arrival["travel_time_hours"] == pytest.approx(details["travel_time_hours"])
+        assert abs(datetime.fromisoformat(arrival["arrival_time"]) - expected).total_seconds() < 1
+        assert arrival["arrival_window"]["start"] < arrival["arrival_window"]["end"]
+        assert set(arrival["shore_arrivals"]) == {
+            "north_shore",
+            "south_shore",
+            "west_shore",
+            "east_shore",
+        }
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -8,9 +8,11 @@ and period estimation from storm characteristics.
 import math
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from src.utils.swell_propagation import (
+    DEFAULT_PERIOD_SWEEP,
     GRAVITY,
     HAWAII_LAT,
     HAWAII_LON,
@@ -606,6 +608,55 @@ class TestPeriodEstimation:
         ), f"Wind speed {wind_speed}kt should yield {min_period}-{max_period}s, got {period:.1f}s"
 
 
+class TestBatchPropagation:
+    """Tests for the vectorized propagate() API."""
+
+    def test_batch_matches_scalar_calculation(self):
+        """Every storm/period/target cell matches calculate_arrival()."""
+        calc = SwellPropagationCalculator()
+        generated = [datetime(2025, 10, 8, 12, 0), datetime(2025, 10, 9, 6, 0)]
+        targets = {"hawaii": (HAWAII_LAT, HAWAII_LON), "north_shore": (21.66, -158.05)}
+
+        batch = calc.propagate(
+            [45.0, -50.0], [155.0, 140.0], [12.0, 16.0, 20.0], generated, targets
+        )
+
+        assert batch.travel_time_hours.shape == (2, 3, 2)
+        for s, (lat, lon) in enumerate([(45.0, 155.0), (-50.0, 140.0)]):
+            for p, period in enumerate([12.0, 16.0, 20.0]):
+                for t, (target_lat, target_lon) in enumerate(targets.values()):
+                    arrival, details = calc.calculate_arrival(
+                        lat, lon, period, generated[s], target_lat, target_lon
+                    )
+                    assert batch.travel_time_hours[s, p, t] == pytest.approx(
+                        details["travel_time_hours"]
+                    )
+                    assert abs(batch.arrival_time(s, p, t) - arrival) < timedelta(seconds=1)
+
+    def test_arrival_window_spans_period_sweep(self):
+        """Longest period arrives first, shortest period last."""
+        calc = SwellPropagationCalculator()
+        generated = datetime(2025, 10, 8, 12, 0)
+
+        batch = calc.propagate([45.0], [155.0], DEFAULT_PERIOD_SWEEP, [generated])
+        start, end = batch.arrival_window(0, "hawaii")
+
+        assert batch.periods.shape == (1, 31)
+        assert start == batch.arrival_time(0, len(DEFAULT_PERIOD_SWEEP) - 1)
+        assert end == batch.arrival_time(0, 0)
+
+    def test_per_storm_periods(self):
+        """A (storms, 1) period array gives one dominant period per storm."""
+        calc = SwellPropagationCalculator()
+        now = datetime(2025, 10, 8)
+
+        batch = calc.propagate([45.0, 45.0], [155.0, 155.0], np.array([[12.0], [18.0]]), [now, now])
+
+        assert batch.travel_time_hours[0, 0, 0] == pytest.approx(
+            batch.travel_time_hours[1, 0, 0] * 18.0 / 12.0
+        )
+
+
 class TestIntegrationScenarios:
     """Integration tests for realistic swell propagation scenarios."""
 
@@ -0,0 +1,208 @@
+"""Unit tests for the batch validation engine."""
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.validation import BatchValidator, ForecastValidator, ValidationDatabase
+from src.validation.batch_validator import merge_time_ranges
+
+
+class FakeFetcher:
+    """Stands in for BuoyDataFetcher, serving synthetic 30-minute observations."""
+
+    def __init__(self, start: datetime, calls: list):
+        self.start = start
+        self.calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def fetch_buoy(self, buoy_id, start_time, end_time):
+        self.calls.append((buoy_id, start_time, end_time))
+        await asyncio.sleep(0)
+        return [
+            {
+                "buoy_id": buoy_id,
+                "observation_time": self.start + timedelta(minutes=30 * i),
+                "wave_height": 6.0,
+                "dominant_period": 13.0,
+                "direction": 315.0,
+                "source": "NDBC",
+            }
+            for i in range(8 * 48)
+        ]
+
+
+class TestMergeTimeRanges(unittest.TestCase):
+    def test_overlapping_ranges_are_merged(self):
+        t = datetime(2025, 10, 1)
+        hours = [(5, 7), (0, 2), (1, 3), (3, 4), (10, 11)]
+        ranges = [(t + timedelta(hours=a), t + timedelta(hours=b)) for a, b in hours]
+
+        merged = merge_time_ranges(ranges)
+
+        self.assertEqual(
+            merged,
+            [
+                (t, t + timedelta(hours=4)),
+                (t + timedelta(hours=5), t + timedelta(hours=7)),
+                (t + timedelta(hours=10), t + timedelta(hours=11)),
+            ],
+        )
+        self.assertEqual(merge_time_ranges([]), [])
+
+
+class TestBatchValidator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db = ValidationDatabase(str(Path(self.tempdir.name) / "validation.db"))
+        self.validator = ForecastValidator(self.db)
+        self.start = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(days=8)
+        self.calls = []
+
+        for day in range(6):
+            forecast_id = f"forecast-{day}"
+            issued = self.start + timedelta(days=day)
+            self.db.save_forecast(
+                {"forecast_id": forecast_id, "generated_time": issued, "metadata": {}}
+            )
+            for hours in range(0, 48, 6):
+                for shore in ("North Shore", "South Shore"):
+                    self.db.save_prediction(
+                        forecast_id=forecast_id,
+                        shore=shore,
+                        forecast_time=issued,
+                        valid_time=issued + timedelta(hours=hours),
+                        predicted_height=7.0,
+                        predicted_direction="NW",
+                        predicted_category="moderate",
+                    )
+
+    def tearDown(self):
+        self.db.close()
+        self.tempdir.cleanup()
+
+    def _batch(self, **kwargs) -> BatchValidator:
+        return BatchValidator(
+            self.validator,
+            fetcher_factory=lambda: FakeFetcher(self.start, self.calls),
+            **kwargs,
+        )
+
+    def _count(self, table: str) -> int:
+        with sqlite3.connect(self.db.db_path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def _validated(self, forecast_id: str) -> int:
+        with sqlite3.connect(self.db.db_path) as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM validations WHERE forecast_id = ?", (forecast_id,)
+            ).fetchone()[0]
+
+    async def test_each_buoy_fetched_once_for_all_forecasts(self):
+        progress = []
+        results = await self._batch(
+            max_workers=3,
+            commit_every=2,
+            progress_callback=lambda p, r: progress.append((p.completed, p.eta_seconds)),
+        ).run(hours_after=24)
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertAlmostEqual(results[0]["mae"], 1.0)
+        self.assertEqual(results[0]["sample_size"], 16)
+
+        fetched = [buoy_id for buoy_id, _, _ in self.calls]
+        self.assertEqual(sorted(fetched), ["51001", "51003", "51004", "51101"])
+        self.assertEqual(self._count("validations"), 6 * 16)
+
+        # Only observations inside some forecast's window are stored, once each
+        stored_per_buoy = self._count("actuals") / 4
+        self.assertLess(stored_per_buoy, 8 * 48)
+        self.assertEqual([completed for completed, _ in progress], list(range(1, 7)))
+        self.assertEqual(progress[-1][1], 0.0)
+
+    async def test_rerun_resumes_without_repeating_committed_work(self):
+        original = self.db.save_validations
+        loop = asyncio.get_running_loop()
+        run = None
+
+        def interrupt_after_first_group(records):
+            original(records)
+            self.db.save_validations = original
+            loop.call_soon_threadsafe(run.cancel)
+
+        self.db.save_validations = interrupt_after_first_group
+        run = asyncio.create_task(self._batch(max_workers=1, commit_every=2).run(hours_after=24))
+        with self.assertRaises(asyncio.CancelledError):
+            await run
+
+        self.assertEqual(self._count("validations"), 2 * 16)
+        actuals_after_first_run = self._count("actuals")
+
+        results = await self._batch(max_workers=2, commit_every=10).run(hours_after=24)
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(self._count("validations"), 6 * 16)
+        self.assertEqual(self._count("actuals"), actuals_after_first_run)
+        self.assertEqual(await self._batch().run(hours_after=24), [])
+
+    async def test_progress_is_reported_after_commit(self):
+        committed = []
+        await self._batch(
+            max_workers=2,
+            commit_every=4,
+            progress_callback=lambda p, r: committed.append(
+                (p.completed, self._validated(r["forecast_id"]))
+            ),
+        ).run(hours_after=24)
+
+        self.assertEqual(committed, [(n, 16) for n in range(1, 7)])
+
+    async def test_unmatched_forecasts_are_not_retried(self):
+        self.db.save_forecast(
+            {
+                "forecast_id": "forecast-unmatched",
+                "generated_time": self.start - timedelta(days=30),
+                "metadata": {},
+            }
+        )
+        self.db.save_prediction(
+            forecast_id="forecast-unmatched",
+            shore="North Shore",
+            forecast_time=self.start - timedelta(days=30),
+            valid_time=self.start - timedelta(days=30),
+            predicted_height=7.0,
+        )
+
+        results = await self._batch().run(hours_after=24)
+
+        unmatched = [r for r in results if r["forecast_id"] == "forecast-unmatched"]
+        self.assertFalse(unmatched[0]["success"])
+        pending = self.db.get_forecasts_needing_validation(hours_after=24)
+        self.assertEqual(pending, [])
+
+    async def test_fetch_failure_leaves_forecasts_pending(self):
+        class FailingFetcher(FakeFetcher):
+            async def fetch_buoy(self, buoy_id, start_time, end_time):
+                raise ConnectionError("offline")
+
+        batch = BatchValidator(
+            self.validator, fetcher_factory=lambda: FailingFetcher(self.start, self.calls)
+        )
+
+        results = await batch.run(hours_after=24)
+
+        self.assertFalse(any(r["success"] for r in results))
+        self.assertEqual(len(self.db.get_forecasts_needing_validation(hours_after=24)), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Unit tests for pooled ValidationDatabase connections."""
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from src.validation.database import ConnectionPool, ValidationDatabase, connect_with_retry
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tempdir.name) / "validation.db")
+        self.db = ValidationDatabase(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self.tempdir.cleanup()
+
+    def test_connections_are_reused_per_thread(self):
+        pool = ConnectionPool(self.db_path)
+        self.addCleanup(pool.close)
+
+        main = pool.connection()
+        self.assertIs(pool.connection(), main)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], main)
+
+        # Closing the pool makes threads reconnect transparently
+        pool.close()
+        reopened = pool.connection()
+        self.assertIsNot(reopened, main)
+        self.assertEqual(reopened.execute("SELECT 1").fetchone(), (1,))
+
+    def test_tuned_pragmas_and_temporary_busy_timeout(self):
+        pool = ConnectionPool(self.db_path, timeout=5.0)
+        self.addCleanup(pool.close)
+
+        conn = pool.connection()
+
+        def pragma(name):
+            return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+        self.assertEqual(pragma("journal_mode"), "wal")
+        self.assertEqual(pragma("synchronous"), 1)  # NORMAL
+        self.assertEqual(pragma("temp_store"), 2)  # MEMORY
+        self.assertEqual(pragma("cache_size"), -16000)
+        self.assertEqual(pragma("foreign_keys"), 1)
+
+        with pool.acquire(timeout=60.0):
+            self.assertEqual(pragma("busy_timeout"), 60000)
+        self.assertEqual(pragma("busy_timeout"), 5000)
+
+    def test_nested_acquire_keeps_outer_state(self):
+        pool = ConnectionPool(self.db_path, timeout=5.0)
+        self.addCleanup(pool.close)
+
+        with pool.acquire(timeout=60.0) as conn:
+            conn.row_factory = sqlite3.Row
+            with pool.acquire() as inner, pool.acquire(timeout=30.0):
+                self.assertIs(inner, conn)
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 60000)
+            self.assertIs(conn.row_factory, sqlite3.Row)
+
+        # The outermost release restores the pool defaults
+        self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone(), (5000,))
+        self.assertIsNone(conn.row_factory)
+
+    def test_read_only_connection_rejects_writes(self):
+        self.db.save_forecast({"forecast_id": "f1", "generated_time": datetime.now()})
+
+        with self.db.read_connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM forecasts").fetchone(), (1,))
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM forecasts")
+
+        self.assertIsNotNone(self.db.get_forecast("f1"))
+
+    def test_concurrent_writers_share_one_instance(self):
+        self.db.save_forecast({"forecast_id": "f1", "generated_time": datetime.now()})
+        now = datetime.now()
+
+        def write(worker: int) -> list[int]:
+            return [
+                self.db.save_prediction(
+                    "f1", "North Shore", now, now + timedelta(hours=i), predicted_height=worker
+                )
+                for i in range(25)
+            ]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            ids = [pid for batch in executor.map(write, range(4)) for pid in batch]
+
+        self.assertEqual(len(set(ids)), 100)
+        self.assertEqual(len(self.db.get_predictions_for_forecast("f1")), 100)
+
+    def test_failed_transaction_leaves_pooled_connection_usable(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.save_predictions(
+                "missing-forecast",
+                [{"shore": None, "forecast_time": datetime.now(), "valid_time": datetime.now()}],
+            )
+
+        self.db.save_forecast({"forecast_id": "f1", "generated_time": datetime.now()})
+        self.assertIsNotNone(self.db.get_forecast("f1"))
+
+    def test_connect_retries_transient_errors(self):
+        real_connect = sqlite3.connect
+        attempts = []
+
+        def flaky_connect(*args, **kwargs):
+            attempts.append(args)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            return real_connect(*args, **kwargs)
+
+        with (
+            patch("src.validation.database.sqlite3.connect", side_effect=flaky_connect),
+            patch("src.validation.database.time.sleep") as sleep,
+        ):
+            conn = connect_with_retry(self.db_path, read_only=True)
+
+        self.addCleanup(conn.close)
+        self.assertEqual(len(attempts), 2)
+        sleep.assert_called_once()
+        self.assertEqual(conn.execute("PRAGMA query_only").fetchone(), (1,))
+
+
+if __name__ == "__main__":
+    unittest.main()
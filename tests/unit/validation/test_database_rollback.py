@@ -160,6 +160,37 @@ class TestActualsBatchRollback:
 
         assert count == 0
 
+    def test_save_actuals_skips_stored_observations(self, temp_db):
+        """Test that re-saving observations reuses existing rows instead of duplicating them."""
+        base_time = datetime(2025, 10, 7, 12, 0, 0)
+        first = [
+            {"buoy_id": "51201", "observation_time": base_time + timedelta(minutes=10 * i)}
+            for i in range(3)
+        ]
+        first_ids = temp_db.save_actuals(first)
+
+        second = [
+            {"buoy_id": "51201", "observation_time": base_time + timedelta(minutes=10)},
+            {"buoy_id": "51201", "observation_time": base_time + timedelta(minutes=30)},
+            {"buoy_id": "51201", "observation_time": base_time + timedelta(minutes=30)},
+            {"buoy_id": "51202", "observation_time": base_time},
+        ]
+        second_ids = temp_db.save_actuals(second)
+
+        assert second_ids[0] == first_ids[1]
+        assert second_ids[1] == second_ids[2]
+        assert len(set(first_ids + second_ids)) == 5
+
+        conn = sqlite3.connect(temp_db.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM actuals").fetchone()[0]
+        conn.close()
+        assert count == 5
+
+        # Bulk saves reuse one connection
+        with temp_db.shared_connection() as conn_a, temp_db.shared_connection() as conn_b:
+            assert conn_a is conn_b
+        temp_db.close()
+
 
 class TestValidationsBatchRollback:
     """Test batch validations with rollback."""
@@ -0,0 +1,230 @@
+"""Unit tests for the local NDBC observation archive."""
+
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from src.core.config import Config
+from src.core.http_client import DownloadResult
+from src.validation import BuoyDataFetcher, ObservationArchive
+from src.validation.observation_archive import RECORD_DTYPE, create_observation_archive
+
+HEADER = (
+    "#YY  MM DD hh mm WDIR WSPD GST  WVHT   DPD   APD MWD   PRES  ATMP  WTMP  DEWP  VIS PTDY  TIDE\n"
+    "#yr  mo dy hr mn degT m/s  m/s     m   sec   sec degT   hPa  degC  degC  degC  nmi  hPa    ft\n"
+)
+
+
+def _observations(start: datetime, count: int, step_minutes: int = 30) -> list[dict]:
+    return [
+        {
+            "buoy_id": "51001",
+            "observation_time": start + timedelta(minutes=step_minutes * i),
+            "wave_height": 5.0 + i,
+            "dominant_period": 12.0,
+            "direction": None if i % 2 else 315.0,
+            "source": "NDBC",
+        }
+        for i in range(count)
+    ]
+
+
+def _ndbc_text(times: list[datetime]) -> str:
+    """Realtime2 text with the given times listed newest first."""
+    rows = [
+        f"{t:%Y %m %d %H %M}  310  8.0  9.5  2.00  11.0   8.3 300 1015.2  24.5  25.1  22.3  8.0 -0.3  0.45"
+        for t in sorted(times, reverse=True)
+    ]
+    return HEADER + "\n".join(rows) + "\n"
+
+
+def _download(text: str) -> DownloadResult:
+    result = DownloadResult("http://example.com", success=True)
+    result.content = text.encode("utf-8")
+    return result
+
+
+class TestObservationArchive(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.archive = ObservationArchive(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_append_only_adds_rows_past_high_water_mark(self):
+        start = datetime(2025, 10, 1)
+        self.assertIsNone(self.archive.high_water_mark("51001"))
+
+        self.assertEqual(self.archive.append("51001", _observations(start, 10)), 10)
+        self.assertEqual(self.archive.high_water_mark("51001"), start + timedelta(hours=4.5))
+
+        # Overlapping, unordered and duplicated rows only add the new tail
+        overlap = _observations(start, 14)
+        self.assertEqual(self.archive.append("51001", overlap[::-1] + overlap[-2:]), 4)
+        self.assertEqual(len(self.archive.query("51001", start, start + timedelta(days=1))), 14)
+
+    def test_range_query_spans_month_partitions(self):
+        start = datetime(2025, 9, 30, 12)
+        self.archive.append("51001", _observations(start, 48))
+
+        self.assertEqual(
+            [p.name for p in self.archive.partitions("51001")], ["2025-09.obs", "2025-10.obs"]
+        )
+
+        result = self.archive.query("51001", datetime(2025, 9, 30, 23), datetime(2025, 10, 1, 1))
+        self.assertEqual(
+            [obs["observation_time"] for obs in result],
+            [datetime(2025, 9, 30, 23) + timedelta(minutes=30 * i) for i in range(5)],
+        )
+        self.assertEqual(result[0]["wave_height"], 27.0)
+        self.assertEqual(result[0]["direction"], 315.0)
+        self.assertIsNone(result[1]["direction"])
+        self.assertEqual(result[0]["source"], "NDBC")
+        self.assertEqual(self.archive.query("51101", start, datetime(2025, 10, 2)), [])
+
+    def test_torn_trailing_record_is_ignored_and_repaired(self):
+        start = datetime(2025, 10, 1)
+        self.archive.append("51001", _observations(start, 3))
+        partition = self.archive.partitions("51001")[0]
+        with open(partition, "ab") as f:
+            f.write(b"\x01" * 7)  # Simulate an interrupted append
+
+        self.assertEqual(self.archive.high_water_mark("51001"), start + timedelta(hours=1))
+        self.assertEqual(len(self.archive.query("51001", start, start + timedelta(hours=2))), 3)
+
+        self.archive.append("51001", _observations(start, 5))
+        self.assertEqual(partition.stat().st_size, 5 * RECORD_DTYPE.itemsize)
+        self.assertEqual(len(self.archive.query("51001", start, start + timedelta(hours=2))), 5)
+
+    def test_values_round_trip_at_full_precision(self):
+        observations = _observations(datetime(2025, 10, 1), 1)
+        observations[0]["wave_height"] = 4.92126
+
+        self.archive.append("51001", observations)
+
+        stored = self.archive.query("51001", datetime(2025, 10, 1), datetime(2025, 10, 2))
+        self.assertEqual(stored[0]["wave_height"], 4.92126)
+
+    def test_concurrent_appends_do_not_duplicate_records(self):
+        observations = _observations(datetime(2025, 10, 1), 50)
+        threads = [
+            threading.Thread(target=self.archive.append, args=("51001", observations))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(partition_records(self.archive), 50)
+
+    def test_factory_respects_config(self):
+        config = Config()
+        config._config = {"general": {"data_directory": self.tempdir.name}, "validation": {}}
+        self.assertEqual(
+            create_observation_archive(config).root, Path(self.tempdir.name) / "archive" / "ndbc"
+        )
+
+        config._config["validation"]["observation_archive"] = False
+        self.assertIsNone(create_observation_archive(config))
+
+
+class TestBuoyDataFetcherArchive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.archive = ObservationArchive(self.tempdir.name)
+        self.http_client = AsyncMock()
+        self.start = datetime(2025, 10, 1)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _times(self, hours: int) -> list[datetime]:
+        return [self.start + timedelta(minutes=30 * i) for i in range(hours * 2)]
+
+    async def test_fetch_archives_only_new_rows(self):
+        fetcher = BuoyDataFetcher(
+            http_client=self.http_client, archive=self.archive, refresh_interval=0
+        )
+        self.http_client.download.return_value = _download(_ndbc_text(self._times(6)))
+
+        first = await fetcher.fetch_buoy(
+            "51001", self.start + timedelta(hours=1), self.start + timedelta(hours=2)
+        )
+        self.assertEqual(len(first), 3)
+        # The whole file is archived, not just the requested range
+        self.assertEqual(
+            len(self.archive.query("51001", self.start, self.start + timedelta(hours=6))), 12
+        )
+
+        # A range the archive already covers is served from disk
+        await fetcher.fetch_buoy("51001", self.start, self.start + timedelta(hours=3))
+        self.assertEqual(self.http_client.download.await_count, 1)
+
+        # Newer data only appends the rows past the high-water mark
+        self.http_client.download.return_value = _download(_ndbc_text(self._times(8)))
+        latest = await fetcher.fetch_buoy(
+            "51001", self.start + timedelta(hours=5), self.start + timedelta(hours=8)
+        )
+        self.assertEqual(self.http_client.download.await_count, 2)
+        self.assertEqual(len(latest), 6)
+        self.assertEqual(partition_records(self.archive), 16)
+
+    async def test_refresh_interval_throttles_downloads(self):
+        fetcher = BuoyDataFetcher(http_client=self.http_client, archive=self.archive)
+        self.http_client.download.return_value = _download(_ndbc_text(self._times(2)))
+
+        end = self.start + timedelta(hours=12)
+        await fetcher.fetch_buoy("51001", self.start, end)
+        await fetcher.fetch_buoy("51001", self.start, end)
+
+        self.assertEqual(self.http_client.download.await_count, 1)
+
+    async def test_refresh_interval_holds_across_fetchers(self):
+        self.http_client.download.return_value = _download(_ndbc_text(self._times(2)))
+        end = self.start + timedelta(hours=12)
+
+        for _ in range(2):
+            fetcher = BuoyDataFetcher(
+                http_client=self.http_client, archive=ObservationArchive(self.tempdir.name)
+            )
+            await fetcher.fetch_buoy("51001", self.start, end)
+
+        self.assertEqual(self.http_client.download.await_count, 1)
+
+    async def test_failed_refresh_is_retried(self):
+        fetcher = BuoyDataFetcher(http_client=self.http_client, archive=self.archive)
+        failed = DownloadResult("http://example.com", success=False)
+        failed.error = "HTTP 503"
+        self.http_client.download.side_effect = [failed, _download(_ndbc_text(self._times(2)))]
+
+        end = self.start + timedelta(hours=1)
+        self.assertEqual(await fetcher.fetch_buoy("51001", self.start, end), [])
+        self.assertIsNone(self.archive.last_refresh("51001"))
+
+        self.assertEqual(len(await fetcher.fetch_buoy("51001", self.start, end)), 3)
+        self.assertEqual(self.http_client.download.await_count, 2)
+
+    async def test_offline_mode_reads_archive_without_downloading(self):
+        self.archive.append("51001", _observations(self.start, 4))
+        fetcher = BuoyDataFetcher(http_client=self.http_client, archive=self.archive, offline=True)
+
+        result = await fetcher.fetch_buoy("51001", self.start, self.start + timedelta(days=1))
+
+        self.assertEqual(len(result), 4)
+        self.http_client.download.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            BuoyDataFetcher(http_client=self.http_client, offline=True)
+
+
+def partition_records(archive: ObservationArchive) -> int:
+    return sum(p.stat().st_size for p in archive.partitions("51001")) // RECORD_DTYPE.itemsize
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,8 @@ import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from src.utils.validation_feedback import ValidationFeedback
+from src.validation.database import ValidationDatabase, ValidationReader
 from src.validation.performance import (
     PerformanceAnalyzer,
     build_performance_context,
@@ -319,6 +321,131 @@ class TestPerformanceAnalyzer(unittest.TestCase):
         self.assertIn("Recent Forecast Performance", context)
 
 
+class TestDailyPerformanceSummary(unittest.TestCase):
+    """Test the materialized daily summary maintained by ValidationDatabase."""
+
+    SHORES = ["North Shore", "South Shore", "West Shore"]
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tempdir.name) / "validation.db")
+        self.db = ValidationDatabase(self.db_path)
+        self.db.save_forecast({"forecast_id": "f1", "generated_time": datetime.now()})
+        self.now = datetime.now()
+        self.actual_id = self.db.save_actual("51001", self.now, wave_height=5.0)
+
+    def tearDown(self):
+        self.db.close()
+        self.tempdir.cleanup()
+
+    def _validations(self, count: int) -> list[dict]:
+        records = []
+        for i in range(count):
+            prediction_id = self.db.save_prediction(
+                "f1", self.SHORES[i % 3], self.now, self.now, predicted_height=5.0
+            )
+            height_error = 25.0 if i == 0 else (i % 5 - 2) * 0.6 + (1.5 if i % 3 == 0 else 0.0)
+            records.append(
+                {
+                    "forecast_id": "f1",
+                    "prediction_id": prediction_id,
+                    "actual_id": self.actual_id,
+                    "height_error": height_error,
+                    "category_match": None if i % 7 == 0 else abs(height_error) < 1.0,
+                    "mae": abs(height_error),
+                    "rmse": abs(height_error) * 1.2,
+                }
+            )
+        return records
+
+    def _raw_result(self, days: int) -> dict:
+        """Aggregate the raw validations table, bypassing the summary."""
+        analyzer = PerformanceAnalyzer(self.db_path)
+        analyzer._query_summary = lambda *args, **kwargs: None
+        return analyzer.get_recent_performance(days=days, min_samples=1)
+
+    def _age_validations(self, days_ago: int, prediction_ids: list[int]) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "UPDATE validations SET validated_at = ? WHERE prediction_id = ?",
+                [
+                    ((self.now - timedelta(days=days_ago)).strftime("%Y-%m-%d 12:00:00"), pid)
+                    for pid in prediction_ids
+                ],
+            )
+
+    def _summary_rows(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM shore_daily_performance").fetchone()[0]
+
+    def test_saves_maintain_summary_matching_raw_aggregates(self):
+        records = self._validations(30)
+        self.db.save_validations(records[:20])
+        for record in records[20:]:
+            self.db.save_validation(**record)
+
+        analyzer = PerformanceAnalyzer(self.db_path)
+        summary = analyzer.get_recent_performance(days=7, min_samples=1)
+        self.assertEqual(summary, {**self._raw_result(7), "metadata": summary["metadata"]})
+        self.assertEqual(summary["overall"]["total_validations"], 29)  # One outlier dropped
+        self.assertEqual([alert["shore"] for alert in summary["bias_alerts"]], ["North Shore"])
+        # 3 shores x (inlier, outlier) buckets at most, all on one day
+        self.assertLessEqual(self._summary_rows(), 4)
+
+        inliers = [r["mae"] for r in records if abs(r["height_error"]) < 10]
+        self.assertAlmostEqual(self.db.get_recent_mae(days=7), sum(inliers) / len(inliers))
+
+    def test_rolling_windows_and_backfill(self):
+        records = self._validations(12)
+        self.db.save_validations(records)
+        self._age_validations(10, [r["prediction_id"] for r in records[:6]])
+        self.db.rebuild_performance_summary()
+
+        rolling = self.db.get_rolling_performance()
+        self.assertEqual(sorted(rolling), [7, 14, 30])
+        self.assertEqual(sum(m["validation_count"] for m in rolling[7].values()), 6)
+        self.assertEqual(sum(m["validation_count"] for m in rolling[14].values()), 11)
+
+        # Existing databases without the summary table are backfilled on open
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DROP TABLE shore_daily_performance")
+        ValidationDatabase(self.db_path)
+        self.assertEqual(self.db.get_rolling_performance(), rolling)
+
+        for days in (7, 14):
+            summary = PerformanceAnalyzer(self.db_path).get_recent_performance(
+                days=days, min_samples=1
+            )
+            self.assertEqual(summary["overall"], self._raw_result(days)["overall"])
+
+    def test_reader_never_creates_or_migrates(self):
+        self.db.save_validations(self._validations(9))
+        self.assertAlmostEqual(
+            ValidationReader(self.db_path).get_recent_mae(days=7), self.db.get_recent_mae(days=7)
+        )
+
+        missing = Path(self.db_path).with_name("missing.db")
+        self.assertIsNone(ValidationReader(missing).get_recent_mae())
+        self.assertFalse(missing.exists())
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DROP TABLE shore_daily_performance")
+        self.assertIsNone(ValidationReader(self.db_path).get_recent_mae())
+        # No backfill: the summary table is left for ValidationDatabase to create
+        with self.assertRaises(sqlite3.OperationalError):
+            self._summary_rows()
+
+    def test_validation_feedback_reads_summary(self):
+        records = self._validations(9)
+        self.db.save_validations(records)
+
+        report = ValidationFeedback(self.db_path, lookback_days=7).get_recent_performance()
+
+        self.assertTrue(report.has_recent_data)
+        self.assertEqual(sum(sp.validation_count for sp in report.shore_performance), 9)
+        self.assertAlmostEqual(report.overall_mae, round(sum(r["mae"] for r in records) / 9, 1))
+
+
 class TestDatabaseMissing(unittest.TestCase):
     """Test behavior when database doesn't exist."""
 
@@ -7,9 +7,11 @@ import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, patch
 
 from src.core import Config
-from src.main import generate_forecast
+from src.main import StageHandoff, generate_forecast
+from src.processing import dict_to_swell_forecast
 from src.validation.database import ValidationDatabase
 
 
@@ -184,10 +186,12 @@ class TestForecastPersistence(unittest.IsolatedAsyncioTestCase):
             logger = logging.getLogger("test.forecast_persistence")
             logger.setLevel(logging.INFO)
 
-            result = await generate_forecast(config, logger, bundle_id=bundle_id)
+            with patch("src.main.CLIENT_POOL.close", new_callable=AsyncMock) as close_clients:
+                result = await generate_forecast(config, logger, bundle_id=bundle_id)
 
             self.assertEqual(result.get("status"), "success")
             self.assertEqual(result.get("forecast_id"), forecast_id)
+            close_clients.assert_awaited_once()
 
             database = ValidationDatabase(str(db_path))
             stored = database.get_forecast(forecast_id)
@@ -196,6 +200,40 @@ class TestForecastPersistence(unittest.IsolatedAsyncioTestCase):
             predictions = database.get_predictions_for_forecast(forecast_id)
             self.assertGreater(len(predictions), 0, "Predictions were not stored for the forecast")
 
+    async def test_generate_forecast_uses_in_memory_handoff(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for directory in ("data", "output", "logs"):
+                (root / directory).mkdir(parents=True, exist_ok=True)
+
+            db_path = root / "validation.db"
+            config = _build_config(root, db_path)
+
+            bundle_id = "test-bundle"
+            bundle_dir = root / "data" / bundle_id
+            forecast_id = _write_fused_forecast(bundle_dir)
+
+            # Hand the fused forecast over in memory; the artifact is only
+            # written by the background task
+            fused_path = bundle_dir / "processed" / "fused_forecast.json"
+            handoff = StageHandoff(dict_to_swell_forecast(json.loads(fused_path.read_text())))
+            fused_path.unlink()
+            handoff.write_artifact(fused_path.write_text, "{}")
+
+            logger = logging.getLogger("test.forecast_persistence")
+            result = await generate_forecast(config, logger, bundle_id=bundle_id, handoff=handoff)
+
+            self.assertEqual(result.get("status"), "success")
+            self.assertEqual(await handoff.flush(), [2])
+            self.assertTrue(fused_path.exists())
+
+            database = ValidationDatabase(str(db_path))
+            predictions = database.get_predictions_for_forecast(forecast_id)
+            self.assertEqual(
+                {(p["predicted_period"], p["predicted_direction"]) for p in predictions},
+                {(15.0, "NW"), (12.0, "S")},
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the cached forecast catalog and conditional responses.
+"""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.web.catalog import ForecastCatalog
+
+
+def _write_forecast(root: Path, forecast_id: str, generated: str, mtime: float) -> Path:
+    forecast_dir = root / forecast_id
+    forecast_dir.mkdir()
+    (forecast_dir / f"{forecast_id}.html").write_text(f"<html><body>{forecast_id}</body></html>")
+    data_path = forecast_dir / "forecast_data.json"
+    data_path.write_text(json.dumps({"generated_time": generated, "forecast_id": forecast_id}))
+    os.utime(data_path, (mtime, mtime))
+    os.utime(forecast_dir, (mtime, mtime))
+    return forecast_dir
+
+
+@pytest.fixture
+def output_root():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _write_forecast(root, "forecast_20251010_060000", "2025-10-10T06:00:00Z", 1_760_000_000)
+        _write_forecast(root, "forecast_20251011_060000", "2025-10-11T06:00:00Z", 1_760_086_400)
+        yield root
+
+
+@pytest.fixture
+def app_module(output_root, monkeypatch):
+    monkeypatch.setenv("SURFCAST_OUTPUT_DIR", str(output_root))
+    monkeypatch.setenv("SURFCAST_CATALOG_POLL_SECONDS", "3600")
+    sys.modules.pop("src.web.app", None)
+    return importlib.import_module("src.web.app")
+
+
+def test_catalog_only_rereads_changed_forecasts(output_root):
+    catalog = ForecastCatalog(output_root, poll_interval=3600)
+
+    entries = catalog.entries()
+    assert [entry.forecast_id for entry in entries] == [
+        "forecast_20251011_060000",
+        "forecast_20251010_060000",
+    ]
+    assert entries[0].generated_time == "2025-10-11T06:00:00Z"
+    assert catalog.json_reads == 2
+
+    # Within the poll interval nothing is rescanned
+    catalog.index()
+    catalog.latest()
+    assert catalog.scans == 1
+
+    _write_forecast(output_root, "forecast_20251012_060000", "2025-10-12T06:00:00Z", 1_760_172_800)
+    first_etag = catalog.index().etag
+    catalog.invalidate()
+
+    assert catalog.latest().forecast_id == "forecast_20251012_060000"
+    assert catalog.scans == 2
+    assert catalog.json_reads == 3
+    assert catalog.index().etag != first_etag
+    assert b"forecast_20251012_060000" in catalog.index().body
+
+
+def test_catalog_skips_entries_removed_during_scan(output_root, monkeypatch):
+    real_scandir = os.scandir
+
+    def scandir_then_remove(path):
+        items = list(real_scandir(path))
+        for item in items:
+            if item.name == "forecast_20251010_060000":
+                for child in Path(item.path).iterdir():
+                    child.unlink()
+                os.rmdir(item.path)
+        return iter(items)
+
+    monkeypatch.setattr("src.web.catalog.os.scandir", scandir_then_remove)
+    catalog = ForecastCatalog(output_root, poll_interval=3600)
+
+    assert [entry.forecast_id for entry in catalog.entries()] == ["forecast_20251011_060000"]
+
+
+def test_payload_cache_follows_file_changes(output_root):
+    catalog = ForecastCatalog(output_root, max_payloads=1)
+    data_path = output_root / "forecast_20251010_060000" / "forecast_data.json"
+
+    first = catalog.payload(data_path)
+    assert catalog.payload(data_path) is first
+
+    data_path.write_text(json.dumps({"generated_time": "rerun"}))
+    os.utime(data_path, (1_760_000_100, 1_760_000_100))
+    second = catalog.payload(data_path)
+    assert second.etag != first.etag
+    assert json.loads(second.body) == {"generated_time": "rerun"}
+
+    data_path.write_text("{not json")
+    with pytest.raises(ValueError):
+        catalog.payload(data_path)
+
+
+def test_index_answers_conditional_requests(app_module):
+    client = TestClient(app_module.app)
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert "2025-10-11T06:00:00Z" in response.text
+    etag = response.headers["etag"]
+    assert response.headers["last-modified"]
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    assert client.get("/", headers={"If-None-Match": '"stale"'}).status_code == 200
+    since = client.get("/", headers={"If-Modified-Since": response.headers["last-modified"]})
+    assert since.status_code == 304
+
+
+def test_forecast_json_answers_conditional_requests(app_module, output_root):
+    client = TestClient(app_module.app)
+
+    latest = client.get("/api/forecasts/latest")
+    assert latest.status_code == 200
+    assert latest.json()["forecast_id"] == "forecast_20251011_060000"
+
+    detail = client.get("/api/forecasts/forecast_20251011_060000")
+    assert detail.headers["etag"] == latest.headers["etag"]
+    revalidated = client.get(
+        "/api/forecasts/forecast_20251011_060000",
+        headers={"If-None-Match": detail.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+    _write_forecast(output_root, "forecast_20251012_060000", "2025-10-12T06:00:00Z", 1_760_172_800)
+    app_module.catalog.invalidate()
+    changed = client.get("/api/forecasts/latest", headers={"If-None-Match": latest.headers["etag"]})
+    assert changed.status_code == 200
+    assert changed.json()["forecast_id"] == "forecast_20251012_060000"
+    assert client.get("/health").json()["forecasts"] == 3